@@ -7,7 +7,6 @@ AeroFrame wrapper for SU2
 
 # Author: Aaron Dettmann
 
-from collections import defaultdict
 from os.path import join
 import os
 from pathlib import Path
@@ -17,6 +16,7 @@ from aeroframe.templates.wrappers import AeroWrapper
 from aeroframe.interpol.translate import get_deformed_mesh
 
 from ceasiompy.SU2Run.su2run import run_SU2_fsi
+from ceasiompy.utils.loadfields import get_load_fields_by_marker
 
 
 class Wrapper(AeroWrapper):
@@ -28,7 +28,7 @@ class Wrapper(AeroWrapper):
         self.paths = {}
         self.paths['d_calc'] = join(self.root_path, '..', 'temp')
         self.paths['f_config'] = join(self.paths['d_calc'], 'ToolInput.cfg')
-        self.paths['f_loads'] = join(self.paths['d_calc'], 'force.csv')
+        self.paths['f_loads'] = join(self.paths['d_calc'], 'force.npz')
         self.paths['f_mesh'] = join(self.paths['d_calc'], 'ToolInput.su2')
         self.paths['f_disp'] = join(self.paths['d_calc'], 'disp.dat')
 
@@ -38,19 +38,6 @@ class Wrapper(AeroWrapper):
         self.first_iteration = True
         self.undeformed_mesh = None
 
-    def _get_su2_load_array(self):
-        """Return the load files as a array"""
-
-        su2_load_array = np.genfromtxt(
-            self.paths['f_loads'],
-            delimiter=',',
-            dtype=None,
-            skip_header=1,
-            encoding='latin1'
-        )
-
-        return su2_load_array
-
     def _get_load_fields(self, use_undeformed_POA=True):
         """
         Return AeroFrame load fields from SU2 results
@@ -61,16 +48,11 @@ class Wrapper(AeroWrapper):
             will be used
         """
 
-        su2_load_array = self._get_su2_load_array()
-
-        load_fields = defaultdict(list)
-        for row in su2_load_array:
-            row = tuple(row)
-            xyz_fxyz = np.concatenate((row[1:7], [0, 0, 0]))
-            load_fields[str(row[-1])].append(xyz_fxyz)
+        load_fields = get_load_fields_by_marker(self.paths['f_loads'])
 
-        for component_uid, value in load_fields.items():
-            value = np.array(value, dtype=float)
+        for component_uid, xyz_fxyz in load_fields.items():
+            # AeroFrame load fields also contain moments (here zero)
+            value = np.hstack((xyz_fxyz, np.zeros((len(xyz_fxyz), 3))))
 
             # Replace the deformed POA
             if not self.first_iteration and use_undeformed_POA:
@@ -13,6 +13,11 @@ RCE = {
     "email": "aidan.jungo@cfse.ch",
 }
 
+# ===== In-process execution =====
+
+# Function called by 'run_subworkflow' as function(cpacs_path, cpacs_out_path)
+MAIN_FUNCTION = 'clcalculator.get_cl'
+
 # ===== CPACS inputs and outputs =====
 
 cpacs_inout = CPACSInOut()
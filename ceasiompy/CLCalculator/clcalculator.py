@@ -30,7 +30,8 @@ from ceasiompy.utils.cpacsfunctions import open_tixi, close_tixi, \
                                      create_branch
 from ceasiompy.utils.standardatmosphere import get_atmosphere
 
-from ceasiompy.utils.moduleinterfaces import check_cpacs_input_requirements
+from ceasiompy.utils.moduleinterfaces import check_cpacs_input_requirements, \
+                                           get_toolinput_file_path, get_tooloutput_file_path
 
 log = get_logger(__file__.split('.')[0])
 
@@ -141,9 +142,8 @@ if __name__ == '__main__':
 
     log.info('----- Start of ' + os.path.basename(__file__) + ' -----')
 
-    MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
-    cpacs_path = os.path.join(MODULE_DIR,'ToolInput','ToolInput.xml')
-    cpacs_out_path = os.path.join(MODULE_DIR,'ToolOutput','ToolOutput.xml')
+    cpacs_path = get_toolinput_file_path('CLCalculator')
+    cpacs_out_path = get_tooloutput_file_path('CLCalculator')
 
     check_cpacs_input_requirements(cpacs_path)
     get_cl(cpacs_path,cpacs_out_path)
@@ -35,6 +35,7 @@ from ceasiompy.utils.ceasiomlogger import get_logger
 from ceasiompy.utils.cpacsfunctions import open_tixi, close_tixi, get_value_or_default, create_branch
 from ceasiompy.utils.ceasiompyfunctions import create_new_wkdir, get_wkdir_or_create_new
 from ceasiompy.utils.mathfunctions import euler2fix, fix2euler
+from ceasiompy.utils.moduleinterfaces import get_toolinput_file_path, get_tooloutput_file_path
 
 log = get_logger(__file__.split('.')[0])
 
@@ -783,8 +784,8 @@ if __name__ == '__main__':
 
     log.info('----- Start of ' + os.path.basename(__file__) + ' -----')
 
-    cpacs_path = os.path.join(MODULE_DIR,'ToolInput','ToolInput.xml')
-    cpacs_out_path = os.path.join(MODULE_DIR,'ToolOutput','ToolOutput.xml')
+    cpacs_path = get_toolinput_file_path('CPACS2SUMO')
+    cpacs_out_path = get_tooloutput_file_path('CPACS2SUMO')
 
     convert_cpacs_to_sumo(cpacs_path, cpacs_out_path)
 
@@ -23,9 +23,11 @@ TODO:
 
 import os
 import sys
+import ast
 import math
 import numpy
 import matplotlib
+import xml.etree.ElementTree as ET
 
 from tixi3 import tixi3wrapper
 from tigl3 import tigl3wrapper
@@ -44,17 +46,238 @@ log = get_logger(__file__.split('.')[0])
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 MODULE_NAME = os.path.basename(os.getcwd())
 
+# Objects from which the set commands start, and the CPACS subtree they modify
+# (relative to the aircraft model)
+COMMAND_ROOTS = {'wings': (lambda aircraft: aircraft.get_wings(), 'wings'),
+                 'fuselage': (lambda aircraft: aircraft.get_fuselages().get_fuselage(1), 'fuselages')}
+
+# Constructors which can be used in the arguments of a set command
+COMMAND_CONSTRUCTORS = {'geometry.CTiglPoint': geometry.CTiglPoint}
+
 
 #==============================================================================
 #   CLASSES
 #==============================================================================
 
+class SetCommand():
+    """Class to apply a set command (e.g. 'wings.get_wing(1).set_sweep(var)')
+
+    The command is parsed once, without 'eval'. It must be a chain of method
+    calls (with constant arguments) from one of the 'COMMAND_ROOTS' and end
+    with the call of a setter whose arguments can be numbers, the variable
+    or 'COMMAND_CONSTRUCTORS'. The object of the setter is resolved once, when
+    the command is bound to an aircraft.
+
+    Attributes:
+        command (str): Command as written in the variable file
+        var_name (str): Name of the variable used in the command
+        root (str): Name of the object the command starts from
+
+    """
+
+    def __init__(self, command, var_name):
+
+        self.command = command.strip()
+        self.var_name = var_name
+
+        try:
+            node = ast.parse(self.command, mode='eval').body
+        except SyntaxError:
+            raise ValueError('Command "' + command + '" is not valid!')
+
+        if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute) \
+                or node.keywords:
+            raise ValueError('Command "' + command + '" must be a setter call!')
+
+        self.root, self._steps = self._compile_chain(node.func.value)
+        self._setter_name = node.func.attr
+        self._args = [self._compile_arg(arg) for arg in node.args]
+        self._setter = None
+
+    def _compile_chain(self, node):
+        """Get the root name and the (method, arguments) steps of a call chain"""
+
+        if isinstance(node, ast.Name):
+            if node.id not in COMMAND_ROOTS:
+                raise ValueError('"' + node.id + '" is not a valid object in command "'
+                                 + self.command + '", use ' + ', '.join(COMMAND_ROOTS))
+            return node.id, []
+
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) \
+                and not node.keywords:
+            root, steps = self._compile_chain(node.func.value)
+            literals = [get_literal(arg) for arg in node.args]
+            if not all(is_literal for is_literal, _ in literals):
+                raise ValueError('Only constant arguments are allowed before the setter in '
+                                 'command "' + self.command + '"')
+            return root, steps + [(node.func.attr, [value for _, value in literals])]
+
+        raise ValueError('Command "' + self.command + '" is not a chain of method calls!')
+
+    def _compile_arg(self, node):
+        """Get a function which computes an argument of the setter from the value"""
+
+        is_literal, literal = get_literal(node)
+        if is_literal and isinstance(literal, (int, float)):
+            return lambda value: literal
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            operand = self._compile_arg(node.operand)
+            return lambda value: -operand(value)
+
+        if isinstance(node, ast.Name) and node.id == self.var_name:
+            return lambda value: value
+
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) \
+                and isinstance(node.func.value, ast.Name) and not node.keywords:
+            name = node.func.value.id + '.' + node.func.attr
+            if name in COMMAND_CONSTRUCTORS:
+                constructor = COMMAND_CONSTRUCTORS[name]
+                args = [self._compile_arg(arg) for arg in node.args]
+                return lambda value: constructor(*[arg(value) for arg in args])
+
+        raise ValueError('Only numbers, "' + self.var_name + '" and '
+                         + ', '.join(COMMAND_CONSTRUCTORS) + ' are allowed as arguments '
+                         'of the setter in command "' + self.command + '"')
+
+    def bind(self, aircraft):
+        """ Resolve the object of the setter on a TIGL aircraft configuration """
+
+        obj = COMMAND_ROOTS[self.root][0](aircraft)
+        for method, args in self._steps:
+            obj = getattr(obj, method)(*args)
+
+        self._setter = getattr(obj, self._setter_name)
+
+    def apply(self, value):
+        """ Call the setter with the value of the variable """
+
+        if self._setter is None:
+            raise ValueError('Command "' + self.command + '" is not bound to an aircraft!')
+
+        self._setter(*[arg(value) for arg in self._args])
+
+
+class CPACSUpdatePlan():
+    """Class to update the design variables of a CPACS file at each iteration
+
+    The set commands of the variables are parsed once and bound to the TIGL
+    objects of a persistent TIXI/TIGL handle, opened on the first CPACS file.
+    At each iteration, the setters are applied to these objects (TIGL only
+    invalidates the geometry of the modified components), the aircraft is
+    written back once and the modified component subtrees and XPath variables
+    are updated in the CPACS file of the iteration.
+
+    Attributes:
+        commands (list): (variable name, SetCommand) of the TIGL variables
+        xpaths (dict): XPath of the variables which are set directly
+
+    """
+
+    def __init__(self, optim_var_dict):
+
+        self.commands = []
+        self.xpaths = {}
+
+        for name, (val_type, listval, minval, maxval, getcommand, setcommand) in optim_var_dict.items():
+            if val_type != 'des' or listval[0] in ['-', 'True', 'False']:
+                continue
+            if setcommand in ['-', '']:
+                self.xpaths[name] = getcommand
+            else:
+                for command in setcommand.split(';'):
+                    if command.strip():
+                        self.commands.append((name, SetCommand(command, name)))
+
+        self._tixi = None
+        self._tigl = None
+        self._aircraft = None
+
+    def _open(self, cpacs_path):
+        """ Open the persistent handles and bind the set commands """
+
+        self._tixi = cpsf.open_tixi(cpacs_path)
+        self._tigl = cpsf.open_tigl(self._tixi)
+        self._aircraft = get_aircraft(self._tigl)
+
+        for name, command in self.commands:
+            command.bind(self._aircraft)
+
+    def update_cpacs_file(self, cpacs_path, cpacs_out_path, values):
+        """ Write a CPACS file with new values of the design variables
+
+        Args:
+            cpacs_path (str): Path to CPACS file to update
+            cpacs_out_path (str): Path to the updated CPACS file
+            values (dict): New value of each design variable
+        """
+
+        subtree_list = []
+        if self.commands:
+            if self._aircraft is None:
+                self._open(cpacs_path)
+
+            for name, command in self.commands:
+                command.apply(float(values[name]))
+
+            # Single write back of the aircraft in the persistent TIXI handle
+            uid = self._aircraft.get_uid()
+            self._aircraft.write_cpacs(uid)
+            geom_xml = self._tixi.exportDocumentAsString()
+
+            model_path = "vehicles/aircraft/model[@uID='{}']".format(uid)
+            for root in sorted({command.root for name, command in self.commands}):
+                subtree_list.append((model_path, COMMAND_ROOTS[root][1]))
+        else:
+            geom_xml = None
+
+        xpath_values = {xpath: values[name] for name, xpath in self.xpaths.items()}
+
+        merge_geometry(cpacs_path, cpacs_out_path, geom_xml, subtree_list, xpath_values)
+
+    def close(self):
+        """ Close the persistent TIXI/TIGL handles """
+
+        if self._tigl is not None:
+            self._tigl.close()
+            self._tixi.close()
+
+        self._tixi = None
+        self._tigl = None
+        self._aircraft = None
+
 
 
 #==============================================================================
 #   FUNCTIONS
 #==============================================================================
 
+def get_literal(node):
+    """ Get the value of a literal (number or string) of a command
+
+    Python < 3.8 parses the literals as 'ast.Num' and 'ast.Str' nodes instead
+    of 'ast.Constant'.
+
+    Args:
+        node (ast.AST): Node of the parsed command
+
+    Returns:
+        is_literal (bool): True if the node is a literal
+        value (int, float or str): Value of the literal, None otherwise
+    """
+
+    if sys.version_info < (3, 8):
+        if isinstance(node, ast.Num):
+            return True, node.n
+        if isinstance(node, ast.Str):
+            return True, node.s
+
+    if isinstance(node, ast.Constant):
+        return True, node.value
+
+    return False, None
+
+
 def get_aircraft(tigl):
     """ Maybe this function could be integrate in cpacsfunctions.py"""
 
@@ -76,14 +299,55 @@ def save_aircraft(tixi, aircraft, filename):
     text_file.close()
 
 
+def merge_geometry(cpacs_path, cpacs_out_path, geom_xml, subtree_list, xpath_values):
+    """ Write a CPACS file with subtrees of another CPACS and new values
+
+    Args:
+        cpacs_path (str): Path to the CPACS file to update
+        cpacs_out_path (str): Path to the updated CPACS file
+        geom_xml (str): CPACS (as string) which contains the new subtrees
+        subtree_list (list): (parent path, tag) of the subtrees to replace,
+                             paths are relative to the root '/cpacs'
+        xpath_values (dict): New value of elements, by XPath
+    """
+
+    tree = ET.parse(cpacs_path)
+    root = tree.getroot()
+
+    if subtree_list:
+        geom_root = ET.fromstring(geom_xml)
+
+    for parent_path, tag in subtree_list:
+        parent = root.find(parent_path)
+        new_elem = geom_root.find(parent_path + '/' + tag)
+        if parent is None or new_elem is None:
+            raise ValueError('"' + parent_path + '/' + tag + '" not found in the CPACS file!')
+
+        old_elem = parent.find(tag)
+        if old_elem is None:
+            parent.append(new_elem)
+        else:
+            new_elem.tail = old_elem.tail
+            parent[list(parent).index(old_elem)] = new_elem
+
+    for xpath, value in xpath_values.items():
+        if not xpath.startswith('/cpacs/'):
+            raise ValueError('XPath "' + xpath + '" must start with "/cpacs/"!')
+        elem = root.find(xpath[len('/cpacs/'):])
+        if elem is None:
+            raise ValueError('"' + xpath + '" not found in the CPACS file!')
+        elem.text = str(value)
+
+    tree.write(cpacs_out_path, encoding='utf-8', xml_declaration=True)
+
+
 def update_cpacs_file(cpacs_path, cpacs_out_path, optim_var_dict):
     """Function to update a CPACS file with value from the optimiser
 
-    This function sets the new values of the design variables given by
-    the routine driver to the CPACS file, using the Tigl and Tixi handler.
-
-    Source:
-        * See CPACSCreator api function,
+    This function sets the new values (last value of each list) of the design
+    variables given by the routine driver to the CPACS file. To update the
+    CPACS file at each iteration, use a 'CPACSUpdatePlan' which is set up
+    only once.
 
     Args:
         cpacs_path (str): Path to CPACS file to update
@@ -93,54 +357,13 @@ def update_cpacs_file(cpacs_path, cpacs_out_path, optim_var_dict):
 
     """
 
-    tixi = cpsf.open_tixi(cpacs_path)
-    tigl = cpsf.open_tigl(tixi)
-
-    aircraft = get_aircraft(tigl)
-    # help(aircraft)
-
-    wings = aircraft.get_wings()
-    # help(wings)
-
-    fuselage = aircraft.get_fuselages().get_fuselage(1)
-    # help(fuselage)
-
-    # Other functions which could be useful
-
-    # help(wings.get_wing(1).get_section(1))
-    # uid = wings.get_wing(1).get_section(2).get_uid()
-    # help(wings.get_wing(1).get_positioning_transformation(uid))
-    # wings.get_wing(1).get_section(2).set_rotation(geometry.CTiglPoint(40,40,-4))
-    # airfoil = wings.get_wing(1).get_section(1).get_section_element(1).get_airfoil_uid()
-    # help(airfoil)
-    # wings.get_wing(1).get_section(1).get_section_element(1).set_airfoil_uid('NACA0006')
-    # scal = wings.get_wing(1).get_section(1).get_section_element(1).get_scaling()
-    # help(wings.get_wing(1).get_section(2))
-
-    # Perform update of all the variable contained in 'optim_var_dict'
-    for name, (val_type, listval, minval, maxval, getcommand, setcommand) in optim_var_dict.items():
-        if val_type == 'des' and listval[0] not in ['-', 'True', 'False']:
-            if setcommand not in ['-', '']:
-                # Define variable (var1,var2,..)
-                locals()[str(name)] = listval[-1]
-                log.info(listval[-1])
-
-                # Execute the command coresponding to the variable
-                if ';' in setcommand: # if more than one command on the line
-                    command_split = setcommand.split(';')
-                    for setcommand in command_split:
-                        eval(setcommand)
-                else:
-                    eval(setcommand)
-            else:
-                xpath = getcommand
-                tixi.updateTextElement(xpath, str(listval[-1]))
-    aircraft.write_cpacs(aircraft.get_uid())
-    tigl.close()
-    cpsf.close_tixi(tixi, cpacs_out_path)
-
-    #or
-    # save_aircraft(tixi,aircraft,'test.xml')
+    plan = CPACSUpdatePlan(optim_var_dict)
+    values = {name: listval[-1] for name, (val_type, listval, minval, maxval,
+                                           getcommand, setcommand) in optim_var_dict.items()}
+    try:
+        plan.update_cpacs_file(cpacs_path, cpacs_out_path, values)
+    finally:
+        plan.close()
 
 
 #==============================================================================
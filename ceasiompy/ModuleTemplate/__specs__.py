@@ -13,6 +13,13 @@ RCE = {
     "email": "neil@nasa.gov",
 }
 
+# ===== In-process execution =====
+
+# * If the module can be run by a single function which takes the input and
+# * output CPACS paths (and only read/write CPACS with 'open_tixi'/'close_tixi'),
+# * it can be declared here, 'run_subworkflow' will then run it in-process
+# MAIN_FUNCTION = 'moduletemplate.my_main_function'
+
 # ===== CPACS inputs and outputs =====
 
 cpacs_inout = CPACSInOut()
@@ -49,7 +49,7 @@ cpacs_inout.add_input(
 cpacs_inout.add_input(
     var_name='Driver',
     var_type=list,
-    default_value=['COBYLA'],
+    default_value=['COBYLA','SLSQP','SurrogateEI'],
     unit='-',
     descr='Choose the driver to run the routine with',
     xpath=CEASIOM_XPATH+'/Optimisation/parameters/driver',
@@ -128,6 +128,78 @@ cpacs_inout.add_input(
     gui_group='DoE settings (if required)'
 )
 
+cpacs_inout.add_input(
+    var_name='doe_nb_proc',
+    var_type=int,
+    default_value=1,
+    unit='-',
+    descr='Number of processes used to evaluate DoE samples at the same time',
+    xpath=CEASIOM_XPATH+'/Optimisation/parameters/DoE/nbProc',
+    gui=include_gui,
+    gui_name='Nb of processes',
+    gui_group='DoE settings (if required)'
+)
+
+cpacs_inout.add_input(
+    var_name='grad_nb_proc',
+    var_type=int,
+    default_value=1,
+    unit='-',
+    descr='Number of processes used to evaluate the finite-difference gradient',
+    xpath=CEASIOM_XPATH+'/Optimisation/parameters/gradient/nbProc',
+    gui=include_gui,
+    gui_name='Nb of processes',
+    gui_group='Gradient settings (if required)'
+)
+
+cpacs_inout.add_input(
+    var_name='fd_step',
+    var_type=float,
+    default_value=1e-3,
+    unit='-',
+    descr='Relative step of the finite differences',
+    xpath=CEASIOM_XPATH+'/Optimisation/parameters/gradient/fdStep',
+    gui=include_gui,
+    gui_name='Step',
+    gui_group='Gradient settings (if required)'
+)
+
+cpacs_inout.add_input(
+    var_name='fd_form',
+    var_type=list,
+    default_value=['forward','central'],
+    unit='-',
+    descr='Forward (one evaluation per variable) or central (two evaluations per variable) differences',
+    xpath=CEASIOM_XPATH+'/Optimisation/parameters/gradient/fdForm',
+    gui=include_gui,
+    gui_name='Finite differences',
+    gui_group='Gradient settings (if required)'
+)
+
+cpacs_inout.add_input(
+    var_name='sbo_history',
+    var_type='pathtype',
+    default_value='-',
+    unit='-',
+    descr='Variable history (CSV) of a previous routine used as initial samples of the surrogates',
+    xpath=CEASIOM_XPATH+'/Optimisation/parameters/surrogate/historyPath',
+    gui=include_gui,
+    gui_name='Initial variable history',
+    gui_group='Surrogate settings (if required)'
+)
+
+cpacs_inout.add_input(
+    var_name='sbo_initial_nb',
+    var_type=int,
+    default_value=10,
+    unit='-',
+    descr='Number of initial samples evaluated with the modules before the infill points',
+    xpath=CEASIOM_XPATH+'/Optimisation/parameters/surrogate/initialSampleNB',
+    gui=include_gui,
+    gui_name='Nb of initial samples',
+    gui_group='Surrogate settings (if required)'
+)
+
 cpacs_inout.add_input(
     var_name='Configuration file path',
     var_type='pathtype',
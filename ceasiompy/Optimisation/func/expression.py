@@ -0,0 +1,160 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Compiler of the objective and constraint expressions of the optimisation.
+
+An expression (e.g. 'cl/cd' or '-mtom+range') is parsed once and can then be
+evaluated at each iteration or on the whole history of a DoE, with NumPy
+arrays as variables. Only arithmetic operations, numbers, variable names and
+a few mathematical functions are allowed.
+
+Python version: >=3.6
+
+| Author: agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+"""
+
+# =============================================================================
+#   IMPORTS
+# =============================================================================
+
+import os
+import sys
+import ast
+
+import numpy as np
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+
+log = get_logger(__file__.split('.')[0])
+
+# Functions which can be used in an expression
+FUNCTIONS = {'abs': np.abs, 'sqrt': np.sqrt, 'exp': np.exp, 'log': np.log,
+             'sin': np.sin, 'cos': np.cos, 'tan': np.tan}
+
+# Literals, Python < 3.8 parses the numbers as 'ast.Num' instead of 'ast.Constant'
+LITERAL_NODES = (ast.Constant, ast.Num) if sys.version_info < (3, 8) else (ast.Constant,)
+
+# Syntax elements which are allowed in an expression
+ALLOWED_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name,
+                 ast.Load, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow,
+                 ast.USub, ast.UAdd) + LITERAL_NODES
+
+
+# =============================================================================
+#   CLASSES
+# =============================================================================
+
+class Expression():
+    """Class to evaluate an objective or constraint expression.
+
+    The expression is parsed and checked when the object is created, it is
+    then evaluated by calling the object with the values of its variables.
+
+    Attributes:
+        expression (str): Expression as given by the user, e.g. 'cl/cd'
+        variables (list): Names of the variables of the expression, in order
+                          of appearance
+
+    """
+
+    def __init__(self, expression):
+
+        self.expression = expression.strip()
+
+        try:
+            tree = ast.parse(self.expression, mode='eval')
+        except SyntaxError:
+            raise ValueError('Expression "' + expression + '" is not valid!')
+
+        self.variables = []
+        for node in ast.walk(tree):
+            if not isinstance(node, ALLOWED_NODES):
+                raise ValueError('"' + type(node).__name__ + '" is not allowed '
+                                 'in expression "' + expression + '"')
+            if isinstance(node, LITERAL_NODES) and not isinstance(
+                    node.value if isinstance(node, ast.Constant) else node.n, (int, float)):
+                raise ValueError('Only numbers are allowed as constants in '
+                                 'expression "' + expression + '"')
+            if isinstance(node, ast.Call):
+                if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS \
+                        or node.keywords or len(node.args) != 1:
+                    raise ValueError('Only the functions ' + ', '.join(FUNCTIONS)
+                                     + ' (with one argument) are allowed in '
+                                     'expression "' + expression + '"')
+
+        func_names = [node.func.id for node in ast.walk(tree) if isinstance(node, ast.Call)]
+        name_list = sorted((node for node in ast.walk(tree) if isinstance(node, ast.Name)),
+                           key=lambda node: node.col_offset)
+        for node in name_list:
+            if node.id not in func_names and node.id not in self.variables:
+                self.variables.append(node.id)
+
+        self._code = compile(tree, '<' + self.expression + '>', 'eval')
+
+    def __repr__(self):
+        return 'Expression(' + repr(self.expression) + ')'
+
+    def __call__(self, values):
+        """ Evaluate the expression
+
+        Args:
+            values (dict): Values of the variables (float or array), any object
+                           with a 'values[name]' access can be used (e.g. a
+                           DataFrame with the variables as columns)
+
+        Returns:
+            result (float or array): Value of the expression, an array if
+                                     the variables are arrays
+        """
+
+        namespace = dict(FUNCTIONS)
+        for name in self.variables:
+            try:
+                namespace[name] = np.asarray(values[name], dtype=np.float64)
+            except KeyError:
+                raise ValueError('No value given for the variable "' + name
+                                 + '" of expression "' + self.expression + '"')
+
+        return eval(self._code, {'__builtins__': {}}, namespace)
+
+
+# =============================================================================
+#   FUNCTIONS
+# =============================================================================
+
+def get_variables(expression_list):
+    """Get the names of the variables used in a list of expressions.
+
+    Args:
+        expression_list (list): Expressions (str or Expression), or a single
+                                expression
+
+    Returns:
+        variables (list): Names of the variables, without duplicates
+
+    """
+
+    if isinstance(expression_list, (str, Expression)):
+        expression_list = [expression_list]
+
+    variables = []
+    for expr in expression_list:
+        if not isinstance(expr, Expression):
+            expr = Expression(expr)
+        variables.extend([v for v in expr.variables if v not in variables])
+
+    return variables
+
+
+# =============================================================================
+#    MAIN
+# =============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Nothing to execute!')
@@ -0,0 +1,230 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Compressed archive of the CPACS files of the iterations of a routine.
+
+The first CPACS file added to the archive is stored once as the baseline. For
+each iteration, only the values of the design variables and the XML subtrees
+which differ from the baseline are stored. The full CPACS file of any
+iteration can be extracted from the archive.
+
+Usage to extract an iteration:
+
+    python geometryarchive.py <archive path> <iteration> <output CPACS path>
+
+Python version: >=3.6
+
+| Author: agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+"""
+
+# =============================================================================
+#   IMPORTS
+# =============================================================================
+
+import os
+import sys
+import copy
+import json
+import zipfile
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+
+log = get_logger(__file__.split('.')[0])
+
+# No file locking on Windows, the archive must then be written by one process
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+BASELINE_NAME = 'baseline.xml'
+
+
+# =============================================================================
+#   CLASSES
+# =============================================================================
+
+class GeometryArchive():
+    """Class to store the CPACS files of the iterations of a routine.
+
+    The archive is a ZIP file (deflate compression) which contains the
+    baseline CPACS file and one entry 'iter_<N>.json' per iteration with the
+    design variables and the changed subtrees. Iterations can be added by
+    several processes at the same time (the archive is locked, except on
+    Windows). 'close' removes the lock file once the archive is complete.
+
+    Attributes:
+        archive_path (str): Path to the archive file
+
+    """
+
+    def __init__(self, archive_path):
+
+        self.archive_path = archive_path
+
+        # Parsed baseline, only read once per process
+        self._baseline = None
+
+    @contextmanager
+    def _lock(self):
+        """Lock the archive for the other processes"""
+
+        if fcntl is None:
+            yield
+            return
+
+        with open(self.archive_path + '.lock', 'w') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def close(self):
+        """ Remove the lock file, when no other process uses the archive """
+
+        lock_path = self.archive_path + '.lock'
+        if os.path.isfile(lock_path):
+            os.remove(lock_path)
+
+    def _get_baseline(self, archive):
+        """Get the root element of the baseline CPACS file"""
+
+        if self._baseline is None:
+            self._baseline = ET.fromstring(archive.read(BASELINE_NAME))
+
+        return self._baseline
+
+    def add(self, iteration, cpacs_path, design_vars=None):
+        """ Add the CPACS file of an iteration to the archive
+
+        Args:
+            iteration (int): Number of the iteration
+            cpacs_path (str): Path to the CPACS file of the iteration
+            design_vars (dict): Values of the design variables
+        """
+
+        if design_vars is None:
+            design_vars = {}
+
+        with self._lock(), zipfile.ZipFile(self.archive_path, 'a', zipfile.ZIP_DEFLATED) as archive:
+
+            if BASELINE_NAME not in archive.namelist():
+                archive.write(cpacs_path, BASELINE_NAME)
+
+            changes = []
+            get_changes(self._get_baseline(archive), ET.parse(cpacs_path).getroot(), [], changes)
+
+            entry = {'iteration': iteration,
+                     'design_variables': design_vars,
+                     'changes': [{'path': path, 'xml': ET.tostring(elem, encoding='unicode')}
+                                 for path, elem in changes]}
+            archive.writestr('iter_{}.json'.format(iteration), json.dumps(entry))
+
+        log.info('Iteration {} archived ({} changed subtrees)'.format(iteration, len(changes)))
+
+    def _read_entry(self, iteration):
+        """Read the entry of an iteration"""
+
+        with self._lock(), zipfile.ZipFile(self.archive_path, 'r') as archive:
+            try:
+                entry = json.loads(archive.read('iter_{}.json'.format(iteration)))
+            except KeyError:
+                raise ValueError('Iteration {} is not in the archive "{}"!'
+                                 .format(iteration, self.archive_path))
+            baseline = self._get_baseline(archive)
+
+        return entry, baseline
+
+    def get_iterations(self):
+        """ Get the list of the iterations in the archive """
+
+        if not os.path.isfile(self.archive_path):
+            return []
+
+        with self._lock(), zipfile.ZipFile(self.archive_path, 'r') as archive:
+            name_list = archive.namelist()
+
+        return sorted(int(name[5:-5]) for name in name_list
+                      if name.startswith('iter_') and name.endswith('.json'))
+
+    def get_design_vars(self, iteration):
+        """ Get the values of the design variables of an iteration """
+
+        entry, _ = self._read_entry(iteration)
+
+        return entry['design_variables']
+
+    def extract(self, iteration, cpacs_path_out):
+        """ Write the full CPACS file of an iteration
+
+        Args:
+            iteration (int): Number of the iteration
+            cpacs_path_out (str): Path to the CPACS file to write
+        """
+
+        entry, baseline = self._read_entry(iteration)
+
+        root = copy.deepcopy(baseline)
+        for change in entry['changes']:
+            elem = ET.fromstring(change['xml'])
+            path = change['path']
+            if not path:
+                root = elem
+                continue
+            parent = root
+            for index in path[:-1]:
+                parent = parent[index]
+            elem.tail = parent[path[-1]].tail
+            parent[path[-1]] = elem
+
+        ET.ElementTree(root).write(cpacs_path_out, encoding='utf-8', xml_declaration=True)
+
+
+# =============================================================================
+#   FUNCTIONS
+# =============================================================================
+
+def get_changes(base, new, path, changes):
+    """ Find the subtrees of 'new' which differ from 'base'
+
+    Elements with a different tag, attributes, text or number of children are
+    replaced as a whole, otherwise their children are compared. Whitespaces
+    around the texts are not compared.
+
+    Args:
+        base (Element): Element of the baseline
+        new (Element): Element at the same position in the new tree
+        path (list): Indices of the children from the root to 'base'
+        changes (list): List where the (path, new element) are appended
+    """
+
+    if base.tag != new.tag or base.attrib != new.attrib or len(base) != len(new) \
+            or (base.text or '').strip() != (new.text or '').strip():
+        changes.append((path, new))
+        return
+
+    for index, (base_child, new_child) in enumerate(zip(base, new)):
+        get_changes(base_child, new_child, path + [index], changes)
+
+
+# =============================================================================
+#    MAIN
+# =============================================================================
+
+if __name__ == '__main__':
+
+    if len(sys.argv) != 4:
+        log.info('Usage: python geometryarchive.py <archive path> <iteration> <output CPACS path>')
+    else:
+        archive = GeometryArchive(sys.argv[1])
+        archive.extract(int(sys.argv[2]), sys.argv[3])
+        archive.close()
+        log.info('Iteration ' + sys.argv[2] + ' extracted to ' + sys.argv[3])
@@ -0,0 +1,192 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Functions of the surrogate-based optimisation: Kriging surrogates of the
+objective and constraints, and choice of the infill points (the points where
+the modules are run) by expected improvement.
+
+Python version: >=3.6
+
+| Author: agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+"""
+
+# =============================================================================
+#   IMPORTS
+# =============================================================================
+
+import os
+import sys
+
+import numpy as np
+import smt.surrogate_models as sms
+from scipy.optimize import minimize
+from scipy.stats import norm
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+
+log = get_logger(__file__.split('.')[0])
+
+# Number of random candidates (per dimension) and of local refinements used to
+# maximise the infill criterion
+CANDIDATE_NB = 500
+REFINE_NB = 5
+
+# Bounds of the hyperparameters used as initial values of the Kriging models
+THETA_BOUNDS = (1e-5, 19.0)
+
+
+# =============================================================================
+#   CLASSES
+# =============================================================================
+
+
+# =============================================================================
+#   FUNCTIONS
+# =============================================================================
+
+def fit_surrogate(x, y, theta0=None):
+    """Train a Kriging surrogate on the evaluated points.
+
+    The hyperparameters found for the previous surrogate can be given as
+    'theta0', so the surrogate is refitted faster when points are added.
+
+    Args:
+        x (array): np.ndarray(n, nx) Evaluated points
+        y (array): Values of the function at these points
+        theta0 (array): Initial hyperparameters of the Kriging model
+
+    Returns:
+        sm (KRG object): Trained surrogate model
+
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64).reshape(-1, 1)
+
+    if theta0 is None:
+        theta0 = [1e-2]*x.shape[1]
+
+    # Previous hyperparameters may be on the bounds of the KRG optimisation
+    theta0 = np.clip(theta0, THETA_BOUNDS[0], THETA_BOUNDS[1])
+
+    sm = sms.KRG(theta0=list(theta0), print_global=False)
+    sm.set_training_values(x, y)
+    sm.train()
+
+    return sm
+
+
+def _predict(sm, x):
+    """Mean and standard deviation of the prediction of a surrogate."""
+
+    mean = sm.predict_values(x).ravel()
+    std = np.sqrt(np.maximum(sm.predict_variances(x).ravel(), 0.0))
+
+    return mean, std
+
+
+def expected_improvement(sm, x, y_min):
+    """Expected improvement of the points 'x' over the best value 'y_min'.
+
+    Args:
+        sm (object): Surrogate model of the function to minimise
+        x (array): np.ndarray(n, nx) Points
+        y_min (float): Best value found so far
+
+    Returns:
+        ei (array): Expected improvement of each point
+
+    """
+    mean, std = _predict(sm, x)
+
+    ei = np.zeros(len(mean))
+    pos = std > 0.0
+    z = (y_min - mean[pos]) / std[pos]
+    ei[pos] = (y_min - mean[pos]) * norm.cdf(z) + std[pos] * norm.pdf(z)
+
+    return ei
+
+
+def feasibility_probability(sm, x, lower, upper):
+    """Probability that a constraint is satisfied at the points 'x'.
+
+    Args:
+        sm (object): Surrogate model of the constraint
+        x (array): np.ndarray(n, nx) Points
+        lower (float): Lower bound of the constraint
+        upper (float): Upper bound of the constraint
+
+    Returns:
+        pof (array): Probability of feasibility of each point
+
+    """
+    mean, std = _predict(sm, x)
+
+    pof = ((mean >= lower) & (mean <= upper)).astype(np.float64)
+    pos = std > 0.0
+    pof[pos] = norm.cdf((upper - mean[pos]) / std[pos]) \
+               - norm.cdf((lower - mean[pos]) / std[pos])
+
+    return pof
+
+
+def get_infill_point(obj_sm, y_min, xlimits, const_list=None, rng=None):
+    """Find the point which maximises the infill criterion.
+
+    The criterion is the expected improvement of the objective times the
+    probability of feasibility of each constraint. It is evaluated on random
+    candidates in the design space, the best ones are then refined with a
+    local optimiser.
+
+    Args:
+        obj_sm (object): Surrogate model of the objective (to minimise)
+        y_min (float): Best (feasible) value of the objective found so far
+        xlimits (array): np.ndarray(nx, 2) Bounds of the design space
+        const_list (list): (surrogate model, lower, upper) of each constraint
+        rng (Generator object): Random generator of the candidates
+
+    Returns:
+        x_best (array): Infill point
+        crit_best (float): Value of the infill criterion at this point
+
+    """
+    xlimits = np.asarray(xlimits, dtype=np.float64)
+    if const_list is None:
+        const_list = []
+    if rng is None:
+        rng = np.random.default_rng()
+
+    def criterion(x):
+        x = np.atleast_2d(x)
+        crit = expected_improvement(obj_sm, x, y_min)
+        for sm, lower, upper in const_list:
+            crit *= feasibility_probability(sm, x, lower, upper)
+        return crit
+
+    candidates = rng.uniform(xlimits[:,0], xlimits[:,1],
+                             (CANDIDATE_NB*len(xlimits), len(xlimits)))
+    crit = criterion(candidates)
+
+    x_best = candidates[np.argmax(crit)]
+    crit_best = crit.max()
+    for x0 in candidates[np.argsort(crit)[-REFINE_NB:]]:
+        res = minimize(lambda x: -criterion(x)[0], x0, method='L-BFGS-B',
+                       bounds=xlimits)
+        if -res.fun > crit_best:
+            x_best = np.clip(res.x, xlimits[:,0], xlimits[:,1])
+            crit_best = -res.fun
+
+    return x_best, crit_best
+
+
+# =============================================================================
+#    MAIN
+# =============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Nothing to execute!')
@@ -21,12 +21,16 @@ TODO
 #==============================================================================
 #   IMPORTS
 #==============================================================================
+import os
+
 import numpy as np
 import openmdao.api as om
 import matplotlib.pyplot as plt
 import pandas as pd
 import tigl3.configuration
 
+import ceasiompy.Optimisation.func.expression as expr
+
 from ceasiompy.utils.ceasiomlogger import get_logger
 
 log = get_logger(__file__.split('.')[0])
@@ -35,10 +39,140 @@ log = get_logger(__file__.split('.')[0])
 #   GLOBALS
 #==============================================================================
 
+# Name of the index column of 'Variable_history.csv'
+HISTORY_INDEX_NAME = 'Name'
+
 #==============================================================================
 #   CLASSES
 #==============================================================================
 
+class ResultReader():
+    """Class to read the driver recorder of a routine incrementally.
+
+    Each update only reads the cases recorded since the previous one and
+    stores their values in preallocated arrays, so the results of a routine
+    can be followed while it is running without reading the whole recorder
+    again.
+
+    Attributes:
+        recorder_path (str): Path to the SQL file of the driver recorder
+        case_nb (int): Number of cases read
+
+    """
+
+    def __init__(self, optim_dir_path, recorder_name='Driver_recorder.sql'):
+
+        self.recorder_path = os.path.join(optim_dir_path, recorder_name)
+        self.case_nb = 0
+
+        self._case_reader = None
+        self._capacity = 0
+        self._types = {}
+        self._buffers = {}
+
+    def _get_new_cases(self):
+        """Get the id of the driver cases recorded since the last update"""
+
+        if not os.path.isfile(self.recorder_path):
+            return []
+
+        # A CaseReader only knows the cases recorded when it is created, the
+        # cases are not preloaded, only those which are needed are read
+        self._case_reader = om.CaseReader(self.recorder_path, pre_load=False)
+        try:
+            case_list = self._case_reader.list_cases('driver', recurse=False,
+                                                     out_stream=None)
+        except TypeError:
+            # Older OpenMDAO versions have no 'out_stream' argument
+            case_list = self._case_reader.list_cases('driver', recurse=False)
+
+        return case_list[self.case_nb:]
+
+    def _reserve(self, case_nb):
+        """Grow the buffers (geometrically) to store 'case_nb' cases"""
+
+        if case_nb <= self._capacity:
+            return
+
+        self._capacity = max(case_nb, 2*self._capacity, 16)
+        for name, buffer in self._buffers.items():
+            new_buffer = np.full((self._capacity, buffer.shape[1]), np.nan)
+            new_buffer[:self.case_nb] = buffer[:self.case_nb]
+            self._buffers[name] = new_buffer
+
+    def _store(self, name, var_type, value):
+        """Store the value of a variable for the current case"""
+
+        value = np.ravel(value)
+        if name not in self._buffers:
+            self._types[name] = var_type
+            self._buffers[name] = np.full((self._capacity, value.size), np.nan)
+
+        self._buffers[name][self.case_nb] = value
+
+    def update(self):
+        """Read the cases recorded since the last update.
+
+        Returns:
+            new_case_nb (int): Number of new cases
+
+        """
+        case_list = self._get_new_cases()
+        if not case_list:
+            return 0
+
+        self._reserve(self.case_nb + len(case_list))
+
+        for case_id in case_list:
+            case = self._case_reader.get_case(case_id)
+
+            for key, val in case.get_objectives().items():
+                self._store(key.replace('objective.',''), 'obj', val)
+            for key, val in case.get_design_vars().items():
+                self._store(key.replace('indeps.',''), 'des', val)
+            for key, val in case.get_constraints().items():
+                if 'const' in key:
+                    self._store(key.replace('const.',''), 'const', val)
+
+            self.case_nb += 1
+
+        return len(case_list)
+
+    @property
+    def values(self):
+        """Live view of the values of each variable, np.ndarray(case_nb, size)"""
+
+        return {name: buffer[:self.case_nb] for name, buffer in self._buffers.items()}
+
+    def to_dataframe(self):
+        """Get the values as a DataFrame (one row per variable, one column per case)
+
+        The first column 'type' gives the type of each variable ('obj', 'des'
+        or 'const'), values of variables of size > 1 are in one row per
+        component ('name_i').
+
+        """
+        data = {}
+        var_type = []
+        for vtype in ['obj', 'des', 'const']:
+            for name, values in self.values.items():
+                if self._types[name] != vtype:
+                    continue
+                if values.shape[1] == 1:
+                    data[name] = values[:,0]
+                    var_type.append(vtype)
+                else:
+                    for i in range(values.shape[1]):
+                        data[name+'_'+str(i)] = values[:,i]
+                        var_type.append(vtype)
+
+        df = pd.DataFrame(data, index=range(self.case_nb)).transpose()
+        df.insert(0, 'type', var_type)
+
+        return df
+
+
+
 #==============================================================================
 #   FUNCTIONS
 #==============================================================================
@@ -155,55 +289,13 @@ def read_results(optim_dir_path):
         df (DataFrame) : Contains all parameters of the routine
 
     """
-    # Read recorded options
-    cr = om.CaseReader(optim_dir_path + '/Driver_recorder.sql')
-    # driver_cases = cr.list_cases('driver') (If  multiple recorders)
-
-    cases = cr.get_cases()
-
-    # Initiates dictionnaries
-    case1 = cr.get_case(0)
-    obj = {}
-    des = {}
-    const = {}
-
-    # Rename keys
-    for k, v in dict(case1.get_objectives()).items():
-        obj[k.replace('objective.','')] = v
-    for k, v in dict(case1.get_design_vars()).items():
-        des[k.replace('indeps.','')] = v
-    for k, v in dict(case1.get_constraints()).items():
-        if 'const' in k:
-            const[k.replace('const.','')] = v
-
-    # Retrieve data from SQL file
-    for case in cases:
-        for key, val in case.get_objectives().items():
-            key = key.replace('objective.','')
-            obj[key] = np.append(obj[key], val)
-
-        for key, val in case.get_design_vars().items():
-            key = key.replace('indeps.','')
-            des[key] = np.append(des[key], val)
-
-        for key, val in case.get_constraints().items():
-            if 'const' in key:
-                key = key.replace('const.','')
-                const[key] = np.append(const[key], val)
+    reader = ResultReader(optim_dir_path)
+    reader.update()
 
+    return reader.to_dataframe()
 
-    df_o = pd.DataFrame(obj).transpose()
-    df_d = pd.DataFrame(des).transpose()
-    df_c = pd.DataFrame(const).transpose()
 
-    df_o.insert(0, 'type', 'obj')
-    df_d.insert(0, 'type', 'des')
-    df_c.insert(0, 'type', 'const')
-
-    return pd.concat([df_o,df_d,df_c], axis=0)
-
-
-def save_results(optim_dir_path):
+def save_results(optim_dir_path, reader=None):
     """Save routine results to CSV.
 
     Add the variable history to the CSV paramater file and save it to the
@@ -212,6 +304,8 @@ def save_results(optim_dir_path):
 
     Args:
         optim_dir_path (str) : Path to the routine working directory.
+        reader (ResultReader) : Reader of the routine results, only the new
+        cases are read if given.
 
     Returns:
         None.
@@ -220,7 +314,10 @@ def save_results(optim_dir_path):
     log.info('Variables will be saved')
 
     # Get variable infos
-    df = read_results(optim_dir_path)
+    if reader is None:
+        reader = ResultReader(optim_dir_path)
+    reader.update()
+    df = reader.to_dataframe()
     # df = df.transpose()
 
     # # Generate dictionary with variable history
@@ -230,13 +327,45 @@ def save_results(optim_dir_path):
 
     # df = df.append(df2).transpose()
 
+    # The name of the index column marks the layout with one column per case
+    df.index.name = HISTORY_INDEX_NAME
     df.to_csv(optim_dir_path+'/Variable_history.csv', index=True, na_rep='-')
 
 
+def read_history(history_path):
+    """Read the variable history saved by a previous routine.
+
+    Read a 'Variable_history.csv' file written by 'save_results' and return
+    its values with one row per evaluation, e.g. to train surrogate models.
+    In the files written by former versions (no name for the index column),
+    the first evaluation is also in column '0', this duplicate is not read.
+
+    Args:
+        history_path (str) : Path to the CSV file.
+
+    Returns:
+        df (DataFrame) : Values of each variable (columns) at each evaluation
+        (rows), missing values are NaN.
+
+    """
+    df = pd.read_csv(history_path, index_col=0, na_values='-')
+    iter_list = [i for i in df.columns if i.isdigit()]
+
+    if df.index.name != HISTORY_INDEX_NAME and '1' in iter_list \
+            and df['0'].equals(df['1']):
+        log.info('Former layout of ' + history_path + ', the first evaluation '
+                 'is read only once.')
+        iter_list.remove('0')
+
+    df = df[iter_list].transpose().apply(pd.to_numeric, errors='coerce')
+
+    return df.reset_index(drop=True)
+
+
 ### --------------- FUNCTIONS FOR PLOTTING --------------- ###
 # -----------------------------------------------------------#
 
-def plot_results(optim_dir_path, routine_type):
+def plot_results(optim_dir_path, routine_type, reader=None):
     """Generate plots of the routine.
 
     Draw plots to vizualize the data. The evolution of each problem parameter
@@ -245,12 +374,17 @@ def plot_results(optim_dir_path, routine_type):
     Args:
         optim_dir_path (str) : Path to the routine working directory.
         routine_type (str) : Type of the routine, can be DoE or Optim
+        reader (ResultReader) : Reader of the routine results, only the new
+        cases are read if given.
 
     Returns:
         None.
 
     """
-    df = read_results(optim_dir_path)
+    if reader is None:
+        reader = ResultReader(optim_dir_path)
+    reader.update()
+    df = reader.to_dataframe()
 
     obj = [i for i in df.index if df['type'][i] == 'obj']
     des = [i for i in df.index if df['type'][i] == 'des']
@@ -359,14 +493,14 @@ def add_type(entry, outputs, objective, var):
 
     Verifies if the entry of a module is listed in its outputs. If it is the
     case it will be set as a constraint ('const') by default, except if
-    the entry is found in the expression of the objective function where it is
-    then labelled as 'obj'. Else it will be marked as a design variable as it
-    belongs to the module input.
+    the entry is a variable of the expression of an objective function where
+    it is then labelled as 'obj'. Else it will be marked as a design variable
+    as it belongs to the module input.
 
     Args:
         name (str) : Name of a variable
         outputs (lst) : List of the modules' output
-        objective (str) : Objective function
+        objective (lst) : Objective functions
         var (dct) : Variable dictionary
 
     Returns:
@@ -376,7 +510,7 @@ def add_type(entry, outputs, objective, var):
     if entry in outputs:
         if type(entry) != str:
             entry = entry.var_name
-        if entry in objective:
+        if entry in expr.get_variables(objective):
             var['type'].append('obj')
             log.info('Added type : obj')
         else:
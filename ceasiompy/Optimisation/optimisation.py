@@ -19,10 +19,14 @@ Todo:
 import os
 import sys
 import shutil
+import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 # import argparse
+import numpy as np
+import openmdao
 import openmdao.api as om
-from tigl3 import geometry # Called within eval() function
-from re import split as splt
+from openmdao.drivers.doe_generators import DOEGenerator
 
 import ceasiompy.utils.optimfunctions as opf
 import ceasiompy.utils.cpacsfunctions as cpsf
@@ -31,6 +35,9 @@ import ceasiompy.utils.moduleinterfaces as mif
 import ceasiompy.utils.workflowfunctions as wkf
 import ceasiompy.Optimisation.func.dictionnary as dct
 import ceasiompy.Optimisation.func.tools as tls
+import ceasiompy.Optimisation.func.expression as expr
+import ceasiompy.Optimisation.func.infill as ifl
+import ceasiompy.Optimisation.func.geometryarchive as gar
 import ceasiompy.CPACSUpdater.cpacsupdater as cpud
 
 from ceasiompy.utils.ceasiomlogger import get_logger
@@ -42,6 +49,28 @@ log = get_logger(__file__.split('.')[0])
 
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Result of the DoE sample evaluated in a sandbox which is being recorded by
+# the driver (see 'SampleGenerator'), None when the modules are run
+sample_result = None
+
+# Outputs of the components for the point being evaluated in a sandbox
+evaluated_outputs = {}
+
+# True in the worker processes which evaluate DoE samples or perturbed points
+# for the gradient, the geometries are only archived by the main process
+sandbox_worker = False
+
+# OpenMDAO has no public hook to replace the total derivatives computed by a
+# driver, 'ParallelGradientDriver' overrides the private 'Driver._compute_totals'.
+# It is only done for the versions whose signature of this method is known,
+# for the others the serial finite differences of the model are used.
+OM_VERSION = tuple(int(v) for v in openmdao.__version__.split('.')[:2])
+PARALLEL_TOTALS = (2, 9) <= OM_VERSION < (4, 0)
+
+# The processes which evaluate the perturbed points are forked to inherit the
+# problem at the current design point, which is not possible on Windows
+FORK_AVAILABLE = 'fork' in multiprocessing.get_all_start_methods()
+
 # =============================================================================
 #   CLASSES
 # =============================================================================
@@ -61,16 +90,23 @@ class geom_param(om.ExplicitComponent):
             if name in optim_var_dict:
                 self.add_input(name, val=listval[0])
 
+        # Set commands are parsed and bound to the geometry only once
+        self.update_plan = cpud.CPACSUpdatePlan(geom_dict)
 
     def compute(self, inputs, outputs):
         """Update the geometry of the CPACS"""
-        cpacs_path = mif.get_tooloutput_file_path(Rt.modules[-1])
-        cpacs_path_out = mif.get_toolinput_file_path(Rt.modules[0])
-
         for name, (val_type, listval, minval, maxval,
                    setcommand, getcommand) in geom_dict.items():
             listval.append(inputs[name][0])
-        cpud.update_cpacs_file(cpacs_path, cpacs_path_out, geom_dict)
+
+        if replay_outputs(self, outputs):
+            return
+
+        cpacs_path = mif.get_tooloutput_file_path(Rt.modules[-1])
+        cpacs_path_out = mif.get_toolinput_file_path(Rt.modules[0])
+
+        values = {name: inputs[name][0] for name in geom_dict}
+        self.update_plan.update_cpacs_file(cpacs_path, cpacs_path_out, values)
 
 
 class moduleComp(om.ExplicitComponent):
@@ -121,6 +157,9 @@ class moduleComp(om.ExplicitComponent):
     def compute(self, inputs, outputs):
         """Launches the module"""
 
+        if replay_outputs(self, outputs):
+            return
+
         # Updating inputs in CPACS file
         cpacs_path = mif.get_toolinput_file_path(self.module_name)
         tixi = cpsf.open_tixi(cpacs_path)
@@ -149,19 +188,20 @@ class moduleComp(om.ExplicitComponent):
             cpacs_path = mif.get_toolinput_file_path(Rt.modules[0])
         cpsf.close_tixi(tixi, cpacs_path)
 
+        store_outputs(self, outputs)
+
 
 class objective(om.ExplicitComponent):
     """Class to compute the objective function(s)"""
 
     def setup(self):
         """ Setup inputs and outputs"""
-        declared = []
+        # Objective expressions are compiled once
+        self.obj_expr = {obj: expr.Expression(obj) for obj in Rt.objective}
+
+        for var in expr.get_variables(self.obj_expr.values()):
+            self.add_input(var)
         for obj in Rt.objective:
-            var_list = splt('[+*/-]', obj)
-            for var in var_list:
-                if var not in declared:
-                    self.add_input(var)
-                    declared.append(var)
             self.add_output('Objective function '+obj)
 
 
@@ -169,27 +209,27 @@ class objective(om.ExplicitComponent):
         """Compute the objective expression"""
         global counter
         counter += 1
-        cpacs_path = mif.get_tooloutput_file_path(Rt.modules[-1])
 
-        # Save the CPACS file for this iteration
-        if counter%Rt.save_iter == 0:
-            loc = optim_dir_path+'/Geometry/'+'iter_{}.xml'.format(counter)
-            shutil.copy(cpacs_path, loc)
+        if replay_outputs(self, outputs):
+            # Geometry and variables of the sample, from its evaluation
+            self.archive(sample_result['cpacs_path'])
+            for name, values in sample_result['variables'].items():
+                optim_var_dict[name][1].extend(values)
+            return
+
+        cpacs_path = mif.get_tooloutput_file_path(Rt.modules[-1])
+        self.archive(cpacs_path)
 
         # Add new variables to dictionnary
         tixi = cpsf.open_tixi(cpacs_path)
         dct.update_dict(tixi, optim_var_dict)
 
-        # Change local wkdir for the next iteration
-        tixi.updateTextElement(opf.WKDIR_XPATH,ceaf.create_new_wkdir(Rt.date,Rt.type))
+        # Change local wkdir for the next iteration (a sandbox has its own wkdir)
+        if not mif.get_sandbox_dir():
+            tixi.updateTextElement(opf.WKDIR_XPATH,ceaf.create_new_wkdir(Rt.date,Rt.type))
 
-        for obj in Rt.objective:
-            var_list = splt('[+*/-]', obj)
-            for v in var_list:
-                if not v.isdigit() and v != '':
-                    exec('{} = inputs["{}"]'.format(v, v))
-
-            result = eval(obj)
+        for obj, obj_expr in self.obj_expr.items():
+            result = obj_expr(inputs)
             if Rt.minmax == 'min':
                 outputs['Objective function '+obj] = -result
             else:
@@ -197,11 +237,567 @@ class objective(om.ExplicitComponent):
 
         cpsf.close_tixi(tixi, cpacs_path)
 
+        store_outputs(self, outputs)
+
+
+    def archive(self, cpacs_path):
+        """Archive the CPACS file for this iteration"""
+        if counter%Rt.save_iter == 0 and not sandbox_worker:
+            design_vars = {name: np.ravel(problem[name]).tolist()
+                           for name in problem.model.get_design_vars()}
+            geom_archive.add(counter, cpacs_path, design_vars)
+
+
+class ParallelGradientDriver(om.ScipyOptimizeDriver):
+    """Scipy optimisation driver with parallel finite-difference gradients.
+
+    The modules do not provide partial derivatives, the total derivatives
+    are computed by 'compute_totals_parallel' which evaluates all the
+    perturbed design points concurrently in sandboxes. This driver is only
+    used when it is possible and useful (see 'use_parallel_gradient').
+    """
+
+    def _compute_totals(self, of=None, wrt=None, return_format='flat_dict', **kwargs):
+        """Compute the total derivatives for the driver"""
+        if of is None:
+            of = list(self.get_objective_values()) + list(self.get_constraint_values())
+        if wrt is None:
+            wrt = list(self.get_design_var_values())
+
+        return compute_totals_parallel(of, wrt, return_format)
+
+
+class SampleGenerator(DOEGenerator):
+    """Generator of DoE samples which have already been evaluated in sandboxes.
+
+    The driver evaluates each sample right after it has been generated, the
+    components then take their outputs from the result of this sample
+    ('sample_result') instead of running the modules. The failed samples are
+    recorded as failed cases, as with a serial DoE.
+
+    Attributes:
+        case_list (list): List of (name, value) of the design variables of
+                          each sample
+        result_list (list): Result of each sample (see 'evaluate_sample')
+
+    """
+
+    def __init__(self, case_list, result_list):
+        super().__init__()
+
+        self.case_list = case_list
+        self.result_list = result_list
+
+    def __call__(self, design_vars, model=None):
+        """Generate the evaluated samples
+
+        Args:
+            design_vars (dict): Design variables of the problem
+            model (om.Group object): Model of the problem
+
+        Yields:
+            case (list): List of (name, value) of the design variables
+        """
+        global sample_result
+
+        try:
+            for case, result in zip(self.case_list, self.result_list):
+                sample_result = result
+                yield case
+        finally:
+            sample_result = None
+
+
+class InfillGenerator(DOEGenerator):
+    """Generator of the design points of a surrogate-based optimisation.
+
+    The points are generated one at a time, the driver evaluates each of them
+    with the modules before the next one is generated. Kriging surrogates of
+    the objective and of the constraints are fitted on the initial samples
+    (from the variable history of a previous routine and/or a Latin hypercube
+    DoE) and refitted after each evaluation. The next point is the one which
+    maximises the expected improvement (times the probability of feasibility).
+
+    Attributes:
+        history_path (str): Path to a 'Variable_history.csv' file ('' if none)
+        initial_nb (int): Number of initial samples evaluated with the modules
+        infill_nb (int): Maximum number of infill points
+        tol (float): The routine stops when the expected improvement is lower
+                     than tol*max(|best objective|,1)
+
+    """
+
+    def __init__(self, history_path='', initial_nb=0, infill_nb=20, tol=1e-3):
+        super().__init__()
+
+        self.history_path = history_path
+        self.initial_nb = initial_nb
+        self.infill_nb = infill_nb
+        self.tol = tol
+
+        self._rng = np.random.default_rng()
+
+    def _get_history(self, des_list, obj, const_list):
+        """Get the evaluated points of the variable history, if it matches"""
+
+        col_list = [name.replace('indeps.','').replace('objective.','').replace('const.','')
+                    for name in des_list + [obj] + const_list]
+
+        if self.history_path in ['','-']:
+            return np.empty((0,len(col_list)))
+        if not os.path.isfile(self.history_path):
+            log.warning('Variable history "' + self.history_path + '" not found!')
+            return np.empty((0,len(col_list)))
+
+        df = tls.read_history(self.history_path).reindex(columns=col_list)
+        df = df.dropna(subset=col_list[:len(des_list)+1])
+        log.info('{} points of the variable history will be used'.format(len(df)))
+
+        return df.to_numpy()
+
+    def __call__(self, design_vars, model=None):
+        """Generate the design points
+
+        Args:
+            design_vars (dict): Design variables of the problem
+            model (om.Group object): Model of the problem
+
+        Yields:
+            case (list): List of (name, value) of the design variables
+        """
+
+        des_list = list(design_vars)
+        sizes = [design_vars[name]['size'] for name in des_list]
+        xlimits = np.column_stack([
+            np.concatenate([np.broadcast_to(meta[bound],(meta['size'],))
+                            for meta in design_vars.values()])
+            for bound in ['lower','upper']])
+        obj = list(model.get_objectives())[0]
+
+        const_bounds = {}
+        for name, meta in model.get_constraints().items():
+            if meta.get('equals') is not None:
+                const_bounds[name] = (meta['equals'], meta['equals'])
+            else:
+                lower = meta['lower'] if meta.get('lower') is not None else -np.inf
+                upper = meta['upper'] if meta.get('upper') is not None else np.inf
+                const_bounds[name] = (lower, upper)
+        const_list = list(const_bounds)
+
+        def to_case(x):
+            case = []
+            for name, value in zip(des_list, np.split(x, np.cumsum(sizes)[:-1])):
+                case.append((name, value))
+            return case
+
+        def get_results(case):
+            values = [np.concatenate([np.ravel(value) for name, value in case])]
+            values.append(np.ravel(model.get_val(obj))[:1])
+            values.extend([np.ravel(model.get_val(name))[:1] for name in const_list])
+            return np.concatenate(values)
+
+        nx = len(xlimits)
+        data = self._get_history(des_list, obj, const_list) if nx == len(des_list) \
+               else np.empty((0,nx+1+len(const_list)))
+
+        if len(data) + self.initial_nb < 2:
+            raise ValueError('At least 2 initial points are needed to fit the surrogates!')
+
+        # Initial samples evaluated with the modules
+        if self.initial_nb:
+            generator = om.LatinHypercubeGenerator(samples=self.initial_nb)
+            for case in generator(design_vars, model):
+                yield case
+                data = np.vstack((data, get_results(case)))
+
+        # Infill points, the surrogates are refitted from their last hyperparameters
+        theta = {}
+        for i in range(self.infill_nb):
+
+            x, y, c = data[:,:nx], data[:,nx], data[:,nx+1:]
+
+            obj_sm = ifl.fit_surrogate(x, y, theta.get(obj))
+            theta[obj] = obj_sm.optimal_theta
+
+            feasible = np.ones(len(x), dtype=bool)
+            sm_list = []
+            for j, name in enumerate(const_list):
+                lower, upper = const_bounds[name]
+                valid = np.isfinite(c[:,j])
+                feasible &= ~valid | ((c[:,j] >= lower) & (c[:,j] <= upper))
+                if valid.sum() < 2:
+                    continue
+                sm = ifl.fit_surrogate(x[valid], c[valid,j], theta.get(name))
+                theta[name] = sm.optimal_theta
+                sm_list.append((sm, lower, upper))
+
+            y_min = y[feasible].min() if feasible.any() else y.min()
+
+            x_new, ei = ifl.get_infill_point(obj_sm, y_min, xlimits, sm_list, self._rng)
+
+            if ei < self.tol * max(abs(y_min), 1.0):
+                log.info('Expected improvement lower than the tolerance, end of the routine')
+                break
+
+            dist = np.abs(x - x_new) / np.maximum(xlimits[:,1] - xlimits[:,0], 1e-12)
+            if np.any(dist.max(axis=1) < 1e-6):
+                log.info('Infill point already evaluated, end of the routine')
+                break
+
+            log.info('Infill point {}: expected improvement = {}'.format(i+1, ei))
+
+            case = to_case(x_new)
+            yield case
+            data = np.vstack((data, get_results(case)))
+
 
 # =============================================================================
 #   FUNCTIONS
 # =============================================================================
 
+def store_outputs(comp, outputs):
+    """Save the outputs of a component evaluated in a sandbox.
+
+    Args:
+        comp (om.ExplicitComponent object): Component which has been computed
+        outputs (om.Vector object): Outputs of the component
+
+    Returns:
+        None.
+
+    """
+    if mif.get_sandbox_dir():
+        evaluated_outputs[comp.pathname] = {name: np.copy(outputs[name]) for name in outputs}
+
+
+def replay_outputs(comp, outputs):
+    """Set the outputs of a component from a sample evaluated in a sandbox.
+
+    When the DoE samples have been evaluated in parallel, the driver records
+    them with a 'SampleGenerator' and each component takes its outputs from
+    the result of the sample instead of running the modules.
+
+    Args:
+        comp (om.ExplicitComponent object): Component to compute
+        outputs (om.Vector object): Outputs of the component
+
+    Returns:
+        replayed (bool): True if the outputs come from a sample result
+
+    """
+    if sample_result is None:
+        return False
+
+    if sample_result['error']:
+        raise om.AnalysisError('DoE sample {} failed:\n'.format(sample_result['index'])
+                               + sample_result['error'])
+
+    for name, value in sample_result['outputs'].get(comp.pathname, {}).items():
+        outputs[name] = value
+
+    return True
+
+
+def evaluate_in_sandbox(sandbox_dir, case):
+    """Evaluate the model for one design point in its own sandbox.
+
+    This function is run in a worker process. The modules are run in a sandbox
+    directory with their own CPACS files and working directory, so design
+    points can be evaluated concurrently.
+
+    Args:
+        sandbox_dir (str): Path of the sandbox directory.
+        case (list): List of (name, value) of the design variables.
+
+    Returns:
+        evaluated_outputs (dict): Outputs of each component for this point.
+
+    """
+    wkf.create_sandbox(sandbox_dir, Rt.modules)
+    evaluated_outputs.clear()
+
+    with wkf.sandbox(sandbox_dir):
+
+        # Private working directory for the modules of this point
+        wkdir = os.path.join(sandbox_dir, 'WKDIR')
+        os.makedirs(wkdir, exist_ok=True)
+        cpacs_path = mif.get_tooloutput_file_path(Rt.modules[-1])
+        tixi = cpsf.open_tixi(cpacs_path)
+        cpsf.create_branch(tixi, opf.WKDIR_XPATH)
+        tixi.updateTextElement(opf.WKDIR_XPATH, wkdir)
+        cpsf.close_tixi(tixi, cpacs_path)
+
+        # The model is run directly, only the driver (in the main process)
+        # writes in the recorders
+        for name, value in case:
+            problem[name] = value
+        problem.model.run_solve_nonlinear()
+
+    return dict(evaluated_outputs)
+
+
+def get_sample_dir(index):
+    """Get the path of the sandbox of a DoE sample ('Runs/Sample_i')."""
+
+    return os.path.join(optim_dir_path, 'Runs', 'Sample_' + str(index))
+
+
+def create_problem():
+    """Create the problem of the routine, with its subsystems and parameters.
+
+    Returns:
+        prob (om.Problem object): Problem of the routine, not set up yet.
+
+    """
+    prob = om.Problem()
+    ivc = om.IndepVarComp()
+
+    ## Add subsystems to problem ##
+    add_subsystems(prob, ivc)
+
+    ## Defining problem parameters ##
+    add_parameters(prob, ivc)
+
+    return prob
+
+
+def evaluate_sample(index, case, routine_state):
+    """Evaluate one DoE sample in its own sandbox ('Runs/Sample_i').
+
+    This function is run in a worker process. The first time, the worker sets
+    up its own problem from the state of the routine. An error is returned
+    with the sample, so the other samples are still evaluated.
+
+    Args:
+        index (int): Index of the sample.
+        case (list): List of (name, value) of the design variables.
+        routine_state (tuple): Routine, variable dictionary and path of the
+        routine directory of the main process.
+
+    Returns:
+        result (dict): Index of the sample, outputs of each component, new
+        values of the variables, path of the resulting CPACS file and error
+        message ('' if the evaluation succeeded).
+
+    """
+    global Rt, optim_var_dict, optim_dir_path, problem, counter, sandbox_worker
+
+    result = {'index': index, 'outputs': {}, 'variables': {},
+              'cpacs_path': '', 'error': ''}
+
+    try:
+        if not sandbox_worker:
+            Rt, optim_var_dict, optim_dir_path = routine_state
+            counter = 0
+            problem = create_problem()
+            problem.setup()
+            problem.final_setup()
+            sandbox_worker = True
+
+        start = {name: len(var[1]) for name, var in optim_var_dict.items()}
+
+        sample_dir = get_sample_dir(index)
+        result['outputs'] = evaluate_in_sandbox(sample_dir, case)
+        result['cpacs_path'] = os.path.join(sample_dir, Rt.modules[-1],
+                                            'ToolOutput', 'ToolOutput.xml')
+
+        # Values read from the resulting CPACS file, the geometric ones are
+        # added by the geometry component of the main process
+        result['variables'] = {name: var[1][start[name]:]
+                               for name, var in optim_var_dict.items()
+                               if name not in geom_dict}
+    except Exception:
+        result['error'] = traceback.format_exc()
+        log.error('DoE sample {} failed:\n'.format(index) + result['error'])
+
+    return result
+
+
+def get_gradient_dir(index):
+    """Get the path of the sandbox of a perturbed point ('Runs/Gradient_i')."""
+
+    return os.path.join(optim_dir_path, 'Runs', 'Gradient_' + str(index))
+
+
+def evaluate_gradient_point(point):
+    """Evaluate one perturbed design point in its own sandbox ('Runs/Gradient_i').
+
+    Args:
+        point (tuple): Index of the point, list of (name, value) of the
+        design variables and names of the responses.
+
+    Returns:
+        values (list): Flattened value of each response at this point.
+
+    """
+    global sandbox_worker
+
+    index, case, of = point
+    sandbox_worker = True
+
+    evaluate_in_sandbox(get_gradient_dir(index), case)
+
+    # Responses are read with the names used by the driver (promoted or absolute)
+    return [np.ravel(problem.get_val(o)).astype(float) for o in of]
+
+
+def use_parallel_gradient():
+    """Check if the gradients can be computed by 'ParallelGradientDriver'.
+
+    The perturbed points are evaluated in forked processes, it is only useful
+    with more than one process for the gradient ('Rt.fd_nb_proc').
+
+    Returns:
+        parallel (bool): True if the gradients are computed in parallel.
+
+    """
+    if Rt.fd_nb_proc <= 1:
+        return False
+
+    if not PARALLEL_TOTALS or not FORK_AVAILABLE:
+        log.warning('Parallel gradients are not available with OpenMDAO '
+                    + openmdao.__version__ + ' on this platform, the gradients '
+                    'will be computed by serial finite differences.')
+        return False
+
+    return True
+
+
+def compute_totals_parallel(of, wrt, return_format='flat_dict'):
+    """Compute total derivatives by finite differences in parallel.
+
+    The model is evaluated at each perturbed design point (one per design
+    variable component for forward differences, two for central differences)
+    in a sandbox, by 'Rt.fd_nb_proc' worker processes. The step is 'Rt.fd_step'
+    relative to the value of the variable (absolute for values smaller than 1).
+    The model must already be evaluated at the current design point.
+
+    Args:
+        of (list): Names of the responses (objectives and constraints).
+        wrt (list): Names of the design variables.
+        return_format (str): 'array', 'flat_dict' or 'dict' (see OpenMDAO
+        'compute_totals').
+
+    Returns:
+        totals (array or dict): Total derivatives in the requested format.
+
+    """
+    x0 = {name: np.atleast_1d(problem.get_val(name)).astype(float) for name in wrt}
+    f0 = {name: np.atleast_1d(problem.get_val(name)).astype(float).ravel() for name in of}
+
+    signs = [1.0, -1.0] if Rt.fd_form == 'central' else [1.0]
+
+    # List of the perturbed points: (design variable, index, step, case)
+    point_list = []
+    for name in wrt:
+        for j in range(x0[name].size):
+            step = Rt.fd_step * max(abs(x0[name].flat[j]), 1.0)
+            for sign in signs:
+                value = np.copy(x0[name])
+                value.flat[j] += sign * step
+                case = [(n, value if n == name else x0[n]) for n in wrt]
+                point_list.append((name, j, sign * step, case))
+
+    log.info('Gradient: {} points will be evaluated on {} processes'.format(len(point_list), Rt.fd_nb_proc))
+
+    # Worker processes are forked to inherit the problem at the current point
+    mp_context = multiprocessing.get_context('fork')
+    try:
+        with ProcessPoolExecutor(max_workers=Rt.fd_nb_proc, mp_context=mp_context) as executor:
+            result_list = list(executor.map(evaluate_gradient_point,
+                                            [(index, point[3], of) for index, point
+                                             in enumerate(point_list)]))
+    finally:
+        # The sandboxes (with their working directory) are not kept, one
+        # gradient is evaluated at each iteration of the optimiser
+        for index in range(len(point_list)):
+            shutil.rmtree(get_gradient_dir(index), ignore_errors=True)
+
+    # Assemble the Jacobian, column by column
+    of_size = sum(f0[name].size for name in of)
+    col_list = {}
+    for (name, j, step, _), values in zip(point_list, result_list):
+        f = np.concatenate(values) if values else np.zeros(0)
+        col_list.setdefault((name, j), []).append((step, f))
+
+    f0_all = np.concatenate([f0[o] for o in of]) if of else np.zeros(0)
+    col_blocks = []
+    for name in wrt:
+        block = np.zeros((of_size, x0[name].size))
+        for j in range(x0[name].size):
+            evals = col_list[(name, j)]
+            if len(evals) == 2:
+                (h1, f1), (h2, f2) = evals
+                block[:, j] = (f1 - f2) / (h1 - h2)
+            else:
+                h1, f1 = evals[0]
+                block[:, j] = (f1 - f0_all) / h1
+        col_blocks.append(block)
+
+    jac = np.hstack(col_blocks) if col_blocks else np.zeros((of_size, 0))
+
+    if return_format == 'array':
+        return jac
+
+    totals = {}
+    row = 0
+    for o in of:
+        col = 0
+        for w in wrt:
+            totals[(o, w)] = jac[row:row+f0[o].size, col:col+x0[w].size]
+            col += x0[w].size
+        row += f0[o].size
+
+    if return_format == 'dict':
+        totals_dict = {o: {} for o in of}
+        for (o, w), val in totals.items():
+            totals_dict[o][w] = val
+        return totals_dict
+
+    return totals
+
+
+def run_doe_parallel(prob):
+    """Evaluate the DoE samples concurrently in a pool of processes.
+
+    The samples are generated once and evaluated in sandboxes by 'Rt.nb_proc'
+    worker processes. The DoE driver then records them as usual, with the
+    outputs of their evaluation (see 'SampleGenerator').
+
+    Args:
+        prob (om.Problem object): Problem of the DoE, already set up.
+
+    Returns:
+        None.
+
+    """
+    prob.final_setup()
+
+    # Generate the samples once, so the driver records the evaluated ones
+    generator = prob.driver.options['generator']
+    case_list = [list(case) for case in generator(prob.model.get_design_vars(), prob.model)]
+
+    log.info('{} DoE samples will be evaluated on {} processes'.format(len(case_list), Rt.nb_proc))
+
+    # Worker processes are started with the default method of the platform,
+    # they set up their own problem from the state of the routine
+    routine_state = (Rt, optim_var_dict, optim_dir_path)
+    result_list = []
+    with ProcessPoolExecutor(max_workers=Rt.nb_proc) as executor:
+        future_list = [executor.submit(evaluate_sample, index, case, routine_state)
+                       for index, case in enumerate(case_list)]
+        for index, future in enumerate(future_list):
+            try:
+                result_list.append(future.result())
+            except Exception:
+                # e.g. the worker process has been terminated abruptly
+                error = traceback.format_exc()
+                log.error('DoE sample {} failed:\n'.format(index) + error)
+                result_list.append({'index': index, 'error': error})
+
+    prob.driver.options['generator'] = SampleGenerator(case_list, result_list)
+
+
 def create_routine_folder():
     """Create the working dicrectory of the routine.
 
@@ -234,7 +830,6 @@ def create_routine_folder():
     # Add subdirectories
     if not os.path.isdir(optim_dir_path):
         os.mkdir(optim_dir_path)
-    os.mkdir(optim_dir_path+'/Geometry')
     os.mkdir(optim_dir_path+'/Runs')
 
     cpsf.close_tixi(tixi, opf.CPACS_OPTIM_PATH)
@@ -257,7 +852,11 @@ def driver_setup(prob):
 
     """
     if Rt.type == 'Optim':
-        if len(Rt.objective) > 1 and False:
+        if Rt.driver == 'SurrogateEI':
+            # The modules are only run at the infill points of the surrogates
+            generator = InfillGenerator(Rt.sbo_history, Rt.sbo_initial_nb, Rt.max_iter, Rt.tol)
+            prob.driver = om.DOEDriver(generator)
+        elif len(Rt.objective) > 1 and False:
             log.info("""More than 1 objective function, the driver will
                      automatically be set to NSGA2""")
             prob.driver = om.pyOptSparseDriver() # multifunc driver : NSGA2
@@ -265,7 +864,12 @@ def driver_setup(prob):
             prob.driver.opt_settings['PopSize'] = 7
             prob.driver.opt_settings['maxGen'] = Rt.max_iter
         else:
-            prob.driver = om.ScipyOptimizeDriver()
+            if use_parallel_gradient():
+                prob.driver = ParallelGradientDriver()
+            else:
+                prob.driver = om.ScipyOptimizeDriver()
+                prob.model.approx_totals(method='fd', step=Rt.fd_step,
+                                         form=Rt.fd_form, step_calc='rel')
             prob.driver.options['optimizer'] = Rt.driver
             prob.driver.options['maxiter'] = Rt.max_iter
             prob.driver.options['tol'] = Rt.tol
@@ -278,7 +882,8 @@ def driver_setup(prob):
         elif Rt.doedriver == 'FullFactorial':
             driver_type = om.FullFactorialGenerator(levels=Rt.samplesnb)
         prob.driver = om.DOEDriver(driver_type)
-        prob.driver.options['run_parallel'] = True
+        # Samples are evaluated in parallel by 'run_doe_parallel' (no MPI)
+        prob.driver.options['run_parallel'] = False
         # prob.driver.options['procs_per_model'] = 1
 
     ## Attaching a recorder and a diagramm visualizer ##
@@ -365,7 +970,7 @@ def routine_launcher(Opt):
         None.
 
     """
-    global counter, optim_var_dict, Rt
+    global counter, optim_var_dict, Rt, problem, geom_archive
 
     counter = 0
     Rt = opf.Routine()
@@ -374,36 +979,37 @@ def routine_launcher(Opt):
 
     ## Initialize CPACS file and problem dictionary ##
     create_routine_folder()
+    geom_archive = gar.GeometryArchive(optim_dir_path+'/Geometry.zip')
     opf.first_run(Rt.modules)
     Rt.get_user_inputs(opf.CPACS_OPTIM_PATH)
     optim_var_dict = opf.create_variable_library(Rt, optim_dir_path)
 
-    ## Instantiate components and subsystems ##
-    prob = om.Problem()
-    ivc = om.IndepVarComp()
-
-    ## Add subsystems to problem ##
-    add_subsystems(prob, ivc)
-
-    ## Defining problem parameters ##
-    add_parameters(prob, ivc)
+    ## Instantiate components, subsystems and problem parameters ##
+    prob = create_problem()
 
     ## Setting up the problem options ##
     driver_setup(prob)
 
     ## Setup the model hierarchy for OpenMDAO ##
     prob.setup()
+    problem = prob
+
+    ## Evaluate DoE samples in parallel ##
+    if Rt.type == 'DoE' and Rt.nb_proc > 1:
+        run_doe_parallel(prob)
 
     ## Run the model ##
     prob.run_driver()
+    geom_archive.close()
 
     ## Recap of the problem inputs/outputs ##
     prob.model.list_inputs()
     prob.model.list_outputs()
 
     ## Results processing ##
-    tls.plot_results(optim_dir_path,'')
-    tls.save_results(optim_dir_path)
+    results = tls.ResultReader(optim_dir_path)
+    tls.plot_results(optim_dir_path,'',results)
+    tls.save_results(optim_dir_path,results)
 
     ## Generate N2 scheme ##
     om.n2(optim_dir_path+'/circuit.sqlite', optim_dir_path+'/circuit.html', False)
@@ -27,6 +27,7 @@ TODO:
 import os
 
 from tkinter import *
+import numpy as np
 import matplotlib.pyplot as plt
 
 import ceasiompy.utils.cpacsfunctions as cpsf
@@ -187,10 +188,10 @@ def plot_aero_coef(cpacs_path,cpacs_out_path):
 
         # Subplot4
         x4 = AeroCoef.aoa
-        if any(AeroCoef.cd) == 0.0:
-            cl_cd = [0]*len(AeroCoef.aoa)
+        if not np.any(AeroCoef.cd):
+            cl_cd = np.zeros(len(AeroCoef.aoa))
         else:
-            cl_cd = res = [cl/cd for cl, cd in zip(AeroCoef.cl, AeroCoef.cd)]
+            cl_cd = AeroCoef.cl / AeroCoef.cd
         y4 = cl_cd
         subplot4.plot(x4,y4,LINE_STYLE[i])
 
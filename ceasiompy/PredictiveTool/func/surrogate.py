@@ -0,0 +1,228 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Persistence of trained surrogate models and predictor to use them.
+
+A trained model is saved with the hash of its training data, the bounds of its
+inputs and its validation RMS error, so it is trained again only when the
+data change. Other modules can then use a 'Predictor' to get predictions
+(e.g. an aeromap) without running the aerodynamic solvers.
+
+Python version: >=3.6
+
+| Author: agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+"""
+
+# =============================================================================
+#   IMPORTS
+# =============================================================================
+
+import os
+import sys
+import pickle
+import hashlib
+import datetime
+
+import numpy as np
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+
+log = get_logger(__file__.split('.')[0])
+
+# Version of the format of the saved models
+SURROGATE_FORMAT = 1
+
+
+# =============================================================================
+#   CLASSES
+# =============================================================================
+
+class Surrogate():
+    """Class to store a trained surrogate model and its metadata.
+
+    Attributes:
+        model (object): Trained SMT surrogate model
+        model_type (str): Type of the model, e.g. 'KRG'
+        data_hash (str): Hash of the training data (see 'get_data_hash')
+        xlimits (array): np.ndarray(nx, 2) Bounds of the inputs of the data
+        rms (array): Validation RMS error of each output
+        x_names (list): Names of the inputs
+        y_names (list): Names of the outputs
+        date (str): Date of the training
+
+    """
+
+    def __init__(self, model, model_type, xd, yd, rms, x_names=None, y_names=None):
+
+        xd = np.atleast_2d(np.asarray(xd,dtype=np.float64))
+
+        self.model = model
+        self.model_type = model_type
+        self.data_hash = get_data_hash(xd,yd)
+        self.xlimits = np.column_stack((xd.min(axis=0),xd.max(axis=0)))
+        self.rms = np.atleast_1d(rms)
+        self.x_names = list(x_names) if x_names is not None else None
+        self.y_names = list(y_names) if y_names is not None else None
+        self.date = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.format = SURROGATE_FORMAT
+
+    def __repr__(self):
+        return 'Surrogate(' + repr(self.model_type) + ', rms=' + str(self.rms) + ')'
+
+    def save(self, model_path):
+        """ Save the surrogate in a file (the file is replaced atomically) """
+
+        tmp_path = model_path + '.tmp'
+        with open(tmp_path,'wb') as f:
+            pickle.dump(self,f,protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path,model_path)
+
+        log.info('Surrogate model saved in ' + model_path)
+
+
+class Predictor():
+    """Class to get predictions from a surrogate model saved in a file.
+
+    The model file is loaded at the first prediction (and loaded again if the
+    file changes), so a predictor is cheap to create.
+
+    Attributes:
+        model_path (str): Path to the file of the surrogate model
+
+    """
+
+    def __init__(self, model_path):
+
+        self.model_path = model_path
+        self._surrogate = None
+        self._file_id = None
+
+    @property
+    def surrogate(self):
+        """ Surrogate model of the file, loaded only when needed """
+
+        file_id = _get_file_id(self.model_path)
+        if self._surrogate is None or file_id != self._file_id:
+            self._surrogate = load_surrogate(self.model_path)
+            self._file_id = file_id
+
+        return self._surrogate
+
+    def is_trained_on(self, xd, yd, model_type=None):
+        """ Check if the saved model has been trained on the data (xd, yd) """
+
+        if not os.path.isfile(self.model_path):
+            return False
+
+        # A file which is not a valid surrogate model is trained again
+        try:
+            surrogate = self.surrogate
+        except (ValueError, pickle.UnpicklingError, EOFError, AttributeError):
+            return False
+
+        if model_type is not None and surrogate.model_type != model_type:
+            return False
+
+        return surrogate.data_hash == get_data_hash(xd,yd)
+
+    def predict_values(self, x):
+        """ Predict the outputs for a batch of points
+
+        Args:
+            x (array): np.ndarray(n, nx) Points, or a single point (nx)
+
+        Returns:
+            y (array): np.ndarray(n, ny) Predicted outputs
+        """
+
+        surrogate = self.surrogate
+        nx = len(surrogate.xlimits)
+
+        x = np.asarray(x,dtype=np.float64)
+        if x.ndim < 2:
+            x = x.reshape(-1,nx)
+        if x.shape[1] != nx:
+            raise ValueError('The surrogate model needs ' + str(nx) + ' inputs, '
+                             + str(x.shape[1]) + ' given!')
+
+        # Predictions are extrapolated outside the bounds of the training data
+        outside = (x < surrogate.xlimits[:,0]) | (x > surrogate.xlimits[:,1])
+        if outside.any():
+            log.warning(str(outside.any(axis=1).sum()) + ' point(s) outside of '
+                        'the bounds of the training data of ' + self.model_path)
+
+        return surrogate.model.predict_values(x)
+
+
+# =============================================================================
+#   FUNCTIONS
+# =============================================================================
+
+def _get_file_id(model_path):
+    """ Identifier of a version of a file, (size, mtime) or None """
+
+    try:
+        stat = os.stat(model_path)
+    except OSError:
+        return None
+
+    return (stat.st_size,stat.st_mtime_ns)
+
+
+def get_data_hash(xd, yd):
+    """ Get the SHA-256 hash of training data
+
+    Args:
+        xd (array): Inputs of the training data
+        yd (array): Outputs of the training data
+
+    Returns:
+        data_hash (str): Hexadecimal hash of the data (values and shapes)
+    """
+
+    sha = hashlib.sha256()
+    for data in [xd, yd]:
+        data = np.ascontiguousarray(data,dtype=np.float64)
+        sha.update(str(data.shape).encode())
+        sha.update(data.tobytes())
+
+    return sha.hexdigest()
+
+
+def load_surrogate(model_path):
+    """ Load a surrogate model from a file
+
+    Args:
+        model_path (str): Path to the file of the surrogate model
+
+    Returns:
+        surrogate (Surrogate): Surrogate model and its metadata
+    """
+
+    if not os.path.isfile(model_path):
+        raise OSError('Surrogate model file "' + model_path + '" not found!')
+
+    with open(model_path,'rb') as f:
+        surrogate = pickle.load(f)
+
+    if not isinstance(surrogate, Surrogate) \
+            or getattr(surrogate,'format',None) != SURROGATE_FORMAT:
+        raise ValueError('"' + model_path + '" is not a valid surrogate model file!')
+
+    log.info('Surrogate model loaded from ' + model_path)
+
+    return surrogate
+
+
+# =============================================================================
+#    MAIN
+# =============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Nothing to execute!')
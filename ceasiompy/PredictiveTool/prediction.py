@@ -27,7 +27,6 @@ import smt.surrogate_models as sms
 import smt.sampling_methods as smp
 import pandas as pd
 import numpy as np
-from re import split as splt
 import matplotlib.pyplot as plt
 
 import ceasiompy.utils.moduleinterfaces as mi
@@ -37,6 +36,8 @@ import ceasiompy.Optimisation.optimisation as opt
 import ceasiompy.utils.workflowfunctions as wkf
 import ceasiompy.utils.apmfunctions as apmf
 import ceasiompy.Optimisation.func.tools as tls
+import ceasiompy.Optimisation.func.expression as expr
+import ceasiompy.PredictiveTool.func.surrogate as sg
 
 from ceasiompy.utils.ceasiomlogger import get_logger
 log = get_logger(__file__.split('.')[0])
@@ -124,12 +125,17 @@ def extract_data_set(file):
     df = pd.read_csv(file)
     df = df.rename(columns={'Unnamed: 0':'Name'})
 
-    # Drop duplicate (first and second columns are the same)
-    df = df.drop('0',1)
+    # Optimisation or DoE results, the first case of the former layout is
+    # written twice and must be read only once
+    if 'Variable_history' in file:
+        var_type = df.set_index('Name')['type']
+        history = tls.read_history(file)
+        x = history[[v for v in history.columns if var_type[v] == 'des']]
+        y = history[[v for v in history.columns if var_type[v] == 'obj']]
+        return x.to_numpy(), y.to_numpy()
 
-    # Separate the input and output points
+    # Separate the input points
     x = df.loc[[i for i,v in enumerate(df['type']) if v == 'des']]
-    y = df.loc[[i for i, v in enumerate(df['type']) if v == 'obj']]
 
     df = df.set_index('Name')
 
@@ -137,15 +143,11 @@ def extract_data_set(file):
     x = x[[i for i in x.columns if i.isdigit()]]
     df = df[[i for i in df.columns if i.isdigit()]]
 
-    # Compute the objectives in the aeromap case, else they are already given
-    if 'Variable_history' not in file:
-        y = pd.DataFrame()
-        for i, obj_expr in enumerate(objectives):
-            for name in splt('[+*/-]', obj_expr):
-                obj_expr = obj_expr.replace(name,'df.loc["{}"]'.format(name))
-            exec('y["{}"] = {}'.format(objectives[i], obj_expr))
-    else:
-        y = y[[i for i in y.columns if i.isdigit()]].transpose()
+    # Compute the objectives in the aeromap case, each objective is evaluated
+    # at once on all the iterations
+    y = pd.DataFrame()
+    for obj in objectives:
+        y[obj] = expr.Expression(obj)(df.transpose())
 
     return x.transpose().to_numpy(), y.to_numpy()
 
@@ -213,7 +215,8 @@ def aeromap_case_gen(modules):
     # Write to CSV
     df = pd.DataFrame(dct)
     df = df.transpose()
-    var_type = ['obj' if i in objectives
+    obj_var = expr.get_variables(objectives)
+    var_type = ['obj' if i in obj_var
                 else 'des' if i in ['alt','mach','aoa','aos']
                 else 'const'
                 for i in df.index]
@@ -257,19 +260,23 @@ def separate_data(x, y):
     return xt, yt, xv, yv
 
 
-def create_model(xd, yd):
+def create_model(xd, yd, model='KRG', show_plots=False, model_path=None):
     """Create a surrogate.
 
     Generate, train and validate a surrogate model with the provided data.
 
     Args:
-        file (str) : Path to CSV file.
+        xd (np array) : DoE inputs
+        yd (np array) : DoE outputs
+        model (str) : Type of surrogate model (see 'model_dict')
+        show_plots (bool) : Show the validation plots
+        model_path (str) : Path where the model is saved, before the plots
+                           are shown (not saved if None)
 
     Returns:
-        sm (surrogate model object) : Trained surrogate model.
+        surrogate (Surrogate) : Trained surrogate model and its metadata.
 
     """
-    model = 'KRG'
     xt, yt, xv, yv = separate_data(xd, yd)
     sm = eval('sms.{}'.format(model_dict[model]))
     # In case the options get user defined as string
@@ -281,10 +288,20 @@ def create_model(xd, yd):
 
     yp = sm.predict_values(xv)
 
+    rms = np.sqrt(np.mean((yp-yv)**2, axis=0))
+    log.info('Validation RMS error: {}'.format(rms))
+
+    surrogate = sg.Surrogate(sm, model, xd, yd, rms, y_names=objectives)
+
+    # Saved first, plt.show() blocks until the plots are closed
+    if model_path is not None:
+        surrogate.save(model_path)
+
+    if not show_plots:
+        return surrogate
+
     for i in range(0,yv.shape[1]):
 
-        rms = np.sqrt(np.mean((yp[:,i]-yv[:,i])**2))#/yv.shape[0])
-        log.info(rms)
         plt.figure()
         plt.plot(yv[:,i], yv[:,i], '-', label='$y_{true}$')
         plt.plot(yv[:,i], yp[:,i], 'r.', label='$\hat{y}$ :'+objectives[i])
@@ -293,7 +310,7 @@ def create_model(xd, yd):
         plt.ylabel('$\hat{y}$')
 
         plt.legend(loc='upper left')
-        plt.title('Kriging model: validation of the prediction model\n {}'.format(rms))
+        plt.title('Kriging model: validation of the prediction model\n {}'.format(rms[i]))
 
         plt.figure()
         for j in range(0,xv.shape[1]):
@@ -306,7 +323,7 @@ def create_model(xd, yd):
             plt.legend(loc='upper left')
     plt.show()
 
-    return sm
+    return surrogate
 
 
 if __name__ == "__main__":
@@ -341,7 +358,13 @@ if __name__ == "__main__":
 
     xd, yd = extract_data_set(file)
 
-    sm = create_model(xd, yd)
+    # The model is trained again only if the training data have changed
+    model_path = os.path.splitext(file)[0] + '_surrogate.pkl'
+    predictor = sg.Predictor(model_path)
+    if predictor.is_trained_on(xd, yd, 'KRG'):
+        log.info('Surrogate model already trained on this data set: ' + model_path)
+    else:
+        create_model(xd, yd, 'KRG', show_plots=True, model_path=model_path)
 
     log.info('End of Predictive tool')
 
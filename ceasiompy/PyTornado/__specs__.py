@@ -117,6 +117,18 @@ cpacs_inout.add_input(
     gui_group=f'Save CPACS external results',
 )
 
+cpacs_inout.add_input(
+    var_name='export_loads_csv',
+    var_type=bool,
+    default_value=False,
+    unit='1',
+    descr='Option to also export extracted loads in a CSV file (aircraft_loads.csv)',
+    xpath=XPATH_PYTORNADO + '/save_results/exportLoadsCSV',
+    gui=True,
+    gui_name='Export loads in CSV',
+    gui_group=f'Save CPACS external results',
+)
+
 cpacs_inout.add_input(
     var_name='x_CG',
     default_value=None,
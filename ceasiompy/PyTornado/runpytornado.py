@@ -47,7 +47,6 @@ from datetime import datetime
 from random import randint
 from glob import glob
 import numpy as np
-import pandas as pd
 import xmltodict as xml
 
 import ceasiompy.utils.cpacsfunctions as cpsf
@@ -55,6 +54,7 @@ import ceasiompy.utils.ceasiompyfunctions as ceaf
 import ceasiompy.utils.moduleinterfaces as mi
 
 from ceasiompy.utils.ceasiomlogger import get_logger
+from ceasiompy.utils.loadfields import save_load_fields, export_load_fields_csv
 
 
 log = get_logger(__file__.split('.')[0])
@@ -228,13 +228,16 @@ def parse_pytornado_settings_dict(dictionary):
         # -----------
 
 
-def _get_load_fields(pytornado_results, dir_pyt_results):
+def _get_load_fields(pytornado_results, dir_pyt_results, csv_export=False):
     """
     Return load fields from PyTornado results (only extract load from last results)
     (TODO: Maybe this function could integrated to Tornado...?)
+    Loads are saved in 'aircraft_loads.npz' and also in 'aircraft_loads.csv'
+    if 'csv_export' is True.
     Args:
         :pytornado_results: (obj) PyTornado results data structure
         :dir_pyt_results: (str): Path to the results dir
+        :csv_export: (bool): Export loads in a CSV file
     Returns:
         :load_fields: (dict) AeroFrame load fields
     """
@@ -248,41 +251,38 @@ def _get_load_fields(pytornado_results, dir_pyt_results):
         (lattice.bookkeeping_by_wing_uid_mirror, '_m'),
     )
 
-    frames = []
+    # Panel forces of all the panels, gathered by wing below
+    panel_force = np.column_stack((vlmdata.panelwise['fx'],
+                                   vlmdata.panelwise['fy'],
+                                   vlmdata.panelwise['fz']))
 
     load_fields = {}
     for (bookkeeping_list, suffix) in bookkeeping_lists:
         for wing_uid, panellist in bookkeeping_list.items():
-            # Count number of panels
-            num_pan = 0
-            for entry in panellist:
-                num_pan += len(entry.pan_idx)
-
-            # Add a first row of zeros in order to use 'append' method (will be removed below)
-            load_field = np.zeros((1, 6))
-            for entry in panellist:
-                # pan_idx: Panel index in PyTornado book keeping system
-                for pan_idx in entry.pan_idx:
-                    load_field_entry = np.zeros((1, 6))
-                    # load_field_entry[0, 0:3] = self.points_of_attack_undeformed[pan_idx]
-                    load_field_entry[0, 0:3] = lattice.bound_leg_midpoints[pan_idx] #TODO: correct to use this field as coordinates??
-                    load_field_entry[0, 3] = vlmdata.panelwise['fx'][pan_idx]
-                    load_field_entry[0, 4] = vlmdata.panelwise['fy'][pan_idx]
-                    load_field_entry[0, 5] = vlmdata.panelwise['fz'][pan_idx]
-                    load_field = np.append(load_field, load_field_entry, axis=0)
-
-            # # Write one CSV file per Wing
-            load_fields[wing_uid + suffix] = load_field[1:, :]
-            df = pd.DataFrame(load_field[1:, :])
-            df.columns =['x', 'y','z','fx', 'fy','fz']
-            df['wing_uid'] = wing_uid + suffix
-            frames.append(df)
-
-    # Write aircraft load in a CSV file
-    df_tot = pd.concat(frames)
-    csv_path = os.path.join(dir_pyt_results,'aircraft_loads.csv')
-    print(csv_path)
-    df_tot.to_csv(csv_path, sep=',',index=False)
+            # pan_idx: Panel index in PyTornado book keeping system
+            pan_idx = [np.asarray(entry.pan_idx, dtype=int).ravel() for entry in panellist]
+            pan_idx = np.concatenate(pan_idx) if pan_idx else np.empty(0, dtype=int)
+
+            load_field = np.empty((len(pan_idx), 6))
+            # load_field[:, 0:3] = self.points_of_attack_undeformed[pan_idx]
+            load_field[:, 0:3] = lattice.bound_leg_midpoints[pan_idx] #TODO: correct to use this field as coordinates??
+            load_field[:, 3:6] = panel_force[pan_idx]
+
+            load_fields[wing_uid + suffix] = load_field
+
+    # Write aircraft loads in a binary load file
+    xyz_fxyz = np.vstack(list(load_fields.values()))
+    marker = np.repeat(list(load_fields.keys()),[len(v) for v in load_fields.values()])
+    load_file_path = os.path.join(dir_pyt_results,'aircraft_loads.npz')
+    save_load_fields(load_file_path,xyz_fxyz[:,0:3],xyz_fxyz[:,3:6],marker,
+                     metadata={'source': 'PyTornado'})
+
+    if csv_export:
+        csv_path = os.path.join(dir_pyt_results,'aircraft_loads.csv')
+        export_load_fields_csv(load_file_path,csv_path,marker_col='wing_uid',
+                               with_ids=False)
+
+    return load_fields
 
 
 def main():
@@ -298,12 +298,13 @@ def main():
     settings_from_CPACS = get_pytornado_settings_from_CPACS(cpacs_in_path)
     if settings_from_CPACS is not None:
         if settings_from_CPACS.get('deleteOldWKDIRs', False):
-            wkdirs = glob(os.path.join(DIR_MODULE, 'wkdir_*'))
+            wkdirs = glob(os.path.join(mi.get_module_run_dir(MODULE_NAME), 'wkdir_*'))
             for wkdir in wkdirs:
                 shutil.rmtree(wkdir, ignore_errors=True)
 
     # ===== Paths =====
-    dir_pyt_wkdir = os.path.join(DIR_MODULE,'wkdir_temp')
+    # PyTornado working directory is in the module run directory (sandbox or module directory)
+    dir_pyt_wkdir = os.path.join(mi.get_module_run_dir(MODULE_NAME),'wkdir_temp')
 
     dir_pyt_aircraft = os.path.join(dir_pyt_wkdir, 'aircraft')
     dir_pyt_settings = os.path.join(dir_pyt_wkdir, 'settings')
@@ -335,9 +336,11 @@ def main():
     tixi =  cpsf.open_tixi(cpacs_in_path)
     extract_loads_xpath = '/cpacs/toolspecific/pytornado/save_results/extractLoads'
     extract_loads = cpsf.get_value_or_default(tixi, extract_loads_xpath, False)
+    export_loads_csv_xpath = '/cpacs/toolspecific/pytornado/save_results/exportLoadsCSV'
+    export_loads_csv = cpsf.get_value_or_default(tixi, export_loads_csv_xpath, False)
 
     if extract_loads:
-        _get_load_fields(results,dir_pyt_results)
+        _get_load_fields(results,dir_pyt_results,export_loads_csv)
 
     # ===== Clean up =====
     shutil.copy(src=file_pyt_aircraft, dst=cpacs_out_path)
@@ -37,6 +37,7 @@ import ceasiompy.utils.ceasiompyfunctions as ceaf
 import ceasiompy.utils.cpacsfunctions as cpsf
 import ceasiompy.utils.apmfunctions as apmf
 import ceasiompy.utils.su2functions as su2f
+import ceasiompy.utils.moduleinterfaces as mi
 
 from ceasiompy.utils.ceasiomlogger import get_logger
 log = get_logger(__file__.split('.')[0])
@@ -753,8 +754,8 @@ if __name__ == '__main__':
 
     log.info('----- Start of ' + os.path.basename(__file__) + ' -----')
 
-    cpacs_path = os.path.join(MODULE_DIR,'ToolInput','ToolInput.xml')
-    cpacs_out_path = os.path.join(MODULE_DIR,'ToolOutput','ToolOutput.xml')
+    cpacs_path = mi.get_toolinput_file_path('SU2MeshDef')
+    cpacs_out_path = mi.get_tooloutput_file_path('SU2MeshDef')
 
     if len(sys.argv)>1:
         if sys.argv[1] == '-c':
@@ -144,6 +144,18 @@ cpacs_inout.add_input(
     gui_group='Aeromap Options',
 )
 
+cpacs_inout.add_input(
+    var_name='warm_start',
+    var_type=bool,
+    default_value=False,
+    unit='1',
+    descr='To start each case from the solution of its nearest case in the aeroMap',
+    xpath=CEASIOM_XPATH + '/aerodynamics/su2/options/warmStart',
+    gui=True,
+    gui_name='Warm start',
+    gui_group='Aeromap Options',
+)
+
 cpacs_inout.add_input(
     var_name='control_surf',
     var_type=bool,
@@ -168,6 +180,42 @@ cpacs_inout.add_input(
     gui_group='CPU',
 )
 
+cpacs_inout.add_input(
+    var_name='nb_proc_total',
+    var_type=int,
+    default_value=1,
+    unit='1',
+    descr='Total number of proc which can be used to run SU2 cases at the same time',
+    xpath=CEASIOM_XPATH + '/aerodynamics/su2/settings/nbProcTotal',
+    gui=True,
+    gui_name='Total nb of processor',
+    gui_group='CPU',
+)
+
+cpacs_inout.add_input(
+    var_name='cache_dir',
+    var_type=str,
+    default_value='',
+    unit='1',
+    descr='Directory where SU2 results are cached to be reused (no cache if empty)',
+    xpath=CEASIOM_XPATH + '/aerodynamics/su2/settings/cacheDir',
+    gui=True,
+    gui_name='Cache directory',
+    gui_group='Cache',
+)
+
+cpacs_inout.add_input(
+    var_name='cache_size_max',
+    var_type=float,
+    default_value=1000.0,
+    unit='MB',
+    descr='Maximum size of the SU2 cache, least recently used results are removed first',
+    xpath=CEASIOM_XPATH + '/aerodynamics/su2/settings/cacheSizeMax',
+    gui=True,
+    gui_name='Cache max size',
+    gui_group='Cache',
+)
+
 cpacs_inout.add_input(
     var_name='max_iter',
     var_type=int,
@@ -228,6 +276,18 @@ cpacs_inout.add_input(
     gui_group='Results',
 )
 
+cpacs_inout.add_input(
+    var_name='export_loads_csv',
+    var_type=bool,
+    default_value=False,
+    unit='1',
+    descr='Option to also export extracted loads in a CSV file (force.csv)',
+    xpath=CEASIOM_XPATH + '/aerodynamics/su2/results/exportLoadsCSV',
+    gui=True,
+    gui_name='Export loads in CSV',
+    gui_group='Results',
+)
+
 
 # ----- Output -----
 
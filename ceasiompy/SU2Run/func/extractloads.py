@@ -25,7 +25,6 @@ TODO:
 import os
 import sys
 import math
-import pandas
 import matplotlib
 
 import vtk
@@ -44,10 +43,11 @@ from ceasiompy.utils.standardatmosphere import get_atmosphere, plot_atmosphere
 from ceasiompy.utils.moduleinterfaces import check_cpacs_input_requirements
 
 from ceasiompy.utils.su2functions import read_config
+from ceasiompy.utils.su2mesh import SU2Mesh
+from ceasiompy.utils.loadfields import save_load_fields, export_load_fields_csv
 
 log = get_logger(__file__.split('.')[0])
 
-
 #==============================================================================
 #   CLASSES
 #==============================================================================
@@ -90,7 +90,7 @@ def compute_forces(vtu_file_path, force_file_path, config_dict):
 
     Args:
         vtu_file_path (str): Path of the VTU file
-        force_file_path (str): Path to the results force file to write
+        force_file_path (str): Path to the results force file (.npz) to write
         config_dict (dict): SU2 cfg file dictionary to dimensionalize
                             non-dimensional output
 
@@ -129,8 +129,10 @@ def compute_forces(vtu_file_path, force_file_path, config_dict):
 
     force = point_nvecs * press[:, None]
 
-    #unit_norm = point_nvecs / np.linalg.norm(point_nvecs, axis=1, keepdims=True) # had to chage that with the last version of numpy
-    unit_norm = point_nvecs / np.linalg.norm(point_nvecs)
+    # Unit normal vector at each point
+    norm = np.linalg.norm(point_nvecs, axis=1, keepdims=True)
+    norm[norm == 0] = 1.0
+    unit_norm = point_nvecs / norm
 
     for name, values in iteritems({'n': unit_norm, 'f': force}):
         vectors = numpy_to_vtk(
@@ -141,32 +143,57 @@ def compute_forces(vtu_file_path, force_file_path, config_dict):
         mesh.GetPointData().SetActiveVectors(name)
 
     # Write CSV force file
-    ids = range(len(coord))
-
     su2_mesh_path = config_dict.get('MESH_FILENAME')
 
     marker_dict = get_mesh_markers_ids(su2_mesh_path)
-    mesh_maker = []
+    point_marker = get_point_markers(marker_dict, len(coord))
+
+    # Points without marker are not saved, they are not part of a component
+    no_marker_ids = np.flatnonzero(point_marker == '')
+    if len(no_marker_ids):
+        log.warning(str(len(no_marker_ids)) + ' points do not belong to any mesh '
+                    'marker, their loads are not saved. Point ids: '
+                    + str(no_marker_ids[:20].tolist())
+                    + (' ...' if len(no_marker_ids) > 20 else ''))
+        on_marker = point_marker != ''
+        coord, force, point_marker = coord[on_marker], force[on_marker], point_marker[on_marker]
+
+    metadata = {'source': 'SU2',
+                'mach': float(config_dict.get('MACH_NUMBER', 0.0)),
+                'aoa': float(config_dict.get('AOA', 0.0)),
+                'aos': float(config_dict.get('SIDESLIP_ANGLE', 0.0))}
+    save_load_fields(force_file_path, coord, force, point_marker, metadata)
+
+    return mesh
 
-    # Find which marker corespond to which ids
-    for i in range(len(coord)):
-        id_to_test = ids[i]
 
-        find = False
-        for marker, ids_list in marker_dict.items():
-            if not find:
-                if id_to_test in ids_list:
-                    mesh_maker.append(marker)
-                    find = True
+def get_point_markers(marker_dict, point_count):
+    """ Function to get the marker of each point
 
-    df = pandas.DataFrame(data={"ids": ids,
-                                'x': coord[:,0],'y': coord[:,1],'z': coord[:,2],
-                                'fx': force[:,0],'fy': force[:,1],'fz': force[:,2],
-                                'marker': mesh_maker })
+    Function 'get_point_markers' returns the name of the marker each point
+    (by id) belongs to. If a point belongs to several markers, the first one
+    in 'marker_dict' is used, points which do not belong to any marker get
+    an empty name (they are not saved by 'compute_forces').
 
-    df.to_csv(force_file_path, sep=',',index=False)
+    Args:
+        marker_dict (dict): Dictionary of marker and ids (array)
+        point_count (int): Number of points
 
-    return mesh
+    Returns:
+        point_marker (array): Name of the marker of each point
+    """
+
+    marker_list = list(marker_dict)
+    label = np.full(point_count, len(marker_list), dtype=np.intp)
+
+    # Scatter in reverse order, so the first marker of a point is kept
+    for marker_idx in reversed(range(len(marker_list))):
+        ids = marker_dict[marker_list[marker_idx]]
+        label[ids[ids < point_count]] = marker_idx
+
+    point_marker = np.array(marker_list + [''], dtype=object)[label]
+
+    return point_marker
 
 
 def dimensionalize_pressure(p, config_dict):
@@ -228,68 +255,42 @@ def write_updated_mesh(mesh, new_vtu_file_path):
     writer.Update()
 
 
-# TODO: maybe create some exteral function to cope with SU2Mesh, get coord, get marker ...
 def get_mesh_markers_ids(su2_mesh_path):
     """ Function to get ids corresponding to each marker
 
     Function 'get_mesh_markers_ids' crete dictionary which contains for each
-    mesh marker (keys) a list of ids belonging to this mesh marker
+    mesh marker (keys) an array of the ids belonging to this mesh marker.
+    Farfield markers are not taken into account.
 
     Args:
         su2_mesh_path (str): Path to the SU2 mesh file
 
     Return:
-        marker_dict (dict): Dictionary of marker and ids
+        marker_dict (dict): Dictionary of marker and ids (sorted int array)
 
     """
 
-    marker_dict = {}
-    ids_list = []
-    start_line_nb = 1e14
-
-    with open(su2_mesh_path) as f:
-        for line_nb, line in enumerate(f.readlines()):
-
-            if 'Farfield' in line:
-                start_line_nb = 1e14
-
-            if 'NPERIODIC' in line:
-                start_line_nb = 1e14
+    mesh = SU2Mesh(su2_mesh_path)
 
-            if ('MARKER_TAG' in line and 'Farfield' not in line):
-                new_marker = line.split('=')[1][:-1]  # -1 to remove "\n"
-                marker_dict[new_marker] = []
-                start_line_nb = line_nb
-                log.info('Mesh marker ' + new_marker + ' start at line: ' + str(start_line_nb))
-
-            if line_nb > start_line_nb+1 :
-                # print(line)
-                line_ids = line.split('\n')[0].split()
-                # print(line_ids)
-                marker_dict[new_marker].append(int(line_ids[1]))
-                marker_dict[new_marker].append(int(line_ids[2]))
-                marker_dict[new_marker].append(int(line_ids[3]))
-
-    # Remove double elements and replace ids by coordinates
-    for key, ids_list in marker_dict.items():
-        new_ids_list = list(dict.fromkeys(ids_list))
-        marker_dict[key] = new_ids_list
-        log.info('Mesh marker ' + key + ' contains ' + str(len(marker_dict[key])) + ' points.')
-
-    if not marker_dict:
-        log.warning('No "MARKER_TAG" has been found in the mesh!')
+    marker_dict = {}
+    for marker in mesh.get_marker_list(farfield=False):
+        marker_dict[marker] = mesh.get_marker_ids(marker)
+        log.info('Mesh marker ' + marker + ' contains '
+                 + str(len(marker_dict[marker])) + ' points.')
 
     return marker_dict
 
 
-def extract_loads(results_files_dir):
+def extract_loads(results_files_dir, csv_export=False):
     """ Function to extract loads from a SU2 resuts file.
 
-    Function 'extract_loads'
+    Function 'extract_loads' computes the forces at the surface points and
+    saves them in a binary load file ('force.npz'), and in 'force.csv' if asked.
 
     Args:
         results_files_dir (str): Path to the directory where results from SU2
                                  are saved.
+        csv_export (bool): If True, loads are also exported in a CSV file
 
     """
 
@@ -297,12 +298,15 @@ def extract_loads(results_files_dir):
     config_file_path = results_files_dir + '/ConfigCFD.cfg'
     surface_flow_file_path = results_files_dir + '/surface_flow.vtu'  # .vtu are creteted by SU2 from v7.0.1
     surface_flow_force_file_path = results_files_dir + '/surface_flow_forces.vtu'
-    force_file_path = results_files_dir + '/force.csv'
+    force_file_path = results_files_dir + '/force.npz'
 
     cfg = read_config(config_file_path)
     updated_mesh = compute_forces(surface_flow_file_path, force_file_path, cfg)
     write_updated_mesh(updated_mesh, surface_flow_force_file_path)
 
+    if csv_export:
+        export_load_fields_csv(force_file_path, results_files_dir + '/force.csv')
+
 
 #==============================================================================
 #    MAIN
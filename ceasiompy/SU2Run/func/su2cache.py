@@ -0,0 +1,263 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Cache of SU2 case results, shared between working directories
+
+Python version: >=3.6
+
+| Author: agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import os
+import sys
+import math
+import shutil
+import hashlib
+
+import ceasiompy.utils.su2functions as su2f
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+
+log = get_logger(__file__.split('.')[0])
+
+# Result files copied in and out of the cache, the first one is mandatory.
+# The history and restart files of the case are cached as well, their names
+# are taken from the configuration file.
+CACHED_FILES = ['forces_breakdown.dat','logfileSU2_CFD.log','surface_flow.vtu']
+
+# Names of the iteration column in the history file (SU2 v7, SU2 v6)
+ITER_COLUMNS = ['Inner_Iter','Iteration']
+
+# Options of the configuration file which are not used in the hash
+WARM_START_OPTIONS = ['RESTART_SOL','SOLUTION_FILENAME']
+
+CHUNK_SIZE = 1 << 20
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+class SU2CaseCache():
+    """Class to reuse results of SU2 cases which have already been run.
+
+    A case is identified by the hash of its effective configuration (all the
+    options of 'ConfigCFD.cfg' except the mesh path and the warm start
+    options) and of the content of its mesh file. Result files of converged
+    cases are stored in 'cache_dir' under this hash, the least recently used
+    entries are removed when the total size of the cache exceeds 'size_max'.
+
+    Attributes:
+        cache_dir (str): Path to the cache directory
+        size_max (float): Maximum size of the cache [MB]
+
+    """
+
+    def __init__(self, cache_dir, size_max=1000.0):
+
+        self.cache_dir = cache_dir
+        self.size_max = size_max
+
+        # Digest of the mesh files already hashed, by (path, size, mtime)
+        self._mesh_digest = {}
+
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+
+    def get_mesh_digest(self, mesh_path):
+        """ Get the SHA-256 digest of a mesh file, computed once per file """
+
+        stat = os.stat(mesh_path)
+        mesh_id = (os.path.abspath(mesh_path), stat.st_size, stat.st_mtime)
+
+        if mesh_id not in self._mesh_digest:
+            sha = hashlib.sha256()
+            with open(mesh_path,'rb') as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                    sha.update(chunk)
+            self._mesh_digest[mesh_id] = sha.hexdigest()
+
+        return self._mesh_digest[mesh_id]
+
+    def get_key(self, config_path):
+        """ Get the hash key of a case from its configuration file
+
+        Args:
+            config_path (str): Path to the SU2 configuration file of the case
+
+        Returns:
+            key (str): Hexadecimal hash of the case
+        """
+
+        cfg = su2f.read_config(config_path)
+
+        # The solution a case starts from does not change its results
+        for name in WARM_START_OPTIONS:
+            cfg.pop(name,None)
+
+        mesh_path = str(cfg.pop('MESH_FILENAME',''))
+        if not os.path.isabs(mesh_path):
+            mesh_path = os.path.join(os.path.dirname(config_path),mesh_path)
+
+        sha = hashlib.sha256()
+        for name in sorted(cfg):
+            sha.update((name + '=' + str(cfg[name]) + '\n').encode())
+        sha.update(self.get_mesh_digest(mesh_path).encode())
+
+        return sha.hexdigest()
+
+    def fetch(self, key, case_dir):
+        """ Copy cached results of 'key' in 'case_dir', return True if found """
+
+        entry_dir = os.path.join(self.cache_dir,key)
+        case_name = os.path.basename(case_dir)
+
+        if not os.path.isfile(os.path.join(entry_dir,CACHED_FILES[0])):
+            log.info('SU2 cache miss for ' + case_name + ' (' + key[:12] + ')')
+            return False
+
+        for file in os.listdir(entry_dir):
+            shutil.copy(os.path.join(entry_dir,file),case_dir)
+
+        # Mark the entry as recently used
+        os.utime(entry_dir)
+        log.info('SU2 cache hit for ' + case_name + ' (' + key[:12] + ')')
+
+        return True
+
+    def store(self, key, case_dir, config_path):
+        """ Save the results of a case in the cache, if it has converged
+
+        Args:
+            key (str): Hash of the case
+            case_dir (str): Path to the case directory
+            config_path (str): Path to the SU2 configuration file of the case
+        """
+
+        if not os.path.isfile(os.path.join(case_dir,CACHED_FILES[0])):
+            log.warning('No "' + CACHED_FILES[0] + '" in ' + case_dir
+                        + ', results cannot be cached.')
+            return
+
+        cfg = su2f.read_config(config_path)
+        if not is_converged(case_dir,cfg):
+            log.warning(os.path.basename(case_dir) + ' has not converged, '
+                        'its results are not cached.')
+            return
+
+        # The restart file is kept, so a case fetched from the cache can
+        # still be used as a warm start by the next cases
+        file_list = CACHED_FILES + [get_history_file(cfg),
+                                    cfg.get('RESTART_FILENAME','restart_flow.dat')]
+
+        entry_dir = os.path.join(self.cache_dir,key)
+
+        # Files are copied in a temporary directory first, so an entry is
+        # never found incomplete by another process
+        tmp_dir = entry_dir + '.tmp' + str(os.getpid())
+        shutil.rmtree(tmp_dir,ignore_errors=True)
+        os.makedirs(tmp_dir)
+        for file in file_list:
+            file_path = os.path.join(case_dir,file)
+            if os.path.isfile(file_path):
+                shutil.copy(file_path,tmp_dir)
+
+        shutil.rmtree(entry_dir,ignore_errors=True)
+        os.rename(tmp_dir,entry_dir)
+        log.info('SU2 results of ' + os.path.basename(case_dir)
+                 + ' saved in cache (' + key[:12] + ')')
+
+        self.evict()
+
+    def evict(self):
+        """ Remove least recently used entries until the cache fits 'size_max' """
+
+        entry_list = []
+        for entry in os.listdir(self.cache_dir):
+            entry_dir = os.path.join(self.cache_dir,entry)
+            if not os.path.isdir(entry_dir) or '.tmp' in entry:
+                continue
+            size = sum(os.path.getsize(os.path.join(entry_dir,file))
+                       for file in os.listdir(entry_dir))
+            entry_list.append((os.path.getmtime(entry_dir),size,entry_dir))
+
+        total_size = sum(size for _, size, _ in entry_list)
+
+        for _, size, entry_dir in sorted(entry_list):
+            if total_size <= self.size_max * 1e6:
+                break
+            shutil.rmtree(entry_dir,ignore_errors=True)
+            total_size -= size
+            log.info('SU2 cache entry ' + os.path.basename(entry_dir)[:12]
+                     + ' evicted (' + str(round(size/1e6,2)) + ' MB)')
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def get_history_file(cfg):
+    """ Get the name of the history file from a SU2 configuration dictionary """
+
+    return cfg.get('CONV_FILENAME','history') + '.csv'
+
+
+def is_converged(case_dir, cfg):
+    """ Check in its history file that a SU2 case has converged
+
+    Function 'is_converged' reads the last line of the history file of the
+    case. The case has converged if all the values of this line are finite
+    (no divergence) and if SU2 stopped before the maximum number of
+    iterations, i.e. the convergence criteria have been satisfied.
+
+    Args:
+        case_dir (str): Path to the case directory
+        cfg (dict): Dictionary of the SU2 configuration file of the case
+
+    Returns:
+        converged (bool): True if the case has converged
+    """
+
+    history_path = os.path.join(case_dir,get_history_file(cfg))
+    if not os.path.isfile(history_path):
+        log.warning('No history file "' + history_path + '" has been found.')
+        return False
+
+    with open(history_path) as f:
+        line_list = [line for line in f.read().splitlines() if line.strip()]
+    if len(line_list) < 2:
+        return False
+
+    header = [name.strip().strip('"') for name in line_list[0].split(',')]
+    try:
+        last_values = [float(value) for value in line_list[-1].split(',')]
+    except ValueError:
+        return False
+
+    if not all(math.isfinite(value) for value in last_values):
+        return False
+
+    iter_max = cfg.get('INNER_ITER',cfg.get('EXT_ITER'))
+    for name in ITER_COLUMNS:
+        if name in header and iter_max is not None:
+            if last_values[header.index(name)] + 1 >= float(iter_max):
+                return False
+
+    return True
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Nothing to execute!')
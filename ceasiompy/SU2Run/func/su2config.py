@@ -33,7 +33,7 @@ import ceasiompy.utils.apmfunctions as apmf
 import ceasiompy.utils.su2functions as su2f
 import ceasiompy.utils.moduleinterfaces as mi
 
-from ceasiompy.utils.standardatmosphere import get_atmosphere
+from ceasiompy.utils.standardatmosphere import get_atmosphere_array
 
 from ceasiompy.utils.ceasiomlogger import get_logger
 
@@ -54,6 +54,87 @@ SU2_XPATH = '/cpacs/toolspecific/CEASIOMpy/aerodynamics/su2'
 #   FUNCTIONS
 #==============================================================================
 
+def get_case_dir_name(case_nb, mach, aoa, aos):
+    """Function to get the name of the directory of a SU2 case."""
+
+    case_dir_name = ''.join(['Case',str(case_nb).zfill(2),
+                             '_alt',str(case_nb),
+                             '_mach',str(round(mach,2)),
+                             '_aoa',str(round(aoa,1)),
+                             '_aos',str(round(aos,1))])
+
+    return case_dir_name
+
+
+def get_warm_start_parents(alt_list, mach_list, aoa_list, aos_list):
+    """Function to find from which case each case should be started.
+
+    Function 'get_warm_start_parents' orders the cases by adding at each step
+    the case which is the nearest from the cases already ordered, in the
+    (alt,mach,aoa,aos) space normalized by the range of each parameter. Each
+    case is started from the solution of this nearest case (its parent), the
+    first case is started from freestream. Cases with the same parent can be
+    run at the same time.
+
+    Args:
+        alt_list (list): List of altitudes
+        mach_list (list): List of Mach numbers
+        aoa_list (list): List of angles of attack
+        aos_list (list): List of angles of sideslip
+
+    Returns:
+        parent_list (list): Index of the parent of each case (None if no parent)
+
+    """
+
+    points = np.column_stack([alt_list,mach_list,aoa_list,aos_list]).astype(float)
+    case_count = len(points)
+
+    parent_list = [None] * case_count
+    if case_count == 0:
+        return parent_list
+
+    span = np.ptp(points,axis=0)
+    span[span == 0] = 1.0
+    points = points / span
+
+    # Distance of each case to the nearest ordered case and its index
+    is_ordered = np.zeros(case_count,dtype=bool)
+    is_ordered[0] = True
+    dist = np.linalg.norm(points - points[0],axis=1)
+    nearest = np.zeros(case_count,dtype=int)
+
+    for _ in range(case_count - 1):
+        idx = int(np.argmin(np.where(is_ordered,np.inf,dist)))
+        is_ordered[idx] = True
+        parent_list[idx] = int(nearest[idx])
+
+        new_dist = np.linalg.norm(points - points[idx],axis=1)
+        is_nearer = new_dist < dist
+        dist[is_nearer] = new_dist[is_nearer]
+        nearest[is_nearer] = idx
+
+    return parent_list
+
+
+def set_warm_start(cfg, wkdir, parent_dir_name):
+    """Function to start a SU2 case from the solution of another case.
+
+    Args:
+        cfg (dict): SU2 configuration dictionary to modify
+        wkdir (str): Path to the working directory
+        parent_dir_name (str): Name of the case directory to start from,
+                               None to start from freestream
+
+    """
+
+    if parent_dir_name is None:
+        cfg['RESTART_SOL'] = 'NO'
+    else:
+        cfg['RESTART_SOL'] = 'YES'
+        cfg['SOLUTION_FILENAME'] = os.path.join(wkdir,parent_dir_name,
+                                                cfg['RESTART_FILENAME'])
+
 # TODO: Change name to generate_su2_cfd_config
 def generate_su2_config(cpacs_path, cpacs_out_path, wkdir):
     """Function to create SU2 confif file.
@@ -193,19 +274,32 @@ def generate_su2_config(cpacs_path, cpacs_out_path, wkdir):
     cfg['MARKER_MOVING'] = '( NONE )'  # TODO: when do we need to define MARKER_MOVING?
     cfg['DV_MARKER'] = bc_wall_str
 
+    # Warm start, each case is started from the solution of its nearest case
+    warm_start_xpath = SU2_XPATH + '/options/warmStart'
+    warm_start = cpsf.get_value_or_default(tixi,warm_start_xpath,False)
+
+    case_dir_name_list = [get_case_dir_name(case_nb,mach_list[case_nb],aoa_list[case_nb],
+                                            aos_list[case_nb]) for case_nb in range(param_count)]
+    if warm_start:
+        parent_list = get_warm_start_parents(alt_list,mach_list,aoa_list,aos_list)
+        log.info('SU2 cases will be started from the solution of their nearest case.')
+    else:
+        parent_list = [None] * param_count
+
+    # Atmosphere at the altitude of all the cases
+    atm = get_atmosphere_array(alt_list)
+
     # Parameters which will vary for the different cases (alt,mach,aoa,aos)
     for case_nb in range(param_count):
 
         cfg['MESH_FILENAME'] = su2_mesh_path
 
-        alt = alt_list[case_nb]
         mach = mach_list[case_nb]
         aoa = aoa_list[case_nb]
         aos = aos_list[case_nb]
 
-        Atm = get_atmosphere(alt)
-        pressure = Atm.pres
-        temp = Atm.temp
+        pressure = float(atm.pres[case_nb])
+        temp = float(atm.temp[case_nb])
 
         cfg['MACH_NUMBER'] = mach
         cfg['AOA'] = aoa
@@ -218,11 +312,13 @@ def generate_su2_config(cpacs_path, cpacs_out_path, wkdir):
         config_file_name = 'ConfigCFD.cfg'
 
 
-        case_dir_name = ''.join(['Case',str(case_nb).zfill(2),
-                                 '_alt',str(case_nb),
-                                 '_mach',str(round(mach,2)),
-                                 '_aoa',str(round(aoa,1)),
-                                 '_aos',str(round(aos,1))])
+        case_dir_name = case_dir_name_list[case_nb]
+
+        parent_nb = parent_list[case_nb]
+        if parent_nb is None:
+            set_warm_start(cfg,wkdir,None)
+        else:
+            set_warm_start(cfg,wkdir,case_dir_name_list[parent_nb])
 
         case_dir_path = os.path.join(wkdir,case_dir_name)
         if not os.path.isdir(case_dir_path):
@@ -244,6 +340,10 @@ def generate_su2_config(cpacs_path, cpacs_out_path, wkdir):
 
             cfg['GRID_MOVEMENT'] = 'ROTATING_FRAME'
 
+            # Damping derivatives cases start from the solution of their case
+            if warm_start:
+                set_warm_start(cfg,wkdir,case_dir_name)
+
             cfg['ROTATION_RATE'] = str(rotation_rate) + ' 0.0 0.0'
             os.mkdir(os.path.join(wkdir,case_dir_name+'_dp'))
             config_output_path = os.path.join(wkdir,case_dir_name+'_dp',config_file_name)
@@ -277,6 +377,10 @@ def generate_su2_config(cpacs_path, cpacs_out_path, wkdir):
                 log.warning('No SU2 deformed mesh has been found!')
                 su2_def_mesh_list = []
 
+            # Deformed mesh cases start from the solution of their case
+            if warm_start:
+                set_warm_start(cfg,wkdir,case_dir_name)
+
             for su2_def_mesh in su2_def_mesh_list:
 
                 mesh_path = os.path.join(wkdir,'MESH',su2_def_mesh)
@@ -180,6 +180,8 @@ def get_su2_results(cpacs_path,cpacs_out_path,wkdir):
     # Check if loads shoud be extracted
     check_extract_loads_xpath = SU2_XPATH + '/results/extractLoads'
     check_extract_loads = cpsf.get_value_or_default(tixi, check_extract_loads_xpath,False)
+    export_loads_csv_xpath = SU2_XPATH + '/results/exportLoadsCSV'
+    export_loads_csv = cpsf.get_value_or_default(tixi, export_loads_csv_xpath,False)
 
     # Create an oject to store the aerodynamic coefficients
     apmf.check_aeromap(tixi,aeromap_uid)
@@ -198,12 +200,22 @@ def get_su2_results(cpacs_path,cpacs_out_path,wkdir):
         if os.path.isdir(config_dir):
             os.chdir(config_dir)
             force_file_name = 'forces_breakdown.dat'
-            if not os.path.isfile(force_file_name):
-                raise OSError('No result force file have been found!')
+
+            # A failed or missing case is filled with NaN, the other cases
+            # of the aeroMap are still extracted
+            cl = cd = cs = cml = cmd = cms = velocity = math.nan
+            force_file_found = os.path.isfile(force_file_name)
+            if not force_file_found:
+                log.warning('No result force file have been found in "'
+                            + config_dir + '", its results are set to NaN!')
+                force_file_lines = []
+            else:
+                with open(force_file_name) as f:
+                    force_file_lines = f.readlines()
 
             # Read result file
-            with open(force_file_name) as f:
-                for line in f.readlines():
+            if force_file_lines:
+                for line in force_file_lines:
                     if 'Total CL:' in line:
                         cl = float(line.split(':')[1].split('|')[0])
                     if 'Total CD:' in line:
@@ -283,9 +295,9 @@ def get_su2_results(cpacs_path,cpacs_out_path,wkdir):
             else: # No damping derivative or control surfaces case
                 Coef.add_coefficients(cl,cd,cs,cml,cmd,cms)
 
-            if check_extract_loads:
+            if check_extract_loads and force_file_found:
                 results_files_dir = os.path.join(wkdir,config_dir)
-                extract_loads(results_files_dir)
+                extract_loads(results_files_dir,export_loads_csv)
 
             os.chdir(wkdir)
 
@@ -27,15 +27,20 @@ TODO:
 
 import os
 import sys
+import time
 import shutil
 import datetime
 
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
 import ceasiompy.utils.ceasiompyfunctions as ceaf
 import ceasiompy.utils.cpacsfunctions as cpsf
 import ceasiompy.utils.apmfunctions as apmf
 import ceasiompy.utils.su2functions as su2f
+import ceasiompy.utils.moduleinterfaces as mi
 
 from ceasiompy.SU2Run.func.su2config import generate_su2_config
+from ceasiompy.SU2Run.func.su2cache import SU2CaseCache
 from ceasiompy.SU2Run.func.extractloads import extract_loads
 from ceasiompy.SU2Run.func.su2results import get_wetted_area, get_efficiency, get_su2_results
 
@@ -49,6 +54,45 @@ SU2_XPATH = '/cpacs/toolspecific/CEASIOMpy/aerodynamics/su2'
 #   CLASSES
 #==============================================================================
 
+class SU2Case():
+    """Class to store the run status of a SU2 case directory.
+
+    Attributes:
+        case_dir (str): Path to the case directory (CaseXX_...)
+        config_path (str): Path to the SU2_CFD configuration file of the case
+        log_path (str): Path to the SU2_CFD log file of the case
+        exit_status (int): Exit status of the last run (None if not run yet)
+        wall_time (float): Wall time of the last run [s]
+        attempt (int): Number of times the case has been run
+        cache_key (str): Hash of the case in the SU2 cache (None if no cache)
+        restart_path (str): Path to the solution the case starts from (None
+                            if it starts from freestream)
+        parent (object): SU2Case which gives this solution (warm start)
+
+    """
+
+    def __init__(self, case_dir, config_path):
+
+        self.case_dir = case_dir
+        self.config_path = config_path
+        self.log_path = os.path.join(case_dir,'logfileSU2_CFD.log')
+
+        self.exit_status = None
+        self.wall_time = 0.0
+        self.attempt = 0
+        self.cache_key = None
+
+        cfg = su2f.read_config(config_path)
+        if cfg.get('RESTART_SOL') == 'YES':
+            self.restart_path = cfg['SOLUTION_FILENAME']
+        else:
+            self.restart_path = None
+        self.parent = None
+
+    @property
+    def succeeded(self):
+        return self.exit_status == 0
+
 
 #==============================================================================
 #   FUNCTIONS
@@ -78,32 +122,127 @@ def run_SU2_single(config_path, wkdir, nb_proc):
     os.chdir(original_dir)
 
 
-def run_SU2_multi(wkdir, nb_proc):
+def run_SU2_case(case, nb_proc):
+    """Function to run SU2_CFD for one case and record its run status.
+
+    Function 'run_SU2_case' runs SU2_CFD in the case directory and saves the
+    exit status and the wall time in the SU2Case object. An error raised
+    when launching SU2 is logged and recorded as a failed run (exit status -1)
+    in order not to stop the other cases.
+
+    Args:
+        case (object): SU2Case object to run
+        nb_proc (int): Number of processes (MPI ranks) to use for this case
+
+    Returns:
+        case (object): The SU2Case object with its updated run status
+
+    """
+
+    case.attempt += 1
+    start = time.time()
+
+    # Start from freestream if the solution to start from is not available
+    parent_failed = case.parent is not None and not case.parent.succeeded
+    if case.restart_path is not None and (parent_failed or not os.path.isfile(case.restart_path)):
+        log.warning('No valid solution file ' + case.restart_path + ', '
+                    + os.path.basename(case.case_dir) + ' will start from freestream.')
+        cfg = su2f.read_config(case.config_path)
+        cfg['RESTART_SOL'] = 'NO'
+        su2f.write_config(case.config_path,cfg)
+        case.restart_path = None
+
+    try:
+        case.exit_status = su2f.run_soft('SU2_CFD',case.config_path,case.case_dir,nb_proc)
+        # su2f.run_soft('SU2_SOL',config_file_path,config_dir,nb_proc)
+        # Only useful if you need surface/volume flow file,
+        # if not forces_breakdown.dat will be generated by SU2_CFD.
+    except Exception as err:
+        log.error('SU2_CFD could not be run in ' + case.case_dir + ': ' + str(err))
+        case.exit_status = -1
+
+    case.wall_time = time.time() - start
+
+    return case
+
+
+def run_SU2_cases(executor, case_list, nb_proc):
+    """Function to run SU2 cases with an executor, in the order of warm starts.
+
+    Function 'run_SU2_cases' submits to the executor all the cases which do
+    not start from the solution of another case of 'case_list' (parent), the
+    other ones are submitted as soon as their parent is finished.
+
+    Args:
+        executor (object): Executor used to run the cases
+        case_list (list): List of SU2Case objects to run
+        nb_proc (int): Number of processes (MPI ranks) for one case
+
+    """
+
+    waiting_list = list(case_list)
+    running = {}
+
+    while waiting_list or running:
+
+        unfinished = set(waiting_list) | set(running.values())
+        ready_list = [case for case in waiting_list if case.parent not in unfinished]
+
+        # Should not happen (parents form a tree), but never wait forever
+        if not ready_list and not running:
+            ready_list = waiting_list[:1]
+
+        for case in ready_list:
+            waiting_list.remove(case)
+            running[executor.submit(run_SU2_case,case,nb_proc)] = case
+
+        done, _ = wait(running,return_when=FIRST_COMPLETED)
+        for future in done:
+            case = running.pop(future)
+            log.info(os.path.basename(case.case_dir) + ' run in '
+                     + str(round(case.wall_time,1)) + ' s, exit status: '
+                     + str(case.exit_status))
+
+
+def run_SU2_multi(wkdir, nb_proc, nb_proc_total=1, nb_retry=1, cache=None):
     """Function to run a multiple SU2 claculation.
 
     Function 'run_SU2_multi' will run in the given working directory SU2
     calculations (SU2_CFD then SU2_SOL). The working directory must have a
-    folder sctructure created by 'SU2Config' module.
+    folder sctructure created by 'SU2Config' module. Cases are run at the same
+    time, each one with 'nb_proc' processes, as long as the total number of
+    processes used stays within 'nb_proc_total'. A failing case does not stop
+    the others, it is run again up to 'nb_retry' times once all the cases
+    have been run. The run status of each case is saved in 'SU2RunStatus.csv'.
+    A case which starts from the solution of another case (warm start) is run
+    once this one is finished.
+    If a SU2CaseCache is given, cases already in the cache are not run again,
+    their results are copied from it.
 
     Args:
         wkdir (str): Path to the working directory
+        nb_proc (int): Number of processes (MPI ranks) for one case
+        nb_proc_total (int): Total number of processes which can be used at
+                             the same time (default: 1, one case at a time)
+        nb_retry (int): Number of times a failed case is run again
+        cache (object): SU2CaseCache object to reuse results (optional)
+
+    Returns:
+        case_list (list): List of SU2Case objects with their run status
 
     """
 
     if not os.path.exists(wkdir):
         raise OSError('The working directory : ' + wkdir + 'does not exit!')
 
-    original_dir = os.getcwd()
-    os.chdir(wkdir)
-
     # Check if there is some case directory
     case_dir_list = [dir for dir in os.listdir(wkdir) if 'Case' in dir]
     if case_dir_list == []:
         raise OSError('No folder has been found in the working directory: ' + wkdir)
 
+    case_list = []
     for dir in sorted(case_dir_list):
         config_dir = os.path.join(wkdir,dir)
-        os.chdir(config_dir)
 
         find_config_cfd = False
 
@@ -117,12 +256,64 @@ def run_SU2_multi(wkdir, nb_proc):
         if not find_config_cfd:
             raise ValueError('No "ConfigCFD.cfg" file has been found in this directory!')
 
-        su2f.run_soft('SU2_CFD',config_cfd_path,config_dir,nb_proc)
-        # su2f.run_soft('SU2_SOL',config_file_path,config_dir,nb_proc)
-        # Only useful if you need surface/volume flow file,
-        # if not forces_breakdown.dat will be generated by SU2_CFD.
-
-        os.chdir(wkdir)
+        case_list.append(SU2Case(config_dir,config_cfd_path))
+
+    # Find the case from which each case starts (warm start)
+    case_dict = {os.path.abspath(case.case_dir): case for case in case_list}
+    for case in case_list:
+        if case.restart_path is not None:
+            parent_dir = os.path.abspath(os.path.dirname(case.restart_path))
+            case.parent = case_dict.get(parent_dir)
+
+    # Get results of the cases already in the cache
+    to_run = case_list
+    if cache is not None:
+        to_run = []
+        for case in case_list:
+            case.cache_key = cache.get_key(case.config_path)
+            if cache.fetch(case.cache_key,case.case_dir):
+                case.exit_status = 0
+            else:
+                to_run.append(case)
+
+    # Number of cases which can be run at the same time
+    nb_parallel = max(1, min(int(nb_proc_total) // int(nb_proc), len(to_run)))
+    log.info(str(len(to_run)) + ' SU2 cases will be run, ' + str(nb_parallel)
+             + ' at the same time with ' + str(nb_proc) + ' proc each.')
+
+    # SU2 runs in separate processes, threads are only used to launch and
+    # wait for them
+    with ThreadPoolExecutor(max_workers=nb_parallel) as executor:
+        for attempt in range(nb_retry+1):
+            if not to_run:
+                break
+            if attempt:
+                log.warning(str(len(to_run)) + ' failed SU2 case(s) will be run again.')
+
+            run_SU2_cases(executor,to_run,nb_proc)
+
+            to_run = [case for case in to_run if not case.succeeded]
+
+    if cache is not None:
+        for case in case_list:
+            if case.succeeded and case.attempt:
+                cache.store(case.cache_key,case.case_dir,case.config_path)
+
+    # Record run status of all the cases
+    summary_path = os.path.join(wkdir,'SU2RunStatus.csv')
+    with open(summary_path,'w') as f:
+        f.write('case,exit_status,wall_time,attempt,log_path\n')
+        for case in case_list:
+            f.write(','.join([os.path.basename(case.case_dir),str(case.exit_status),
+                              str(round(case.wall_time,3)),str(case.attempt),
+                              case.log_path]) + '\n')
+
+    failed_list = [os.path.basename(case.case_dir) for case in case_list if not case.succeeded]
+    if failed_list:
+        log.error('The following SU2 case(s) failed: ' + ', '.join(failed_list)
+                  + '. See ' + summary_path)
+
+    return case_list
 
 
 # TODO: The deformation part should be moved to SU2MeshDef module
@@ -182,13 +373,22 @@ if __name__ == '__main__':
 
     log.info('----- Start of ' + os.path.basename(__file__) + ' -----')
 
-    cpacs_path = os.path.join(MODULE_DIR,'ToolInput','ToolInput.xml')
-    cpacs_out_path = os.path.join(MODULE_DIR,'ToolOutput','ToolOutput.xml')
+    cpacs_path = mi.get_toolinput_file_path('SU2Run')
+    cpacs_out_path = mi.get_tooloutput_file_path('SU2Run')
 
     tixi = cpsf.open_tixi(cpacs_path)
 
     # Get number of proc to use
     nb_proc = cpsf.get_value_or_default(tixi,SU2_XPATH+'/settings/nbProc',1)
+    nb_proc_total = cpsf.get_value_or_default(tixi,SU2_XPATH+'/settings/nbProcTotal',1)
+
+    # Get SU2 cache, if a cache directory is defined
+    cache_dir = cpsf.get_value_or_default(tixi,SU2_XPATH+'/settings/cacheDir','')
+    if cache_dir:
+        cache_size_max = cpsf.get_value_or_default(tixi,SU2_XPATH+'/settings/cacheSizeMax',1000.0)
+        cache = SU2CaseCache(cache_dir,cache_size_max)
+    else:
+        cache = None
 
     if len(sys.argv)>1:
         if sys.argv[1] == '-c':
@@ -200,7 +400,7 @@ if __name__ == '__main__':
             run_SU2_single(config_path,wkdir,nb_proc)
         elif sys.argv[1] == '-m':
             wkdir = os.path.join(MODULE_DIR,sys.argv[2])
-            run_SU2_multi(wkdir,nb_proc)
+            run_SU2_multi(wkdir,nb_proc,nb_proc_total,cache=cache)
         elif sys.argv[1] == '-f':
             wkdir = os.path.join(MODULE_DIR,sys.argv[2])
             config_path = os.path.join(wkdir,'ConfigCFD.cfg')   # temporary
@@ -213,7 +413,7 @@ if __name__ == '__main__':
     else: # if no argument given
         wkdir = ceaf.get_wkdir_or_create_new(tixi)
         generate_su2_config(cpacs_path,cpacs_out_path,wkdir)
-        run_SU2_multi(wkdir,nb_proc)
+        run_SU2_multi(wkdir,nb_proc,nb_proc_total,cache=cache)
         get_su2_results(cpacs_path,cpacs_out_path,wkdir)
 
     # TODO: cpacs_out_path for 'create_config' should be a temp file, now it's erase by 'get_su2get_su2_results'
@@ -32,6 +32,7 @@ import platform
 
 import ceasiompy.utils.ceasiompyfunctions as ceaf
 import ceasiompy.utils.cpacsfunctions as cpsf
+import ceasiompy.utils.moduleinterfaces as mi
 
 from ceasiompy.utils.ceasiomlogger import get_logger
 
@@ -302,8 +303,8 @@ if __name__ == '__main__':
 
     log.info('----- Start of ' + os.path.basename(__file__) + ' -----')
 
-    cpacs_path = os.path.join(MODULE_DIR,'ToolInput','ToolInput.xml')
-    cpacs_out_path = os.path.join(MODULE_DIR,'ToolOutput','ToolOutput.xml')
+    cpacs_path = mi.get_toolinput_file_path('SUMOAutoMesh')
+    cpacs_out_path = mi.get_tooloutput_file_path('SUMOAutoMesh')
 
     create_SU2_mesh(cpacs_path,cpacs_out_path)
 
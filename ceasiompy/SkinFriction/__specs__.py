@@ -15,6 +15,11 @@ RCE = {
     "email": "aidan.jungo@cfse.ch",
 }
 
+# ===== In-process execution =====
+
+# Function called by 'run_subworkflow' as function(cpacs_path, cpacs_out_path)
+MAIN_FUNCTION = 'skinfriction.add_skin_friction'
+
 
 cpacs_inout = CPACSInOut()
 
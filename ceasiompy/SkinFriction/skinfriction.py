@@ -9,7 +9,7 @@ Python version: >=3.6
 
 | Author: Aidan Jungo
 | Creation: 2019-06-13
-| Last modifiction: 2020-03-31
+| Last modifiction: 2026-10-18
 
 TODO:
 
@@ -24,13 +24,14 @@ TODO:
 #==============================================================================
 
 import os
-import math
+
+import numpy as np
 
 import ceasiompy.utils.cpacsfunctions as cpsf
 import ceasiompy.utils.apmfunctions as apmf
 import ceasiompy.utils.moduleinterfaces as mi
 
-from ceasiompy.utils.standardatmosphere import get_atmosphere
+from ceasiompy.utils.standardatmosphere import get_atmosphere_array
 
 from ceasiompy.utils.ceasiomlogger import get_logger
 
@@ -104,6 +105,8 @@ def estimate_skin_friction_coef(wetted_area,wing_area,wing_span,mach,alt):
 
     Function 'estimate_skin_friction_coef' gives an estimation of the skin
     friction drag coefficient, based on an empirical formala (see source).
+    Mach numbers and altitudes can be arrays (e.g. the columns of an aeroMap),
+    the coefficients are then calculated for all the points at once.
 
     Source:
         * Gerard W. H. van Es.  "Rapid Estimation of the Zero-Lift Drag
@@ -114,35 +117,43 @@ def estimate_skin_friction_coef(wetted_area,wing_area,wing_span,mach,alt):
         wetted_area (float):  Wetted Area of the entire aircraft [m^2]
         wing_area (float):  Main wing area [m^2]
         wing_span (float):  Main wing span [m]
-        mach (float):  Cruise Mach number [-]
-        alt (float):  Aircraft altitude [m]
+        mach (float or array):  Cruise Mach number [-]
+        alt (float or array):  Aircraft altitude [m]
 
     Returns:
-        cd0 (float): Drag coefficient due to skin friction [-]
+        cd0 (float or array): Drag coefficient due to skin friction [-]
     """
 
-    # Get atmosphere values at this altitude
-    Atm = get_atmosphere(alt)
+    mach, alt = np.broadcast_arrays(np.asarray(mach,dtype=np.float64),
+                                    np.asarray(alt,dtype=np.float64))
+
+    # Get atmosphere values at these altitudes
+    atm = get_atmosphere_array(alt)
 
-    kinetic_visc = Atm.visc/Atm.dens
+    kinetic_visc = atm.visc/atm.dens
 
     # Get speed from Mach Number
-    speed = mach * Atm.sos
+    speed = mach * atm.sos
 
     # Reynolds number based on the ratio Wetted Area / Wing Span
     reynolds_number = (wetted_area/wing_span) * speed / kinetic_visc
-    log.info('Reynolds number:' + str(round(reynolds_number)))
 
     # Skin friction coefficient, formula from source (see function description)
-    cfe = 0.00258 + 0.00102 * math.exp(-6.28*1e-9*reynolds_number) \
-          + 0.00295 * math.exp(-2.01*1e-8*reynolds_number)
-    log.info('Skin friction coefficient:' + str(round(cfe,5)))
+    cfe = 0.00258 + 0.00102 * np.exp(-6.28*1e-9*reynolds_number) \
+          + 0.00295 * np.exp(-2.01*1e-8*reynolds_number)
 
     # Drag coefficient due to skin friction
     cd0 = cfe * wetted_area / wing_area
-    log.info("Skin friction drag coefficient: " + str(cd0))
 
-    return cd0
+    if cd0.size:
+        log.info('Reynolds number: ' + str(round(reynolds_number.min())) + ' to '
+                 + str(round(reynolds_number.max())))
+        log.info('Skin friction coefficient: ' + str(round(cfe.min(),5)) + ' to '
+                 + str(round(cfe.max(),5)))
+        log.info('Skin friction drag coefficient: ' + str(cd0.min()) + ' to '
+                 + str(cd0.max()) + ' (' + str(cd0.size) + ' points)')
+
+    return cd0[()]
 
 
 def add_skin_friction(cpacs_path,cpacs_out_path):
@@ -203,6 +214,18 @@ def add_skin_friction(cpacs_path,cpacs_out_path):
         AeroCoef = apmf.get_aeromap(tixi,aeromap_uid)
         AeroCoef.complete_with_zeros()
 
+        # Calculate Cd0 for all cases
+        cd0 = estimate_skin_friction_coef(wetted_area,wing_area,wing_span, \
+                                          AeroCoef.mach,AeroCoef.alt)
+
+        # Projection of cd0 on cl, cd and cs axis
+        #TODO: Should Cd0 be projected or not???
+        aoa_rad = np.radians(AeroCoef.aoa)
+        aos_rad = np.radians(AeroCoef.aos)
+        cd0_cl = cd0 * np.sin(aoa_rad)
+        cd0_cd = cd0 * np.cos(aoa_rad) * np.cos(aos_rad)
+        cd0_cs = cd0 * np.sin(aos_rad)
+
         # Create new aeroCoefficient object to store coef with added skin friction
         AeroCoefSF = apmf.AeroCoefficient()
         AeroCoefSF.alt = AeroCoef.alt
@@ -210,49 +233,16 @@ def add_skin_friction(cpacs_path,cpacs_out_path):
         AeroCoefSF.aoa = AeroCoef.aoa
         AeroCoefSF.aos = AeroCoef.aos
 
-        # Iterate over all cases
-        case_count = AeroCoef.get_count()
-        for case in range(case_count):
-
-            # Get parameters for this case
-            alt = AeroCoef.alt[case]
-            mach = AeroCoef.mach[case]
-            aoa = AeroCoef.aoa[case]
-            aos = AeroCoef.aos[case]
-
-            # Calculate Cd0 for this case
-            cd0 = estimate_skin_friction_coef(wetted_area,wing_area,wing_span, \
-                                              mach,alt)
-
-            # Projection of cd0 on cl, cd and cs axis
-            #TODO: Should Cd0 be projected or not???
-            aoa_rad = math.radians(aoa)
-            aos_rad = math.radians(aos)
-            cd0_cl = cd0 * math.sin(aoa_rad)
-            cd0_cd = cd0 * math.cos(aoa_rad) * math.cos(aos_rad)
-            cd0_cs = cd0 * math.sin(aos_rad)
-
-            # Update aerodynamic coefficients
-            cl = AeroCoef.cl[case] + cd0_cl
-            cd = AeroCoef.cd[case] + cd0_cd
-            cs = AeroCoef.cs[case] + cd0_cs
-
-            # Shoud we change something? e.i. if a force is not apply at aero center...?
-            if len(AeroCoef.cml):
-                cml = AeroCoef.cml[case]
-            else:
-                cml = 0.0  # Shoud be change, just to test pyTornado
-            if len(AeroCoef.cmd):
-                cmd = AeroCoef.cmd[case]
-            else:
-                cmd = 0.0
-            if len(AeroCoef.cms):
-                cms = AeroCoef.cms[case]
-            else:
-                cms = 0.0
-
-            # Add new coefficients into the aeroCoefficient object
-            AeroCoefSF.add_coefficients(cl,cd,cs,cml,cmd,cms)
+        # Update aerodynamic coefficients
+        AeroCoefSF.cl = AeroCoef.cl + cd0_cl
+        AeroCoefSF.cd = AeroCoef.cd + cd0_cd
+        AeroCoefSF.cs = AeroCoef.cs + cd0_cs
+
+        # Shoud we change something? e.i. if a force is not apply at aero center...?
+        # (missing moment coefficients have been completed with zeros)
+        AeroCoefSF.cml = AeroCoef.cml
+        AeroCoefSF.cmd = AeroCoef.cmd
+        AeroCoefSF.cms = AeroCoef.cms
 
         # Create new aeroMap UID
         aeromap_sf_uid = aeromap_uid + '_SkinFriction'
@@ -292,9 +282,8 @@ if __name__ == '__main__':
 
     log.info('----- Start of ' + os.path.basename(__file__) + ' -----')
 
-    MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
-    cpacs_path = os.path.join(MODULE_DIR,'ToolInput','ToolInput.xml')
-    cpacs_out_path = os.path.join(MODULE_DIR,'ToolOutput','ToolOutput.xml')
+    cpacs_path = mi.get_toolinput_file_path('SkinFriction')
+    cpacs_out_path = mi.get_tooloutput_file_path('SkinFriction')
 
     mi.check_cpacs_input_requirements(cpacs_path)
 
@@ -16,6 +16,11 @@ RCE = {
     "email": "loic.verdier@epfl.ch",
 }
 
+# ===== In-process execution =====
+
+# Function called by 'run_subworkflow' as function(cpacs_path, cpacs_out_path)
+MAIN_FUNCTION = 'dynamicstabilityState.dynamic_stability_analysis'
+
 
 # ===== CPACS inputs and outputs =====
 
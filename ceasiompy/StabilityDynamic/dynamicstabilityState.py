@@ -9,7 +9,7 @@ Python version: >=3.6
 
 | Author: Verdier Loïc
 | Creation: 2019-10-24
-| Last modifiction: 2020-04-07 (AJ)
+| Last modifiction: 2026-10-18
 
 TODO:
     * Modify the code where there are "TODO"
@@ -44,16 +44,16 @@ import ceasiompy.utils.apmfunctions as apmf
 import ceasiompy.utils.moduleinterfaces as mi
 
 from ceasiompy.StabilityDynamic.func_dynamic import plot_sp_level_a, plot_sp_level_b, plot_sp_level_c,\
-                                            get_unic, interpolation, get_index,  trim_derivative,\
                                             speed_derivative_at_trim, adimensionalise,\
-                                            speed_derivative_at_trim_lat, concise_derivative_longi, concise_derivative_lat,\
-                                            longi_root_identification, direc_root_identification,\
+                                            concise_derivative_longi, concise_derivative_lat,\
+                                            longi_root_identification_batch, direc_root_identification_batch,\
                                             check_sign_longi, check_sign_lat,\
                                             short_period_damping_rating, short_period_frequency_rating, cap_rating, \
                                             phugoid_rating, roll_rating, spiral_rating, dutch_roll_rating, plot_splane,\
-                                            longi_mode_characteristic, direc_mode_characteristic, trim_condition
+                                            longi_mode_characteristic, direc_mode_characteristic
 
-from ceasiompy.utils.standardatmosphere import get_atmosphere, plot_atmosphere
+from ceasiompy.utils.standardatmosphere import get_atmosphere, get_atmosphere_array
+from ceasiompy.utils.trimfunctions import TrimTable
 from ceasiompy.SkinFriction.skinfriction import get_largest_wing_dim
 from ceasiompy.utils.ceasiomlogger import get_logger
 
@@ -186,29 +186,44 @@ def dynamic_stability_analysis(cpacs_path, cpacs_out_path):
     cml_list = Coeffs.cml
     cms_list = Coeffs.cms
     cmd_list = Coeffs.cmd
-    dcsdrstar_list = Coeffs.dcsdrstar
-    dcsdpstar_list = Coeffs.dcsdpstar
-    dcldqstar_list = Coeffs.dcldqstar
-    dcmsdqstar_list = Coeffs.dcmsdqstar
-    dcddqstar_list = Coeffs.dcddqstar
-    dcmldqstar_list = Coeffs.dcmldqstar
-    dcmddpstar_list = Coeffs.dcmddpstar
-    dcmldpstar_list = Coeffs.dcmldpstar
-    dcmldrstar_list = Coeffs.dcmldrstar
-    dcmddrstar_list = Coeffs.dcmddrstar
 
 
+    # Index of the aeroMap rows by (alt, mach, aoa, aos), built only once
+    aeromap_index = apmf.AeroMapIndex(Coeffs)
+
     # All different vallues with only one occurence
-    alt_unic = get_unic(alt_list)
-    mach_unic = get_unic(mach_list)
-    aos_unic = get_unic(aos_list)
-    aoa_unic = get_unic(aoa_list)
+    alt_unic = aeromap_index.get_unique('alt')
+    mach_unic = aeromap_index.get_unique('mach')
+    aos_unic = aeromap_index.get_unique('aos')
+    aoa_unic = aeromap_index.get_unique('aoa')
 
     # TODO get from CPACS
     incrementalMap = False
 
+    # Trim conditions (cl = cl_required) of all the (alt, mach, aos) slices of the aeroMap
+    atm = get_atmosphere_array(alt_unic)
+    u0_grid = np.outer(atm.sos, mach_unic)
+    with np.errstate(divide='ignore'):
+        cl_required = (m*atm.grav[:,None])/(0.5*atm.dens[:,None]*u0_grid**2*s)
+    cl_trim = TrimTable(aeromap_index, cl_list, 'aoa', cl_required[:,:,None,None])
+
+    # Coefficients, damping and speed derivatives at all the trim points (aos = 0)
+    aeromap_interp = apmf.AeroMapInterpolator(Coeffs, aeromap_index)
+    trim_aoa_grid = np.full((len(alt_unic),len(mach_unic)), np.nan)
+    if 0 in aos_unic:
+        trim_aoa_grid = cl_trim.table['value'][:,:,np.flatnonzero(aos_unic == 0)[0]]
+    alt_grid, mach_grid = np.meshgrid(alt_unic, mach_unic, indexing='ij')
+    trim_coefs = aeromap_interp.get_values(alt_grid, mach_grid, trim_aoa_grid, 0)
+    trim_mach_der = speed_derivative_at_trim(aeromap_interp, alt_grid, mach_grid, trim_aoa_grid, mach_unic, 'mach')
+    trim_aos_der = speed_derivative_at_trim(aeromap_interp, alt_grid, mach_grid, trim_aoa_grid, aos_unic, 'aos')
+
+    # State matrices and (alt, mach, trim_aoa, ...) of all the trim points
+    longi_matrices = []
+    longi_cases = []
+    direc_matrices = []
+    direc_cases = []
+
     for alt in alt_unic:
-        idx_alt = [i for i in range(len(alt_list)) if alt_list[i] == alt]
         Atm = get_atmosphere(alt)
         g = Atm.grav
         a = Atm.sos
@@ -216,35 +231,38 @@ def dynamic_stability_analysis(cpacs_path, cpacs_out_path):
 
         for mach in mach_unic:
             print('Mach : ' , mach)
-            idx_mach = [i for i in range(len(mach_list)) if mach_list[i] == mach]
             u0,m_adim,i_xx,i_yy,i_zz,i_xz = adimensionalise(a,mach,rho,s,b,mac,m,I_xx,I_yy,I_zz,I_xz) # u0 is V0 in Cook
 
             # Hyp: trim condition when: ( beta = 0 and dCm/dalpha = 0)  OR  ( aos=0 and dcms/daoa = 0 )
             if 0 not in aos_unic :
                 log.warning('The aircraft can not be trimmed (requiring symetric flight condition) as beta never equal to 0 for Alt = {}, mach = {}'.format(alt,mach))
             else:
-                idx_aos = [i for i in range(len(aos_list)) if aos_list[i] == 0]
-                find_index = get_index(idx_alt, idx_mach, idx_aos)
+                find_index = aeromap_index.get_rows(alt=alt, mach=mach, aos=0)
+                # Rows in ascending aoa, as the points of the trim table
+                find_index = find_index[np.argsort(aoa_list[find_index], kind='stable')]
                 # If there is only one data at (alt, mach, aos) then dont make stability anlysis
                 if len(find_index) <= 1:
                     log.warning('Not enough data at : Alt = {} , mach = {}, aos = 0, can not perform stability analysis'.format(alt,mach))
                 # If there is at leat 2 data at (alt, mach, aos) then, make stability anlysis
                 else:
                     # Calculate trim conditions
-                    cms = []
-                    aoa = []
-                    cl = []
-                    for index in find_index:
-                        cms.append(cms_list[index])
-                        aoa.append(aoa_list[index]*np.pi/180)
-                        cl.append(cl_list[index])
-
-                    cl_required = (m*g)/(0.5*rho*u0**2*s)
-                    (trim_aoa , idx_trim_before, idx_trim_after, ratio) = trim_condition(alt, mach, cl_required, cl, aoa,)
-
-                    if trim_aoa:
+                    cms = cms_list[find_index]
+                    aoa = aoa_list[find_index]*np.pi/180
+                    cl = cl_list[find_index]
+
+                    idx_trim = cl_trim.get_index(alt=alt, mach=mach, aos=0)
+                    trim = cl_trim.table[idx_trim]
+                    if trim['cross_nb'] > 0:
+                        trim_aoa = trim['value']*np.pi/180
+                        idx_trim_before, idx_trim_after, ratio = trim['idx_before'], trim['idx_after'], trim['ratio']
+                    else:
+                        log.info('Alt = {}, mach = {} not enough lift to fly, cl_max= {} and required_cl = {}'.format(alt, mach, max(cl), cl_required[idx_trim[:2]]))
+                        trim_aoa = idx_trim_before = idx_trim_after = ratio = None
+
+                    if trim_aoa is not None:
                         trim_aoa_deg = trim_aoa *180/np.pi
-                        trim_cms = interpolation(cms, idx_trim_before, idx_trim_after, ratio)
+                        trim_values = trim_coefs[idx_trim[:2]]
+                        trim_cms = trim_values.cms
                         pitch_moment_derivative_rad = (cms[idx_trim_after] - cms[idx_trim_before]) / (aoa[idx_trim_after] - aoa[idx_trim_before])
                         pitch_moment_derivative_deg = pitch_moment_derivative_rad / (180/np.pi)
                         # Find incremental cms
@@ -262,7 +280,7 @@ def dynamic_stability_analysis(cpacs_path, cpacs_out_path):
 
                     else:
                         trim_aoa_deg = None
-                        trim_cms = None
+                        trim_cms = np.nan
                         pitch_moment_derivative_deg = None
                         dcms = None
                         trim_elevator =  None
@@ -270,22 +288,13 @@ def dynamic_stability_analysis(cpacs_path, cpacs_out_path):
 
                     # Longitudinal dynamic stability,
                     # Stability analysis
-                    if longitudinal_analysis and trim_cms:
-                        cl = []
-                        cd = []
-                        dcldqstar = []
-                        dcddqstar = []
-                        dcmsdqstar = []
-                        for index in find_index:
-                            cl.append(cl_list[index])
-                            cd.append(cd_list[index])
-                            dcldqstar.append(dcldqstar_list[index])
-                            dcddqstar.append(dcddqstar_list[index])
-                            dcmsdqstar.append(dcmsdqstar_list[index])
+                    if longitudinal_analysis and not np.isnan(trim_cms):
+                        cl = cl_list[find_index]
+                        cd = cd_list[find_index]
 
                         # Trimm variables
-                        cd0 =interpolation(cd, idx_trim_before, idx_trim_after, ratio) # Dragg coeff at trim
-                        cl0 =interpolation(cl, idx_trim_before, idx_trim_after, ratio)   # Lift coeff at trim
+                        cd0 = trim_values.cd # Dragg coeff at trim
+                        cl0 = trim_values.cl   # Lift coeff at trim
                         cl_dividedby_cd_trim = cl0/cd0  #  cl/cd ratio at trim, at trim aoa
 
                         # Lift & drag coefficient derivative with respect to AOA at trimm
@@ -293,20 +302,19 @@ def dynamic_stability_analysis(cpacs_path, cpacs_out_path):
                         cd_alpha0 = (cd[idx_trim_after] - cd[idx_trim_before]) / (aoa[idx_trim_after] - aoa[idx_trim_before])
                         print(idx_trim_before, idx_trim_after, ratio)
 
-                        dcddqstar0 = interpolation(dcddqstar, idx_trim_before, idx_trim_after, ratio) # x_q
-                        dcldqstar0 = interpolation(dcldqstar, idx_trim_before, idx_trim_after, ratio) # z_q
-                        dcmsdqstar0 = interpolation(dcmsdqstar, idx_trim_before, idx_trim_after, ratio) # m_q
+                        dcddqstar0 = trim_values.dcddqstar # x_q
+                        dcldqstar0 = trim_values.dcldqstar # z_q
+                        dcmsdqstar0 = trim_values.dcmsdqstar # m_q
                         cm_alpha0 = trim_cms
 
                         # Speed derivatives if there is at least 2 distinct mach values
                         if len(mach_unic) >=2 :
-                            dcddm0 =speed_derivative_at_trim(cd_list, mach, mach_list, mach_unic, idx_alt, aoa_list, aos_list, idx_trim_before, idx_trim_after, ratio)
-
-                            if dcddm0 == None :
+                            dcddm0 = trim_mach_der[idx_trim[:2]].cd
+                            if np.isnan(dcddm0) :
                                 dcddm0 = 0
                                 log.warning('Not enough data to determine dcddm or (Cd_mach) at trim condition at Alt = {}, mach = {}, aoa = {}, aos = 0. Assumption: dcddm = 0'.format(alt,mach,round(trim_aoa_deg,2)))
-                            dcldm0 =speed_derivative_at_trim (cl_list, mach, mach_list, mach_unic, idx_alt, aoa_list, aos_list, idx_trim_before, idx_trim_after, ratio)
-                            if dcldm0 == None :
+                            dcldm0 = trim_mach_der[idx_trim[:2]].cl
+                            if np.isnan(dcldm0) :
                                 dcldm0 = 0
                                 log.warning('Not enough data to determine dcldm (Cl_mach) at trim condition at Alt = {}, mach = {}, aoa = {}, aos = 0. Assumption: dcldm = 0'.format(alt,mach,round(trim_aoa_deg,2)))
                         else :
@@ -364,45 +372,26 @@ def dynamic_stability_analysis(cpacs_path, cpacs_out_path):
 
                     # Laterl-Directional
                     if lateral_directional_analysis:
-                        cml = [] # N
-                        cmd = [] # L
-                        aos = []
-                        aoa = [] # For Ue We
-                        cs = [] # For y_v
-                        dcsdpstar = [] # y_p
-                        dcmddpstar = []  # l_p
-                        dcmldpstar = []  # n_p
-                        dcsdrstar = [] # y_r
-                        dcmldrstar = []  # n_r
-                        dcmddrstar = []  # l_r
-
-                        for index in find_index:
-                            cml.append(cml_list[index]) # N , N_v
-                            cmd.append(cmd_list[index]) # L ,  L_v
-                            aos.append(aos_list[index]*np.pi/180)
-                            aoa.append(aoa_list[index]) # For Ue We
-                            cs.append(cs_list[index])
-                            dcsdpstar.append(dcsdpstar_list[index]) # y_p
-                            dcmddpstar.append(dcmddpstar_list[index]) # l_p
-                            dcmldpstar.append(dcmldpstar_list[index]) # n_p
-                            dcsdrstar.append(dcsdrstar_list[index]) # y_r
-                            dcmldrstar.append(dcmldrstar_list[index]) # n_r
-                            dcmddrstar.append(dcmddrstar_list[index]) # l_r
+                        cml = cml_list[find_index] # N , N_v
+                        cmd = cmd_list[find_index] # L ,  L_v
+                        aos = aos_list[find_index]*np.pi/180
+                        aoa = aoa_list[find_index] # For Ue We
+                        cs = cs_list[find_index] # For y_v
+                        trim_values = trim_coefs[idx_trim[:2]]
 
                         #Trimm condition calculation
                         # speed derivatives :  y_v / l_v / n_v  /  Must be devided by speed given that the hyp v=Beta*U
                         if len(aos_unic) >=2 :
-                            print('Mach : ', mach, '   and idx_mach : ', idx_mach)
-                            cs_beta0 = speed_derivative_at_trim_lat(cs_list , aos_list, aos_unic, idx_alt, idx_mach, aoa_list, idx_trim_before, idx_trim_after, ratio)# y_v
-                            if cs_beta0 == None :
+                            cs_beta0 = trim_aos_der[idx_trim[:2]].cs # y_v
+                            if np.isnan(cs_beta0) :
                                 cs_beta0 = 0
                                 log.warning('Not enough data to determine cs_beta (Y_v) at trim condition at Alt = {}, mach = {}, aoa = {}, aos = 0. Assumption: cs_beta = 0'.format(alt,mach,round(trim_aoa_deg,2)))
-                            cmd_beta0  = speed_derivative_at_trim_lat(cmd_list , aos_list, aos_unic, idx_alt, idx_mach, aoa_list, idx_trim_before, idx_trim_after, ratio)# l_v
-                            if cmd_beta0 ==None :
+                            cmd_beta0 = trim_aos_der[idx_trim[:2]].cmd # l_v
+                            if np.isnan(cmd_beta0) :
                                 cmd_beta0 = 0
                                 log.warning('Not enough data to determine cmd_beta (L_v) at trim condition at Alt = {}, mach = {}, aoa = {}, aos = 0. Assumption: cmd_beta = 0'.format(alt,mach,round(trim_aoa_deg,2)))
-                            cml_beta0 = speed_derivative_at_trim_lat(cml_list , aos_list, aos_unic, idx_alt, idx_mach, aoa_list, idx_trim_before, idx_trim_after, ratio)# n_v
-                            if cml_beta0 == None :
+                            cml_beta0 = trim_aos_der[idx_trim[:2]].cml # n_v
+                            if np.isnan(cml_beta0) :
                                 cml_beta0 = 0
                                 log.warning('Not enough data to determine cml_beta (N_v) at trim condition at Alt = {}, mach = {}, aoa = {}, aos = 0. Assumption: cml_beta = 0'.format(alt,mach,round(trim_aoa_deg,2)))
                         else :
@@ -411,13 +400,13 @@ def dynamic_stability_analysis(cpacs_path, cpacs_out_path):
                             cml_beta0 = 0
                             log.warning('Not enough data to determine cs_beta (Y_v), cmd_beta (L_v) and cml_beta (N_v) at trim condition at Alt = {}, mach = {}, aoa = {}, aos = 0. Assumption: cs_beta = cmd_beta = cml_beta = 0'.format(alt,mach,round(trim_aoa_deg,2)))
 
-                        dcsdpstar0 = interpolation(dcsdpstar, idx_trim_before, idx_trim_after, ratio) # y_p
-                        dcmddpstar0  = interpolation(dcmddpstar, idx_trim_before, idx_trim_after, ratio) # l_p
-                        dcmldpstar0 = interpolation(dcmldpstar, idx_trim_before, idx_trim_after, ratio) # n_p
+                        dcsdpstar0 = trim_values.dcsdpstar # y_p
+                        dcmddpstar0 = trim_values.dcmddpstar # l_p
+                        dcmldpstar0 = trim_values.dcmldpstar # n_p
 
-                        dcsdrstar0 =interpolation(dcsdrstar, idx_trim_before, idx_trim_after, ratio) # y_r
-                        dcmldrstar0 =  interpolation(dcmldrstar, idx_trim_before, idx_trim_after, ratio) # n_r
-                        dcmddrstar0 =  interpolation(dcmddrstar, idx_trim_before, idx_trim_after, ratio) # l_r
+                        dcsdrstar0 = trim_values.dcsdrstar # y_r
+                        dcmldrstar0 = trim_values.dcmldrstar # n_r
+                        dcmddrstar0 = trim_values.dcmddrstar # l_r
 
                         # TODO: calculate that and find in the cpacs
                         dcsdxi0 = 0
@@ -457,7 +446,7 @@ def dynamic_stability_analysis(cpacs_path, cpacs_out_path):
                         # Sign check  (Ref: Thomas Yechout Book, P304)
                         check_sign_lat(Y_v,L_v,N_v,Y_p,L_p,Y_r,L_r,N_r,L_xi,Y_zeta,L_zeta,N_zeta)
 
-                    if trim_aoa :
+                    if trim_aoa is not None:
                         for angles in flight_path_angle:
                             theta_e =  angles + trim_aoa
 
@@ -469,52 +458,15 @@ def dynamic_stability_analysis(cpacs_path, cpacs_out_path):
 
                                 C_longi = np.identity(4)
                                 D_longi = np.zeros((4,2))
-                                # Identify longitudinal roots
-                                if  longi_root_identification(A_longi)[0] == None : # If longitudinal root not complex conjugate raise warning and plot roots
-                                    eg_value_longi = longi_root_identification(A_longi)[1]
-                                    log.warning('Longi : charcateristic equation  roots are not complex conjugate : {}'.format(eg_value_longi))
-                                    legend = ['Root1', 'Root2', 'Root3', 'Root4']
-                                    plot_title = 'S-plane longitudinal characteristic equation roots at (Alt = {}, Mach= {}, trimed at aoa = {}°)'.format(alt,mach,trim_aoa)
-                                    plot_splane(eg_value_longi, plot_title,legend,show_plots,save_plots)
-                                else:                                                                                     # Longitudinal roots are complex conjugate
-                                    (sp1, sp2, ph1, ph2, eg_value_longi , eg_vector_longi, eg_vector_longi_magnitude)\
-                                            = longi_root_identification(A_longi)
-                                    legend = ['sp1', 'sp2', 'ph1', 'ph2']
-                                    plot_title = 'S-plane longitudinal characteristic equation roots at (Alt = {}, Mach= {}, trimed at aoa = {}°)'.format(alt,mach,trim_aoa)
-                                    plot_splane(eg_value_longi, plot_title,legend,show_plots,save_plots)
-
-                                    # Modes parameters : damping ratio, frequence, CAP, time tou double amplitude
-                                    Z_w_dimensional = Z_w*(0.5*rho*s*u0**2)   # Z_w* (0.5*rho*s*u0**2)  is the dimensional form of Z_w,   Z_w = -(cl_alpha0 + cd0) P312 Yechout
-                                    z_alpha =  Z_w_dimensional * u0  /m # alpha = w/u0 hence,   z_alpha =  Z_w_dimensional * u0      [Newton/rad/Kg :   m/s^2 /rad]
-                                    load_factor = - z_alpha/g #  number of g's/rad (1g/rad 2g/rad  3g/rad)
-                                    (sp_freq, sp_damp, sp_cap, ph_freq, ph_damp, ph_t2)\
-                                            =  longi_mode_characteristic(sp1,sp2,ph1,ph2,load_factor)
-
-                                    # Rating
-                                    sp_damp_rate = short_period_damping_rating(aircraft_class,sp_damp)
-                                    sp_freq_rate = short_period_frequency_rating(flight_phase,aircraft_class,sp_freq, load_factor)
-                                    # Plot SP freq vs Load factor
-                                    legend = 'Alt = {}, Mach= {}, trim aoa = {}°'.format(alt,mach,trim_aoa)
-                                    if flight_phase == 'A' :
-                                        plot_sp_level_a([load_factor], [sp_freq], legend, show_plots,save_plots)
-                                    elif flight_phase == 'B' :
-                                        plot_sp_level_b(x_axis, y_axis, legend, show_plots,save_plots)
-                                    else:
-                                        plot_sp_level_c(x_axis, y_axis, legend, show_plots,save_plots)
-                                    sp_cap_rate = cap_rating(flight_phase, sp_cap, sp_damp)
-                                    ph_rate = phugoid_rating(ph_damp, ph_t2)
-                                    # Raise warning if unstable mode in the log file
-                                    if sp_damp_rate == None :
-                                        log.warning('ShortPeriod UNstable at Alt = {}, Mach = {} , due to DampRatio = {} '.format(alt,mach,round(sp_damp, 4)))
-                                    if sp_freq_rate == None :
-                                        log.warning('ShortPeriod UNstable at Alt = {}, Mach = {} , due to UnDampedFreq = {} rad/s '.format(alt,mach,round(sp_freq, 4)))
-                                    if sp_cap_rate == None :
-                                        log.warning('ShortPeriod UNstable at Alt = {}, Mach = {} , with CAP evaluation, DampRatio = {} , CAP = {} '.format(alt,mach,round(sp_damp, 4),round(sp_cap, 4)))
-                                    if ph_rate == None :
-                                        log.warning('Phugoid UNstable at Alt = {}, Mach = {} , DampRatio = {} , UnDampedFreq = {} rad/s'.format(alt,mach,round(ph_damp, 4),round(ph_freq, 4)))
-
-                                    # TODO
-                                    # Compute numerator TF for (Alt, mach, flight_path_angle, aoa_trim, aos=0
+
+                                # Load factor, to evaluate the short period mode
+                                Z_w_dimensional = Z_w*(0.5*rho*s*u0**2)   # Z_w* (0.5*rho*s*u0**2)  is the dimensional form of Z_w,   Z_w = -(cl_alpha0 + cd0) P312 Yechout
+                                z_alpha =  Z_w_dimensional * u0  /m # alpha = w/u0 hence,   z_alpha =  Z_w_dimensional * u0      [Newton/rad/Kg :   m/s^2 /rad]
+                                load_factor = - z_alpha/g #  number of g's/rad (1g/rad 2g/rad  3g/rad)
+
+                                # Roots are identified for all the trim points at once (see below)
+                                longi_matrices.append(A_longi)
+                                longi_cases.append((alt, mach, trim_aoa, load_factor))
 
                             if lateral_directional_analysis:
                                 (A_direc, B_direc,y_v,l_v,n_v,y_p,y_phi,y_psi,l_p,l_phi,l_psi,n_p,y_r,l_r,n_r,n_phi,n_psi, y_xi,l_xi,n_xi, y_zeta,l_zeta,n_zeta)\
@@ -525,32 +477,9 @@ def dynamic_stability_analysis(cpacs_path, cpacs_out_path):
                                 C_direc = np.identity(5)
                                 D_direc = np.zeros((5,2))
 
-                                if  direc_root_identification(A_direc)[0] == None: # Lateral-directional roots are correctly identified
-                                    eg_value_direc = direc_root_identification(A_direc)[1]
-                                    print('Lat-Dir : charcateristic equation  roots are not complex conjugate : {}'.format(eg_value_direc))
-                                    legend = ['Root1', 'Root2', 'Root3', 'Root4']
-                                    plot_title = 'S-plane lateral characteristic equation roots at (Alt = {}, Mach= {}, trimed at aoa = {}°)'.format(alt,mach,trim_aoa)
-                                    plot_splane(eg_value_direc, plot_title,legend,show_plots,save_plots)
-                                else:                                                                                     # Lateral-directional roots are correctly identified
-                                    (roll, spiral, dr1, dr2, eg_value_direc, eg_vector_direc, eg_vector_direc_magnitude)\
-                                        = direc_root_identification(A_direc)
-                                    legend = ['roll', 'spiral', 'dr1', 'dr2']
-                                    plot_title = 'S-plane lateralcharacteristic equation roots at (Alt = {}, Mach= {}, trimed at aoa = {}°)'.format(alt,mach,trim_aoa)
-                                    plot_splane(eg_value_direc, plot_title,legend,show_plots,save_plots)
-                                    (roll_timecst, spiral_timecst, spiral_t2, dr_freq, dr_damp, dr_damp_freq) = direc_mode_characteristic(roll,spiral,dr1,dr2)
-
-                                    # Rating
-                                    roll_rate = roll_rating(flight_phase, aircraft_class, roll_timecst)
-                                    spiral_rate = spiral_rating(flight_phase, spiral_timecst, spiral_t2)
-                                    dr_rate = dutch_roll_rating(flight_phase, aircraft_class, dr_damp, dr_freq, dr_damp_freq)
-
-                                    # Raise warning in the log file if unstable mode
-                                    if roll_rate == None :
-                                        log.warning('Roll mode UNstable at Alt = {}, Mach = {} , due to roll root = {}, roll time contatant = {} s'.format(alt,mach,round(roll_root, 4), round(roll_timecst, 4)))
-                                    if spiral_rate == None :
-                                        log.warning('Spiral mode UNstable at Alt = {}, Mach = {} , spiral root = {}, time_double_ampl = {}'.format(alt,mach,round(spiral_root, 4), round(spiral_t2, 4)))
-                                    if dr_rate == None :
-                                        log.warning('Dutch Roll UNstable at Alt = {}, Mach = {} , Damping Ratio = {} , frequency = {} rad/s '.format(alt,mach,round(dr_damp, 4),round(dr_freq, 4)))
+                                # Roots are identified for all the trim points at once (see below)
+                                direc_matrices.append(A_direc)
+                                direc_cases.append((alt, mach, trim_aoa))
 
 
                         # TODO: Save those value if code works
@@ -636,6 +565,90 @@ def dynamic_stability_analysis(cpacs_path, cpacs_out_path):
                         # num_tf_rud_beta_xpath = flight_qualities_case_xpath +'lateral/numBetaDrp'  # numerator of TF of rudder impact to sideslip angle : beta
                         # den_tf_latdir_xpath = flight_qualities_case_xpath + '/lateral/denLat' # denominator of longitudinal motion
 
+    # Identify the longitudinal roots of all the trim points at once
+    if longi_matrices:
+        longi_valid, longi_roots, eg_value_longi, eg_vector_longi \
+            = longi_root_identification_batch(np.array(longi_matrices))
+
+        for n, (alt, mach, trim_aoa, load_factor) in enumerate(longi_cases):
+            plot_title = 'S-plane longitudinal characteristic equation roots at (Alt = {}, Mach= {}, trimed at aoa = {}°)'.format(alt,mach,trim_aoa)
+
+            if not longi_valid[n]: # If longitudinal root not complex conjugate raise warning and plot roots
+                log.warning('Longi : charcateristic equation  roots are not complex conjugate : {}'.format(eg_value_longi[n]))
+                legend = ['Root1', 'Root2', 'Root3', 'Root4']
+                plot_splane(eg_value_longi[n], plot_title,legend,show_plots,save_plots)
+                continue
+
+            # Longitudinal roots are complex conjugate
+            sp1, sp2, ph1, ph2 = longi_roots[n]
+            legend = ['sp1', 'sp2', 'ph1', 'ph2']
+            plot_splane(longi_roots[n], plot_title,legend,show_plots,save_plots)
+
+            # Modes parameters : damping ratio, frequence, CAP, time tou double amplitude
+            (sp_freq, sp_damp, sp_cap, ph_freq, ph_damp, ph_t2)\
+                    =  longi_mode_characteristic(sp1,sp2,ph1,ph2,load_factor)
+
+            # Rating
+            sp_damp_rate = short_period_damping_rating(aircraft_class,sp_damp)
+            sp_freq_rate = short_period_frequency_rating(flight_phase,aircraft_class,sp_freq, load_factor)
+            # Plot SP freq vs Load factor
+            legend = 'Alt = {}, Mach= {}, trim aoa = {}°'.format(alt,mach,trim_aoa)
+            if flight_phase == 'A' :
+                plot_sp_level_a([load_factor], [sp_freq], legend, show_plots,save_plots)
+            elif flight_phase == 'B' :
+                plot_sp_level_b([load_factor], [sp_freq], legend, show_plots,save_plots)
+            else:
+                plot_sp_level_c([load_factor], [sp_freq], legend, show_plots,save_plots)
+            sp_cap_rate = cap_rating(flight_phase, sp_cap, sp_damp)
+            ph_rate = phugoid_rating(ph_damp, ph_t2)
+            # Raise warning if unstable mode in the log file
+            if sp_damp_rate == None :
+                log.warning('ShortPeriod UNstable at Alt = {}, Mach = {} , due to DampRatio = {} '.format(alt,mach,round(sp_damp, 4)))
+            if sp_freq_rate == None :
+                log.warning('ShortPeriod UNstable at Alt = {}, Mach = {} , due to UnDampedFreq = {} rad/s '.format(alt,mach,round(sp_freq, 4)))
+            if sp_cap_rate == None :
+                log.warning('ShortPeriod UNstable at Alt = {}, Mach = {} , with CAP evaluation, DampRatio = {} , CAP = {} '.format(alt,mach,round(sp_damp, 4),round(sp_cap, 4)))
+            if ph_rate == None :
+                log.warning('Phugoid UNstable at Alt = {}, Mach = {} , DampRatio = {} , UnDampedFreq = {} rad/s'.format(alt,mach,round(ph_damp, 4),round(ph_freq, 4)))
+
+            # TODO
+            # Compute numerator TF for (Alt, mach, flight_path_angle, aoa_trim, aos=0
+
+    # Identify the lateral-directional roots of all the trim points at once
+    if direc_matrices:
+        direc_valid, direc_roots, eg_value_direc, eg_vector_direc \
+            = direc_root_identification_batch(np.array(direc_matrices))
+
+        for n, (alt, mach, trim_aoa) in enumerate(direc_cases):
+
+            if not direc_valid[n]:
+                print('Lat-Dir : charcateristic equation  roots are not complex conjugate : {}'.format(eg_value_direc[n]))
+                legend = ['Root1', 'Root2', 'Root3', 'Root4']
+                plot_title = 'S-plane lateral characteristic equation roots at (Alt = {}, Mach= {}, trimed at aoa = {}°)'.format(alt,mach,trim_aoa)
+                plot_splane(eg_value_direc[n], plot_title,legend,show_plots,save_plots)
+                continue
+
+            # Lateral-directional roots are correctly identified
+            roll, spiral, dr1, dr2 = direc_roots[n]
+            roll, spiral = roll.real, spiral.real
+            legend = ['roll', 'spiral', 'dr1', 'dr2']
+            plot_title = 'S-plane lateralcharacteristic equation roots at (Alt = {}, Mach= {}, trimed at aoa = {}°)'.format(alt,mach,trim_aoa)
+            plot_splane(direc_roots[n], plot_title,legend,show_plots,save_plots)
+            (roll_timecst, spiral_timecst, spiral_t2, dr_freq, dr_damp, dr_damp_freq) = direc_mode_characteristic(roll,spiral,dr1,dr2)
+
+            # Rating
+            roll_rate = roll_rating(flight_phase, aircraft_class, roll_timecst)
+            spiral_rate = spiral_rating(flight_phase, spiral_timecst, spiral_t2)
+            dr_rate = dutch_roll_rating(flight_phase, aircraft_class, dr_damp, dr_freq, dr_damp_freq)
+
+            # Raise warning in the log file if unstable mode
+            if roll_rate == None :
+                log.warning('Roll mode UNstable at Alt = {}, Mach = {} , due to roll root = {}, roll time contatant = {} s'.format(alt,mach,round(roll, 4), round(roll_timecst, 4)))
+            if spiral_rate == None :
+                log.warning('Spiral mode UNstable at Alt = {}, Mach = {} , spiral root = {}, time_double_ampl = {}'.format(alt,mach,round(spiral, 4), round(spiral_t2, 4)))
+            if dr_rate == None :
+                log.warning('Dutch Roll UNstable at Alt = {}, Mach = {} , Damping Ratio = {} , frequency = {} rad/s '.format(alt,mach,round(dr_damp, 4),round(dr_freq, 4)))
+
 
 if __name__ == '__main__':
 
@@ -9,7 +9,7 @@ Python version: >=3.6
 
 | Author: Loic Verdier
 | Creation: 2020-02-24
-| Last modifiction: 2020-03-24 (AJ)
+| Last modifiction: 2026-10-18
 
 TODO:
 
@@ -36,11 +36,18 @@ from matplotlib.lines import Line2D
 from matplotlib.patches import Patch
 from matplotlib.ticker import ScalarFormatter
 
+import ceasiompy.utils.moduleinterfaces as mi
+
+from ceasiompy.utils.trimfunctions import find_crossings, check_crossing
 from ceasiompy.utils.ceasiomlogger import get_logger
 
 log = get_logger(__file__.split('.')[0])
 
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+MODULE_NAME = os.path.basename(MODULE_DIR)
+
+# Relative tolerance to identify real and complex conjugate roots
+ROOT_TOL = 1e-9
 
 #=============================================================================
 #   CLASSES
@@ -146,7 +153,7 @@ def plot_sp_level_a(x_axis, y_axis, legend, show_plots, save_plots):
 
     if save_plots:
         fig_title = plot_title.replace(' ','_')
-        fig_path = os.path.join(MODULE_DIR,'ToolOutput',fig_title) + '.svg'
+        fig_path = os.path.join(mi.get_module_run_dir(MODULE_NAME),'ToolOutput',fig_title) + '.svg'
         plt.savefig(fig_path)
 
     if show_plots:
@@ -227,7 +234,7 @@ def plot_sp_level_b(x_axis, y_axis, legend, show_plots, save_plots):
 
     if save_plots:
         fig_title = plot_title.replace(' ','_')
-        fig_path = os.path.join(MODULE_DIR,'ToolOutput',fig_title) + '.svg'
+        fig_path = os.path.join(mi.get_module_run_dir(MODULE_NAME),'ToolOutput',fig_title) + '.svg'
         plt.savefig(fig_path)
 
     # Show Plots
@@ -372,7 +379,7 @@ def plot_sp_level_c(x_axis, y_axis, legend, show_plots, save_plots):
 
     if save_plots:
         fig_title = plot_title.replace(' ','_')
-        fig_path = os.path.join(MODULE_DIR,'ToolOutput',fig_title) + '.svg'
+        fig_path = os.path.join(mi.get_module_run_dir(MODULE_NAME),'ToolOutput',fig_title) + '.svg'
         plt.savefig(fig_path)
 
     if show_plots:
@@ -388,11 +395,8 @@ def get_unic(vector):
     Returns:
         vector_unic (list): List of unic values ordered in ascending way
     """
-    vector_unic = []
-    for elem in vector:
-        if elem not in vector_unic:
-            vector_unic.append(elem)
-    vector_unic.sort()
+    vector_unic = sorted(set(vector))
+
     return vector_unic
 
 
@@ -427,15 +431,8 @@ def get_index(idx_list1, idx_list2, idx_list3):
         find_idx (list): list of index (integer) common in the 3 lists
     """
 
-    # List of index of elements which have the same index in vectors list, list1, list2
-    find_idx = []
-
-    # Fill   the liste find_index
-    for idx1 in idx_list1:
-        for idx2 in idx_list2:
-            for idx3 in idx_list3:
-                if idx1 == idx2 == idx3:
-                    find_idx.append(idx1)
+    # Intersection of the 3 lists, in ascending order
+    find_idx = sorted(set(idx_list1) & set(idx_list2) & set(idx_list3))
 
     return find_idx
 
@@ -449,196 +446,48 @@ def trim_derivative(alt, mach, list1, list2):
     Args:
         alt (float): Altitude [m]
         mach (float) : Mach Number [-]
-        list1 (list): List of coefficient (e.g. Moment coefficient)
-        list2 (list): List of parameter (e.g. Angle of attack (or sideslip))
+        list1 cm (list): Moment coefficient [-]
+        list2 angle (list): Angle of attack (or sideslip) [deg]
 
     Returns:
         cruise_angle (float): Angle to get cm. = 0
         trim_parameter (float): Moment derivative at cruise_angle
-        cross (boolean): List of unique value
+        idx_trim_before, idx_trim_after (int): Index of the points around cm = 0
+        ratio (float): Position of cm = 0 between these points
     """
 
-    crossed = True
-    trim_value = 0
-    trim_parameter = 0
-    idx_trim_before = 0
-    idx_trim_after = 0
-    ratio = 0
-
-    # Check moment coefficient list
-    if len(np.argwhere(np.diff(np.sign(list1)))) == 0  :
-        crossed = False
-        # If all list1. values are 0:
-        if list1.count(0) == len(list1):
-            log.warning('Alt = {}, mach = {} moment coefficients list is composed of 0 only.'.format(alt, mach))
-        # If cm curve does not cross the 0 line
-        else:
-            log.error('Alt = {}, mach = {} moment coefficients list does not cross the 0 line, aircraft not stable, trimm conditions not achieved.'.format(alt, mach))
-    # If list1. Curve crosses the 0 line more than once no stability analysis can be performed
-    elif len(np.argwhere(np.diff(np.sign(list1)))) > 2 or list1.count(0) > 1:
-        log.error('Alt = {}, mach = {} moment coefficients list crosses more than once the 0 line, no stability analysis performed'.format(alt, mach))
-        crossed  = False
-    # If list1. Curve crosses the 0 line twice
-    elif 0 not in np.sign(list1) and len(np.argwhere(np.diff(np.sign(list1)))) == 2:
-        log.error('Alt = {}, mach = {} moment coefficients list crosses the 0 line twice, no stability analysis performed'.format(alt, mach))
-        crossed = False
-    # If   0 is in list1
-    elif 0 in np.sign(list1) and list1.count(0) == 1 and crossed:
-        idx_list1_0 = [i for i in range(len(list1)) if list1[i] == 0][0]
-        # If 0 is the first element in list1
-        if idx_list1_0 == 0 :
-            idx_trim_before = idx_list1_0
-            idx_trim_after = idx_list1_0+1
-
-            # Angles and coeffs before and after crossing the 0 line
-            value_before = list2[idx_trim_before ]
-            value_after = list2[idx_trim_after ]
-            list1_before = list1[idx_trim_before ]
-            list1_after = list1[idx_trim_after ]
-
-            trim_value = value_before
-            trim_parameter = (list1_after-list1_before)/(value_after-value_before)
-            ratio = trim_value/(value_after -value_before )
-
-        # If 0 is the last element in list1
-        elif idx_list1_0 == len(list1) - 1:
-            idx_trim_before = idx_list1_0-1
-            idx_trim_after = idx_list1_0
-
-            # values and coeffs before and after crossing the 0 line
-            value_before = list2[idx_trim_before]
-            value_after = list2[idx_trim_after]
-            list1_before = list1[idx_trim_before]
-            list1_after = list1[idx_trim_after]
-
-            trim_value = value_after
-            trim_parameter = (list1_after-list1_before)/(value_after-value_before)
-            ratio = trim_value/(value_after -value_before)
-
-        # If  0 is nor the first nor the last element in list1
-        elif 0 < idx_list1_0 < len(list1)-1:
-            idx_trim_before = idx_list1_0-1
-            idx_trim_after = idx_list1_0+1
-
-            # Angles and coeffs before and after crossing the 0 line
-            value_before = list2[idx_trim_before]
-            value_after = list2[idx_trim_after]
-            list1_before = list1[idx_trim_before]
-            list1_after = list1[idx_trim_after]
-
-            trim_value= list2[idx_list1_0]
-            trim_parameter = (list1_after - list1_before)/(value_after - value_before)
-            ratio = trim_value/(value_after - value_before )
-
-    # If list1 crosse the 0 line and 0 is not in list1
-    elif  len(np.argwhere(np.diff(np.sign(list1)))) == 1 and 0 not in np.sign(list1) and crossed:
-        # Make the linear equation btween the 2 point before and after crossing the 0 ine y=ax+b
-        idx_list1_0 = np.argwhere(np.diff(np.sign(list1)))[0][0]
-        idx_trim_before = idx_list1_0
-        idx_trim_after = idx_list1_0+1
-
-        # Angles and coeffs before and after crossing the 0 line
-        value_before = list2[idx_trim_before]
-        value_after = list2[idx_trim_after]
-        list1_before = list1[idx_trim_before]
-        list1_after = list1[idx_trim_after]
-
-        fit = np.polyfit([value_before, value_after], [list1_before, list1_after], 1)  # returns [a,b] of y=ax+b
-
-        trim_value= -fit[1]/fit[0] # list1. = 0 for y = 0  hence cruise agngle = -b/a
-        trim_parameter = fit[0]
-        ratio =  trim_value/(value_after - value_before )
-
-    return (trim_value, trim_parameter, idx_trim_before, idx_trim_after, ratio)
+    trim = find_crossings(list1, list2)
+
+    if not check_crossing(alt, mach, trim):
+        return (0, 0, 0, 0, 0)
+
+    return (trim['value'], trim['slope'], trim['idx_before'], trim['idx_after'], trim['ratio'])
 
 
 # Function derivative, or more trim condition function
 def trim_condition(alt, mach, cl_required, cl, aoa):
-    """Find if a moments coefficeint cm cross the 0 line, once or more
-        Find if a moment coefficeint cm. crosse the 0 line only once and return
-        the corresponding angle and the cm derivative at cm=0
+    """Find the angle of attack at which the lift compensate the weight
 
     Args:
         alt (float): Altitude [m]
         mach (float) : Mach Number [-]
         cl_required (float): Lift coefficient required
-        cl (list): Lift coefficient list [-]  # TODO: rename cl_list
-        aoa (list): Angle of attack list (or sideslip) [deg]  # TODO: rename aoa_list
+        cl (list): Lift coefficient list [-]
+        aoa (list): Angle of attack (or sideslip) list [deg]
 
     Returns:
         None if the lift is not enough to fly
         Aoa at which the lift compensate the weight
-        pitch moement at this (aoa, alt, amch)
+        Index of the points around this aoa and ratio to interpolate between them
     """
 
-    list1 = []
-    for element in cl :
-        list1.append(element - cl_required)
+    trim = find_crossings(np.asarray(cl, dtype=float) - cl_required, aoa)
 
-    # Check moment coefficient list
-    if len(np.argwhere(np.diff(np.sign(list1)))) == 0  :
-        # If list1 does not cross the 0 line
+    if trim['cross_nb'] == 0:
         log.info('Alt = {}, mach = {} not enough lift to fly, cl_max= {} and required_cl = {}'.format(alt, mach, max(cl), cl_required))
         return  (None, None, None, None)
 
-        #  COMPUTE cms derivatives and check if the slope is negative.
-    # If  0 is in list1
-    elif 0 in np.sign(list1) and list1.count(0) == 1 :
-        idx_list1_0 = [i for i in range(len(list1)) if list1[i] == 0][0]
-        # If 0 is the first element in list1
-        if idx_list1_0 == 0 :
-            idx_trim_before = idx_list1_0
-            idx_trim_after = idx_list1_0+1
-
-            # Angles and coeffs before and after crossing the 0 line
-            aoa_before = aoa[idx_trim_before ]
-            aoa_after = aoa[idx_trim_after ]
-
-            trim_aoa = aoa_before
-            ratio =  (trim_aoa - aoa_before)/(aoa_after - aoa_before )
-
-        # If 0 is the last element in list1
-        elif idx_list1_0 == len(list1) - 1:
-            idx_trim_before = idx_list1_0-1
-            idx_trim_after = idx_list1_0
-
-            # aoas and coeffs before and after crossing the 0 line
-            aoa_before = aoa[idx_trim_before]
-            aoa_after = aoa[idx_trim_after]
-
-            trim_aoa = aoa_after
-            ratio =  (trim_aoa - aoa_before)/(aoa_after - aoa_before )
-
-        # If  0 is nor the first nor the last element in list1
-        elif 0 < idx_list1_0 < len(list1)-1:
-            idx_trim_before = idx_list1_0-1
-            idx_trim_after = idx_list1_0+1
-
-            # Angles and coeffs before and after crossing the 0 line
-            aoa_before = aoa[idx_trim_before]
-            aoa_after = aoa[idx_trim_after]
-
-            trim_aoa= aoa[idx_list1_0]
-            ratio =  (trim_aoa - aoa_before)/(aoa_after - aoa_before )
-
-    else:
-        # Make the linear equation btween the 2 point before and after crossing the 0 ine y=ax+b
-        idx_list1_0 = np.argwhere(np.diff(np.sign(list1)))[0][0]
-        idx_trim_before = idx_list1_0
-        idx_trim_after = idx_list1_0+1
-
-        # Angles and coeffs before and after crossing the 0 line
-        aoa_before = aoa[idx_trim_before]
-        aoa_after = aoa[idx_trim_after]
-        list1_before = list1[idx_trim_before]
-        list1_after = list1[idx_trim_after]
-
-        fit = np.polyfit([aoa_before, aoa_after], [list1_before, list1_after], 1)  # returns [a,b] of y=ax+b
-
-        trim_aoa= -fit[1]/fit[0] # list1. = 0 for y = 0  hence cruise agngle = -b/a
-        ratio =  (trim_aoa - aoa_before)/(aoa_after - aoa_before )
-
-    return (trim_aoa, idx_trim_before, idx_trim_after, ratio)
+    return (trim['value'], trim['idx_before'], trim['idx_after'], trim['ratio'])
 
 
 def adimensionalise(a,mach,rho,s,b,mac,m,I_xx,I_yy,I_zz,I_xz):
@@ -783,7 +632,7 @@ def plot_splane(eg_value_longi, plot_title, legend,show_plots, save_plots):
 
     if save_plots:
         fig_title = plot_title.replace(' ','_')
-        fig_path = os.path.join(MODULE_DIR,'ToolOutput',fig_title) + '.svg'
+        fig_path = os.path.join(mi.get_module_run_dir(MODULE_NAME),'ToolOutput',fig_title) + '.svg'
         plt.savefig(fig_path)
 
     if show_plots:
@@ -898,132 +747,95 @@ def concise_derivative_lat(Y_v,L_v,N_v,Y_p,L_p,N_p,Y_r,L_r,N_r,Y_xi,L_xi,N_xi,
     return (A_direc, B_direc,y_v,l_v,n_v,y_p,y_phi,y_psi,l_p,l_phi,l_psi,n_p,y_r,l_r,n_r,n_phi,n_psi, y_xi,l_xi,n_xi, y_zeta,l_zeta,n_zeta)
 
 
-def speed_derivative_at_trim (parameter_list, mach, mach_list, mach_unic_list, idx_alt, aoa_list, aos_list, idx_trim_before, idx_trim_after, ratio):
+def speed_derivative_at_trim(aeromap_interp, alt, mach, trim_aoa, param_unic, param='mach'):
+    """ Find the speed derivatives of all the coefficients at trim conditions
+
+    The derivatives with respect to the mach number (or to the angle of
+    sideslip, as v = beta*U) are finite differences between the neighbouring
+    values of the aeroMap, right/left differences at the first/last value.
+    The coefficients are interpolated at the trim angle of attack and aos = 0.
 
-    """ Find the speed derivative of "parameter" at trim conditions
     Args:
-        parameter_list (): list of parameter's values : e.i. Cd (dragg coefficient)
-        mach (): the mach at trim conditions
-        mach_list (): ...
-        mach_unic_list (): list of unic values of mach
-        TODO: complete args
-        idx_trim_before (): index
+        aeromap_interp (AeroMapInterpolator): Interpolator of the aeroMap
+        alt (float or array): Altitude of the trim points
+        mach (float or array): Mach number of the trim points
+        trim_aoa (float or array): Angle of attack of the trim points [deg]
+        param_unic (array): Unique values of 'param' in the aeroMap
+        param (str): 'mach' or 'aos', parameter of the derivatives
 
     Returns:
-        parameter_speed_derivative: parameter speed derivaive at trim condtion ei cd@ aoa=4.22
+        derivatives (recarray): Derivatives at each trim point, one field per
+                                coefficient e.g. derivatives.cd, NaN when
+                                there is not enough data
     """
-    idx_mach_left = []
-    idx_mach_right = []
-    # if Mach first value,of Mach unic hence make a right derivative
-    if mach == mach_unic_list[0]:
-        mach_left = mach
-        mach_right = mach_unic_list[1]
-        idx_mach_left = [j for j in range(len(mach_list)) if mach_list[j] == mach_left]
-        idx_mach_right = [j for j in range(len(mach_list)) if mach_list[j] == mach_right ]
-    # if Mach last value,of Mach_unic hence make a left derivative
-    elif mach == mach_unic_list[-1]:
-        mach_left =  mach_unic_list[-2]
-        mach_right = mach
-        idx_mach_left = [j for j in range(len(mach_list)) if mach_list[j] == mach_left ]
-        idx_mach_right = [j for j in range(len(mach_list)) if mach_list[j] == mach_right ]
-    # else,  Mach  value is nor the first nor the last value, of Mach_unic hence make middle derivative
-    else:
-        idx_mach_in_mach_unic = [j for j in range(len(mach_unic_list)) if mach_unic_list[j] == mach][0] #Find index oh mach in mach_unic_list
-        mach_left = mach_unic_list[idx_mach_in_mach_unic-1]
-        mach_right = mach_unic_list[idx_mach_in_mach_unic+1]
-        idx_mach_left = [j for j in range(len(mach_list)) if mach_list[j] == mach_left ]
-        idx_mach_right = [j for j in range(len(mach_list)) if mach_list[j] == mach_right ]
 
-    idx_aoa_left = [j for j in range(len(aoa_list)) if aoa_list[j] == aoa_list[idx_trim_before]]
-    idx_aoa_right = [j for j in range(len(aoa_list)) if aoa_list[j] == aoa_list[idx_trim_after]]
-    idx_aos = [j for j in range(len(aos_list)) if aos_list[j] == 0] # at trim, aos = 0
+    point = {'alt': alt, 'mach': mach, 'aoa': trim_aoa, 'aos': 0.0}
 
-    # Cd @ trim AOA @mach_left
-    idx_parameter_left_left = get_index(get_index(idx_aoa_left, idx_mach_left, idx_aos),idx_alt,idx_alt)[0] # left index of left  value
-    idx_parameter_left_right= get_index(get_index(idx_aoa_right, idx_mach_left, idx_aos),idx_alt,idx_alt)[0]  # right index of left value
-    parameter_left = parameter_list[idx_parameter_left_left]  + (parameter_list[idx_parameter_left_right] - parameter_list[idx_parameter_left_left])*ratio
+    # Neighbouring values of the trim point in the aeroMap
+    idx = np.searchsorted(param_unic, point[param])
+    left = param_unic[np.maximum(idx-1, 0)]
+    right = param_unic[np.minimum(idx+1, len(param_unic)-1)]
 
-    # Cd @ trim AOA @mach_right
-    idx_parameter_right_left = get_index(get_index(idx_aoa_left, idx_mach_right, idx_aos),idx_alt,idx_alt)[0]  # left index of rightvalue
-    idx_parameter_right_right= get_index(get_index(idx_aoa_right, idx_mach_right, idx_aos),idx_alt,idx_alt)[0]  # right index of right value
-    parameter_right = parameter_list[idx_parameter_right_left]  + (parameter_list[idx_parameter_right_right] - parameter_list[idx_parameter_right_left])*ratio
+    values_left = aeromap_interp.get_values(**{**point, param: left})
+    values_right = aeromap_interp.get_values(**{**point, param: right})
 
-    # Cd  derivative @ trim AOA
-    parameter_speed_derivative = (parameter_left-parameter_right)/(mach_left-mach_right)
+    derivatives = np.empty(values_left.shape, dtype=values_left.dtype).view(np.recarray)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for name in aeromap_interp.names:
+            derivatives[name] = (values_left[name]-values_right[name])/(left-right)
 
-    return parameter_speed_derivative
+    return derivatives
 
 
-def speed_derivative_at_trim_lat(parameter_list,aos_list, aos_unic_list,idx_alt,
-                                 idx_mach, aoa_list,idx_trim_before,
-                                 idx_trim_after, ratio):
-    """ Find the speed derivative of "parameter" at trim conditions, at trom: aos =0
+def is_conjugate(root1, root2):
+    """Check if roots are complex conjugate (with a relative tolerance)
 
     Args:
-        parameter_list : list of parameter's values : e.i. Cd (dragg coefficient)
-        aos : the aos at trim conditions
-        aos_unic_list : list of unic values of aos
-        idx_trim_before : index
-        TODO: complte
+        root1 (array) : First roots
+        root2 (array) : Second roots
 
     Returns:
-        parameter_speed_derivative: parameter speed derivaive at trim condtion ei cd@ aoa=4.22
+        conjugate (array) : True where 'root2' is the conjugate of 'root1' and
+                            the roots are not real
     """
 
-    idx_aos_left = []
-    idx_aos_right = []
-    # if aos first value,of aos unic hence make a right derivative
-    if 0 == aos_unic_list[0] :
-        aos_left = 0
-        aos_right = aos_unic_list[1]
-        idx_aos_left = [j for j in range(len(aos_list)) if aos_list[j] == aos_left]
-        idx_aos_right = [j for j in range(len(aos_list)) if aos_list[j] == aos_right ]
-    # if aos last value,of aos_unic hence make a left derivative
-    elif 0 == aos_unic_list[-1] :
-        aos_left =  aos_unic_list[-2]
-        aos_right = 0
-        idx_aos_left = [j for j in range(len(aos_list)) if aos_list[j] == aos_left ]
-        idx_aos_right = [j for j in range(len(aos_list)) if aos_list[j] == aos_right ]
-    # else,  aos  value is nor the first nor the last value, of aos_unic hence make middle derivative
-    else:
-        idx_aos_in_aos_unic = [j for j in range(len(aos_unic_list)) if aos_unic_list[j] == 0][0]
-        aos_left = aos_unic_list[idx_aos_in_aos_unic-1]
-        aos_right = aos_unic_list[idx_aos_in_aos_unic+1]
-        idx_aos_left = [j for j in range(len(aos_list)) if aos_list[j] == aos_left ]
-        idx_aos_right = [j for j in range(len(aos_list)) if aos_list[j] == aos_right ]
+    root1 = np.asarray(root1, dtype=complex)
+    root2 = np.asarray(root2, dtype=complex)
+    scale = ROOT_TOL * np.maximum(np.abs(root1), 1)
 
-    idx_aoa_left = [j for j in range(len(aoa_list)) if aoa_list[j] == aoa_list[idx_trim_before]]
-    idx_aoa_right = [j for j in range(len(aoa_list)) if aoa_list[j] == aoa_list[idx_trim_after]]
+    return (np.abs(root1 - np.conj(root2)) <= scale) & (np.abs(root1.imag) > scale)
 
-    # Cs @ trim AOA @aos_left   (interpolation)
-    idx_parameter_left_left = get_index(get_index(idx_aoa_left, idx_aos_left, idx_mach),idx_alt,idx_alt) # left index of left value
-    idx_parameter_left_right= get_index(get_index(idx_aoa_right, idx_aos_left, idx_mach),idx_alt,idx_alt)  # right index of left value
 
-    if idx_parameter_left_left == [] or idx_parameter_left_right == []:
-        return
-    else:
-        idx_parameter_left_left = idx_parameter_left_left[0]# left value
-        idx_parameter_left_right = idx_parameter_left_right[0]  # right value
+def longi_root_identification_batch(A_longi):
+    """Identifies the roots of the longitudinal charcateristic equations
 
-    parameter_left = parameter_list[idx_parameter_left_left]  + (parameter_list[idx_parameter_left_right] - parameter_list[idx_parameter_left_left])*ratio
+    The eigenvalues of all the state matrices (e.g. one per trim point of an
+    aeromap) are computed with a single batched 'np.linalg.eig'. For each
+    matrix, the roots are sorted by natural frequency (modulus): the two
+    slowest are the phugoid roots and the two fastest the short period roots.
+    In each mode, the root with the negative imaginary part comes first.
 
-    # Cd @ trim AOA @aos_right  (interpolation)
-    idx_parameter_right_left = get_index(get_index(idx_aoa_left, idx_aos_right, idx_mach),idx_alt,idx_alt)  # left index of right value
-    idx_parameter_right_right= get_index(get_index(idx_aoa_right, idx_aos_right, idx_mach),idx_alt,idx_alt) # right index of right  value
+    Args:
+        A_longi (3D array) : np.ndarray(N,4,4) State space matrices in CONCISE form
 
-    # if no value found for the left parameters, the function returns: None
-    if idx_parameter_right_left == [] or idx_parameter_right_right == []:
-        return
-    else:
-        idx_parameter_right_left = idx_parameter_right_left[0] # left value
-        idx_parameter_right_right = idx_parameter_right_right[0] # right value
+    Returns:
+        valid (array) : np.ndarray(N) True if both modes are complex conjugate
+        roots (array) : np.ndarray(N,4) Roots sp1, sp2, ph1, ph2 of each matrix
+        eg_value_longi (array) : np.ndarray(N,4) Eigenvalues
+        eg_vector_longi (array) : np.ndarray(N,4,4) Eigenvectors
+    """
+
+    eg_value_longi, eg_vector_longi = linalg.eig(np.asarray(A_longi, dtype=float))
+    eg_value_longi = eg_value_longi.astype(complex)
 
-    parameter_right = parameter_list[idx_parameter_right_left]  + (parameter_list[idx_parameter_right_right] - parameter_list[idx_parameter_right_left])*ratio
+    # Sort by modulus, then by imaginary part (conjugate roots have the same modulus)
+    order = np.lexsort((eg_value_longi.imag, np.abs(eg_value_longi)), axis=-1)
+    sorted_roots = np.take_along_axis(eg_value_longi, order, axis=-1)
+    roots = sorted_roots[:, [2,3,0,1]]
 
-    # Cd  derivative @ trim AOA
-    parameter_speed_derivative = (parameter_left-parameter_right)/(aos_left-aos_right)
+    valid = is_conjugate(roots[:,0], roots[:,1]) & is_conjugate(roots[:,2], roots[:,3])
 
-    return parameter_speed_derivative
+    return valid, roots, eg_value_longi, eg_vector_longi
 
 
 def longi_root_identification(A_longi):
@@ -1042,87 +854,15 @@ def longi_root_identification(A_longi):
             ph2 : complex conjugate root of the phugoid mode
     """
 
-    # Compute eigenvalues and eigenvectors of longi CONCISE equations at trim
-    eg_value_longi , eg_vector_longi = linalg.eig(A_longi)
-
-    # TODO: maybe use as test
-    # delta = a S^4 + bS^3 + cS^2 + dS  + e  , delta_longi  = [a,b,c,d,e]     from page 423 Cook
-    # delta_longi = [1, \
-    #                        -(m_q+x_u+z_w),\
-    #                        (m_q*z_w - m_w*z_q) + (m_q*x_u - m_u*x_q) + (x_u*z_w - x_w*z_u) - m_theta,\
-    #                        (m_theta*x_u-m_u*x_theta)+(m_theta*z_w-m_w*z_theta)+m_q*(x_w*z_u-x_u*z_w)+x_q*(m_u*z_w-m_w*z_u)+z_q*(m_w*x_u-m_u*x_w),\
-    #                        m_theta*(x_w*z_u-x_u*z_w)+x_theta*(m_u*z_w-m_w*z_u)+z_theta*(m_w*x_u-m_u*x_w)]
-    # roots_longi = np.roots(delta_longi)
-    # print('\n Eigenvalues Longitudinal :')
-    # print(eg_value_longi)
-    # print('\n DEN TF roots Longitudinal :')
-    # print(roots_longi)
-    # print('\n Eigenvectors Longitudinal :')
-    # print(eg_vector_longi)
-
-    count = 0
-    real_root = []
-    complex_root = []
-    for root  in eg_value_longi:
-        if isinstance(root , complex):
-            count += 1
-            complex_root.append(root)
-        else:
-            real_root.append(root )
+    valid, roots, eg_value_longi, eg_vector_longi = longi_root_identification_batch([A_longi])
 
-    # count number of complex numbers
-    if count == 2: # if phugoid not stable (real number):
-        if real_root[0] <= real_root[0] :
-            ph1 = real_root[0]
-            ph2 = real_root[1]
-        else:
-            ph1 = real_root[1]
-            ph2 = real_root[0]
-        if np.imag(complex_root[0]) < np.imag(complex_root[1]):
-            sp1 = complex_root[0]
-            sp2 = complex_root[1]
-        else:
-            sp1 = complex_root[1]
-            sp2 = complex_root[0]
-    else: # if phugoid and short period both complex:
-        root1 = eg_value_longi[0]
-        root2 = eg_value_longi[1]
-        root3 = eg_value_longi[2]
-        root4 = eg_value_longi[3]
-        if (np.imag(root1))**2 == (np.imag(root2))**2:
-            couple1 = [root1,root2]
-            couple2 = [root3,root4]
-        elif (np.imag(root1))**2 == (np.imag(root3))**2:
-            couple1 = [root1,root3]
-            couple2 = [root2,root4]
-        else :
-            couple1 = [root1,root4]
-            couple2 = [root2,root3]
-
-        if abs(np.imag(root1)) > abs(np.imag(couple2[0]))**2:
-            sp1 = root1
-            sp2 = couple1[1]
-            ph1 = couple2[0]
-            ph2 = couple2[1]
-        else:
-            ph1 = root1
-            ph2 = couple1[1]
-            sp1 = couple2[0]
-            sp2 = couple2[1]
-
-    # If short period roots are not correctly identified all longi roots are not identified and roots are not physically possible, and programm has to stop
-    if sp1 != np.conj(sp2) or ph1 != np.conj(ph2)  :
-        return (None, eg_value_longi)
-    else:
-        # Calculate eigen vectors magnitude :
-        eg_vector_longi_magnitude = []
-        for row in eg_vector_longi:
-            new_row = []
-            for vector in row :
-                vector_magnitude = abs(vector) # Module of complex number
-                new_row.append(format(vector_magnitude, '.3g'))
-            eg_vector_longi_magnitude.append(new_row)
-        return(sp1, sp2, ph1, ph2, eg_value_longi , eg_vector_longi, eg_vector_longi_magnitude)
+    if not valid[0]:
+        return (None, eg_value_longi[0])
+
+    sp1, sp2, ph1, ph2 = roots[0]
+    eg_vector_longi_magnitude = np.abs(eg_vector_longi[0])
+
+    return(sp1, sp2, ph1, ph2, eg_value_longi[0], eg_vector_longi[0], eg_vector_longi_magnitude)
 
 
 def longi_mode_characteristic(sp1,sp2,ph1,ph2,load_factor):
@@ -1381,11 +1121,54 @@ def phugoid_rating(phugoid_damping, ph_t2):
     return ph_rate
 
 
+def direc_root_identification_batch(A_direc):
+    """Identifies the roots of the lateral charcateristic equations
+
+    The eigenvalues of all the state matrices are computed with a single
+    batched 'np.linalg.eig'. For each matrix, the complex conjugate pair is the
+    dutch roll, the real root with the largest absolute value is the roll root
+    and the second one is the spiral root.
+
+    Args:
+        A_direc (3D array) : np.ndarray(N,n,n) State space matrices in CONCISE form
+
+    Returns:
+        valid (array) : np.ndarray(N) True if all the roots are identified
+        roots (array) : np.ndarray(N,4) Roots roll, spiral, dr1, dr2 of each
+                        matrix (dr1 with positive imaginary part)
+        eg_value_direc (array) : np.ndarray(N,n) Eigenvalues
+        eg_vector_direc (array) : np.ndarray(N,n,n) Eigenvectors
+    """
+
+    eg_value_direc, eg_vector_direc = linalg.eig(np.asarray(A_direc, dtype=float))
+    eg_value_direc = eg_value_direc.astype(complex)
+
+    is_complex = np.abs(eg_value_direc.imag) > ROOT_TOL * np.maximum(np.abs(eg_value_direc), 1)
+
+    # Real roots sorted by decreasing absolute value, complex roots at the end
+    real_abs = np.where(is_complex, -1.0, np.abs(eg_value_direc.real))
+    real_order = np.argsort(-real_abs, axis=-1, kind='stable')
+    roll = np.take_along_axis(eg_value_direc, real_order[:,:1], axis=-1)[:,0].real
+    spiral = np.take_along_axis(eg_value_direc, real_order[:,1:2], axis=-1)[:,0].real
+
+    # Dutch roll roots are the complex roots with the largest/smallest imaginary part
+    imag = np.where(is_complex, eg_value_direc.imag, 0.0)
+    dr1 = np.take_along_axis(eg_value_direc, np.argmax(imag, axis=-1)[:,None], axis=-1)[:,0]
+    dr2 = np.take_along_axis(eg_value_direc, np.argmin(imag, axis=-1)[:,None], axis=-1)[:,0]
+
+    n_complex = is_complex.sum(axis=-1)
+    valid = (n_complex == 2) & (eg_value_direc.shape[-1] - n_complex >= 2) & is_conjugate(dr1, dr2)
+
+    roots = np.column_stack((roll, spiral, dr1, dr2))
+
+    return valid, roots, eg_value_direc, eg_vector_direc
+
+
 def direc_root_identification(A_direc):
     """identifies the root of the lateral charcateristic equation
 
     Args:
-        roots_direc_list : a list of four roots
+        A_direc (2D matrix) : State space matrix in CONCISE form
 
     Returns:
         If dutch roll roots are not complex conjugate, and spiral and roll not identified, the function returns:
@@ -1397,58 +1180,15 @@ def direc_root_identification(A_direc):
             dr1 : complex conjugate root of the dutch roll mode
     """
 
-    # Compute eigenvalues and eigenvectors of lateral CONCISE equations at trim
-    eg_value_direc , eg_vector_direc = linalg.eig(A_direc)
-
-    # TODO: from book, maybe use as test
-    # # In cincise form,   delta = aS^5 + bS^4 + cS^3+ dS^2 + eS + f ,  delta_direc =[a,b,c,d,e,f]
-    # delta_direc = [1,\
-    #                         -(l_p+n_r+y_v),
-    #                         (l_p*n_r-l_r*n_p)+(n_r*y_v-n_v*y_r)+(l_p*y_v-l_v*y_p)-(l_phi+n_psi),\
-    #                         (l_p*n_psi-l_psi*n_p)+(l_phi*n_r-l_r*n_phi)+l_v*(n_r*y_p-n_p*y_r-y_phi)+n_v*(l_p*y_r-l_r*y_p-y_psi)+y_v*(l_r*n_p-l_p*n_r+l_phi+n_psi),\
-    #                         (l_phi*n_psi-l_psi*n_psi)+l_v*((n_r*y_phi-n_phi*y_r)+(n_psi*y_p-n_p*y_psi))+n_v*((l_phi*y_r-l_r*y_phi)+(l_p*y_psi-l_psi*y_p))+y_v*((l_r*n_phi-l_phi*n_r)+(l_psi*n_p-l_p*n_psi)),\
-    #                         l_v*(n_psi*y_phi-n_phi*y_psi)+n_v*(l_phi*y_psi-l_psi*y_phi)+y_v*(l_psi*n_phi-l_phi*n_psi)]
-
-    roll = None
-    spiral = None
-    dr1 = None
-    dr2 = None
-    reals = []
-
-    for root in eg_value_direc :
-        if  root.imag != 0: # if complex root
-            if np.imag(root)>0: # If imaginary part >0
-                dr1 = root # Dutch Roll Root1
-            else :
-                dr2 = root # Dutch Roll Root2
-        else: # If real root
-            reals.append(root.real)
-
-    absolute = [abs(value) for value in reals]
-    absolute.sort(reverse=True)
-
-    for elem in reals:
-        if abs(elem) == absolute[0]:
-            roll = elem
-        elif abs(elem) == absolute[1]:
-            spiral = elem
-        else:
-            pass
+    valid, roots, eg_value_direc, eg_vector_direc = direc_root_identification_batch([A_direc])
 
-    if dr1 == None or dr2== None or roll == None or spiral == None: # Check that all variable have been assigned a value
-        return  (None, eg_value_direc)
-    elif  dr1 != np.conj(dr2) : # Check that dr roots are complex conjugate
-        return  (None, eg_value_direc)
-    else:
-        # Calculate eigen vectors magnitude :
-        eg_vector_direc_magnitude = []
-        for row in eg_vector_direc:
-            new_row = []
-            for vector in row :
-                vector_magnitude = abs(vector) # Module of complex number
-                new_row.append(format(vector_magnitude, '.4g'))
-            eg_vector_direc_magnitude.append(new_row)
-        return(roll, spiral, dr1, dr2, eg_value_direc, eg_vector_direc, eg_vector_direc_magnitude)
+    if not valid[0]:
+        return (None, eg_value_direc[0])
+
+    roll, spiral, dr1, dr2 = roots[0]
+    eg_vector_direc_magnitude = np.abs(eg_vector_direc[0])
+
+    return(roll.real, spiral.real, dr1, dr2, eg_value_direc[0], eg_vector_direc[0], eg_vector_direc_magnitude)
 
 
 def direc_mode_characteristic(roll,spiral,dr1,dr2):
@@ -9,7 +9,7 @@ Python version: >=3.6
 
 | Author: Loic Verdier
 | Creation: 2020-02-24
-| Last modifiction: 2020-03-25 (AJ)
+| Last modifiction: 2026-10-18
 
 TODO:
 
@@ -32,11 +32,15 @@ from matplotlib import rcParams, cycler
 from matplotlib.lines import Line2D
 from matplotlib.patches import Patch
 
+import ceasiompy.utils.moduleinterfaces as mi
+
+from ceasiompy.utils.trimfunctions import find_crossings, check_crossing
 from ceasiompy.utils.ceasiomlogger import get_logger
 
 log = get_logger(__file__.split('.')[0])
 
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+MODULE_NAME = os.path.basename(MODULE_DIR)
 
 #=============================================================================
 #   CLASSES
@@ -57,11 +61,7 @@ def get_unic(vector):
     Returns:
         vector_unic (list): List of unic values ordered in ascending way
     """
-    vector_unic = []
-    for elem in vector:
-        if elem not in vector_unic:
-            vector_unic.append(elem)
-    vector_unic.sort()
+    vector_unic = sorted(set(vector))
 
     return vector_unic
 
@@ -80,15 +80,8 @@ def get_index(idx_list1, idx_list2, idx_list3):
         find_idx (list): list of index (integer) common in the 3 lists
     """
 
-    # List of index of elements which have the same index in vectors list, list1, list2
-    find_idx = []
-
-    # Fill   the liste find_index
-    for idx1 in idx_list1:
-        for idx2 in idx_list2:
-            for idx3 in idx_list3:
-                if idx1 == idx2 == idx3:
-                    find_idx.append(idx1)
+    # Intersection of the 3 lists, in ascending order
+    find_idx = sorted(set(idx_list1) & set(idx_list2) & set(idx_list3))
 
     return find_idx
 
@@ -145,12 +138,11 @@ def order_correctly(A,B):
 
         A plot with different curves if asked.
     """
-    n = len(A)
-    for i in range(n):
-        for j in range(n):
-            if A[i] > A[j] and i <= j:
-                A[i], A[j] = A[j] , A[i]
-                B[i], B[j] = B[j] , B[i]
+    # Stable sort, equal elements of A keep their relative order
+    order = np.argsort(A, kind='stable')
+    A = np.asarray(A)[order]
+    B = np.asarray(B)[order]
+
     return A,B
 
 
@@ -169,191 +161,42 @@ def trim_derivative(alt, mach, list1, list2):
     Returns:
         cruise_angle (float): Angle to get cm. = 0
         trim_parameter (float): Moment derivative at cruise_angle
-        cross (boolean): List of unique value
+        idx_trim_before, idx_trim_after (int): Index of the points around cm = 0
+        ratio (float): Position of cm = 0 between these points
     """
 
-    crossed = True
-    trim_value = 0
-    trim_parameter = 0
-    idx_trim_before = 0
-    idx_trim_after = 0
-    ratio = 0
-
-    # Check moment coefficient list
-    if len(np.argwhere(np.diff(np.sign(list1)))) == 0  :
-        crossed = False
-        # If all list1. values are 0:
-        if list1.count(0) == len(list1):
-            log.warning('Alt = {}, mach = {} moment coefficients list is composed of 0 only.'.format(alt, mach))
-        # If cm curve does not cross the 0 line
-        else:
-            log.error('Alt = {}, mach = {} moment coefficients list does not cross the 0 line, aircraft not stable, trimm conditions not achieved.'.format(alt, mach))
-    # If list1. Curve crosses the 0 line more than once no stability analysis can be performed
-    elif len(np.argwhere(np.diff(np.sign(list1)))) > 2 or list1.count(0) > 1:
-        log.error('Alt = {}, mach = {} moment coefficients list crosses more than once the 0 line, no stability analysis performed'.format(alt, mach))
-        crossed  = False
-    # If list1. Curve crosses the 0 line twice
-    elif 0 not in np.sign(list1) and len(np.argwhere(np.diff(np.sign(list1)))) == 2:
-        log.error('Alt = {}, mach = {} moment coefficients list crosses the 0 line twice, no stability analysis performed'.format(alt, mach))
-        crossed = False
-    # If   0 is in list1
-    elif 0 in np.sign(list1) and list1.count(0) == 1 and crossed:
-        idx_list1_0 = [i for i in range(len(list1)) if list1[i] == 0][0]
-        # If 0 is the first element in list1
-        if idx_list1_0 == 0 :
-            idx_trim_before = idx_list1_0
-            idx_trim_after = idx_list1_0+1
-
-            # Angles and coeffs before and after crossing the 0 line
-            value_before = list2[idx_trim_before ]
-            value_after = list2[idx_trim_after ]
-            list1_before = list1[idx_trim_before ]
-            list1_after = list1[idx_trim_after ]
-
-            trim_value = value_before
-            trim_parameter = (list1_after-list1_before)/(value_after-value_before)
-            ratio = trim_value/(value_after -value_before )
-
-        # If 0 is the last element in list1
-        elif idx_list1_0 == len(list1) - 1:
-            idx_trim_before = idx_list1_0-1
-            idx_trim_after = idx_list1_0
-
-            # values and coeffs before and after crossing the 0 line
-            value_before = list2[idx_trim_before]
-            value_after = list2[idx_trim_after]
-            list1_before = list1[idx_trim_before]
-            list1_after = list1[idx_trim_after]
-
-            trim_value = value_after
-            trim_parameter = (list1_after-list1_before)/(value_after-value_before)
-            ratio = trim_value/(value_after -value_before)
-
-        # If  0 is nor the first nor the last element in list1
-        elif 0 < idx_list1_0 < len(list1)-1:
-            idx_trim_before = idx_list1_0-1
-            idx_trim_after = idx_list1_0+1
-
-            # Angles and coeffs before and after crossing the 0 line
-            value_before = list2[idx_trim_before]
-            value_after = list2[idx_trim_after]
-            list1_before = list1[idx_trim_before]
-            list1_after = list1[idx_trim_after]
-
-            trim_value= list2[idx_list1_0]
-            trim_parameter = (list1_after - list1_before)/(value_after - value_before)
-            ratio = trim_value/(value_after - value_before )
-
-    # If list1 crosse the 0 line and 0 is not in list1
-    elif  len(np.argwhere(np.diff(np.sign(list1)))) == 1 and 0 not in np.sign(list1) and crossed:
-        # Make the linear equation btween the 2 point before and after crossing the 0 ine y=ax+b
-        idx_list1_0 = np.argwhere(np.diff(np.sign(list1)))[0][0]
-        idx_trim_before = idx_list1_0
-        idx_trim_after = idx_list1_0+1
-
-        # Angles and coeffs before and after crossing the 0 line
-        value_before = list2[idx_trim_before]
-        value_after = list2[idx_trim_after]
-        list1_before = list1[idx_trim_before]
-        list1_after = list1[idx_trim_after]
-
-        fit = np.polyfit([value_before, value_after], [list1_before, list1_after], 1)  # returns [a,b] of y=ax+b
-
-        trim_value= -fit[1]/fit[0]    # list1. = 0 for y = 0  hence cruise agngle = -b/a
-        trim_parameter = fit[0]
-        ratio =  trim_value/(value_after - value_before )
-
-    return (trim_value, trim_parameter, idx_trim_before, idx_trim_after, ratio)
+    trim = find_crossings(list1, list2)
+
+    if not check_crossing(alt, mach, trim):
+        return (0, 0, 0, 0, 0)
 
+    return (trim['value'], trim['slope'], trim['idx_before'], trim['idx_after'], trim['ratio'])
 
 
 # Function derivative, or more trim condition function
-def trim_condition(alt, mach, cl_required, cl, aoa,):
-    """Find if a moments coefficeint cm cross the 0 line, once or more
-        Find if a moment coefficeint cm. crosse the 0 line only once and return
-        the corresponding angle and the cm derivative at cm=0
+def trim_condition(alt, mach, cl_required, cl, aoa):
+    """Find the angle of attack at which the lift compensate the weight
+
     Args:
         alt (float): Altitude [m]
         mach (float) : Mach Number [-]
+        cl_required (float): Lift coefficient required
         cl (list): Lift coefficient list [-]
         aoa (list): Angle of attack (or sideslip) list [deg]
+
     Returns:
         None if the lift is not enough to fly
         Aoa at which the lift compensate the weight
-        pitch moement at this (aoa, alt, amch)
+        Index of the points around this aoa and ratio to interpolate between them
     """
 
-    list1 = []
-    for element in cl :
-        list1.append(element - cl_required)
+    trim = find_crossings(np.asarray(cl, dtype=float) - cl_required, aoa)
 
-    # Check moment coefficient list
-    if len(np.argwhere(np.diff(np.sign(list1)))) == 0  :
-        # If list1 does not cross the 0 line
+    if trim['cross_nb'] == 0:
         log.info('Alt = {}, mach = {} not enough lift to fly, cl_max= {} and required_cl = {}'.format(alt, mach, max(cl), cl_required))
         return  (None, None, None, None)
 
-        #  COMPUTE cms derivatives and check if the slope is negative.
-    # If  0 is in list1
-    elif 0 in np.sign(list1) and list1.count(0) == 1 :
-        idx_list1_0 = [i for i in range(len(list1)) if list1[i] == 0][0]
-        # If 0 is the first element in list1
-        if idx_list1_0 == 0 :
-            idx_trim_before = idx_list1_0
-            idx_trim_after = idx_list1_0+1
-
-            # Angles and coeffs before and after crossing the 0 line
-            aoa_before = aoa[idx_trim_before ]
-            aoa_after = aoa[idx_trim_after ]
-
-            trim_aoa = aoa_before
-            ratio =  (trim_aoa - aoa_before)/(aoa_after - aoa_before )
-
-        # If 0 is the last element in list1
-        elif idx_list1_0 == len(list1) - 1:
-            idx_trim_before = idx_list1_0-1
-            idx_trim_after = idx_list1_0
-
-            # aoas and coeffs before and after crossing the 0 line
-            aoa_before = aoa[idx_trim_before]
-            aoa_after = aoa[idx_trim_after]
-
-            trim_aoa = aoa_after
-            ratio =  (trim_aoa - aoa_before)/(aoa_after - aoa_before )
-
-        # If  0 is nor the first nor the last element in list1
-        elif 0 < idx_list1_0 < len(list1)-1:
-            idx_trim_before = idx_list1_0-1
-            idx_trim_after = idx_list1_0+1
-
-            # Angles and coeffs before and after crossing the 0 line
-            aoa_before = aoa[idx_trim_before]
-            aoa_after = aoa[idx_trim_after]
-
-            trim_aoa= aoa[idx_list1_0]
-            ratio =  (trim_aoa - aoa_before)/(aoa_after - aoa_before )
-
-    # If list1 crosse the 0 line and 0 is not in list1
-    # elif  len(np.argwhere(np.diff(np.sign(list1)))) == 1 and 0 not in np.sign(list1) and crossed:
-    else:
-        # Make the linear equation btween the 2 point before and after crossing the 0 ine y=ax+b
-        idx_list1_0 = np.argwhere(np.diff(np.sign(list1)))[0][0]
-        idx_trim_before = idx_list1_0
-        idx_trim_after = idx_list1_0+1
-
-        # Angles and coeffs before and after crossing the 0 line
-        aoa_before = aoa[idx_trim_before]
-        aoa_after = aoa[idx_trim_after]
-        list1_before = list1[idx_trim_before]
-        list1_after = list1[idx_trim_after]
-
-        fit = np.polyfit([aoa_before, aoa_after], [list1_before, list1_after], 1)  # returns [a,b] of y=ax+b
-
-        trim_aoa= -fit[1]/fit[0]    # list1. = 0 for y = 0  hence cruise agngle = -b/a
-        ratio =  (trim_aoa - aoa_before)/(aoa_after - aoa_before )
-
-    return (trim_aoa, idx_trim_before, idx_trim_after, ratio)
-
+    return (trim['value'], trim['idx_before'], trim['idx_after'], trim['ratio'])
 
 
 def find_max_min(list1,list2): # fin values max and mi in list of lists
@@ -459,7 +302,7 @@ def plot_multicurve(y_axis, x_axis, plot_legend, plot_title, xlabel, ylabel, sho
 
     if save_plots:
         fig_titile = plot_title.replace(' ','_')
-        fig_path = os.path.join(MODULE_DIR,'ToolOutput',fig_titile) + '.svg'
+        fig_path = os.path.join(mi.get_module_run_dir(MODULE_NAME),'ToolOutput',fig_titile) + '.svg'
         plt.savefig(fig_path)
 
     if show_plots:
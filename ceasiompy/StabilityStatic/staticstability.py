@@ -9,7 +9,7 @@ Python version: >=3.6
 
 | Author: Verdier Loïc
 | Creation: 2019-10-24
-| Last modifiction: 2020-04-06 (AJ)
+| Last modifiction: 2026-10-18
 
 TODO:
     * Modify the code where there are "TODO"
@@ -36,11 +36,11 @@ import ceasiompy.utils.cpacsfunctions as cpsf
 import ceasiompy.utils.apmfunctions as apmf
 import ceasiompy.utils.moduleinterfaces as mi
 
-from ceasiompy.utils.standardatmosphere import get_atmosphere
+from ceasiompy.utils.standardatmosphere import get_atmosphere_array
+from ceasiompy.utils.trimfunctions import TrimTable, check_crossing
 
-from ceasiompy.StabilityStatic.func_static import get_unic, get_index, extract_subelements,\
-                                            order_correctly, trim_derivative, plot_multicurve,\
-                                            trim_condition, interpolation
+from ceasiompy.StabilityStatic.func_static import extract_subelements,\
+                                            order_correctly, plot_multicurve
 
 from ceasiompy.utils.ceasiomlogger import get_logger
 
@@ -135,10 +135,13 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
     cms_list = Coeffs.cms
     cmd_list = Coeffs.cmd
 
-    alt_unic = get_unic(alt_list)
-    mach_unic = get_unic(mach_list)
-    aos_unic = get_unic(aos_list)
-    aoa_unic = get_unic(aoa_list)
+    # Index of the aeroMap rows by (alt, mach, aoa, aos), built only once
+    aeromap_index = apmf.AeroMapIndex(Coeffs)
+
+    alt_unic = aeromap_index.get_unique('alt')
+    mach_unic = aeromap_index.get_unique('mach')
+    aos_unic = aeromap_index.get_unique('aos')
+    aoa_unic = aeromap_index.get_unique('aoa')
 
     # TODO: get incremental map from CPACS
     # Incremental map elevator
@@ -188,17 +191,20 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
     cpacs_stability_lat = 'True'
     cpacs_stability_direc = 'True'
 
+    # Trim conditions of all the (alt, mach, aos) and (alt, mach, aoa) slices of the aeroMap
+    atm = get_atmosphere_array(alt_unic)
+    u0_grid = np.outer(atm.sos, mach_unic)
+    with np.errstate(divide='ignore'):
+        cl_required = (m*atm.grav[:,None])/(0.5*atm.dens[:,None]*u0_grid**2*s) # Required lift for level flight
+    cl_trim = TrimTable(aeromap_index, cl_list, 'aoa', cl_required[:,:,None,None])
+    cms_trim, cms_trim_derivative = cl_trim.interpolate(cms_list)
+    # minus sign because cmd and cml sign convention on ceasiom is the oposite as books convention
+    cmd_trim = TrimTable(aeromap_index, -cmd_list, 'aos')
+    cml_trim = TrimTable(aeromap_index, -cml_list, 'aos')
+
     # Aero analyses for all given altitude, mach and aos_list, over different
     for alt in alt_unic:
 
-        Atm = get_atmosphere(alt)
-        g = Atm.grav
-        a = Atm.sos
-        rho = Atm.dens
-
-        # Find index of altitude which have the same value
-        idx_alt = [i for i in range(len(alt_list)) if alt_list[i] == alt]
-
         # Prepar trim condition lists
         trim_alt_longi = []
         trim_mach_longi = []
@@ -224,9 +230,6 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
         trim_derivative_direc = []
 
         for mach in mach_unic:
-            u0 = a*mach
-            # Find index of mach which have the same value
-            idx_mach = [j for j in range(len(mach_list)) if mach_list[j] == mach]
 
             # Longitudinal stability
             # Analyse in function of the angle of attack for given, alt, mach and aos_list
@@ -242,9 +245,7 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
             # by default, cms don't  cross 0 line
             crossed = False
 
-            # Find index at which  aos= 0
-            idx_aos = [j for j in range(len(aos_list)) if aos_list[j] == 0]
-            find_idx = get_index(idx_alt,idx_mach,idx_aos)
+            find_idx = aeromap_index.get_rows(alt=alt, mach=mach, aos=0)
 
             # If find_idx is empty an APM function would have corrected before
             # If there there is only one value  in  find_idx for a given Alt, Mach, aos_list, no analyse can be performed
@@ -256,15 +257,10 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
             elif len(find_idx) > 1: # if there is at least 2 values in find_idx :
 
                 # Find all cms_list values for index corresonding to an altitude, a mach, an aos_list=0, and different aoa_list
-                cms = []
-                aoa = []
-                cl = []
-                cd = []
-                for index in find_idx:
-                    cms.append(cms_list[index])
-                    aoa.append(aoa_list[index])
-                    cl.append(cl_list[index])
-                    cd.append(cd_list[index])
+                cms = cms_list[find_idx]
+                aoa = aoa_list[find_idx]
+                cl = cl_list[find_idx]
+                cd = cd_list[find_idx]
 
                 # Save values which will be plot
                 plot_cms.append(cms)
@@ -281,13 +277,18 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
                         break
 
                 if aoa_good :
-                    # Required lift for level flight
-                    cl_required = (m*g)/(0.5*rho*u0**2*s)
-                    (trim_aoa , idx_trim_before, idx_trim_after, ratio) = trim_condition(alt, mach, cl_required, cl, aoa)
-
-                    if trim_aoa:
-                        trim_cms = interpolation(cms, idx_trim_before, idx_trim_after, ratio)
-                        pitch_moment_derivative_deg = (cms[idx_trim_after] - cms[idx_trim_before]) / (aoa[idx_trim_after] - aoa[idx_trim_before])
+                    # Required lift for level flight and trim conditions
+                    idx_trim = cl_trim.get_index(alt=alt, mach=mach, aos=0)
+                    trim = cl_trim.table[idx_trim]
+                    cl_required_trim = cl_required[idx_trim[:2]]
+
+                    if trim['cross_nb'] > 0:
+                        trim_aoa = trim['value']
+                        idx_trim_before = trim['idx_before']
+                        idx_trim_after = trim['idx_after']
+                        ratio = trim['ratio']
+                        trim_cms = cms_trim[idx_trim]
+                        pitch_moment_derivative_deg = cms_trim_derivative[idx_trim]
                         # Find incremental cms
                         if incrementalMap :
                             for index, mach_number in enumerate(mach_unic,0):
@@ -302,6 +303,8 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
                             dcms  = None
                             trim_elevator =  None
                     else:
+                        log.info('Alt = {}, mach = {} not enough lift to fly, cl_max= {} and required_cl = {}'.format(alt, mach, max(cl), cl_required_trim))
+                        trim_aoa = idx_trim_before = idx_trim_after = ratio = None
                         trim_cms = None
                         pitch_moment_derivative_deg = None
                         dcms  = None
@@ -312,7 +315,7 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
                     plt.title(plot_title___, fontdict=None, loc='center', pad=None)
                     plt.plot(aoa, cl, marker='o', markersize=4, linewidth=1)
                     plt.plot(aoa, cms, marker='+', markerfacecolor='orange', markersize=12)
-                    plt.plot([aoa[0], aoa[-1]],[cl_required, cl_required] , markerfacecolor='red', markersize=12)
+                    plt.plot([aoa[0], aoa[-1]],[cl_required_trim, cl_required_trim] , markerfacecolor='red', markersize=12)
                     plt.legend([r'$C_L$', r'$C_M$', r'$C_{Lrequired}$'])
                     ax = plt.gca()
                     ax.annotate(r'$\alpha$ [°]', xy=(1, 0), ha='right', va='top', xycoords='axes fraction', fontsize=12)
@@ -364,8 +367,7 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
 
                 # by default, don't  cross 0 line
                 crossed = False
-                idx_aoa = [j for j in range(len(aoa_list)) if aoa_list[j] == aoa]
-                find_idx = get_index(idx_alt,idx_mach,idx_aoa)
+                find_idx = aeromap_index.get_rows(alt=alt, mach=mach, aoa=aoa)
 
                 # If find_idx is empty an APM function would have corrected before
                 # If there there is only one value  in  find_idx for a given Alt, Mach, aos_list, no analyse can be performed
@@ -377,11 +379,8 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
                     cpacs_stability_lat = 'NotCalculated'
 
                 elif len(find_idx)> 1: #if there is at least 2 values in find_idx
-                    cmd = []
-                    aos = []
-                    for index in find_idx:
-                        cmd.append(-cmd_list[index])  # menus sign because cmd sign convention on ceasiom is the oposite as books convention
-                        aos.append(aos_list[index])
+                    cmd = -cmd_list[find_idx]  # menus sign because cmd sign convention on ceasiom is the oposite as books convention
+                    aos = aos_list[find_idx]
                     aos, cmd = order_correctly(aos,cmd) # To roder the lists with values for growing aos
                     #  If cmd Curve crosses th 0 line more than once na stability analysis can be performed
                     curve_legend = r'$\alpha$ = ' + str(aoa) + r' °'
@@ -399,9 +398,11 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
                             break
 
                     if aos_good :
-                        cruise_aos, roll_moment_derivative, idx_trim_before, idx_trim_after, ratio =  trim_derivative(alt, mach, cmd, aos)
+                        trim = cmd_trim.get(alt=alt, mach=mach, aoa=aoa)
+                        crossed = check_crossing(alt, mach, trim)
+                        cruise_aos, roll_moment_derivative = trim['value'], trim['slope']
 
-                    if  idx_trim_before != idx_trim_after and aos_good :
+                    if crossed and aos_good :
                         if roll_moment_derivative < 0 :
                             log.info('Vehicle laterally staticaly stable.')
                             if aoa == 0 :
@@ -441,8 +442,7 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
             for aoa in aoa_unic:
                 # by default, don't  cross 0 line
                 crossed = False
-                idx_aoa = [j for j in range(len(aoa_list)) if aoa_list[j] == aoa]
-                find_idx = get_index(idx_alt,idx_mach,idx_aoa)
+                find_idx = aeromap_index.get_rows(alt=alt, mach=mach, aoa=aoa)
 
                 # If find_idx is empty an APM function would have corrected before
                 # If there there is only one value  in  find_idx for a given Alt, Mach, aos_list, no analyse can be performed
@@ -454,11 +454,8 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
                     cpacs_stability_direc = 'NotCalculated'
 
                 elif len(find_idx)> 1: #if there is at least 2 values in find_idx
-                    cml = []
-                    aos = []
-                    for index in find_idx:
-                        cml.append(-cml_list[index])  # menus sign because cml sign convention on ceasiom is the oposite as books convention
-                        aos.append(aos_list[index])
+                    cml = -cml_list[find_idx]  # menus sign because cml sign convention on ceasiom is the oposite as books convention
+                    aos = aos_list[find_idx]
                     aos, cml = order_correctly(aos,cml) # To order values with growing aos
                     #  If cml Curve crosses th 0 line more than once na stability analysis can be performed
                     curve_legend = r'$\alpha$ = ' + str(aoa) + r' °'
@@ -476,9 +473,11 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
                             break
 
                     if aos_good :
-                        cruise_aos, side_moment_derivative, idx_trim_before, idx_trim_after, ratio =  trim_derivative(alt, mach, cml, aos)
+                        trim = cml_trim.get(alt=alt, mach=mach, aoa=aoa)
+                        crossed = check_crossing(alt, mach, trim)
+                        cruise_aos, side_moment_derivative = trim['value'], trim['slope']
 
-                    if  idx_trim_before != idx_trim_after and aos_good :
+                    if crossed and aos_good :
                         if side_moment_derivative > 0 :
                             log.info('Vehicle directionnaly staticaly stable.')
                             if aoa == 0 :
@@ -534,7 +533,6 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
         if plot_for_different_mach : # To check Altitude Mach
             ## LONGI
             # Plot cms vs aoa for const alt and aos = 0 and different mach
-            idx_aos = [k for k in range(len(aos_list)) if aos_list[k] == 0]
             plot_cms = []
             plot_aoa = []
             plot_legend= []
@@ -545,8 +543,7 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
             longitudinaly_stable = True
 
             for mach in mach_unic:
-                idx_mach = [j for j in range(len(mach_list)) if mach_list[j] == mach]
-                find_idx = get_index(idx_alt,idx_aos,idx_mach)
+                find_idx = aeromap_index.get_rows(alt=alt, mach=mach, aos=0)
 
                 # If there is only one value in Find_idx
                 # An error message has been already printed through the first part of the code
@@ -558,11 +555,8 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
                 # If there is at list 2 values in find_idx :
                 if len(find_idx) > 1:
                     # Find all cms_list values for index corresonding to an altitude, a mach, an aos_list=0, and different aoa_list
-                    cms = []
-                    aoa = []
-                    for index in find_idx:
-                        cms.append(cms_list[index])
-                        aoa.append(aoa_list[index])
+                    cms = cms_list[find_idx]
+                    aoa = aoa_list[find_idx]
                     # Save values which will be plot
                     plot_cms.append(cms)
                     plot_aoa.append(aoa)
@@ -575,7 +569,6 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
             ## LATERAL
             # Plot cmd vs aos for const alt and aoa and different mach
             for aoa in aoa_unic:
-                idx_aoa = [k for k in range(len(aoa_list)) if aoa_list[k] == aoa]
                 plot_cmd = []
                 plot_aos = []
                 plot_legend = []
@@ -587,8 +580,7 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
                 laterally_stable = True
 
                 for mach in mach_unic:
-                    idx_mach = [j for j in range(len(mach_list)) if mach_list[j] == mach]
-                    find_idx = get_index(idx_alt,idx_aoa,idx_mach)
+                    find_idx = aeromap_index.get_rows(alt=alt, mach=mach, aoa=aoa)
 
                     #If there is only one valur in find_idx
                     # An error message has been already printed through the first part of the code
@@ -601,11 +593,8 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
                     # If there is at list 2 values in find_idx :
                     if len(find_idx) > 1:
                         # Find all cmd_list values for index corresonding to an altitude, a mach, an aos_list=0, and different aoa_list
-                        cmd = []
-                        aos = []
-                        for index in find_idx:
-                            cmd.append(-cmd_list[index])
-                            aos.append(aos_list[index])
+                        cmd = -cmd_list[find_idx]
+                        aos = aos_list[find_idx]
                         aos, cmd = order_correctly(aos,cmd) # To order values with growing aos
 
                         # Save values which will be plot
@@ -621,7 +610,6 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
             ## Directional
             # Plot cml vs aos for const alt and aoa and different mach
             for aoa in aoa_unic:
-                idx_aoa = [k for k in range(len(aoa_list)) if aoa_list[k] == aoa]
                 plot_cml = []
                 plot_aos = []
                 plot_legend = []
@@ -633,8 +621,7 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
                 dirrectionaly_stable = True
 
                 for mach in mach_unic:
-                    idx_mach = [j for j in range(len(mach_list)) if mach_list[j] == mach]
-                    find_idx = get_index(idx_alt,idx_aoa,idx_mach)
+                    find_idx = aeromap_index.get_rows(alt=alt, mach=mach, aoa=aoa)
                     #If there is only one valur in find_idx
                     # An error message has been already printed through the first part of the code
 
@@ -646,11 +633,8 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
                     # If there is at list 2 values in find_idx :
                     if len(find_idx) > 1:
                         # Find all cml_list values for index corresonding to an altitude, a mach, an aos_list=0, and different aoa_list
-                        cml = []
-                        aos = []
-                        for index in find_idx:
-                            cml.append(-cml_list[index])
-                            aos.append(aos_list[index])
+                        cml = -cml_list[find_idx]
+                        aos = aos_list[find_idx]
                         aos, cml = order_correctly(aos,cml) # To order values with growing aos
 
                         # Save values which will be plot
@@ -685,11 +669,7 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
     # ALTITUDE PLOTS
     if plot_for_different_alt : # To check Altitude Influence
         # plot cms VS aoa for constant mach, aos= 0 and different altitudes:
-        # Find index of altitude which have the same value
-        idx_aos = [i for i in range(len(aos_list)) if aos_list[i] == 0]
         for mach in mach_unic:
-            # Find index of mach which have the same value
-            idx_mach = [j for j in range(len(mach_list)) if mach_list[j] == mach]
             # Prepare variables for plots
             plot_cms = []
             plot_aoa = []
@@ -702,8 +682,7 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
 
             # Find index of slip angle which have the same value
             for alt in alt_unic:
-                idx_alt = [j for j in range(len(alt_list)) if alt_list[j] == alt]
-                find_idx = get_index(idx_aos,idx_mach,idx_alt)
+                find_idx = aeromap_index.get_rows(alt=alt, mach=mach, aos=0)
 
                 # If find_idx is empty an APM function would have corrected before
                 # If there is only one value  in  find_idx for a given Alt, Mach, aos_list, no analyse can be performed
@@ -717,11 +696,8 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
                 # If there is at list 2 values in find_idx :
                 if len(find_idx) > 1:
                     # Find all cms_list values for index corresonding to an altitude, a mach, an aos_list=0, and different aoa_list
-                    cms = []
-                    aoa = []
-                    for index in find_idx:
-                        cms.append(cms_list[index])
-                        aoa.append(aoa_list[index])
+                    cms = cms_list[find_idx]
+                    aoa = aoa_list[find_idx]
 
                     # Save values which will be plot
                     plot_cms.append(cms)
@@ -737,11 +713,7 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
         ## Lateral
         # plot cmd VS aos for constant mach, aoa_list and different altitudes:
         for aoa in aoa_unic:
-            # Find index of altitude which have the same value
-            idx_aoa = [i for i in range(len(aoa_list)) if aoa_list[i] == aoa]
             for mach in mach_unic:
-                # Find index of mach which have the same value
-                idx_mach = [j for j in range(len(mach_list)) if mach_list[j] == mach]
                 # Prepare variables for plots
                 plot_cmd = []
                 plot_aos = []
@@ -754,8 +726,7 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
 
                 # Find index of slip angle which have the same value
                 for alt in alt_unic:
-                    idx_alt = [j for j in range(len(alt_list)) if alt_list[j] == alt]
-                    find_idx = get_index(idx_aoa,idx_mach,idx_alt)
+                    find_idx = aeromap_index.get_rows(alt=alt, mach=mach, aoa=aoa)
                     # If find_idx is empty an APM function would have corrected before
                     # If there there is only one value  in  find_idx for a given Alt, Mach, aos_list, no analyse can be performed
                     # An error message has been already printed through the first part of the code
@@ -768,11 +739,8 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
                     # If there is at list 2 values in find_idx :
                     if len(find_idx) > 1:
                         # Find all cmd_list values for index corresonding to an altitude, a mach, an aos_list=0, and different aoa_list
-                        cmd = []
-                        aos = []
-                        for index in find_idx:
-                            cmd.append(-cmd_list[index])
-                            aos.append(aos_list[index])
+                        cmd = -cmd_list[find_idx]
+                        aos = aos_list[find_idx]
 
                         # Save values which will be plot
                         plot_cmd.append(cmd)
@@ -787,11 +755,7 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
         ## DIRECTIONAL
         # plot cml VS aos for constant mach, aoa_list and different altitudes:
         for aoa in aoa_unic:
-            # Find index of altitude which have the same value
-            idx_aoa = [i for i in range(len(aoa_list)) if aoa_list[i] == aoa]
             for mach in mach_unic:
-                # Find index of mach which have the same value
-                idx_mach = [j for j in range(len(mach_list)) if mach_list[j] == mach]
                 # Prepare variables for plots
                 plot_cml = []
                 plot_aos = []
@@ -804,8 +768,7 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
 
                 # Find index of slip angle which have the same value
                 for alt in alt_unic:
-                    idx_alt = [j for j in range(len(alt_list)) if alt_list[j] == alt]
-                    find_idx = get_index(idx_aoa,idx_mach,idx_alt)
+                    find_idx = aeromap_index.get_rows(alt=alt, mach=mach, aoa=aoa)
 
                     # Check if it is an unstability case detected previously
                     for combination in direc_unstable_cases :
@@ -815,11 +778,8 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
                     # If there is at list 2 values in find_idx :
                     if len(find_idx) > 1:
                         # Find all cml_list values for index corresonding to an altitude, a mach, an aos_list=0, and different aoa_list
-                        cml = []
-                        aos = []
-                        for index in find_idx:
-                            cml.append(-cml_list[index])
-                            aos.append(aos_list[index])
+                        cml = -cml_list[find_idx]
+                        aos = aos_list[find_idx]
 
                         # Save values which will be plot
                         plot_cml.append(cml)
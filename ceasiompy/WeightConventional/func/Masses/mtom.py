@@ -19,6 +19,8 @@ Python version: >=3.6
 #   IMPORT
 #==============================================================================
 
+import os
+
 import pandas as pd
 import numpy as np
 import matplotlib as mpl
@@ -29,6 +31,10 @@ from ceasiompy.utils.ceasiomlogger import get_logger
 
 log = get_logger(__file__.split('.')[0])
 
+# Aircraft data used for the regression, in WeightConventional/ToolInput
+AIRCRAFT_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  '..','..','ToolInput','AircraftData2018_v1_ste.csv')
+
 
 #==============================================================================
 #   CLASSES
@@ -131,7 +137,7 @@ def estimate_mtom(fuse_length, fuse_width, wing_area, wing_span, NAME):
 
     log.info('-------------- mtom regression --------------')
 
-    aircraft_data_file_name = 'ToolInput/AircraftData2018_v1_ste.csv'
+    aircraft_data_file_name = AIRCRAFT_DATA_PATH
     log.info('Open ' + str(aircraft_data_file_name))
     aircraft_data = pd.read_csv(aircraft_data_file_name)
     aircraft_data_1 = aircraft_data.set_index('Manufacturer')
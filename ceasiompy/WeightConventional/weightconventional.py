@@ -33,6 +33,7 @@ from ceasiompy.WeightConventional.func.Crew.crewmembers import estimate_crew
 from ceasiompy.WeightConventional.func.Masses.oem import estimate_operating_empty_mass
 from ceasiompy.WeightConventional.func.Masses.mtom import estimate_limits, estimate_mtom
 from ceasiompy.utils.cpacsfunctions import aircraft_name
+from ceasiompy.utils.moduleinterfaces import get_toolinput_file_path, get_tooloutput_file_path
 from ceasiompy.utils.ceasiomlogger import get_logger
 
 # Should be changed or removed
@@ -297,8 +298,8 @@ if __name__ == '__main__':
 
     log.info('----- Start of ' + os.path.basename(__file__) + ' -----')
 
-    cpacs_path = os.path.join(MODULE_DIR,'ToolInput','ToolInput.xml')
-    cpacs_out_path = os.path.join(MODULE_DIR,'ToolOutput','ToolOutput.xml')
+    cpacs_path = get_toolinput_file_path('WeightConventional')
+    cpacs_out_path = get_tooloutput_file_path('WeightConventional')
 
     get_weight_estimations(cpacs_path,cpacs_out_path)
 
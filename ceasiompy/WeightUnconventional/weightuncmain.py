@@ -43,6 +43,7 @@ from ceasiompy.WeightUnconventional.func.Fuel.fuelmass import estimate_fuse_fuel
 from ceasiompy.utils.WB.UncGeometry import uncgeomanalysis
 
 from ceasiompy.utils.cpacsfunctions import aircraft_name
+from ceasiompy.utils.moduleinterfaces import get_toolinput_file_path, get_tooloutput_file_path
 
 from ceasiompy.utils.ceasiomlogger import get_logger
 
@@ -318,8 +319,8 @@ if __name__ == '__main__':
 
     log.info('----- Start of ' + os.path.basename(__file__) + ' -----')
 
-    cpacs_path = os.path.join(MODULE_DIR,'ToolInput','ToolInput.xml')
-    cpacs_out_path = os.path.join(MODULE_DIR,'ToolOutput','ToolOutput.xml')
+    cpacs_path = get_toolinput_file_path('WeightUnconventional')
+    cpacs_out_path = get_tooloutput_file_path('WeightUnconventional')
 
     get_weight_unc_estimations(cpacs_path,cpacs_out_path)
 
@@ -21,7 +21,7 @@ import math
 
 from ceasiompy.utils.ceasiomlogger import get_logger
 
-from ceasiompy.utils.cpacsfunctions import open_tixi, open_tigl, close_tixi
+from ceasiompy.utils.cpacsfunctions import get_tixi_tigl
 
 log = get_logger(__file__.split('.')[0])
 
@@ -183,8 +183,7 @@ def fuse_geom_eval(ag, cpacs_in):
     log.info('---------------------------------------------')
 
     # Opening tixi and tigl
-    tixi = open_tixi(cpacs_in)
-    tigl = open_tigl(tixi)
+    tixi, tigl = get_tixi_tigl(cpacs_in)
 
 ## ----------------------------------------------------------------------------
 ## COUNTING 1 -----------------------------------------------------------------
@@ -396,8 +395,6 @@ def fuse_geom_eval(ag, cpacs_in):
     ag.cabin_seg = cabin_seg
     ag.fuse_mean_width = ag.fuse_mean_width[0]
 
-    close_tixi(tixi, cpacs_in)
-
 # log info display ------------------------------------------------------------
 
     log.info('---------------------------------------------')
@@ -21,7 +21,7 @@ import math
 
 from ceasiompy.utils.ceasiomlogger import get_logger
 
-from ceasiompy.utils.cpacsfunctions import open_tixi, open_tigl, close_tixi
+from ceasiompy.utils.cpacsfunctions import get_tixi_tigl
 
 log = get_logger(__file__.split('.')[0])
 
@@ -186,8 +186,7 @@ def wing_geom_eval(ag, cpacs_in):
     log.info('---------------------------------------------')
 
     # Opening tixi and tigl
-    tixi = open_tixi(cpacs_in)
-    tigl = open_tigl(tixi)
+    tixi, tigl = get_tixi_tigl(cpacs_in)
 
 ## ----------------------------------------------------------------------------
 ## COUNTING 1 -----------------------------------------------------------------
@@ -386,7 +385,6 @@ def wing_geom_eval(ag, cpacs_in):
             a += 1
 
     ag.w_seg_sec = seg_sec
-    close_tixi(tixi, cpacs_in)
 
 # log info display ------------------------------------------------------------
     log.info('---------------------------------------------')
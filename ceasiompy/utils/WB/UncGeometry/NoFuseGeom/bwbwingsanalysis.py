@@ -183,8 +183,7 @@ def geom_eval(w_nb, awg, cpacs_in):
     log.info('-----------------------------------------------------------')
 
     # Opening tixi and tigl
-    tixi = cpsf.open_tixi(cpacs_in)
-    tigl = cpsf.open_tigl(tixi)
+    tixi, tigl = cpsf.get_tixi_tigl(cpacs_in)
 
     # INITIALIZATION 1 ---------------------------------------------------------
     awg.w_nb = w_nb
@@ -350,8 +349,6 @@ def geom_eval(w_nb, awg, cpacs_in):
             c = True
             a += 1
 
-    cpsf.close_tixi(tixi, cpacs_in)
-
     # log info display ------------------------------------------------------------
     log.info('-----------------------------------------------------------')
     log.info('---------- Wing Results -----------------------------------')
@@ -23,7 +23,7 @@ import math
 
 from ceasiompy.utils.ceasiomlogger import get_logger
 
-from ceasiompy.utils.cpacsfunctions import open_tixi,open_tigl, close_tixi
+from ceasiompy.utils.cpacsfunctions import get_tixi_tigl
 
 log = get_logger(__file__.split('.')[0])
 
@@ -63,8 +63,7 @@ def wing_check_thickness(h_min, awg, cpacs_in, TP, FUEL_ON_CABIN=0):
     log.info('----------- Evaluating fuselage and wing volume -----------')
     log.info('-----------------------------------------------------------')
 
-    tixi = open_tixi(cpacs_in)
-    tigl = open_tigl(tixi)
+    tixi, tigl = get_tixi_tigl(cpacs_in)
 
     SPACING = 0.1
     subd_c = 30  # Number of subdivisions along the perimeter on eachsurface,
@@ -186,8 +186,7 @@ def fuse_geom_eval(fus_nb, h_min, fuse_thick, F_FUEL, afg, cpacs_in):
     log.info('-----------------------------------------------------------')
 
     # Opening tixi and tigl
-    tixi = cpsf.open_tixi(cpacs_in)
-    tigl = cpsf.open_tigl(tixi)
+    tixi, tigl = cpsf.get_tixi_tigl(cpacs_in)
 
     #INITIALIZATION 1 ----------------------------------------------------------
     afg.fus_nb = fus_nb
@@ -430,8 +429,6 @@ def fuse_geom_eval(fus_nb, h_min, fuse_thick, F_FUEL, afg, cpacs_in):
             afg.fuse_cabin_vol[i-1] = 0
             afg.cabin_area[i-1] = 0
 
-    cpsf.close_tixi(tixi, cpacs_in)
-
     # log info display ------------------------------------------------------------
     log.info('-----------------------------------------------------------')
     log.info('---------- Fuselage Geometry Evaluations ------------------')
@@ -187,8 +187,7 @@ def wing_geom_eval(w_nb, TP,  awg, cpacs_in):
     log.info('-----------------------------------------------------------')
 
     # Opening tixi and tigl
-    tixi = cpsf.open_tixi(cpacs_in)
-    tigl = cpsf.open_tigl(tixi)
+    tixi, tigl = cpsf.get_tixi_tigl(cpacs_in)
 
 
     # INITIALIZATION 1 ---------------------------------------------------------
@@ -395,8 +394,6 @@ def wing_geom_eval(w_nb, TP,  awg, cpacs_in):
             c = True
             a += 1
 
-    cpsf.close_tixi(tixi, cpacs_in)
-
     # log info display ---------------------------------------------------------
     log.info('-----------------------------------------------------------')
     log.info('---------- Wing Geometry Evaluation -----------------------')
@@ -64,7 +64,7 @@ def get_number_of_parts(cpacs_in):
 
     """
 
-    tixi = cpsf.open_tixi(cpacs_in)
+    tixi, _ = cpsf.get_tixi_tigl(cpacs_in,with_tigl=False)
 
     if tixi.checkElement('/cpacs/vehicles/aircraft/model/fuselages'):
         fus_nb = tixi.getNamedChildrenCount('/cpacs/vehicles/aircraft/model/fuselages','fuselage')
@@ -76,8 +76,6 @@ def get_number_of_parts(cpacs_in):
     else:
         wing_nb = 0
 
-    cpsf.close_tixi(tixi, cpacs_in)
-
     return(fus_nb, wing_nb)
 
 
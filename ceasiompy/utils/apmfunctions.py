@@ -10,7 +10,7 @@ CPACS version: 3.1
 
 | Author : Aidan Jungo
 | Creation: 2019-08-15
-| Last modifiction: 2020-02-17
+| Last modifiction: 2026-10-18
 
 TODO:
 
@@ -32,6 +32,8 @@ import smt.sampling_methods as smp
 
 import numpy as np
 import pandas as pd
+from scipy.interpolate import RegularGridInterpolator, LinearNDInterpolator
+from scipy.spatial import QhullError, cKDTree
 
 import ceasiompy.utils.cpacsfunctions as cpsf
 
@@ -41,36 +43,69 @@ log = get_logger(__file__.split('.')[0])
 
 AEROPERFORMANCE_XPATH = '/cpacs/vehicles/aircraft/model/analyses/aeroPerformance'
 
+# Columns of an aeroMap and their XPath relative to '/aeroPerformanceMap'
+PARAM_XPATH = {'alt': '/altitude',
+               'mach': '/machNumber',
+               'aoa': '/angleOfAttack',
+               'aos': '/angleOfSideslip'}
+
+COEF_XPATH = {'cl': '/cl',
+              'cd': '/cd',
+              'cs': '/cs',
+              'cml': '/cml',
+              'cmd': '/cmd',
+              'cms': '/cms'}
+
+DAMPING_DER_XPATH = {'d' + coef + 'd' + rate + 'star':
+                     '/dampingDerivatives/positiveRates/d' + coef + 'd' + rate + 'star'
+                     for rate in ['p','q','r']
+                     for coef in COEF_XPATH}
+
+AEROMAP_XPATH = {**PARAM_XPATH, **COEF_XPATH, **DAMPING_DER_XPATH}
+
 #==============================================================================
 #   CLASSES
 #==============================================================================
 
 
+def _column(name, owner=None):
+    """ Create a property to access the column 'name' of an AeroCoefficient.
+
+    The getter returns a view (no copy) of the valid part of the column
+    buffer, the setter replaces the whole column by the given values.
+
+    Args:
+        name (str): Name of the column
+        owner (str): Name of the attribute which refers to the AeroCoefficient
+                     object, None if it is the object itself
+    """
+
+    def getter(self):
+        aero = getattr(self,owner) if owner else self
+        return aero._buffers[name][:aero._sizes[name]]
+
+    def setter(self, values):
+        aero = getattr(self,owner) if owner else self
+        array = np.asarray(values,dtype=np.float64).ravel()
+        aero._buffers[name] = array
+        aero._sizes[name] = array.size
+
+    return property(getter,setter)
+
+
 class DampingDerivative():
+    """ Damping derivatives of an AeroCoefficient object.
 
-    def __init__(self):
+    Values are stored as columns of the AeroCoefficient object they belong to,
+    'Coef.damping_derivatives.dcldpstar' and 'Coef.dcldpstar' are the same
+    array.
+    """
 
-        # Damping derivatives Coefficients
-        self.dcldpstar = []
-        self.dcddpstar = []
-        self.dcsdpstar = []
-        self.dcmldpstar = []
-        self.dcmddpstar = []
-        self.dcmsdpstar = []
-
-        self.dcldqstar = []
-        self.dcddqstar = []
-        self.dcsdqstar = []
-        self.dcmldqstar = []
-        self.dcmddqstar = []
-        self.dcmsdqstar = []
-
-        self.dcldrstar = []
-        self.dcddrstar = []
-        self.dcsdrstar = []
-        self.dcmldrstar = []
-        self.dcmddrstar = []
-        self.dcmsdrstar = []
+    __slots__ = ('_aero',)
+
+    def __init__(self,aero):
+
+        self._aero = aero
 
     def add_damping_der_coef(self,dcl,dcd,dcs,dcml,dcmd,dcms,rot_axis):
 
@@ -79,27 +114,16 @@ class DampingDerivative():
         # The rotations are performed around the global axis directions with
         # the aircraft model's global reference point as origin.
 
-        if rot_axis == '_dp':
-            self.dcldpstar.append(dcl)
-            self.dcddpstar.append(dcd)
-            self.dcsdpstar.append(dcs)
-            self.dcmldpstar.append(dcml)
-            self.dcmddpstar.append(dcmd)
-            self.dcmsdpstar.append(dcms)
-        if rot_axis == '_dq':
-            self.dcldqstar.append(dcl)
-            self.dcddqstar.append(dcd)
-            self.dcsdqstar.append(dcs)
-            self.dcmldqstar.append(dcml)
-            self.dcmddqstar.append(dcmd)
-            self.dcmsdqstar.append(dcms)
-        if rot_axis == '_dr':
-            self.dcldrstar.append(dcl)
-            self.dcddrstar.append(dcd)
-            self.dcsdrstar.append(dcs)
-            self.dcmldrstar.append(dcml)
-            self.dcmddrstar.append(dcmd)
-            self.dcmsdrstar.append(dcms)
+        if rot_axis not in ['_dp','_dq','_dr']:
+            return
+
+        rate = rot_axis[-1]
+        for coef, value in zip(COEF_XPATH,[dcl,dcd,dcs,dcml,dcmd,dcms]):
+            self._aero._append('d' + coef + 'd' + rate + 'star',value)
+
+
+for _name in DAMPING_DER_XPATH:
+    setattr(DampingDerivative,_name,_column(_name,'_aero'))
 
 
 class IncrementMap():
@@ -138,58 +162,66 @@ class IncrementMap():
 
 
 class AeroCoefficient():
+    """ Parameters and aerodynamic coefficients of an aeroMap.
 
-    def __init__(self):
+    Every parameter, coefficient and damping derivative is stored as a
+    contiguous float64 array (e.g. 'Coef.alt', 'Coef.cl', 'Coef.dcldqstar').
+    Columns can be set at once with any sequence of floats or grown point by
+    point with 'add_param_point' and 'add_coefficients'. A column which has not
+    been filled is an empty array.
+    """
 
-        # Parameters
-        self.alt = []
-        self.mach = []
-        self.aos = []
-        self.aoa = []
+    __slots__ = ('_buffers','_sizes','damping_derivatives','IncrMap')
 
-        # Coefficients
-        self.cl = []
-        self.cd = []
-        self.cs = []
-        self.cml = []
-        self.cmd = []
-        self.cms = []
+    def __init__(self):
 
-        self.damping_derivatives = DampingDerivative()
+        # Column buffers, they could be larger than the number of values
+        self._buffers = {name: np.empty(0) for name in AEROMAP_XPATH}
+        self._sizes = {name: 0 for name in AEROMAP_XPATH}
+
+        self.damping_derivatives = DampingDerivative(self)
 
         #self.increment_map = IncrementMap()
 
+    def _append(self,name,value):
+        """ Append a value to a column, its buffer is doubled when full """
+
+        size = self._sizes[name]
+        buffer = self._buffers[name]
+
+        if size == buffer.size:
+            new_buffer = np.empty(max(16,2*size))
+            new_buffer[:size] = buffer[:size]
+            self._buffers[name] = buffer = new_buffer
+
+        buffer[size] = value
+        self._sizes[name] = size + 1
+
     def add_param_point(self,alt,mach,aoa,aos):
 
-        self.alt.append(alt)
-        self.mach.append(mach)
-        self.aoa.append(aoa)
-        self.aos.append(aos)
+        self._append('alt',alt)
+        self._append('mach',mach)
+        self._append('aoa',aoa)
+        self._append('aos',aos)
 
     def add_coefficients(self,cl,cd,cs,cml,cmd,cms):
 
-        self.cl.append(cl)
-        self.cd.append(cd)
-        self.cs.append(cs)
-        self.cml.append(cml)
-        self.cmd.append(cmd)
-        self.cms.append(cms)
+        self._append('cl',cl)
+        self._append('cd',cd)
+        self._append('cs',cs)
+        self._append('cml',cml)
+        self._append('cmd',cmd)
+        self._append('cms',cms)
 
 
     def check_validity(self):
-        # TODO: this function could  probalby be simplified
 
         if  not (len(self.alt) == len(self.mach) == len(self.aoa) == len(self.aos)):
             raise ValueError('Not all parameter lists have the same lenght!')
 
-        if any([math.isnan(a) for a in self.alt]):
-            raise ValueError('Parameter "alt" containts "NaN"!')
-        if any([math.isnan(a) for a in self.mach]):
-            raise ValueError('Parameter "mach" containts "NaN"!')
-        if any([math.isnan(a) for a in self.aoa]):
-            raise ValueError('Parameter "aoa" containts "NaN"!')
-        if any([math.isnan(a) for a in self.aos]):
-            raise ValueError('Parameter "aos" containts "NaN"!')
+        for param in PARAM_XPATH:
+            if np.isnan(getattr(self,param)).any():
+                raise ValueError('Parameter "' + param + '" containts "NaN"!')
 
         if not (len(self.cl) == len(self.cd) == len(self.cs)):
             # raise ValueError('Proebleme with the lenght of the coefficient list')
@@ -224,62 +256,27 @@ class AeroCoefficient():
 
         case_count = self.get_count()
 
-        if self.cl == []:
-            self.cl = [0]*case_count
-            log.warning('No "cl" values have been found, a list of zeros will be used instead')
-        if self.cd == []:
-            self.cd = [0]*case_count
-            log.warning('No "cd" values have been found, a list of zeros will be used instead')
-        if self.cs == []:
-            self.cs = [0]*case_count
-            log.warning('No "cs" values have been found, a list of zeros will be used instead')
-        if self.cml == []:
-            self.cml = [0]*case_count
-            log.warning('No "cml" values have been found, a list of zeros will be used instead')
-        if self.cmd == []:
-            self.cmd = [0]*case_count
-            log.warning('No "cmd" values have been found, a list of zeros will be used instead')
-        if self.cms == []:
-            self.cms = [0]*case_count
-            log.warning('No "cms" values have been found, a list of zeros will be used instead')
+        for coef in COEF_XPATH:
+            if not len(getattr(self,coef)):
+                setattr(self,coef,np.zeros(case_count))
+                log.warning('No "' + coef + '" values have been found, a list of zeros will be used instead')
 
 
     def sort_by_key(self,sort_key):
         """ sort the data in AeroCoefficient object by the 'sort_key' """
 
-        # Create a dictionary from data
-        dict = self.to_dict(self)
-
-        # Create a dataframe from dictionary
-        df = pd.DataFrame(dict)
-        # Sort the dataframe with the given key
-        df_sorted = df.sort_values(sort_key)
-
-        # Put back the data in the AeroCoefficient object
-        self.alt = df_sorted['alt'].tolist()
-        self.mach = df_sorted['mach'].tolist()
-        self.aoa = df_sorted['aoa'].tolist()
-        self.aos = df_sorted['aos'].tolist()
+        order = np.argsort(getattr(self,sort_key),kind='stable')
 
-        self.cl = df_sorted['cl'].tolist()
-        self.cd = df_sorted['cd'].tolist()
-        self.cs = df_sorted['cs'].tolist()
-
-        self.cml = df_sorted['cml'].tolist()
-        self.cmd = df_sorted['cmd'].tolist()
-        self.cms = df_sorted['cms'].tolist()
+        # Reorder all the filled columns (of the same length as the key)
+        for name in AEROMAP_XPATH:
+            column = getattr(self,name)
+            if len(column) == len(order):
+                setattr(self,name,column[order])
 
     def to_dict(self):
-        dct = {'alt':self.alt,
-        'mach': self.mach,
-        'aoa':self.aoa,
-        'aos':self.aos,
-        'cl':self.cl,
-        'cd':self.cd,
-        'cs':self.cs,
-        'cml':self.cml,
-        'cmd':self.cmd,
-        'cms':self.cms}
+        """ Return a dictionary of the parameters and coefficients (as views) """
+
+        dct = {name: getattr(self,name) for name in [*PARAM_XPATH, *COEF_XPATH]}
         return dct
 
     def print_coef_list(self):
@@ -312,6 +309,235 @@ class AeroCoefficient():
     #     # of "self.get_unique_value('aoa',2.0) should return all aoa == 2.0"
 
 
+for _name in AEROMAP_XPATH:
+    setattr(AeroCoefficient,_name,_column(_name))
+del _name
+
+
+class AeroMapIndex():
+    """ Index of the rows of an AeroCoefficient object by parameter values.
+
+    Parameters values are rounded to a tolerance ('tol') to be used as keys,
+    rows are grouped once per combination of parameters and then found with a
+    dictionary lookup, e.g. 'index.get_rows(alt=0,mach=0.5,aos=0)'.
+    """
+
+    __slots__ = ('tol','_values','_keys','_groups')
+
+    def __init__(self,Coef,tol=1e-6):
+
+        self.tol = tol
+        self._values = {param: np.array(getattr(Coef,param)) for param in PARAM_XPATH}
+        self._keys = {param: np.rint(values/tol).astype(np.int64)
+                      for param, values in self._values.items()}
+
+        # Groups of rows for each combination of parameters, built when needed
+        self._groups = {}
+
+    def _get_groups(self,params):
+        """ Get the dictionary {key tuple: rows} for a combination of parameters """
+
+        if params not in self._groups:
+
+            keys = np.column_stack([self._keys[param] for param in params])
+            unique_keys, inverse = np.unique(keys,axis=0,return_inverse=True)
+            inverse = inverse.ravel()
+
+            # Rows sorted by group, in their original order inside a group
+            order = np.argsort(inverse,kind='stable')
+            bounds = np.cumsum(np.bincount(inverse,minlength=len(unique_keys)))[:-1]
+
+            self._groups[params] = {tuple(key): rows for key, rows
+                                    in zip(unique_keys.tolist(),np.split(order,bounds))}
+
+        return self._groups[params]
+
+    def get_rows(self,alt=None,mach=None,aoa=None,aos=None):
+        """ Get the index of rows matching all the given parameters values
+
+        Args:
+            alt, mach, aoa, aos (float): Parameter values, None to ignore one
+
+        Returns:
+            rows (array): Index (in ascending order) of the matching rows
+        """
+
+        given = {'alt': alt, 'mach': mach, 'aoa': aoa, 'aos': aos}
+        params = tuple(param for param in PARAM_XPATH if given[param] is not None)
+
+        if not params:
+            return np.arange(len(self._keys['alt']))
+
+        key = tuple(int(np.rint(given[param]/self.tol)) for param in params)
+
+        return self._get_groups(params).get(key,np.empty(0,dtype=np.intp))
+
+    def get_unique(self,param):
+        """ Get the unique values of a parameter, in ascending order """
+
+        keys, first = np.unique(self._keys[param],return_index=True)
+
+        return self._values[param][first]
+
+    def get_grid(self,values,params=('alt','mach','aos','aoa')):
+        """ Reshape values of the aeroMap rows on the grid of the parameters
+
+        Args:
+            values (array): Value at each row of the aeroMap, e.g. Coef.cms,
+                            or np.ndarray(n, k) for k values per row
+            params (tuple): Parameters of the axes of the grid, in order
+
+        Returns:
+            axes (list): Unique values of each parameter (see 'get_unique')
+            grid (array): Values on the grid (k values on the last axis),
+                          NaN where there is no row
+        """
+
+        axes = []
+        index = []
+        for param in params:
+            keys, first, inverse = np.unique(self._keys[param],return_index=True,
+                                             return_inverse=True)
+            axes.append(self._values[param][first])
+            index.append(inverse.ravel())
+
+        values = np.asarray(values)
+        grid = np.full([len(axis) for axis in axes] + list(values.shape[1:]),np.nan)
+        grid[tuple(index)] = values
+
+        return axes, grid
+
+
+class AeroMapInterpolator():
+    """ Linear interpolation of all the coefficients of an aeroMap.
+
+    The interpolator is built once per aeroMap. When the aeroMap is a full
+    tensor grid of (alt, mach, aos, aoa) values a regular grid interpolator is
+    used, otherwise the points are triangulated (Delaunay) at the first query
+    and the triangulation is kept for the next ones. If the points can not be
+    triangulated (e.g. they are all on a line), the nearest point of the
+    aeroMap is taken instead. Parameters with only one value are not
+    interpolated: points must be at this value. The filled
+    coefficients and damping derivatives are interpolated at once, e.g.
+    'interp.get_values(alt=0,mach=0.5,aoa=trim_aoa_array,aos=0).cd'.
+
+    Attributes:
+        names (list): Names of the interpolated coefficients
+        is_grid (bool): True if the aeroMap is a full tensor grid
+
+    """
+
+    __slots__ = ('names','is_grid','_tol','_params','_fixed','_lower','_scale',
+                 '_points','_values','_interpolator','_nearest')
+
+    def __init__(self,Coef,aeromap_index=None):
+
+        if aeromap_index is None:
+            aeromap_index = AeroMapIndex(Coef)
+        self._tol = aeromap_index.tol
+
+        row_nb = len(Coef.alt)
+        self.names = [name for name in [*COEF_XPATH, *DAMPING_DER_XPATH]
+                      if row_nb and len(getattr(Coef,name)) == row_nb]
+        if not self.names:
+            raise ValueError('No coefficient to interpolate in the aeroMap!')
+        values = np.column_stack([getattr(Coef,name) for name in self.names])
+
+        grid_params = ('alt','mach','aos','aoa')
+        unique = {param: aeromap_index.get_unique(param) for param in grid_params}
+        self._params = tuple(param for param in grid_params if len(unique[param]) > 1)
+        self._fixed = {param: unique[param][0] for param in grid_params
+                       if param not in self._params}
+
+        # Full grid: one row for each combination of the parameters values
+        point_nb = int(np.prod([len(unique[param]) for param in self._params]))
+        self.is_grid = point_nb == row_nb == len(aeromap_index._get_groups(grid_params))
+
+        self._interpolator = None
+        self._nearest = False
+        if not self._params:
+            self._values = values[0]
+        elif self.is_grid:
+            axes, grid = aeromap_index.get_grid(values,self._params)
+            self._interpolator = RegularGridInterpolator(axes,grid,bounds_error=False,
+                                                         fill_value=np.nan)
+        else:
+            # Parameters are scaled on [0,1] for the triangulation
+            points = np.column_stack([getattr(Coef,param) for param in self._params])
+            self._lower = points.min(axis=0)
+            self._scale = points.max(axis=0) - self._lower
+            self._points = (points - self._lower) / self._scale
+            self._values = values
+
+    def _interpolate(self,points):
+        """ Interpolate the values at np.ndarray(n, param_nb) points """
+
+        if not self._params:
+            return np.broadcast_to(self._values,(len(points),len(self.names)))
+
+        if self._interpolator is None:
+            try:
+                self._interpolator = LinearNDInterpolator(self._points,self._values,
+                                                          fill_value=np.nan)
+            except (QhullError,ValueError):
+                # Degenerate (flat) or one parameter scattered aeroMap
+                log.warning('The points of the aeroMap can not be triangulated over '
+                            + ', '.join(self._params) + ', the nearest point is used.')
+                self._interpolator = cKDTree(self._points)
+                self._nearest = True
+
+        if not self.is_grid:
+            points = (points - self._lower) / self._scale
+
+        if self._nearest:
+            values = self._values[self._interpolator.query(points)[1]]
+        else:
+            values = self._interpolator(points)
+
+        # No extrapolation with the nearest point either
+        if self._nearest:
+            scaled_tol = self._tol / self._scale
+            outside = ((points < -scaled_tol) | (points > 1 + scaled_tol)).any(axis=1)
+            values[outside] = np.nan
+
+        return values
+
+    def get_values(self,alt,mach,aoa,aos):
+        """ Get the values of all the coefficients at the given points
+
+        Args:
+            alt, mach, aoa, aos (float or array): Parameters of the points,
+                                                  broadcast together
+
+        Returns:
+            values (recarray): Array of the shape of the points with one field
+                               per coefficient (see 'names'), e.g. values.cl,
+                               NaN outside of the aeroMap
+        """
+
+        given = dict(zip(('alt','mach','aoa','aos'),
+                         np.broadcast_arrays(*[np.asarray(param,dtype=np.float64)
+                                               for param in (alt,mach,aoa,aos)])))
+        shape = given['alt'].shape
+
+        inside = np.ones(shape,dtype=bool)
+        for param, value in self._fixed.items():
+            inside &= np.abs(given[param] - value) <= self._tol
+
+        result = np.full(shape + (len(self.names),),np.nan)
+        if inside.any():
+            points = np.empty((np.count_nonzero(inside),len(self._params)))
+            for i, param in enumerate(self._params):
+                points[:,i] = given[param][inside]
+            result[inside] = self._interpolate(points)
+
+        values = np.empty(shape,dtype=[(name,np.float64) for name in self.names])
+        for i, name in enumerate(self.names):
+            values[name] = result[...,i]
+
+        return values.view(np.recarray)
+
+
 #==============================================================================
 #   FUNCTIONS
 #==============================================================================
@@ -469,10 +695,8 @@ def save_parameters(tixi,aeromap_uid,Param):
     Param.check_validity()
 
     # Add parameters to the aeroPerformanceMap
-    cpsf.add_float_vector(tixi,apm_xpath+'/altitude',Param.alt)
-    cpsf.add_float_vector(tixi,apm_xpath+'/machNumber',Param.mach)
-    cpsf.add_float_vector(tixi,apm_xpath+'/angleOfAttack',Param.aoa)
-    cpsf.add_float_vector(tixi,apm_xpath+'/angleOfSideslip',Param.aos)
+    for param, xpath in PARAM_XPATH.items():
+        cpsf.add_float_vector(tixi,apm_xpath+xpath,getattr(Param,param))
 
 
 
@@ -497,88 +721,23 @@ def save_coefficients(tixi,aeromap_uid,Coef):
     apm_xpath = tixi.uIDGetXPath(aeromap_uid) + '/aeroPerformanceMap'
     param_count = Coef.get_count()
 
-    # CL coefficients
-    if len(Coef.cl) == 0:
-        log.warning('No "cl" value have been found, this node will stay empty')
-    elif len(Coef.cl) == param_count:
-        cpsf.add_float_vector(tixi,apm_xpath+'/cl',Coef.cl)
-        log.info('"cl" values have been added to the corresponding node')
-    else:
-        raise ValueError('The number of "cl" values is incorrect, it must be \
-                          either equal to the number of parameters or 0')
-
-    # CD coefficients
-    if len(Coef.cd) == 0:
-        log.warning('No "cd" value have been found, this node will stay empty')
-    elif len(Coef.cd) == param_count:
-        cpsf.add_float_vector(tixi,apm_xpath+'/cd',Coef.cd)
-        log.info('"cd" values have been added to the corresponding node')
-    else:
-        raise ValueError('The number of "cd" values is incorrect, it must be \
-                          either equal to the number of parameters or 0')
-
-    # CS coefficients
-    if len(Coef.cs) == 0:
-        log.warning('No "cs" value have been found, this node will stay empty')
-    elif len(Coef.cs) == param_count:
-        cpsf.add_float_vector(tixi,apm_xpath+'/cs',Coef.cs)
-        log.info('"cs" values have been added to the corresponding node')
-    else:
-        raise ValueError('The number of "cs" values is incorrect, it must \
-        either equal to the number of parameters or 0')
-
-    # Cml coefficients
-    if len(Coef.cml) == 0:
-        log.warning('No "cml" value have been found, this node will stay empty')
-    elif len(Coef.cml) == param_count:
-        cpsf.add_float_vector(tixi,apm_xpath+'/cml',Coef.cml)
-        log.info('"cml" values have been added to the corresponding node')
-    else:
-        raise ValueError('The number of "cml" values is incorrect, it must \
-        either equal to the number of parameters or 0')
-
-    # Cmd coefficients
-    if len(Coef.cmd) == 0:
-        log.warning('No "cmd" value have been found, this node will stay empty')
-    elif len(Coef.cmd) == param_count:
-        cpsf.add_float_vector(tixi,apm_xpath+'/cmd',Coef.cmd)
-        log.info('"cmd" values have been added to the corresponding node')
-    else:
-        raise ValueError('The number of "cmd" values is incorrect, it must \
-        either equal to the number of parameters or 0')
-
-    # Cms coefficients
-    if len(Coef.cms) == 0:
-        log.warning('No "cms" value have been found, this node will stay empty')
-    elif len(Coef.cms) == param_count:
-        cpsf.add_float_vector(tixi,apm_xpath+'/cms',Coef.cms)
-        log.info('"cms" values have been added to the corresponding node')
-    else:
-        raise ValueError('The number of "cms" values is incorrect, it must \
-        either equal to the number of parameters or 0')
-
-    # DampingDerivative
-    if len(Coef.damping_derivatives.dcldpstar): # TODO: Improve this check
-        cpsf.add_float_vector(tixi,apm_xpath+'/dampingDerivatives/positiveRates/dcldpstar',Coef.damping_derivatives.dcldpstar)
-        cpsf.add_float_vector(tixi,apm_xpath+'/dampingDerivatives/positiveRates/dcddpstar',Coef.damping_derivatives.dcddpstar)
-        cpsf.add_float_vector(tixi,apm_xpath+'/dampingDerivatives/positiveRates/dcsdpstar',Coef.damping_derivatives.dcsdpstar)
-        cpsf.add_float_vector(tixi,apm_xpath+'/dampingDerivatives/positiveRates/dcmldpstar',Coef.damping_derivatives.dcmldpstar)
-        cpsf.add_float_vector(tixi,apm_xpath+'/dampingDerivatives/positiveRates/dcmddpstar',Coef.damping_derivatives.dcmddpstar)
-        cpsf.add_float_vector(tixi,apm_xpath+'/dampingDerivatives/positiveRates/dcmsdpstar',Coef.damping_derivatives.dcmsdpstar)
-
-        cpsf.add_float_vector(tixi,apm_xpath+'/dampingDerivatives/positiveRates/dcldqstar',Coef.damping_derivatives.dcldqstar)
-        cpsf.add_float_vector(tixi,apm_xpath+'/dampingDerivatives/positiveRates/dcddqstar',Coef.damping_derivatives.dcddqstar)
-        cpsf.add_float_vector(tixi,apm_xpath+'/dampingDerivatives/positiveRates/dcsdqstar',Coef.damping_derivatives.dcsdqstar)
-        cpsf.add_float_vector(tixi,apm_xpath+'/dampingDerivatives/positiveRates/dcmldqstar',Coef.damping_derivatives.dcmldqstar)
-        cpsf.add_float_vector(tixi,apm_xpath+'/dampingDerivatives/positiveRates/dcmddqstar',Coef.damping_derivatives.dcmddqstar)
-        cpsf.add_float_vector(tixi,apm_xpath+'/dampingDerivatives/positiveRates/dcmsdqstar',Coef.damping_derivatives.dcmsdqstar)
-
-        cpsf.add_float_vector(tixi,apm_xpath+'/dampingDerivatives/positiveRates/dcldrstar',Coef.damping_derivatives.dcldrstar)
-        cpsf.add_float_vector(tixi,apm_xpath+'/dampingDerivatives/positiveRates/dcddrstar',Coef.damping_derivatives.dcddrstar)
-        cpsf.add_float_vector(tixi,apm_xpath+'/dampingDerivatives/positiveRates/dcsdrstar',Coef.damping_derivatives.dcsdrstar)
-        cpsf.add_float_vector(tixi,apm_xpath+'/dampingDerivatives/positiveRates/dcmldrstar',Coef.damping_derivatives.dcmldrstar)
-        cpsf.add_float_vector(tixi,apm_xpath+'/dampingDerivatives/positiveRates/dcmddrstar',Coef.damping_derivatives.dcmddrstar)
-        cpsf.add_float_vector(tixi,apm_xpath+'/dampingDerivatives/positiveRates/dcmsdrstar',Coef.damping_derivatives.dcmsdrstar)
+    # Coefficients
+    for coef, xpath in COEF_XPATH.items():
+        values = getattr(Coef,coef)
+        if len(values) == 0:
+            log.warning('No "' + coef + '" value have been found, this node will stay empty')
+        elif len(values) == param_count:
+            cpsf.add_float_vector(tixi,apm_xpath+xpath,values)
+            log.info('"' + coef + '" values have been added to the corresponding node')
+        else:
+            raise ValueError('The number of "' + coef + '" values is incorrect, it must be \
+                              either equal to the number of parameters or 0')
+
+    # DampingDerivative, only those which have been calculated are saved
+    for damping_der, xpath in DAMPING_DER_XPATH.items():
+        values = getattr(Coef,damping_der)
+        if len(values):
+            cpsf.add_float_vector(tixi,apm_xpath+xpath,values)
 
 # Add Control surace deflections
 # if len(Coef.IncrMap.dcl): # TODO: Improve this check
@@ -623,176 +782,27 @@ def get_aeromap(tixi,aeromap_uid):
 
     Coef = AeroCoefficient()
 
-    Coef.alt = cpsf.get_float_vector(tixi,apm_xpath +'/altitude')
-    Coef.mach  = cpsf.get_float_vector(tixi,apm_xpath +'/machNumber')
-    Coef.aoa = cpsf.get_float_vector(tixi,apm_xpath +'/angleOfAttack')
-    Coef.aos = cpsf.get_float_vector(tixi,apm_xpath +'/angleOfSideslip')
-
-    cl_xpath = apm_xpath +'/cl'
-    if tixi.checkElement(cl_xpath):
-        check_str = tixi.getTextElement(cl_xpath)
-        if check_str == '':
-            log.warning('No /cl values have been found in the CPACS file')
-            log.warning('An empty list will be returned.')
-            Coef.cl = []
-        else:
-            Coef.cl = cpsf.get_float_vector(tixi,cl_xpath)
-
-    cd_xpath = apm_xpath +'/cd'
-    if tixi.checkElement(cd_xpath):
-        check_str = tixi.getTextElement(cd_xpath)
-        if check_str == '':
-            log.warning('No /cd values have been found in the CPACS file')
-            log.warning('An empty list will be returned.')
-            Coef.cd = []
-        else:
-            Coef.cd = cpsf.get_float_vector(tixi,cd_xpath)
-
-    cs_xpath = apm_xpath +'/cs'
-    if tixi.checkElement(cs_xpath):
-        check_str = tixi.getTextElement(cs_xpath)
-        if check_str == '':
-            log.warning('No /cs values have been found in the CPACS file')
-            log.warning('An empty list will be returned.')
-            Coef.cs = []
-        else:
-            Coef.cs = cpsf.get_float_vector(tixi,cs_xpath)
-
-    cml_xpath = apm_xpath +'/cml'
-    if tixi.checkElement(cml_xpath):
-        check_str = tixi.getTextElement(cml_xpath)
-        if check_str == '':
-            log.warning('No /cml values have been found in the CPACS file')
-            log.warning('An empty list will be returned.')
-            Coef.cml = []
-        else:
-            Coef.cml = cpsf.get_float_vector(tixi,cml_xpath)
-
-    cmd_xpath = apm_xpath +'/cmd'
-    if tixi.checkElement(cmd_xpath):
-        check_str = tixi.getTextElement(cmd_xpath)
-        if check_str == '':
-            log.warning('No /cmd values have been found in the CPACS file')
-            log.warning('An empty list will be returned.')
-            Coef.cmd = []
-        else:
-            Coef.cmd = cpsf.get_float_vector(tixi,cmd_xpath)
-
-    cms_xpath = apm_xpath +'/cms'
-    if tixi.checkElement(cms_xpath):
-        check_str = tixi.getTextElement(cms_xpath)
-        if check_str == '':
-            log.warning('No /cms values have been found in the CPACS file')
-            log.warning('An empty list will be returned.')
-            Coef.cms = []
-        else:
-            Coef.cms = cpsf.get_float_vector(tixi,cms_xpath)
-
-
-    #Damping derivatives (TODO: inprove that)
-
-    dcsdrstar_xpath = apm_xpath +'/dampingDerivatives/positiveRates/dcsdrstar'
-    if tixi.checkElement(dcsdrstar_xpath):
-        check_str = tixi.getTextElement(dcsdrstar_xpath)
-
-        if check_str == '':
-            log.warning('No /dampingDerivatives/positiveRates/dcsdrstar,  values have been found in the CPACS file')
-            log.warning('An empty list will be returned.')
-            Coef.dcsdrstar = []
-        else:
-            Coef.dcsdrstar = cpsf.get_float_vector(tixi, dcsdrstar_xpath)
-
-    dcsdpstar_xpath = apm_xpath +'/dampingDerivatives/positiveRates/dcsdpstar'
-    if tixi.checkElement(dcsdpstar_xpath):
-        check_str = tixi.getTextElement(dcsdpstar_xpath)
-        if check_str == '':
-            log.warning('No /dampingDerivatives/positiveRates/dcsdpstar,  values have been found in the CPACS file')
-            log.warning('An empty list will be returned.')
-            Coef.dcsdpstar = []
-        else:
-            Coef.dcsdpstar = cpsf.get_float_vector(tixi, dcsdpstar_xpath)
-
-    dcldqstar_xpath = apm_xpath +'/dampingDerivatives/positiveRates/dcldqstar'
-    if tixi.checkElement(dcldqstar_xpath):
-        check_str = tixi.getTextElement(dcldqstar_xpath)
-        if check_str == '':
-            log.warning('No /dampingDerivatives/positiveRates/dcldqstar,  values have been found in the CPACS file')
-            log.warning('An empty list will be returned.')
-            Coef.dcddqstar = []
-        else:
-            Coef.dcldqstar = cpsf.get_float_vector(tixi, dcldqstar_xpath)
-
-    dcmsdqstar_xpath = apm_xpath +'/dampingDerivatives/positiveRates/dcmsdqstar'
-    if tixi.checkElement(dcmsdqstar_xpath):
-        check_str = tixi.getTextElement(dcmsdqstar_xpath)
-        if check_str == '':
-            log.warning('No /dampingDerivatives/positiveRates/dcmsdqstar,  values have been found in the CPACS file')
-            log.warning('An empty list will be returned.')
-            Coef.dcmsdqstar = []
-        else:
-            Coef.dcmsdqstar = cpsf.get_float_vector(tixi, dcmsdqstar_xpath)
-
-    dcddqstar_xpath = apm_xpath +'/dampingDerivatives/positiveRates/dcddqstar'
-    if tixi.checkElement(dcddqstar_xpath):
-        check_str = tixi.getTextElement(dcddqstar_xpath)
-        if check_str == '':
-            log.warning('No /dampingDerivatives/positiveRates/dcddqstar,  values have been found in the CPACS file')
-            log.warning('An empty list will be returned.')
-            Coef.dcddqstar = []
-        else:
-            Coef.dcddqstar = cpsf.get_float_vector(tixi, dcddqstar_xpath)
-
-
-    dcmddpstar_xpath = apm_xpath +'/dampingDerivatives/positiveRates/dcmddpstar'
-    if tixi.checkElement(dcmddpstar_xpath):
-        check_str = tixi.getTextElement(dcmddpstar_xpath)
-        if check_str == '':
-            log.warning('No /dampingDerivatives/positiveRates/dcmddpstar,  values have been found in the CPACS file')
-            log.warning('An empty list will be returned.')
-            Coef.dcmddpstar = []
-        else:
-            Coef.dcmddpstar = cpsf.get_float_vector(tixi, dcmddpstar_xpath)
-
-    dcmldqstar_xpath = apm_xpath +'/dampingDerivatives/positiveRates/dcmldqstar'
-    if tixi.checkElement(dcmldqstar_xpath):
-        check_str = tixi.getTextElement(dcmldqstar_xpath)
-        if check_str == '':
-            log.warning('No /dampingDerivatives/positiveRates/dcmldqstar,  values have been found in the CPACS file')
-            log.warning('An empty list will be returned.')
-            Coef.dcmldqstar = []
-        else:
-            Coef.dcmldqstar = cpsf.get_float_vector(tixi, dcmldqstar_xpath)
+    # Read all the columns present in the aeroMap, each node is read only once
+    for name, xpath in AEROMAP_XPATH.items():
+        node_xpath = apm_xpath + xpath
 
+        if not tixi.checkElement(node_xpath):
+            if name in PARAM_XPATH:
+                raise ValueError(node_xpath + ' path does not exist!')
+            continue
 
-    dcmldpstar_xpath = apm_xpath +'/dampingDerivatives/positiveRates/dcmldpstar'
-    if tixi.checkElement(dcmldpstar_xpath):
-        check_str = tixi.getTextElement(dcmldpstar_xpath)
-        if check_str == '':
-            log.warning('No /dampingDerivatives/positiveRates/dcmldpstar,  values have been found in the CPACS file')
-            log.warning('An empty list will be returned.')
-            Coef.dcmldpstar = []
-        else:
-            Coef.dcmldpstar = cpsf.get_float_vector(tixi, dcmldpstar_xpath)
+        vector_str = tixi.getTextElement(node_xpath)
+        if vector_str.endswith(';'):
+            vector_str = vector_str[:-1]
 
-    dcmldrstar_xpath = apm_xpath +'/dampingDerivatives/positiveRates/dcmldrstar'
-    if tixi.checkElement(dcmldrstar_xpath):
-        check_str = tixi.getTextElement(dcmldrstar_xpath)
-        if check_str == '':
-            log.warning('No /dampingDerivatives/positiveRates/dcmldrstar,  values have been found in the CPACS file')
+        if vector_str == '':
+            if name in PARAM_XPATH:
+                raise ValueError('No value has been found at ' + node_xpath)
+            log.warning('No ' + xpath + ' values have been found in the CPACS file')
             log.warning('An empty list will be returned.')
-            Coef.dcmldrstar = []
-        else:
-            Coef.dcmldrstar = cpsf.get_float_vector(tixi, dcmldrstar_xpath)
+            continue
 
-    dcmddrstar_xpath = apm_xpath +'/dampingDerivatives/positiveRates/dcmddrstar'
-    if tixi.checkElement(dcmddrstar_xpath):
-        check_str = tixi.getTextElement(dcmddrstar_xpath)
-        if check_str == '':
-            log.warning('No /dampingDerivatives/positiveRates/dcmddrstar,  values have been found in the CPACS file')
-            log.warning('An empty list will be returned.')
-            Coef.dcmddrstar = []
-        else:
-            Coef.dcmddrstar = cpsf.get_float_vector(tixi, dcmddrstar_xpath)
+        setattr(Coef,name,np.array(vector_str.split(';'),dtype=np.float64))
 
     return Coef
 
@@ -826,18 +836,8 @@ def merge_aeroMap(tixi, aeromap_uid_1,aeromap_uid_2,aeromap_uid_merge,
     create_empty_aeromap(tixi, aeromap_uid_merge, description)
     MergeAero = AeroCoefficient()
 
-    MergeAero.alt = Aero1.alt + Aero2.alt
-    MergeAero.mach = Aero1.mach + Aero2.mach
-    MergeAero.aoa = Aero1.aoa + Aero2.aoa
-    MergeAero.aos = Aero1.aos + Aero2.aos
-
-    MergeAero.cl = Aero1.cl + Aero2.cl
-    MergeAero.cd = Aero1.cd + Aero2.cd
-    MergeAero.cs = Aero1.cs + Aero2.cs
-
-    MergeAero.cml = Aero1.cml + Aero2.cml
-    MergeAero.cmd = Aero1.cmd + Aero2.cmd
-    MergeAero.cms = Aero1.cms + Aero2.cms
+    for name in [*PARAM_XPATH, *COEF_XPATH]:
+        setattr(MergeAero,name,np.concatenate((getattr(Aero1,name),getattr(Aero2,name))))
 
     MergeAero.sort_by_key('aoa')
 
@@ -877,37 +877,16 @@ def aeromap_from_csv(tixi,aeromap_uid,csv_path):
     Aero = AeroCoefficient()
 
     try:
-        Aero.alt = df['alt'].astype(float).tolist()
-        Aero.mach = df['mach'].astype(float).tolist()
-        Aero.aoa = df['aoa'].astype(float).tolist()
-        Aero.aos = df['aos'].astype(float).tolist()
+        for param in PARAM_XPATH:
+            setattr(Aero,param,df[param].to_numpy(dtype=np.float64))
     except:
         raise ValueError('Some parameter lists containt "NaN" value, it is not permited!')
 
-    try:
-        Aero.cl = df['cl'].astype(float).tolist()
-    except:
-        log.warning('No "cl" value have been found in the CPACS file')
-    try:
-        Aero.cd = df['cd'].astype(float).tolist()
-    except:
-        log.warning('No "cd" value have been found in the CPACS file')
-    try:
-        Aero.cs = df['cs'].astype(float).tolist()
-    except:
-        log.warning('No "cs" value have been found in the CPACS file')
-    try:
-        Aero.cml = df['cml'].astype(float).tolist()
-    except:
-        log.warning('No "cml" value have been found in the CPACS file')
-    try:
-        Aero.cmd = df['cmd'].astype(float).tolist()
-    except:
-        log.warning('No "cmd" value have been found in the CPACS file')
-    try:
-        Aero.cms = df['cms'].astype(float).tolist()
-    except:
-        log.warning('No "cms" value have been found in the CPACS file')
+    for coef in COEF_XPATH:
+        try:
+            setattr(Aero,coef,df[coef].to_numpy(dtype=np.float64))
+        except:
+            log.warning('No "' + coef + '" value have been found in the CPACS file')
 
     Aero.check_validity()
 
@@ -25,6 +25,9 @@ TODO:
 
 import os
 import sys
+import hashlib
+
+from collections import OrderedDict
 
 # Depending how/where Tixi and Tigl are installed, it could be:
 # import tixi3wrapper
@@ -41,6 +44,15 @@ from ceasiompy.utils.ceasiomlogger import get_logger
 
 log = get_logger(__file__.split('.')[0])
 
+# CPACS documents kept in memory (as XML string) instead of files, by absolute
+# path. A value of None means the document will be kept in memory when saved.
+IN_MEMORY_CPACS = {}
+
+# Shared read-only TIXI/TIGL handles (see 'get_tixi_tigl'), by absolute path,
+# the least recently used are dropped when there are more than HANDLE_CACHE_SIZE
+HANDLE_CACHE = OrderedDict()
+HANDLE_CACHE_SIZE = 4
+
 #==============================================================================
 #   CLASSES
 #==============================================================================
@@ -67,7 +79,12 @@ def open_tixi(cpacs_path):
     """
 
     tixi_handle = tixi3wrapper.Tixi3()
-    tixi_handle.open(cpacs_path)
+
+    cpacs_str = IN_MEMORY_CPACS.get(os.path.abspath(cpacs_path))
+    if cpacs_str is not None:
+        tixi_handle.openString(cpacs_str)
+    else:
+        tixi_handle.open(cpacs_path)
 
     log.info('TIXI handle has been created.'+cpacs_path)
 
@@ -104,7 +121,8 @@ def close_tixi(tixi_handle, cpacs_out_path):
 
     Function 'close_tixi' close the TIXI Handle and save the CPACS file at the
     location given by 'cpacs_out_path' after checking if the directory path
-    exists
+    exists. If 'cpacs_out_path' is kept in memory (see 'keep_cpacs_in_memory'),
+    the CPACS file is saved in memory instead.
 
     Source :
         * TIXI functions: http://tixi.sourceforge.net/Doc/index.html
@@ -115,6 +133,16 @@ def close_tixi(tixi_handle, cpacs_out_path):
 
     """
 
+    # Cached handles of this file are not up to date anymore
+    invalidate_handle_cache(cpacs_out_path)
+
+    if os.path.abspath(cpacs_out_path) in IN_MEMORY_CPACS:
+        IN_MEMORY_CPACS[os.path.abspath(cpacs_out_path)] = tixi_handle.exportDocumentAsString()
+        log.info("Output CPACS file has been saved in memory: " + cpacs_out_path)
+        tixi_handle.close()
+        log.info("TIXI Handle has been closed.")
+        return
+
     # Check if the directory of 'cpacs_out_path' exist, if not, create it
     path_split = cpacs_out_path.split('/')[:-1]
     dir_path = '/'.join(str(m) for m in path_split)
@@ -131,6 +159,140 @@ def close_tixi(tixi_handle, cpacs_out_path):
     log.info("TIXI Handle has been closed.")
 
 
+def keep_cpacs_in_memory(cpacs_path, cpacs_str=None):
+    """ Keep a CPACS file in memory instead of reading/writing it on disk.
+
+    Function 'keep_cpacs_in_memory' registers 'cpacs_path' as an in-memory
+    CPACS document. Until it is released, 'open_tixi' reads it from memory
+    (if it has a content) and 'close_tixi' saves it in memory. It is used to
+    pass CPACS files from one module to the next one without writing them.
+
+    Args:
+        cpacs_path (str): Path of the CPACS file
+        cpacs_str (str): XML content of the CPACS file, None to keep the next
+                         saved content
+
+    """
+
+    IN_MEMORY_CPACS[os.path.abspath(cpacs_path)] = cpacs_str
+
+
+def get_cpacs_in_memory(cpacs_path):
+    """ Get the XML content of an in-memory CPACS file (None if not saved) """
+
+    return IN_MEMORY_CPACS.get(os.path.abspath(cpacs_path))
+
+
+def release_cpacs_in_memory(cpacs_path):
+    """ Write an in-memory CPACS file on disk and stop keeping it in memory.
+
+    Args:
+        cpacs_path (str): Path of the CPACS file
+
+    """
+
+    cpacs_str = IN_MEMORY_CPACS.pop(os.path.abspath(cpacs_path),None)
+
+    if cpacs_str is None:
+        return
+
+    dir_path = os.path.dirname(os.path.abspath(cpacs_path))
+    if not os.path.exists(dir_path):
+        os.makedirs(dir_path)
+
+    with open(cpacs_path,'w') as f:
+        f.write(cpacs_str)
+    log.info("CPACS file kept in memory has been saved at: " + cpacs_path)
+
+
+def _get_cpacs_id(cpacs_path):
+    """ Get an identifier of the content of a CPACS file (in memory or on disk) """
+
+    cpacs_str = IN_MEMORY_CPACS.get(os.path.abspath(cpacs_path))
+    if cpacs_str is not None:
+        return hashlib.sha1(cpacs_str.encode()).hexdigest()
+
+    stat = os.stat(cpacs_path)
+
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def get_tixi_tigl(cpacs_path, with_tigl=True):
+    """ Get shared TIXI and TIGL handles of a CPACS file, to read it.
+
+    Function 'get_tixi_tigl' returns TIXI and TIGL handles of a CPACS file
+    which are kept open and reused by all the functions which read the same
+    file, to avoid parsing it and building its geometry several times. The
+    handles are identified by the path of the file and its modification time
+    and size (or its content if it is kept in memory), they are replaced when
+    the file changes. Handles saved with 'close_tixi' are invalidated. When
+    more than HANDLE_CACHE_SIZE files are read, the least recently used
+    handles are removed from the cache but not closed, as a caller may still
+    use them, they are released when they are not referenced anymore.
+
+    These handles are shared, they must not be modified nor closed, use
+    'open_tixi' and 'open_tigl' to modify a CPACS file.
+
+    Args:
+        cpacs_path (str): Path to the CPACS file
+        with_tigl (bool): False to only get the TIXI handle, TIGL handle is
+                          then None if it has not been created yet
+
+    Returns:
+        tixi_handle (handles): Shared TIXI Handle of the CPACS file
+        tigl_handle (handles): Shared TIGL Handle of the CPACS file
+    """
+
+    abs_path = os.path.abspath(cpacs_path)
+    cpacs_id = _get_cpacs_id(cpacs_path)
+
+    entry = HANDLE_CACHE.get(abs_path)
+    if entry is not None and entry[0] != cpacs_id:
+        invalidate_handle_cache(cpacs_path)
+        entry = None
+
+    if entry is None:
+        entry = [cpacs_id, open_tixi(cpacs_path), None]
+        HANDLE_CACHE[abs_path] = entry
+    else:
+        HANDLE_CACHE.move_to_end(abs_path)
+        log.info('Shared TIXI handle is used for ' + cpacs_path)
+
+    if with_tigl and entry[2] is None:
+        entry[2] = open_tigl(entry[1])
+
+    # Drop least recently used handles, without closing them
+    while len(HANDLE_CACHE) > HANDLE_CACHE_SIZE:
+        abs_path_lru, _ = HANDLE_CACHE.popitem(last=False)
+        log.info('Shared TIXI/TIGL handles are not cached anymore for ' + abs_path_lru)
+
+    return entry[1], entry[2]
+
+
+def invalidate_handle_cache(cpacs_path=None):
+    """ Close the shared TIXI/TIGL handles of a CPACS file (or of all files).
+
+    Args:
+        cpacs_path (str): Path to the CPACS file, None for all the files
+
+    """
+
+    if cpacs_path is None:
+        path_list = list(HANDLE_CACHE)
+    else:
+        path_list = [os.path.abspath(cpacs_path)]
+
+    for abs_path in path_list:
+        entry = HANDLE_CACHE.pop(abs_path,None)
+        if entry is None:
+            continue
+        _, tixi_handle, tigl_handle = entry
+        if tigl_handle is not None:
+            tigl_handle.close()
+        tixi_handle.close()
+        log.info('Shared TIXI/TIGL handles have been closed for ' + abs_path)
+
+
 def create_branch(tixi, xpath, add_child=False):
     """ Function to create a CPACS branch.
 
@@ -0,0 +1,260 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed for CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Functions to sample fuselage and wing surfaces with TIGL on (eta, zeta) grids
+and to evaluate moments of inertia of lumped masses, shared by the modules
+BalanceConventional and BalanceUnconventional.
+
+Python version: >=3.6
+
+| Author : agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import os
+import sys
+
+import numpy as np
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+
+log = get_logger(__file__.split('.')[0])
+
+# Coordinate factors to mirror points, by CPACS symmetry
+# (1: x-y plane, 2: x-z plane, 3: y-z plane)
+SYM_FACTORS = {1: np.array([1.0,1.0,-1.0]),
+               2: np.array([1.0,-1.0,1.0]),
+               3: np.array([-1.0,1.0,1.0])}
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def _get_surface_grid(tigl, get_point, key, eta_list, zeta_list):
+    """ Evaluate a TIGL 'get_point' function on a (eta, zeta) grid
+
+    Grids are cached on the TIGL handle, so they are evaluated only once per
+    handle (shared TIGL handles are replaced when their CPACS file changes).
+
+    Args:
+        tigl (handles): TIGL handle
+        get_point (function): TIGL function (component, segment, eta, zeta)
+        key (tuple): Name of the function, component and segment index
+        eta_list (array): Eta coordinates of the grid
+        zeta_list (array): Zeta coordinates of the grid
+
+    Returns:
+        grid (array): np.ndarray(n_eta, n_zeta, 3) Points of the grid
+    """
+
+    eta_list = np.asarray(eta_list,dtype=np.float64)
+    zeta_list = np.asarray(zeta_list,dtype=np.float64)
+
+    cache = getattr(tigl,'ceasiompy_grid_cache',None)
+    if cache is None:
+        cache = {}
+        tigl.ceasiompy_grid_cache = cache
+
+    grid_key = key + (eta_list.tobytes(),zeta_list.tobytes())
+
+    if grid_key not in cache:
+        comp, seg = key[1:]
+        grid = np.empty((len(eta_list),len(zeta_list),3))
+        for j, eta in enumerate(eta_list):
+            for k, zeta in enumerate(zeta_list):
+                grid[j,k] = get_point(comp,seg,float(eta),float(zeta))
+        cache[grid_key] = grid
+
+    return cache[grid_key]
+
+
+def get_fuselage_grid(tigl, fus_idx, seg_idx, eta_list, zeta_list):
+    """ Function to get points of a fuselage segment on a (eta, zeta) grid
+
+    Args:
+        tigl (handles): TIGL handle
+        fus_idx (int): Index of the fuselage (starting at 1)
+        seg_idx (int): Index of the segment (starting at 1)
+        eta_list (array): Eta coordinates of the grid
+        zeta_list (array): Zeta coordinates of the grid
+
+    Returns:
+        grid (array): np.ndarray(n_eta, n_zeta, 3) Points of the grid
+    """
+
+    return _get_surface_grid(tigl,tigl.fuselageGetPoint,
+                             ('fuselage',int(fus_idx),int(seg_idx)),
+                             eta_list,zeta_list)
+
+
+def get_wing_grid(tigl, wing_idx, seg_idx, eta_list, zeta_list, upper=False):
+    """ Function to get points of a wing segment on a (eta, zeta) grid
+
+    Args:
+        tigl (handles): TIGL handle
+        wing_idx (int): Index of the wing (starting at 1)
+        seg_idx (int): Index of the segment (starting at 1)
+        eta_list (array): Eta coordinates of the grid
+        zeta_list (array): Zeta coordinates of the grid
+        upper (bool): True for the upper surface, False for the lower one
+
+    Returns:
+        grid (array): np.ndarray(n_eta, n_zeta, 3) Points of the grid
+    """
+
+    if upper:
+        return _get_surface_grid(tigl,tigl.wingGetUpperPoint,
+                                 ('wing_upper',int(wing_idx),int(seg_idx)),
+                                 eta_list,zeta_list)
+
+    return _get_surface_grid(tigl,tigl.wingGetLowerPoint,
+                             ('wing_lower',int(wing_idx),int(seg_idx)),
+                             eta_list,zeta_list)
+
+
+def get_fuselage_nodes(tigl, fus_idx, seg_idx, subd_l, subd_c, subd_r, center_point):
+    """ Function to get the lumped mass nodes of a fuselage segment
+
+    Function 'get_fuselage_nodes' returns, for each of the 'subd_l'+1 sections
+    of the segment, the 'subd_c'+1 points of the section perimeter followed
+    by points distributed inside the section (on a spiral from its center).
+
+    Args:
+        tigl (handles): TIGL handle
+        fus_idx (int): Index of the fuselage (starting at 1)
+        seg_idx (int): Index of the segment (starting at 1)
+        subd_l (int): Number of subdivisions along the longitudinal axis
+        subd_c (int): Number of subdivisions along the perimeter
+        subd_r (int): Number of subdivisions along the radial axis
+        center_point (array): x,y,z coordinates of the center of the section
+
+    Returns:
+        nodes (array): np.ndarray(n, 3) Coordinates of the nodes
+    """
+
+    eta_list = np.arange(int(subd_l)+1) * (1.0/subd_l)
+    zeta_list = np.arange(int(subd_c)+1) * (1.0/subd_c)
+    grid = get_fuselage_grid(tigl,fus_idx,seg_idx,eta_list,zeta_list)
+
+    D0 = np.sqrt(np.arange(subd_r*subd_c) / float(subd_r*subd_c))
+    D = D0 - (D0[-1] - 0.98)
+    D = D[D >= 0]
+    theta = np.pi * (3 - np.sqrt(5)) * np.arange(len(D))
+
+    # Inner points are scaled on the last point of the perimeter
+    (xc,yc,zc) = center_point
+    x0, y0, z0 = grid[:,-1,0], grid[:,-1,1], grid[:,-1,2]
+    deltar = np.sqrt((y0-yc)**2 + (z0-zc)**2)[:,None] * D
+
+    inner = np.empty((len(eta_list),len(D),3))
+    inner[:,:,0] = x0[:,None]
+    inner[:,:,1] = yc + deltar*np.cos(theta)
+    inner[:,:,2] = zc + deltar*np.sin(theta)
+
+    return np.concatenate((grid,inner),axis=1).reshape(-1,3)
+
+
+def get_wing_nodes(tigl, wing_idx, seg_idx, eta_list, zeta_steps):
+    """ Function to get the lumped mass nodes of a wing segment
+
+    Function 'get_wing_nodes' returns, for each section of the segment, the
+    two lower points at zeta=0 and zeta=1, followed by pairs of lower and
+    upper points. Their zeta coordinates start from the side which has the
+    smallest x coordinate and increase by 'zeta_steps'.
+
+    Args:
+        tigl (handles): TIGL handle
+        wing_idx (int): Index of the wing (starting at 1)
+        seg_idx (int): Index of the segment (starting at 1)
+        eta_list (array): Eta coordinates of the sections
+        zeta_steps (array): Zeta steps between successive pairs of points
+
+    Returns:
+        nodes (array): np.ndarray(n, 3) Coordinates of the nodes
+    """
+
+    eta_list = np.asarray(eta_list,dtype=np.float64)
+    zeta_steps = np.asarray(zeta_steps,dtype=np.float64)
+
+    nodes = np.empty((len(eta_list),2+2*len(zeta_steps),3))
+    if not len(eta_list):
+        return nodes.reshape(-1,3)
+
+    nodes[:,:2] = get_wing_grid(tigl,wing_idx,seg_idx,eta_list,[0.0,1.0])
+    from_zero = nodes[:,0,0] < nodes[:,1,0]
+
+    for side, zeta_start, sign in [(True,0.0,1.0), (False,1.0,-1.0)]:
+        idx = np.flatnonzero(from_zero == side)
+        if not len(idx):
+            continue
+        zeta_list = np.cumsum(np.concatenate(([zeta_start],sign*zeta_steps)))[1:]
+        nodes[idx,2::2] = get_wing_grid(tigl,wing_idx,seg_idx,eta_list[idx],zeta_list)
+        nodes[idx,3::2] = get_wing_grid(tigl,wing_idx,seg_idx,eta_list[idx],zeta_list,
+                                        upper=True)
+
+    return nodes.reshape(-1,3)
+
+
+def get_symmetric_points(points, sym):
+    """ Function to mirror points with a CPACS symmetry
+
+    Args:
+        points (array): np.ndarray(n, 3) Points to mirror
+        sym (int): CPACS symmetry (1: x-y plane, 2: x-z plane, 3: y-z plane)
+
+    Returns:
+        sym_points (array): np.ndarray(n, 3) Mirrored points
+    """
+
+    if sym not in SYM_FACTORS:
+        raise ValueError('Symmetry "' + str(sym) + '" is not valid!')
+
+    return points * SYM_FACTORS[sym]
+
+
+def lumped_masses_inertia(points, masses, center_of_gravity):
+    """ Function to evaluate the moments of inertia of lumped masses
+
+    Args:
+        points (array): np.ndarray(n, 3) Position of the lumped masses [m]
+        masses (array): Mass of each lumped mass, or a single mass [kg]
+        center_of_gravity (array): x,y,z coordinates of the CoG [m]
+
+    Returns:
+        inertia (array): Ixx, Iyy, Izz, Ixy, Iyz, Ixz [kgm^2]
+    """
+
+    points = np.asarray(points,dtype=np.float64).reshape(-1,3)
+    if not len(points):
+        return np.zeros(6)
+
+    dist = points - np.asarray(center_of_gravity,dtype=np.float64)
+    masses = np.broadcast_to(np.asarray(masses,dtype=np.float64),(len(points),))
+
+    # Second moments of mass  S[a,b] = sum(m * da * db)
+    S = (dist * masses[:,None]).T @ dist
+
+    return np.array([S[1,1] + S[2,2], S[0,0] + S[2,2], S[0,0] + S[1,1],
+                     S[0,1], S[1,2], S[0,2]])
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Nothing to execute!')
@@ -0,0 +1,163 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed for CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Functions to save and load surface load fields in a binary (.npz) file
+
+A load field file contains the coordinates of the points where loads are
+applied, the forces at these points, the marker (SU2) or wing (PyTornado) each
+point belongs to and some metadata about the case. It is written by SU2Run and
+PyTornado and read by AeroFrame, a CSV export is available if needed.
+
+Python version: >=3.6
+
+| Author : agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import os
+import sys
+import json
+
+import numpy as np
+import pandas as pd
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+
+log = get_logger(__file__.split('.')[0])
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def save_load_fields(load_file_path, coord, force, marker, metadata=None):
+    """ Function to save load fields in a binary file
+
+    Function 'save_load_fields' saves the coordinates, forces and markers of
+    all the points in a uncompressed .npz file. Markers are saved as a list of
+    names and the index of the marker of each point.
+
+    Args:
+        load_file_path (str): Path to the load file (.npz) to write
+        coord (array): np.ndarray(n, 3) Coordinates of the points
+        force (array): np.ndarray(n, 3) Force at the points
+        marker (array): Name of the marker (or wing) of each point
+        metadata (dict): Information about the case (must be JSON serializable)
+
+    """
+
+    coord = np.asarray(coord,dtype=np.float64).reshape(-1,3)
+    force = np.asarray(force,dtype=np.float64).reshape(-1,3)
+
+    if len(coord) != len(force) or len(coord) != len(marker):
+        raise ValueError('Coordinates, forces and markers must have the same length!')
+
+    marker_names, marker_idx = np.unique(np.asarray(marker,dtype=str),return_inverse=True)
+
+    np.savez(load_file_path,
+             coord=coord,
+             force=force,
+             marker_names=marker_names,
+             marker_idx=marker_idx.astype(np.int32),
+             metadata=np.array(json.dumps(metadata or {})))
+
+    log.info('Load fields saved in ' + load_file_path)
+
+
+def get_load_fields(load_file_path):
+    """ Function to get load fields from a binary file
+
+    Args:
+        load_file_path (str): Path to the load file (.npz)
+
+    Returns:
+        coord (array): np.ndarray(n, 3) Coordinates of the points
+        force (array): np.ndarray(n, 3) Force at the points
+        marker (array): Name of the marker (or wing) of each point
+        metadata (dict): Information about the case
+
+    """
+
+    if not os.path.isfile(load_file_path):
+        raise OSError('Load file ' + load_file_path + ' has not been found!')
+
+    with np.load(load_file_path) as data:
+        coord = data['coord']
+        force = data['force']
+        marker = data['marker_names'][data['marker_idx']]
+        metadata = json.loads(str(data['metadata']))
+
+    return coord, force, marker, metadata
+
+
+def get_load_fields_by_marker(load_file_path):
+    """ Function to get load fields of each marker from a binary file
+
+    Args:
+        load_file_path (str): Path to the load file (.npz)
+
+    Returns:
+        load_fields (dict): Array np.ndarray(n, 6) of coordinates and forces
+                            (x,y,z,fx,fy,fz) of the points of each marker
+
+    """
+
+    coord, force, marker, _ = get_load_fields(load_file_path)
+
+    xyz_fxyz = np.hstack((coord,force))
+
+    load_fields = {}
+    for name in np.unique(marker):
+        load_fields[str(name)] = xyz_fxyz[marker == name]
+
+    return load_fields
+
+
+def export_load_fields_csv(load_file_path, csv_file_path, marker_col='marker',
+                           with_ids=True):
+    """ Function to export a binary load file to a CSV file
+
+    The default columns are the ones of the SU2 'force.csv' file
+    (ids,x,y,z,fx,fy,fz,marker), PyTornado 'aircraft_loads.csv' file has no
+    'ids' column and the marker column is called 'wing_uid'.
+
+    Args:
+        load_file_path (str): Path to the load file (.npz)
+        csv_file_path (str): Path to the CSV file to write
+        marker_col (str): Name of the marker column
+        with_ids (bool): Write the point ids in the first column
+
+    """
+
+    coord, force, marker, _ = get_load_fields(load_file_path)
+
+    data = {'ids': np.arange(len(coord))} if with_ids else {}
+    data.update({'x': coord[:,0],'y': coord[:,1],'z': coord[:,2],
+                 'fx': force[:,0],'fy': force[:,1],'fz': force[:,2],
+                 marker_col: marker})
+    df = pd.DataFrame(data=data)
+
+    df.to_csv(csv_file_path, sep=',',index=False)
+
+    log.info('Load fields exported in ' + csv_file_path)
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Nothing to execute!')
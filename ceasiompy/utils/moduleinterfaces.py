@@ -44,6 +44,9 @@ SU2_XPATH = '/cpacs/toolspecific/CEASIOMpy/aerodynamics/su2'
 MODNAME_TOP = 'ceasiompy'
 MODNAME_SPECS = '__specs__'
 
+# Environment variable with the path of the active sandbox directory
+SANDBOX_ENV = 'CEASIOMPY_SANDBOX'
+
 #==============================================================================
 #   CLASSES
 #==============================================================================
@@ -261,6 +264,34 @@ def get_module_list():
     return module_list
 
 
+def get_sandbox_dir():
+    """ Get the path of the active sandbox directory, '' if there is none """
+
+    return os.environ.get(SANDBOX_ENV,'')
+
+
+def get_module_run_dir(module_name):
+    """ Get the directory where a module reads and writes its files
+
+    The ToolInput and ToolOutput directories of a module are in its own
+    directory, or in '<sandbox>/<module_name>' when a sandbox is active (see
+    'workflowfunctions.sandbox'). Modules are run from this directory.
+
+    Args:
+        module_name (str): name of the module as a string
+
+    Retruns:
+        run_dir (str): Path to the run directory of the module
+
+    """
+
+    sandbox_dir = get_sandbox_dir()
+    if sandbox_dir:
+        return os.path.join(sandbox_dir,module_name)
+
+    return os.path.join(LIB_DIR,module_name)
+
+
 def get_toolinput_file_path(module_name):
     """ Get the path to the ToolInput.xml CPACS file of a specific module
 
@@ -272,7 +303,7 @@ def get_toolinput_file_path(module_name):
 
     """
 
-    toolinput_path = os.path.join(LIB_DIR,module_name,'ToolInput','ToolInput.xml')
+    toolinput_path = os.path.join(get_module_run_dir(module_name),'ToolInput','ToolInput.xml')
 
     return toolinput_path
 
@@ -288,7 +319,7 @@ def get_tooloutput_file_path(module_name):
 
     """
 
-    toolinput_path = os.path.join(LIB_DIR,module_name,'ToolOutput','ToolOutput.xml')
+    toolinput_path = os.path.join(get_module_run_dir(module_name),'ToolOutput','ToolOutput.xml')
 
     return toolinput_path
 
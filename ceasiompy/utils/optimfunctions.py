@@ -49,7 +49,7 @@ OPTIM_XPATH = '/cpacs/toolspecific/CEASIOMpy/Optimisation/'
 AEROMAP_XPATH = '/cpacs/vehicles/aircraft/model/analyses/aeroPerformance'
 SU2_XPATH = '/cpacs/toolspecific/CEASIOMpy/aerodynamics/su2'
 
-banned_entries = ['wing','delete_old_wkdirs','check_extract_loads']
+banned_entries = ['wing','delete_old_wkdirs','check_extract_loads','export_loads_csv']
 
 # ==============================================================================
 #   CLASS
@@ -79,6 +79,16 @@ class Routine:
         # DoE
         self.doedriver = 'uniform'
         self.samplesnb = 3
+        self.nb_proc = 1
+
+        # Finite-difference gradient
+        self.fd_nb_proc = 1
+        self.fd_step = 1e-3
+        self.fd_form = 'forward'
+
+        # Surrogate-based optimisation
+        self.sbo_history = ''
+        self.sbo_initial_nb = 10
 
         # User specified configuration file path
         self.user_config = '../Optimisation/Default_config.csv'
@@ -101,6 +111,16 @@ class Routine:
         # Specific DoE parameters
         self.doedriver = cpsf.get_value_or_default(tixi, OPTIM_XPATH+'parameters/DoE/driver', 'uniform')
         self.samplesnb = int(cpsf.get_value_or_default(tixi, OPTIM_XPATH+'parameters/DoE/sampleNB', 3))
+        self.nb_proc = int(cpsf.get_value_or_default(tixi, OPTIM_XPATH+'parameters/DoE/nbProc', 1))
+
+        # Specific gradient parameters
+        self.fd_nb_proc = int(cpsf.get_value_or_default(tixi, OPTIM_XPATH+'parameters/gradient/nbProc', 1))
+        self.fd_step = float(cpsf.get_value_or_default(tixi, OPTIM_XPATH+'parameters/gradient/fdStep', 1e-3))
+        self.fd_form = cpsf.get_value_or_default(tixi, OPTIM_XPATH+'parameters/gradient/fdForm', 'forward')
+
+        # Specific surrogate-based optimisation parameters
+        self.sbo_history = cpsf.get_value_or_default(tixi, OPTIM_XPATH+'parameters/surrogate/historyPath', '')
+        self.sbo_initial_nb = int(cpsf.get_value_or_default(tixi, OPTIM_XPATH+'parameters/surrogate/initialSampleNB', 10))
 
         # User specified configuration file path
         self.user_config = cpsf.get_value_or_default(tixi, OPTIM_XPATH+'Config/filepath', '../Optimisation/Default_config.csv')
@@ -9,7 +9,7 @@ Python version: >=3.6
 
 | Author : Aidan Jungo
 | Creation: 2018-10-04
-| Last modifiction: 2018-10-08
+| Last modifiction: 2026-10-18
 
 TODO:
 
@@ -24,7 +24,8 @@ TODO:
 import os
 import sys
 
-import math
+import functools
+
 import numpy
 import matplotlib.pyplot as plt
 
@@ -33,6 +34,41 @@ from ceasiompy.utils.ceasiomlogger import get_logger
 log = get_logger(__file__.split('.')[0])
 
 
+# Air constants
+GRAV_REF = 9.80665  # Gravitational acceleration at sea level [m/s^2]
+MOL_WEIGHT = 28.9644  # [Mol]
+GAS_CONST = 8.31432  # Gas constant [kg/Mol/K]
+GMR = GRAV_REF * MOL_WEIGHT / GAS_CONST
+GAMMA = 1.4  # [-]
+R = 287.053  # [J/Kg/K]
+EARTH_RADIUS = 6.371e6  # [m]
+
+# Reference values at sea level
+TEMP_REF = 288.15  # [K]
+PRES_REF = 101325.0  # [Pa]
+DENS_REF = 1.225  # [kg/m^3]
+
+# Layers definition
+HEIGHT = numpy.array([0.0, 11000.0, 20000.0, 32000.0, 47000.0,
+                      51000.0, 71000.0, 84852.0])  # [m]
+TEMP_POINT = numpy.array([288.15, 216.65, 216.65, 228.65, 270.65,
+                          270.65, 214.65, 186.946])  # [K]
+TEMP_GRAD = numpy.array([-6.5, 0.0, 1.0, 2.8, 0.0, -2.8, -2.0])  # [K/km]
+REL_PRESSURE = numpy.array([1.0, 2.23361105092158e-1, 5.403295010784876e-2,
+                            8.566678359291667e-3, 1.0945601337771144e-3,
+                            6.606353132858367e-4, 3.904683373343926e-5,
+                            3.6850095235747942e-6])  # [-]
+
+# Fields of the arrays returned by 'get_atmosphere_array' (same names as the
+# attributes of the class 'Atmosphere')
+ATM_DTYPE = numpy.dtype([('temp', float), ('pres', float), ('dens', float),
+                         ('visc', float), ('sos', float), ('re_len_ma', float),
+                         ('grav', float)])
+
+# Number of altitudes kept in the cache of 'get_atmosphere'
+ATM_CACHE_SIZE = 128
+
+
 #==============================================================================
 #   CLASSES
 #==============================================================================
@@ -56,102 +92,118 @@ class Atmosphere:
     def __init__(self):
         """On earth surface, at sea lever (0m)  (reference values or 0)"""
 
-        self.temp = 288.15
-        self.pres = 101325.0
-        self.dens = 1.225
+        self.temp = TEMP_REF
+        self.pres = PRES_REF
+        self.dens = DENS_REF
         self.visc = 0
         self.sos = 0
         self.re_len_ma = 0
-        self.grav = 9.80665
+        self.grav = GRAV_REF
 
 
 #==============================================================================
 #   FUNCTIONS
 #==============================================================================
 
-def get_atmosphere(alt):
-    """ Return atmosphere parameters for any given altitude.
+def get_atmosphere_array(alt):
+    """ Return atmosphere parameters for an array of altitudes.
 
-    Function which caluculate the Reynolds number per unit of length [m] per
-    unit of Mach [-] for a given altitude between 0 and 84000m
-    Calculate also Temperature, Pressure, Density, Viscosity, Speed of Sound at
-    this altitude
-
-    Source :
-        * 1976 Standard Atmosphere:
-          http://www.digitaldutch.com/atmoscalc/graphs.htm
-        * Gravitational acceleration:
-          https://en.wikipedia.org/wiki/Gravity_of_Earth
+    Vectorized version of 'get_atmosphere', the layer of each altitude is
+    found with 'numpy.searchsorted' and the parameters are calculated only once
+    for each distinct altitude (e.g. the few altitudes of an aeroMap).
 
     Args:
-        alt (float): Altitude from earth surface [m]
+        alt (float or array): Altitudes from earth surface [m]
 
     Returns:
-        atm (object): Object Atmosphere (see example of use at the end)
+        atm (recarray): Array of the same shape as 'alt' with the fields 'temp',
+                        'pres', 'dens', 'visc', 'sos', 're_len_ma' and 'grav'
+                        (see class 'Atmosphere'), e.g. atm.temp or atm['temp']
     """
 
-    # Create an object 'Atmosphere'
-    atm = Atmosphere()
+    alt = numpy.asarray(alt, dtype=float)
 
-    # Air Constants
-    MOL_WEIGHT = 28.9644  # [Mol]
-    GAS_CONST = 8.31432  # Gas constant [kg/Mol/K]
-    GMR = atm.grav * MOL_WEIGHT / GAS_CONST
-    GAMMA = 1.4  # [-]
-    R = 287.053  # [J/Kg/K]
-
-    # Layers definition
-    height = [0.0, 11000.0, 20000.0, 32000.0, 47000.0,
-              51000.0, 71000.0, 84852.0]  # [m]
-    temp_point = [288.15, 216.65, 216.65, 228.65, 270.65,
-                  270.65, 214.65, 186.946]  # [K]
-    temp_grad = [-6.5, 0.0, 1.0, 2.8, 0.0, -2.8, -2.0]  # [K/m]
-    rel_pressure = [1.0, 2.23361105092158e-1, 5.403295010784876e-2,
-                    8.566678359291667e-3, 1.0945601337771144e-3,
-                    6.606353132858367e-4, 3.904683373343926e-5,
-                    3.6850095235747942e-6]  # [-]
-
-    # Reference values
-    temp_ref = atm.temp
-    pres_ref = atm.pres
-    dens_ref = atm.dens
-    grav_ref = atm.grav
-
-    # Check if Altitude is valid and find to which layer it corresponds
-    if alt >= 0 and alt < 84852:
-        i = 0
-        while alt > height[i+1]:
-            i = i + 1
-    else:
+    # Check if Altitudes are valid (NaN are also rejected)
+    if not numpy.all((alt >= 0) & (alt < HEIGHT[-1])):
         raise ValueError('Altitude must be between 0 and 84000m!')
-        return 0
+
+    alt_unic, inverse = numpy.unique(alt, return_inverse=True)
+
+    # Find to which layer each altitude corresponds (a layer includes its
+    # upper limit)
+    i = numpy.maximum(numpy.searchsorted(HEIGHT, alt_unic, side='left') - 1, 0)
+    delta_h = alt_unic - HEIGHT[i]
+    grad = TEMP_GRAD[i]
+
+    atm = numpy.empty(len(alt_unic), dtype=ATM_DTYPE)
 
     # Calculate gravity at altitude (Earth is assumed as a perfect
     # sphere with a radially symmetric distribution of mass; Radius=6371km)
-    atm.grav = grav_ref * (6.371e6/(6.371e6 + float(alt)))**2
+    atm['grav'] = GRAV_REF * (EARTH_RADIUS/(EARTH_RADIUS + alt_unic))**2
 
     # Calculate temperature at altitude (interpolation)
-    atm.temp = temp_point[i] + temp_grad[i]/1000.0 * (alt-height[i])
+    temp = TEMP_POINT[i] + grad/1000.0 * delta_h
+    atm['temp'] = temp
 
     # Calculate pressure at altitude
-    if abs(temp_grad[i]) < 0.1:
-        atm.pres = pres_ref * rel_pressure[i] * math.exp(-GMR \
-                   * (alt-height[i]) / 1000.0 / (temp_point[i]))
-    else:
-        atm.pres = pres_ref * rel_pressure[i] * (temp_point[i]/atm.temp) \
-                   ** (GMR/(temp_grad[i]/1000.0)/1000.0)
+    pres = numpy.empty(len(alt_unic))
+    iso = numpy.abs(grad) < 0.1
+    grd = ~iso
+    pres[iso] = PRES_REF * REL_PRESSURE[i[iso]] * numpy.exp(-GMR \
+                * delta_h[iso] / 1000.0 / TEMP_POINT[i[iso]])
+    pres[grd] = PRES_REF * REL_PRESSURE[i[grd]] * (TEMP_POINT[i[grd]]/temp[grd]) \
+                ** (GMR/(grad[grd]/1000.0)/1000.0)
+    atm['pres'] = pres
 
     # Calculate density at altitude
-    atm.dens = dens_ref * atm.pres/pres_ref * temp_ref/atm.temp
+    atm['dens'] = DENS_REF * pres/PRES_REF * TEMP_REF/temp
 
     # Calculate dynamic viscosity at altitude
-    atm.visc = 1.512041288 * atm.temp**1.5 / (atm.temp+120) / 1000000.0
+    atm['visc'] = 1.512041288 * temp**1.5 / (temp+120) / 1000000.0
 
     # Calculate speed of sound at altitude
-    atm.sos = math.sqrt(GAMMA*R*atm.temp)
+    atm['sos'] = numpy.sqrt(GAMMA*R*temp)
 
     # Reynolds per unit of length [m] per unit of Mach [Ma] at Altitude
-    atm.re_len_ma = atm.dens * atm.sos / atm.visc
+    atm['re_len_ma'] = atm['dens'] * atm['sos'] / atm['visc']
+
+    return atm[inverse].reshape(alt.shape).view(numpy.recarray)
+
+
+@functools.lru_cache(maxsize=ATM_CACHE_SIZE)
+def _get_atmosphere_values(alt):
+    """ Atmosphere parameters at one altitude, as a tuple (cached) """
+
+    return get_atmosphere_array(alt).item()
+
+
+def get_atmosphere(alt):
+    """ Return atmosphere parameters for any given altitude.
+
+    Function which caluculate the Reynolds number per unit of length [m] per
+    unit of Mach [-] for a given altitude between 0 and 84000m
+    Calculate also Temperature, Pressure, Density, Viscosity, Speed of Sound at
+    this altitude. The values are calculated by 'get_atmosphere_array' and
+    cached for the last altitudes.
+
+    Source :
+        * 1976 Standard Atmosphere:
+          http://www.digitaldutch.com/atmoscalc/graphs.htm
+        * Gravitational acceleration:
+          https://en.wikipedia.org/wiki/Gravity_of_Earth
+
+    Args:
+        alt (float): Altitude from earth surface [m]
+
+    Returns:
+        atm (object): Object Atmosphere (see example of use at the end)
+    """
+
+    # Create an object 'Atmosphere'
+    atm = Atmosphere()
+
+    for name, value in zip(ATM_DTYPE.names, _get_atmosphere_values(float(alt))):
+        setattr(atm, name, value)
 
     return atm
 
@@ -165,23 +217,9 @@ def plot_atmosphere():
     # Create 500 points between 0 and 84000m
     alt_list = numpy.arange(0.0, 84000., 500.0)
 
-    temp_list = []
-    pres_list = []
-    dens_list = []
-    visc_list = []
-    sos_list = []
-    grav_list = []
-
-    for alt in alt_list:
-        atm = get_atmosphere(alt)
-        temp_list.append(atm.temp)
-        pres_list.append(atm.pres)
-        dens_list.append(atm.dens)
-        visc_list.append(atm.visc)
-        sos_list.append(atm.sos)
-        grav_list.append(atm.grav)
-
-    plt.plot(temp_list, alt_list)
+    atm = get_atmosphere_array(alt_list)
+
+    plt.plot(atm.temp, alt_list)
 
     plt.xlabel('Temperature (K)')
     plt.ylabel('Altitude (m)')
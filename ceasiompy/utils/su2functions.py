@@ -25,11 +25,14 @@ TODO:
 
 import os
 import sys
+import subprocess
 
 from collections import OrderedDict
 
 import ceasiompy.utils.ceasiompyfunctions as ceaf
 
+from ceasiompy.utils.su2mesh import SU2Mesh
+
 from ceasiompy.utils.ceasiomlogger import get_logger
 
 log = get_logger(__file__.split('.')[0])
@@ -110,12 +113,7 @@ def get_mesh_marker(su2_mesh_path):
         marker_list (list): List of all mesh marker
     """
 
-    marker_list = []
-    with open(su2_mesh_path) as f:
-        for line in f.readlines():
-            if ('MARKER_TAG' in line and 'Farfield' not in line):
-                new_marker = line.split('=')[1][:-1]  # -1 to remove "\n"
-                marker_list.append(new_marker)
+    marker_list = SU2Mesh(su2_mesh_path).get_marker_list(farfield=False)
 
     if not marker_list:
         log.warning('No "MARKER_TAG" has been found in the mesh!')
@@ -128,12 +126,18 @@ def run_soft(soft, config_path, wkdir, nb_proc):
 
     Function 'run_soft' create the comment line to run correctly a SU2 software
     (SU2_DEF, SU2_CFD, SU2_SOL) with MPI (if installed). The SOFT_DICT is
-    create from the SOFT_LIST define at the top of this script.
+    create from the SOFT_LIST define at the top of this script. The software
+    is run in 'wkdir' without changing the current directory of the process,
+    so several softwares can be run at the same time in different directories.
 
     Args:
         soft (str): Software to execute (SU2_DEF, SU2_CFD, SU2_SOL)
         config_path (str): Path to the configuration file
         wkdir (str): Path to the working directory
+        nb_proc (int): Number of processes (MPI ranks) to use
+
+    Returns:
+        exit_status (int): Exit status of the software (0 if succeeded)
 
     """
 
@@ -152,24 +156,26 @@ def run_soft(soft, config_path, wkdir, nb_proc):
 
     # if mpi_install_path is not None:
     #     command_line =  [mpi_install_path,'-np',str(nb_proc),
-    #                      soft_install_path,config_path,'>',logfile_path]
+    #                      soft_install_path,config_path]
     if mpi_install_path is not None:
         command_line =  [mpi_install_path,'-np',str(nb_proc),
-                         soft_install_path,config_path,'>',logfile_path]
+                         soft_install_path,config_path]
     # elif soft == 'SU2_DEF' a disp.dat must be there to run with MPI
     else:
-        command_line = [soft_install_path,config_path,'>',logfile_path]
-
-    original_dir = os.getcwd()
-    os.chdir(wkdir)
+        command_line = [soft_install_path,config_path]
 
     log.info('>>> ' + soft + ' Start Time')
 
-    os.system(' '.join(command_line))
+    with open(logfile_path,'w') as logfile:
+        exit_status = subprocess.call(command_line,cwd=wkdir,stdout=logfile,
+                                      stderr=subprocess.STDOUT)
 
     log.info('>>> ' + soft + ' End Time')
 
-    os.chdir(original_dir)
+    if exit_status:
+        log.warning(soft + ' exited with status ' + str(exit_status) + ', see ' + logfile_path)
+
+    return exit_status
 
 
 #==============================================================================
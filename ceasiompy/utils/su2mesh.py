@@ -0,0 +1,277 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed for CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Reader of SU2 mesh files, shared by the modules which use SU2 meshes
+
+Python version: >=3.6
+
+| Author : agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+TODO:
+
+    * Read volume elements (NELEM block) if needed
+
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import os
+import sys
+import mmap
+import json
+
+import numpy as np
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+
+log = get_logger(__file__.split('.')[0])
+
+# Version of the index file format, increase it when the format changes
+INDEX_VERSION = 1
+
+# Number of nodes of SU2 surface elements (line, triangle, quadrilateral)
+ELEM_NODE_COUNT = {3: 2, 5: 3, 9: 4}
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+class SU2Mesh():
+    """Class to read a SU2 mesh file without loading it in memory.
+
+    At the first use of a mesh file, an index of its sections (NDIME, NELEM,
+    NPOIN, NMARK and each MARKER_TAG) with their byte offsets is built and
+    saved next to the mesh ('<mesh name>.meshindex.json'). The index is
+    reused as long as the mesh file does not change, the mesh sections are
+    then read directly from a memory map of the file.
+
+    Attributes:
+        su2_mesh_path (str): Path to the SU2 mesh file
+        ndime (int): Number of dimensions
+        nelem (int): Number of (volume) elements
+        npoin (int): Number of points
+        marker_list (list): Names of the markers, in the file order
+
+    """
+
+    def __init__(self, su2_mesh_path):
+
+        self.su2_mesh_path = su2_mesh_path
+        self.index_path = os.path.splitext(su2_mesh_path)[0] + '.meshindex.json'
+
+        stat = os.stat(su2_mesh_path)
+        self._file_id = [stat.st_size, stat.st_mtime_ns]
+
+        self._index = self._load_index()
+        if self._index is None:
+            self._index = self._build_index()
+            self._save_index()
+
+        self.ndime = self._index['NDIME']
+        self.nelem = self._index['NELEM'][0]
+        self.npoin = self._index['NPOIN'][0]
+        self.marker_list = list(self._index['MARKER'])
+
+    def _load_index(self):
+        """ Load the saved index, None if not available or not up to date """
+
+        if not os.path.isfile(self.index_path):
+            return None
+
+        try:
+            with open(self.index_path) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if index.get('version') != INDEX_VERSION or index.get('file_id') != self._file_id:
+            return None
+
+        return index
+
+    def _save_index(self):
+        """ Save the index next to the mesh file, if possible """
+
+        try:
+            with open(self.index_path,'w') as f:
+                json.dump(self._index,f)
+        except OSError:
+            log.warning('The index of ' + self.su2_mesh_path + ' could not be saved.')
+
+    def _build_index(self):
+        """ Find the position of all the sections of the mesh file
+
+        For each section, the number of entities and the byte offsets of the
+        first and after the last data line are saved.
+        """
+
+        log.info('Indexing SU2 mesh ' + self.su2_mesh_path)
+
+        index = {'version': INDEX_VERSION, 'file_id': self._file_id,
+                 'NDIME': 0, 'NELEM': [0,0,0], 'NPOIN': [0,0,0], 'NMARK': 0,
+                 'MARKER': {}}
+
+        with open(self.su2_mesh_path,'rb') as f, \
+             mmap.mmap(f.fileno(),0,access=mmap.ACCESS_READ) as mm:
+
+            # Header of the sections: (keyword, header offset, data offset)
+            header_list = []
+            for keyword in [b'NDIME',b'NELEM',b'NPOIN',b'NMARK',b'MARKER_TAG']:
+                pos = _find_keyword(mm,keyword,0)
+                while pos >= 0:
+                    header_list.append((keyword.decode(),pos,mm.find(b'\n',pos)+1))
+                    if keyword != b'MARKER_TAG':
+                        break
+                    pos = _find_keyword(mm,keyword,pos+1)
+
+            header_list.sort(key=lambda header: header[1])
+            header_pos_list = [header[1] for header in header_list] + [len(mm)]
+
+            for i, (keyword, pos, data_pos) in enumerate(header_list):
+                value = mm[pos:data_pos].split(b'=')[1].split()[0].decode()
+                end_pos = header_pos_list[i+1]
+
+                if keyword in ['NDIME','NMARK']:
+                    index[keyword] = int(value)
+                elif keyword in ['NELEM','NPOIN']:
+                    index[keyword] = [int(value),data_pos,end_pos]
+                else:
+                    # MARKER_TAG line is followed by a MARKER_ELEMS line
+                    elems_pos = data_pos
+                    data_pos = mm.find(b'\n',elems_pos)+1
+                    elem_count = int(mm[elems_pos:data_pos].split(b'=')[1])
+                    index['MARKER'][value] = [elem_count,data_pos,end_pos]
+
+        if not index['MARKER']:
+            log.warning('No "MARKER_TAG" has been found in the mesh!')
+
+        return index
+
+    def _read_block(self, start, end):
+        """ Read bytes of the mesh file between two offsets """
+
+        with open(self.su2_mesh_path,'rb') as f, \
+             mmap.mmap(f.fileno(),0,access=mmap.ACCESS_READ) as mm:
+            return mm[start:end]
+
+    def get_marker_list(self, farfield=True):
+        """ Get the names of the markers, without Farfield ones if asked """
+
+        if farfield:
+            return list(self.marker_list)
+
+        return [marker for marker in self.marker_list if 'Farfield' not in marker]
+
+    def get_marker_elem_count(self, marker):
+        """ Get the number of elements of a marker """
+
+        return self._index['MARKER'][marker][0]
+
+    def get_marker_ids(self, marker):
+        """ Get the ids of the points of a marker
+
+        Args:
+            marker (str): Name of the marker
+
+        Returns:
+            ids (array): Sorted unique ids of the points of the marker
+        """
+
+        if marker not in self._index['MARKER']:
+            raise ValueError('Marker "' + marker + '" not found in ' + self.su2_mesh_path)
+
+        elem_count, start, end = self._index['MARKER'][marker]
+
+        return get_elements_ids(self._read_block(start,end),elem_count)
+
+    def get_points(self):
+        """ Get the coordinates of all the points
+
+        Returns:
+            points (array): np.ndarray(npoin, ndime) Coordinates of the points
+        """
+
+        npoin, start, end = self._index['NPOIN']
+        if not npoin:
+            return np.empty((0,self.ndime))
+
+        values = np.array(self._read_block(start,end).split(),dtype=np.float64)
+
+        # Point lines could end with the point index
+        return values.reshape(npoin,-1)[:,:self.ndime]
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def _find_keyword(mm, keyword, start):
+    """ Find the next keyword at the beginning of a line, -1 if not found """
+
+    pos = mm.find(keyword,start)
+    while pos > 0 and mm[pos-1:pos] not in (b'\n',b' ',b'\t'):
+        pos = mm.find(keyword,pos+1)
+
+    return pos
+
+
+def get_elements_ids(block, elem_count):
+    """ Function to get the unique point ids of a block of SU2 element lines
+
+    Function 'get_elements_ids' parses lines of elements ('type id1 id2 ...')
+    and returns the ids of their points. When all the elements are of the same
+    type, all lines are parsed at once.
+
+    Args:
+        block (bytes): Lines of the elements
+        elem_count (int): Number of elements in the block
+
+    Returns:
+        ids (array): Sorted unique ids of the points of the elements
+
+    """
+
+    if not elem_count:
+        return np.empty(0,dtype=np.int64)
+
+    values = np.array(block.split(),dtype=np.int64)
+
+    if len(values) % elem_count == 0:
+        elems = values.reshape(elem_count,-1)
+        if np.all(elems[:,0] == elems[0,0]):
+            node_count = ELEM_NODE_COUNT.get(int(elems[0,0]),elems.shape[1]-1)
+            return _unique_ids(elems[:,1:1+node_count])
+
+    # Mixed element types
+    ids_list = []
+    for line in block.splitlines()[:elem_count]:
+        line_values = line.split()
+        node_count = ELEM_NODE_COUNT.get(int(line_values[0]),len(line_values)-1)
+        ids_list.extend(line_values[1:1+node_count])
+
+    return _unique_ids(np.array(ids_list,dtype=np.int64))
+
+
+def _unique_ids(ids):
+    """ Get sorted unique values of an array of (non negative) point ids """
+
+    # Ids are bounded by the number of points, a mask is faster than a sort
+    is_used = np.zeros(ids.max()+1,dtype=bool)
+    is_used[ids] = True
+
+    return np.flatnonzero(is_used)
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Nothing to execute!')
@@ -0,0 +1,250 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Trim functions used by the stability modules.
+
+The crossings of a target value (e.g. cm = 0 or cl = cl_required) are found
+at once for all the slices of an aeroMap reshaped as an (alt, mach, aos, aoa)
+grid, the result is a structured array with the trim angle, the local slope
+and the interpolation indices of each slice.
+
+Python version: >=3.6
+
+| Author: agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import numpy as np
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+
+log = get_logger(__file__.split('.')[0])
+
+# Fields of the trim tables
+TRIM_DTYPE = np.dtype([('point_nb', int),     # Number of points (without missing values)
+                       ('zero_nb', int),      # Number of values exactly equal to the target
+                       ('cross_nb', int),     # Number of crossings of the target
+                       ('value', float),      # Angle of the first crossing
+                       ('slope', float),      # Slope at the first crossing
+                       ('idx_before', int),   # Index of the points around the crossing
+                       ('idx_after', int),
+                       ('ratio', float)])     # Position of the crossing between the points
+
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+class TrimTable():
+    """ Trim conditions of all the slices of an aeroMap.
+
+    The values of a coefficient are reshaped on the (alt, mach, aos, aoa) grid
+    of the aeroMap, or (alt, mach, aoa, aos) to trim in sideslip, and the
+    crossings of the target along the last axis are found at once for all the
+    slices (see 'find_crossings').
+
+    Attributes:
+        params (tuple): Parameters of the slices, e.g. ('alt','mach','aos')
+        axis (str): Parameter along which the crossings are found, e.g. 'aoa'
+        axes (list): Unique values of the parameters of the grid
+        table (array): Structured array (TRIM_DTYPE) with one element per slice
+
+    """
+
+    def __init__(self, aeromap_index, values, axis='aoa', target=0.0):
+
+        self.axis = axis
+        self.params = tuple(param for param in ('alt','mach','aos','aoa') if param != axis)
+        self._index = aeromap_index
+
+        self.axes, grid = aeromap_index.get_grid(values, self.params + (axis,))
+        grid = grid - target
+
+        # Order of the points of the slices (missing points at the end)
+        self._order = _get_valid_order(grid)
+
+        self.table = find_crossings(grid, self.axes[-1])
+
+    def get_index(self, **params):
+        """ Get the index of the slice for the given parameters values
+
+        Args:
+            **params (float): Value of each parameter, e.g. alt=0,mach=0.5,aos=0
+
+        Returns:
+            index (tuple): Index of the slice in the table
+        """
+
+        index = []
+        for param, axis in zip(self.params, self.axes):
+            match = np.flatnonzero(np.abs(axis - params[param]) <= self._index.tol)
+            if not len(match):
+                raise ValueError('No ' + param + ' = ' + str(params[param]) + ' in the aeroMap!')
+            index.append(match[0])
+
+        return tuple(index)
+
+    def get(self, **params):
+        """ Get the trim conditions of the slice for the given parameters values """
+
+        return self.table[self.get_index(**params)]
+
+    def interpolate(self, values):
+        """ Get values and slopes of an other coefficient at the trim points
+
+        Args:
+            values (array): Value at each row of the aeroMap, e.g. Coef.cms
+
+        Returns:
+            trim_values (array): Values interpolated at the first crossing
+            trim_slopes (array): Slopes between the points around the crossing
+        """
+
+        _, grid = self._index.get_grid(values, self.params + (self.axis,))
+        x = np.broadcast_to(self.axes[-1], grid.shape)
+
+        y = np.take_along_axis(grid, self._order, axis=-1)
+        x = np.take_along_axis(x, self._order, axis=-1)
+
+        idx_before = np.maximum(self.table['idx_before'], 0)[...,None]
+        idx_after = np.maximum(self.table['idx_after'], 0)[...,None]
+
+        y_before = np.take_along_axis(y, idx_before, axis=-1)[...,0]
+        y_after = np.take_along_axis(y, idx_after, axis=-1)[...,0]
+        x_before = np.take_along_axis(x, idx_before, axis=-1)[...,0]
+        x_after = np.take_along_axis(x, idx_after, axis=-1)[...,0]
+
+        crossed = self.table['cross_nb'] > 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            trim_values = np.where(crossed, y_before + self.table['ratio']*(y_after-y_before), np.nan)
+            trim_slopes = np.where(crossed, (y_after-y_before)/(x_after-x_before), np.nan)
+
+        return trim_values, trim_slopes
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def _get_valid_order(y):
+    """ Order of the points along the last axis, missing (NaN) points at the end """
+
+    return np.argsort(np.isnan(y), axis=-1, kind='stable')
+
+
+def find_crossings(y, x):
+    """ Find where curves cross the 0 line, for all the curves at once
+
+    Each curve is given by the values 'y' along the last axis at the abscissas
+    'x' (in ascending order). Missing points (NaN) are ignored. A crossing is
+    either a value exactly equal to 0 or a change of sign between two points.
+    The first crossing of each curve is interpolated linearly: for an exact 0
+    the points before and after it are used to get the slope.
+
+    Args:
+        y (array): np.ndarray(..., n) Values of the curves
+        x (array): Abscissas of the points, np.ndarray(n) or same shape as 'y'
+
+    Returns:
+        table (array): Structured array (TRIM_DTYPE) of shape y.shape[:-1],
+                       'idx_before' and 'idx_after' are the indices of the
+                       points among the valid points of the curve (-1 and
+                       NaN values where the curve does not cross)
+    """
+
+    y = np.asarray(y, dtype=float)
+    x = np.broadcast_to(np.asarray(x, dtype=float), y.shape)
+
+    order = _get_valid_order(y)
+    y = np.take_along_axis(y, order, axis=-1)
+    x = np.take_along_axis(x, order, axis=-1)
+
+    n = y.shape[-1]
+    table = np.zeros(y.shape[:-1], dtype=TRIM_DTYPE)
+    table['point_nb'] = np.count_nonzero(~np.isnan(y), axis=-1)
+
+    zero = y == 0
+    with np.errstate(invalid='ignore'):
+        change = np.sign(y[...,:-1]) * np.sign(y[...,1:]) < 0
+    table['zero_nb'] = np.count_nonzero(zero, axis=-1)
+    table['cross_nb'] = table['zero_nb'] + np.count_nonzero(change, axis=-1)
+
+    # A crossing needs at least two points
+    table['cross_nb'][table['point_nb'] < 2] = 0
+
+    # First crossing: exact zero at index k, or change of sign between k and k+1
+    pos = np.arange(n)
+    first_zero = np.where(zero, pos, n).min(axis=-1)
+    first_change = np.where(change, pos[:-1], n).min(axis=-1) if n > 1 else np.full(y.shape[:-1], n)
+    at_zero = first_zero <= first_change
+
+    last = np.maximum(table['point_nb'] - 1, 0)
+    idx_before = np.where(at_zero, np.maximum(first_zero - 1, 0), first_change)
+    idx_after = np.where(at_zero, np.minimum(first_zero + 1, last), first_change + 1)
+    idx_before = np.minimum(idx_before, n - 1)
+    idx_after = np.minimum(idx_after, n - 1)
+    idx_zero = np.minimum(first_zero, n - 1)
+
+    def take(a, idx):
+        return np.take_along_axis(a, idx[...,None], axis=-1)[...,0]
+
+    x_before, x_after = take(x, idx_before), take(x, idx_after)
+    y_before, y_after = take(y, idx_before), take(y, idx_after)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = (y_after - y_before) / (x_after - x_before)
+        value = np.where(at_zero, take(x, idx_zero), x_before - y_before / slope)
+        ratio = (value - x_before) / (x_after - x_before)
+
+    crossed = table['cross_nb'] > 0
+    table['value'] = np.where(crossed, value, np.nan)
+    table['slope'] = np.where(crossed, slope, np.nan)
+    table['ratio'] = np.where(crossed, ratio, np.nan)
+    table['idx_before'] = np.where(crossed, idx_before, -1)
+    table['idx_after'] = np.where(crossed, idx_after, -1)
+
+    return table
+
+
+def check_crossing(alt, mach, trim):
+    """ Check that a moment coefficient curve crosses the 0 line only once
+
+    Args:
+        alt (float): Altitude [m]
+        mach (float) : Mach Number [-]
+        trim (record): Trim conditions of the curve (see 'find_crossings')
+
+    Returns:
+        crossed (bool): True if the curve crosses the 0 line only once
+    """
+
+    if trim['point_nb'] and trim['zero_nb'] == trim['point_nb']:
+        log.warning('Alt = {}, mach = {} moment coefficients list is composed of 0 only.'.format(alt, mach))
+        return False
+
+    if trim['cross_nb'] == 0:
+        log.error('Alt = {}, mach = {} moment coefficients list does not cross the 0 line, aircraft not stable, trimm conditions not achieved.'.format(alt, mach))
+        return False
+
+    if trim['cross_nb'] > 1:
+        log.error('Alt = {}, mach = {} moment coefficients list crosses {} times the 0 line, no stability analysis performed'.format(alt, mach, trim['cross_nb']))
+        return False
+
+    return True
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Nothing to execute!')
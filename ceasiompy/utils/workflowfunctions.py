@@ -25,8 +25,11 @@ TODO:
 import os
 import subprocess
 import shutil
+import importlib
+from contextlib import contextmanager
 
 import ceasiompy.utils.moduleinterfaces as mi
+import ceasiompy.utils.cpacsfunctions as cpsf
 
 from ceasiompy.SettingsGUI.settingsgui import create_settings_gui
 
@@ -77,13 +80,110 @@ def copy_module_to_module(module_from, io_from, module_to, io_to):
     shutil.copy(file_copy_from,file_copy_to)
 
 
-def run_subworkflow(module_to_run,cpacs_path_in='',cpacs_path_out=''):
+def create_sandbox(sandbox_dir, module_list):
+    """ Create a sandbox directory to run modules in isolation.
+
+    Function 'create_sandbox' creates in 'sandbox_dir' a directory for each
+    module of 'module_list' with its own ToolInput and ToolOutput directories.
+    The whole ToolInput directory of these modules is copied in the sandbox,
+    as some modules read other files than the CPACS file from their run
+    directory (e.g. 'ToolInput/user_toolinput.xml'). Only the files of the
+    ToolOutput directory are copied, its subdirectories contain results of
+    previous runs which are written again by the modules.
+
+    Args:
+        sandbox_dir (str): Path of the sandbox directory to create
+        module_list (list): List of modules which will be run in the sandbox
+
+    """
+
+    for module in module_list:
+        for io_dir in ['ToolInput','ToolOutput']:
+            module_io_dir = os.path.join(LIB_DIR,module,io_dir)
+            sandbox_io_dir = os.path.join(sandbox_dir,module,io_dir)
+            if not os.path.isdir(sandbox_io_dir):
+                os.makedirs(sandbox_io_dir)
+
+            if not os.path.isdir(module_io_dir):
+                continue
+
+            for name in os.listdir(module_io_dir):
+                path = os.path.join(module_io_dir,name)
+                sandbox_path = os.path.join(sandbox_io_dir,name)
+                if os.path.isfile(path):
+                    shutil.copy(path,sandbox_path)
+                elif io_dir == 'ToolInput' and os.path.isdir(path):
+                    if os.path.isdir(sandbox_path):
+                        shutil.rmtree(sandbox_path)
+                    shutil.copytree(path,sandbox_path)
+
+    log.info('Sandbox has been created in ' + sandbox_dir)
+
+
+@contextmanager
+def sandbox(sandbox_dir):
+    """ Context manager to run modules in a sandbox created by 'create_sandbox'
+
+    Inside the context, the ToolInput/ToolOutput paths of all modules (see
+    'moduleinterfaces.get_module_run_dir') are in 'sandbox_dir', also for the
+    modules run as subprocess.
+
+    Args:
+        sandbox_dir (str): Path of the sandbox directory
+    """
+
+    previous_sandbox_dir = mi.get_sandbox_dir()
+    os.environ[mi.SANDBOX_ENV] = sandbox_dir
+
+    try:
+        yield sandbox_dir
+    finally:
+        if previous_sandbox_dir:
+            os.environ[mi.SANDBOX_ENV] = previous_sandbox_dir
+        else:
+            del os.environ[mi.SANDBOX_ENV]
+
+
+def get_module_main_function(module):
+    """ Get the function to run a module in-process.
+
+    Function 'get_module_main_function' returns the function declared as
+    'MAIN_FUNCTION' ('file_name.function_name') in the __specs__ file of a
+    module. This function is called as function(cpacs_path, cpacs_out_path).
+
+    Args:
+        module (str): Name of the module
+
+    Returns:
+        main_function (function): Function to run the module, None if the
+                                  module does not declare it
+    """
+
+    specs = mi.get_specs_for_module(module)
+    main_function = getattr(specs,'MAIN_FUNCTION',None)
+
+    if not main_function:
+        return None
+
+    file_name, function_name = main_function.rsplit('.',1)
+    python_module = importlib.import_module('.'.join(['ceasiompy',module,file_name]))
+
+    return getattr(python_module,function_name)
+
+
+def run_subworkflow(module_to_run,cpacs_path_in='',cpacs_path_out='',in_process=True):
     """Function to run a list of module in order.
 
     Function 'run_subworkflow' will exectute in order all the module contained
     in 'module_to_run' list. Every time the resuts of one module (generaly CPACS
     file) will be copied as input for the next module.
 
+    Modules which declare a 'MAIN_FUNCTION' in their __specs__ file are run
+    in-process if 'in_process' is True: they are imported once and the CPACS
+    file is passed in memory between consecutive in-process modules. Other
+    modules are run in a separate python process, from their run directory
+    (module directory or sandbox, see 'sandbox'). The current working
+    directory of the process is not changed.
 
     Args:
         module_to_run (list): List of mododule to run (in order)
@@ -91,6 +191,7 @@ def run_subworkflow(module_to_run,cpacs_path_in='',cpacs_path_out=''):
                              ToolInput folder of the first submodule
         cpacs_path_out (str): Path of the output CPACS file use, if not already
                               in the ToolInput folder of the first submodule
+        in_process (bool): If False, all modules are run in a separate process
 
     """
 
@@ -110,41 +211,67 @@ def run_subworkflow(module_to_run,cpacs_path_in='',cpacs_path_out=''):
 
     log.info('The following modules will be executed: ' + str(module_to_run))
 
-    for m, module in enumerate(module_to_run):
+    # CPACS files kept in memory, written on disk at the end
+    in_memory_list = []
 
-        log.info('\n')
-        log.info('######################################################################################')
-        log.info('Run module: ' + module)
-        log.info('######################################################################################\n')
+    try:
+        for m, module in enumerate(module_to_run):
 
-        # Go to the module directory
-        module_path = os.path.join(LIB_DIR,module)
-        print('\n Going to ',module_path,'\n')
-        os.chdir(module_path)
+            log.info('\n')
+            log.info('######################################################################################')
+            log.info('Run module: ' + module)
+            log.info('######################################################################################\n')
 
-        # Copy CPACS file from previous module to this one
-        if m > 0:
-            copy_module_to_module(module_to_run[m-1],'out',module,'in')
+            module_path = os.path.join(LIB_DIR,module)
+            run_dir = mi.get_module_run_dir(module)
 
-        if module == 'SettingsGUI':
             cpacs_path = mi.get_toolinput_file_path(module)
             cpacs_out_path = mi.get_tooloutput_file_path(module)
-            create_settings_gui(cpacs_path,cpacs_out_path,module_to_run[m:])
-        elif module == 'Optimisation':
-            log.info('The optimisation module is not being run as such')
-            copy_module_to_module(module,'in',module,'out')
-        else:
-            # Find the python file to run
-            for file in os.listdir(module_path):
-                if file.endswith('.py'):
-                    if not file.startswith('__'):
-                        main_python = file
-
-            # Run the module
-            error = subprocess.call(['python',main_python])
 
-            if error:
-                raise ValueError('An error ocured in the module '+ module)
+            main_function = get_module_main_function(module) if in_process else None
+
+            # Copy CPACS file from previous module to this one
+            if m > 0:
+                previous_out_path = mi.get_tooloutput_file_path(module_to_run[m-1])
+                cpacs_str = cpsf.get_cpacs_in_memory(previous_out_path)
+                if main_function and cpacs_str is not None:
+                    cpsf.keep_cpacs_in_memory(cpacs_path,cpacs_str)
+                    in_memory_list.append(cpacs_path)
+                else:
+                    cpsf.release_cpacs_in_memory(previous_out_path)
+                    copy_module_to_module(module_to_run[m-1],'out',module,'in')
+
+            if module == 'SettingsGUI':
+                create_settings_gui(cpacs_path,cpacs_out_path,module_to_run[m:])
+            elif module == 'Optimisation':
+                log.info('The optimisation module is not being run as such')
+                copy_module_to_module(module,'in',module,'out')
+            elif main_function:
+                log.info('Run ' + module + ' in-process')
+                cpsf.keep_cpacs_in_memory(cpacs_out_path)
+                in_memory_list.append(cpacs_out_path)
+
+                try:
+                    mi.check_cpacs_input_requirements(cpacs_path,submod_name=module)
+                    main_function(cpacs_path,cpacs_out_path)
+                except Exception as err:
+                    raise ValueError('An error ocured in the module '+ module) from err
+            else:
+                # Find the python file to run
+                for file in os.listdir(module_path):
+                    if file.endswith('.py'):
+                        if not file.startswith('__'):
+                            main_python = file
+
+                # Run the module
+                error = subprocess.call(['python',os.path.join(module_path,main_python)],cwd=run_dir)
+
+                if error:
+                    raise ValueError('An error ocured in the module '+ module)
+
+    finally:
+        for cpacs_path in in_memory_list:
+            cpsf.release_cpacs_in_memory(cpacs_path)
 
     # Copy the cpacs file in the first module
     if cpacs_path_out:
@@ -2,6 +2,9 @@ import os
 import shutil
 from contextlib import contextmanager
 import importlib
+from types import SimpleNamespace
+
+import numpy as np
 
 PYTORNADO_MAIN_MODULE = 'ceasiompy.PyTornado.runpytornado'
 HERE = os.path.dirname(os.path.abspath(__file__))
@@ -34,3 +37,30 @@ def test_basic_run():
 
     with run_module_test_locally(PYTORNADO_MAIN_MODULE, HERE) as main:
         os.system(f'python {main}')
+
+
+def test_get_load_fields():
+    """Test that panel loads are gathered by wing"""
+
+    from ceasiompy.PyTornado.runpytornado import _get_load_fields
+
+    midpoints = np.arange(18, dtype=float).reshape(6, 3)
+    panelwise = {'fx': np.arange(6.0), 'fy': np.arange(6.0)*10, 'fz': np.arange(6.0)*100}
+    lattice = SimpleNamespace(
+        bound_leg_midpoints=midpoints,
+        bookkeeping_by_wing_uid={'Wing': [SimpleNamespace(pan_idx=[0, 1]),
+                                          SimpleNamespace(pan_idx=np.array([4]))]},
+        bookkeeping_by_wing_uid_mirror={'Wing': [SimpleNamespace(pan_idx=range(2, 4))]},
+    )
+    results = {'vlmdata': SimpleNamespace(panelwise=panelwise), 'lattice': lattice}
+
+    load_fields = _get_load_fields(results, HERE, csv_export=True)
+
+    assert sorted(load_fields) == ['Wing', 'Wing_m']
+    assert np.array_equal(load_fields['Wing'][:, 0:3], midpoints[[0, 1, 4]])
+    assert np.array_equal(load_fields['Wing'][2, 3:6], [4, 40, 400])
+    assert np.array_equal(load_fields['Wing_m'][:, 3], [2, 3])
+
+    for file in ['aircraft_loads.npz', 'aircraft_loads.csv']:
+        assert os.path.isfile(os.path.join(HERE, file))
+        os.remove(os.path.join(HERE, file))
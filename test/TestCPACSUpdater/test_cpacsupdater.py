@@ -0,0 +1,170 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'ceasiompy/CPACSUpdater/cpacsupdater.py'
+
+Python version: >=3.6
+
+| Author : agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import os
+import ast
+import sys
+import shutil
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+from ceasiompy.CPACSUpdater.cpacsupdater import SetCommand, get_literal, merge_geometry
+
+log = get_logger(__file__.split('.')[0])
+
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+OUT_DIR = os.path.join(MODULE_DIR,'ToolOutput')
+
+CPACS_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<cpacs>
+  <vehicles>
+    <aircraft>
+      <model uID="{uid}">
+        <fuselages><fuselage uID="fus1"/></fuselages>
+        <wings><wing uID="wing1"><sweep>{sweep}</sweep></wing></wings>
+      </model>
+    </aircraft>
+  </vehicles>
+  <toolspecific><wkdir>{wkdir}</wkdir></toolspecific>
+</cpacs>
+"""
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+class FakeObject():
+    """Class which replaces TIGL objects, it records the method calls"""
+
+    def __init__(self, calls, name):
+        self.calls = calls
+        self.name = name
+
+    def __getattr__(self, method):
+        def call(*args):
+            self.calls.append((self.name + '.' + method, args))
+            return FakeObject(self.calls, self.name + '.' + method)
+        return call
+
+
+class FakeAircraft():
+    """Class which replaces a TIGL aircraft configuration"""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_wings(self):
+        return FakeObject(self.calls, 'wings')
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def test_set_command():
+    """Test the class 'SetCommand'"""
+
+    aircraft = FakeAircraft()
+
+    command = SetCommand('wings.get_wing(1).get_section(2).set_sweep(w_sweep)','w_sweep')
+    assert command.root == 'wings'
+
+    with pytest.raises(ValueError):
+        command.apply(1.0)
+
+    # The object of the setter is resolved once
+    command.bind(aircraft)
+    assert aircraft.calls == [('wings.get_wing',(1,)),
+                              ('wings.get_wing.get_section',(2,))]
+
+    command.apply(25.0)
+    command.apply(-2.0)
+    assert aircraft.calls[2:] == [('wings.get_wing.get_section.set_sweep',(25.0,)),
+                                  ('wings.get_wing.get_section.set_sweep',(-2.0,))]
+
+    # Numeric and string arguments, with the variable
+    aircraft = FakeAircraft()
+    command = SetCommand('wings.get_wing("wing1").get_section(2).set_width(var, 3, -0.5)','var')
+    command.bind(aircraft)
+    command.apply(1.5)
+    assert aircraft.calls == [('wings.get_wing',('wing1',)),
+                              ('wings.get_wing.get_section',(2,)),
+                              ('wings.get_wing.get_section.set_width',(1.5,3,-0.5))]
+
+    for invalid_command in ['wings.get_wing(1).set_sweep(other_var)',
+                            '__import__("os").system("ls")',
+                            'os.get_wing(1).set_sweep(w_sweep)',
+                            'wings.get_wing(w_sweep).set_sweep(1)',
+                            'wings.get_wing(1).set_sweep(w_sweep*2)',
+                            'wings.get_wing(1).sweep',
+                            'wings.get_wing(1).set_sweep(']:
+        with pytest.raises(ValueError):
+            SetCommand(invalid_command,'w_sweep')
+
+
+def test_get_literal():
+    """Test function 'get_literal'"""
+
+    assert get_literal(ast.parse('2', mode='eval').body) == (True, 2)
+    assert get_literal(ast.parse('0.5', mode='eval').body) == (True, 0.5)
+    assert get_literal(ast.parse('"wing1"', mode='eval').body) == (True, 'wing1')
+    assert get_literal(ast.parse('var', mode='eval').body) == (False, None)
+    assert get_literal(ast.parse('-1', mode='eval').body) == (False, None)
+
+
+def test_merge_geometry():
+    """Test function 'merge_geometry'"""
+
+    if not os.path.isdir(OUT_DIR):
+        os.makedirs(OUT_DIR)
+
+    cpacs_path = os.path.join(OUT_DIR,'merge_in.xml')
+    cpacs_out_path = os.path.join(OUT_DIR,'merge_out.xml')
+    with open(cpacs_path,'w') as f:
+        f.write(CPACS_XML.format(uid='ac',sweep=10.0,wkdir='iter_2'))
+
+    geom_xml = CPACS_XML.format(uid='ac',sweep=20.0,wkdir='iter_1')
+    model_path = "vehicles/aircraft/model[@uID='ac']"
+
+    merge_geometry(cpacs_path,cpacs_out_path,geom_xml,[(model_path,'wings')],
+                   {'/cpacs/vehicles/aircraft/model/fuselages/fuselage': 'x'})
+
+    root = ET.parse(cpacs_out_path).getroot()
+    assert root.find(model_path + '/wings/wing/sweep').text == '20.0'
+    assert root.find(model_path + '/fuselages/fuselage').text == 'x'
+    assert root.find('toolspecific/wkdir').text == 'iter_2'
+    assert [elem.tag for elem in root.find(model_path)] == ['fuselages','wings']
+
+    with pytest.raises(ValueError):
+        merge_geometry(cpacs_path,cpacs_out_path,None,[],{'/cpacs/wrong/path': 1.0})
+
+    shutil.rmtree(OUT_DIR)
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Running Test CPACSUpdater')
+    log.info('To run test use the following command:')
+    log.info('>> pytest -v')
@@ -0,0 +1,84 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'ceasiompy/Optimisation/func/expression.py'
+
+Python version: >=3.6
+
+| Author : agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+from ceasiompy.Optimisation.func.expression import Expression, get_variables
+
+log = get_logger(__file__.split('.')[0])
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def test_expression():
+    """Test the class 'Expression'"""
+
+    obj = Expression('-mtom+range')
+    assert obj.variables == ['mtom','range']
+    assert obj({'mtom': 2.0, 'range': 5.0}) == 3.0
+
+    obj = Expression('-cl/cd + cms*2')
+    assert obj.variables == ['cl','cd','cms']
+    assert obj({'cl': 1.0, 'cd': 0.5, 'cms': 0.25}) == pytest.approx(-1.5)
+
+    obj = Expression('2*cl/cd + sqrt(cl)')
+    assert obj.variables == ['cl','cd']
+    assert obj({'cl': 4.0, 'cd': 0.5}) == pytest.approx(18.0)
+
+    # Evaluated at once on all the iterations of a history
+    history = pd.DataFrame({'cl': [1.0,2.0,3.0], 'cd': [0.1,0.2,0.5]})
+    assert np.allclose(Expression('cl/cd')(history),[10.0,10.0,6.0])
+
+    with pytest.raises(ValueError):
+        Expression('cl/cd')({'cl': 1.0})
+
+    for invalid_expr in ['cl/', '__import__("os")', 'cl.real', 'cl if cd else 1',
+                         '"text"', 'print(cl)', 'cl[0]']:
+        with pytest.raises(ValueError):
+            Expression(invalid_expr)
+
+
+def test_get_variables():
+    """Test the function 'get_variables'"""
+
+    assert get_variables(['cl/cd','cms','cd*2']) == ['cl','cd','cms']
+    assert get_variables('cl') == ['cl']
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Running Test Expression')
+    log.info('To run test use the following command:')
+    log.info('>> pytest -v')
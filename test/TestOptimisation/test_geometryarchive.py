@@ -0,0 +1,132 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'ceasiompy/Optimisation/func/geometryarchive.py'
+
+Python version: >=3.6
+
+| Author : agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import os
+import sys
+import shutil
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+from ceasiompy.Optimisation.func.geometryarchive import GeometryArchive, get_changes
+
+log = get_logger(__file__.split('.')[0])
+
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+OUT_DIR = os.path.join(MODULE_DIR,'ToolOutput','GeometryArchive')
+
+CPACS_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<cpacs xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+  <header><name>Test</name></header>
+  <vehicles>
+    <wing uID="wing1">
+      <span>{span}</span>
+      <sections>{sections}</sections>
+    </wing>
+    <fuselage uID="fus1"><length>30.0</length></fuselage>
+  </vehicles>
+</cpacs>
+"""
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def write_cpacs(name, span, sections):
+    """Write a simplified CPACS file"""
+
+    path = os.path.join(OUT_DIR,name)
+    with open(path,'w') as f:
+        f.write(CPACS_XML.format(span=span,sections=sections))
+
+    return path
+
+
+def test_get_changes():
+    """Test function 'get_changes'"""
+
+    base = ET.fromstring(CPACS_XML.format(span=10.0,sections='<s/>'))
+    new = ET.fromstring(CPACS_XML.format(span=12.0,sections='<s/><s/>'))
+
+    changes = []
+    get_changes(base,new,[],changes)
+
+    assert [(path, elem.tag) for path, elem in changes] == [([1,0,0],'span'),
+                                                           ([1,0,1],'sections')]
+
+    changes = []
+    get_changes(base,base,[],changes)
+    assert changes == []
+
+
+def test_geometry_archive():
+    """Test the class 'GeometryArchive'"""
+
+    if os.path.isdir(OUT_DIR):
+        shutil.rmtree(OUT_DIR)
+    os.makedirs(OUT_DIR)
+
+    archive = GeometryArchive(os.path.join(OUT_DIR,'Geometry.zip'))
+    assert archive.get_iterations() == []
+
+    archive.add(1,write_cpacs('iter1.xml',10.0,'<s/>'),{'span': [10.0]})
+    archive.add(2,write_cpacs('iter2.xml',12.0,'<s/><s/>'),{'span': [12.0]})
+
+    assert archive.get_iterations() == [1,2]
+    assert archive.get_design_vars(2) == {'span': [12.0]}
+
+    # Extracted files are equal to the archived ones
+    for i in [1,2]:
+        out_path = os.path.join(OUT_DIR,'out{}.xml'.format(i))
+        archive.extract(i,out_path)
+        original = ET.tostring(ET.parse(os.path.join(OUT_DIR,'iter{}.xml'.format(i))).getroot())
+        assert ET.tostring(ET.parse(out_path).getroot()) == original
+
+    # A new reader (e.g. after the routine) can extract the iterations
+    archive = GeometryArchive(os.path.join(OUT_DIR,'Geometry.zip'))
+    archive.extract(2,os.path.join(OUT_DIR,'out.xml'))
+    assert ET.parse(os.path.join(OUT_DIR,'out.xml')).find('vehicles/wing/span').text == '12.0'
+
+    with pytest.raises(ValueError):
+        archive.extract(3,os.path.join(OUT_DIR,'out.xml'))
+
+    # Iteration without design variables, the lock file is removed on close
+    archive.add(3,write_cpacs('iter3.xml',14.0,'<s/>'))
+    assert archive.get_design_vars(3) == {}
+    archive.close()
+    assert not os.path.isfile(os.path.join(OUT_DIR,'Geometry.zip.lock'))
+
+    shutil.rmtree(OUT_DIR)
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Running Test Geometry Archive')
+    log.info('To run test use the following command:')
+    log.info('>> pytest -v')
@@ -0,0 +1,109 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'ceasiompy/Optimisation/func/infill.py'
+
+Python version: >=3.6
+
+| Author : agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+from ceasiompy.Optimisation.func.infill import expected_improvement, \
+                                               feasibility_probability, get_infill_point
+
+log = get_logger(__file__.split('.')[0])
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+class FakeSurrogate():
+    """Class which replaces a Kriging model, prediction (x-1)^2 with a
+    variance which is zero at x=0 and x=2 """
+
+    def predict_values(self, x):
+        return (x[:,:1] - 1.0)**2
+
+    def predict_variances(self, x):
+        return (x[:,:1] * (2.0 - x[:,:1]))**2
+
+
+class FakeConstraint():
+    """Class which replaces a Kriging model, exact prediction x """
+
+    def predict_values(self, x):
+        return x[:,:1]
+
+    def predict_variances(self, x):
+        return np.zeros((len(x),1))
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def test_expected_improvement():
+    """Test function 'expected_improvement'"""
+
+    sm = FakeSurrogate()
+    x = np.array([[0.0],[1.0],[2.0]])
+
+    ei = expected_improvement(sm,x,0.5)
+
+    # No uncertainty at x=0 and x=2 (prediction 1 > 0.5), for x=1:
+    # (0.5 - 0) * cdf(0.5) + 1 * pdf(0.5)
+    assert np.allclose(ei,[0.0,0.5*0.6914625+0.3520653,0.0])
+
+
+def test_feasibility_probability():
+    """Test function 'feasibility_probability'"""
+
+    sm = FakeSurrogate()
+    x = np.array([[0.0],[1.0],[2.0]])
+
+    assert np.allclose(feasibility_probability(sm,x,-np.inf,0.5),[0.0,0.6914625,0.0])
+    assert np.allclose(feasibility_probability(sm,x,0.5,np.inf),[1.0,0.3085375,1.0])
+
+
+def test_get_infill_point():
+    """Test function 'get_infill_point'"""
+
+    sm = FakeSurrogate()
+    rng = np.random.default_rng(0)
+
+    x_best, crit_best = get_infill_point(sm,0.5,[[0.0,2.0]],rng=rng)
+
+    assert x_best == pytest.approx([1.0],abs=1e-3)
+    assert crit_best == pytest.approx(expected_improvement(sm,x_best[None],0.5)[0])
+
+    # Constraint x <= 0.6
+    x_best, crit_best = get_infill_point(sm,0.5,[[0.0,2.0]],
+                                         [(FakeConstraint(),-np.inf,0.6)],rng=rng)
+    assert x_best == pytest.approx([0.6],abs=1e-3)
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Running Test Infill')
+    log.info('To run test use the following command:')
+    log.info('>> pytest -v')
@@ -0,0 +1,125 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'ceasiompy/Optimisation/func/tools.py'
+
+Python version: >=3.6
+
+| Author : agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import os
+import sys
+import shutil
+
+import numpy as np
+import openmdao.api as om
+import pytest
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+from ceasiompy.Optimisation.func.tools import ResultReader, save_results, read_history
+
+log = get_logger(__file__.split('.')[0])
+
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+OPTIM_DIR = os.path.join(MODULE_DIR,'ToolOutput','Optim')
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+class Paraboloid(om.ExplicitComponent):
+    """Component which reads the recorder each time it is computed"""
+
+    def initialize(self):
+        self.options.declare('reader')
+        self.new_case_nb = []
+
+    def setup(self):
+        self.add_input('x', 1.0)
+        self.add_output('f', 1.0)
+        self.add_output('const_x2', 1.0)
+
+    def compute(self, inputs, outputs):
+        outputs['f'] = (inputs['x'] - 1.0)**2
+        outputs['const_x2'] = 2 * inputs['x']
+        self.new_case_nb.append(self.options['reader'].update())
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def test_result_reader():
+    """Test the class 'ResultReader' and function 'read_history'"""
+
+    if os.path.isdir(OPTIM_DIR):
+        shutil.rmtree(OPTIM_DIR)
+    os.makedirs(OPTIM_DIR)
+
+    reader = ResultReader(OPTIM_DIR)
+    assert reader.update() == 0
+
+    prob = om.Problem()
+    ivc = om.IndepVarComp()
+    ivc.add_output('x', 1.0)
+    prob.model.add_subsystem('indeps', ivc, promotes=['*'])
+    comp = prob.model.add_subsystem('comp', Paraboloid(reader=reader), promotes=['*'])
+    prob.model.add_design_var('x', lower=-2.0, upper=2.0)
+    prob.model.add_objective('f')
+    prob.model.add_constraint('const_x2', upper=3.0)
+
+    x_list = [-2.0, 0.0, 1.0, 2.0]
+    prob.driver = om.DOEDriver(om.ListGenerator([[('x', x)] for x in x_list]))
+    prob.driver.add_recorder(om.SqliteRecorder(os.path.join(OPTIM_DIR,'Driver_recorder.sql')))
+    prob.setup()
+    prob.run_driver()
+    prob.cleanup()
+
+    # During the routine, each update reads the case recorded before
+    assert comp.new_case_nb == [0, 1, 1, 1]
+    assert reader.update() == 1
+    assert reader.update() == 0
+
+    assert np.allclose(reader.values['x'][:,0], x_list)
+
+    df = reader.to_dataframe()
+    assert list(df['type']) == ['obj', 'des', 'const']
+    assert np.allclose(df.loc['f'][1:].astype(float), [9.0, 1.0, 0.0, 1.0])
+
+    save_results(OPTIM_DIR, reader)
+    history = read_history(os.path.join(OPTIM_DIR,'Variable_history.csv'))
+    assert np.allclose(history['const_x2'], [-4.0, 0.0, 2.0, 4.0])
+
+    # Former layout, the first case is written twice and the index is unnamed
+    legacy_path = os.path.join(OPTIM_DIR,'Variable_history_legacy.csv')
+    with open(legacy_path,'w') as f:
+        f.write(',type,0,1,2,3,4\n')
+        f.write('f,obj,9.0,9.0,1.0,0.0,1.0\n')
+        f.write('x,des,-2.0,-2.0,0.0,1.0,2.0\n')
+        f.write('const_x2,const,-4.0,-4.0,-,2.0,4.0\n')
+    history = read_history(legacy_path)
+    assert np.allclose(history['x'], x_list)
+    assert np.allclose(history['const_x2'], [-4.0, np.nan, 2.0, 4.0], equal_nan=True)
+
+    shutil.rmtree(OPTIM_DIR)
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Running Test Tools')
+    log.info('To run test use the following command:')
+    log.info('>> pytest -v')
@@ -0,0 +1,88 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'ceasiompy/PredictiveTool/prediction.py'
+
+Python version: >=3.6
+
+| Author : agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import os
+import sys
+import shutil
+
+import numpy as np
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+from ceasiompy.PredictiveTool.prediction import extract_data_set
+
+log = get_logger(__file__.split('.')[0])
+
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+OUT_DIR = os.path.join(MODULE_DIR,'ToolOutput','Prediction')
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def test_extract_data_set():
+    """Test function 'extract_data_set' with the former and current layouts
+       of 'Variable_history.csv'"""
+
+    if os.path.isdir(OUT_DIR):
+        shutil.rmtree(OUT_DIR)
+    os.makedirs(OUT_DIR)
+
+    # Current layout, each evaluation is written once
+    history_path = os.path.join(OUT_DIR,'Variable_history.csv')
+    with open(history_path,'w') as f:
+        f.write('Name,type,0,1,2\n')
+        f.write('f,obj,9.0,1.0,0.0\n')
+        f.write('x,des,-2.0,0.0,1.0\n')
+        f.write('y,des,3.0,2.0,1.0\n')
+        f.write('const_x2,const,-4.0,-,2.0\n')
+
+    x, y = extract_data_set(history_path)
+    assert np.array_equal(x,[[-2.0,3.0],[0.0,2.0],[1.0,1.0]])
+    assert np.array_equal(y,[[9.0],[1.0],[0.0]])
+
+    # Former layout, the first evaluation is written twice and read once
+    legacy_path = os.path.join(OUT_DIR,'Variable_history_legacy.csv')
+    with open(legacy_path,'w') as f:
+        f.write(',type,0,1,2,3\n')
+        f.write('f,obj,9.0,9.0,1.0,0.0\n')
+        f.write('x,des,-2.0,-2.0,0.0,1.0\n')
+        f.write('y,des,3.0,3.0,2.0,1.0\n')
+        f.write('const_x2,const,-4.0,-4.0,-,2.0\n')
+
+    x_legacy, y_legacy = extract_data_set(legacy_path)
+    assert np.array_equal(x_legacy,x)
+    assert np.array_equal(y_legacy,y)
+
+    shutil.rmtree(OUT_DIR)
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Running Test Prediction')
+    log.info('To run test use the following command:')
+    log.info('>> pytest -v')
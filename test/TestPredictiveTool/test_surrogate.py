@@ -0,0 +1,112 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'ceasiompy/PredictiveTool/func/surrogate.py'
+
+Python version: >=3.6
+
+| Author : agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+from ceasiompy.PredictiveTool.func.surrogate import Surrogate, Predictor, \
+                                                    get_data_hash, load_surrogate
+
+log = get_logger(__file__.split('.')[0])
+
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+MODEL_PATH = os.path.join(MODULE_DIR,'ToolOutput','test_surrogate.pkl')
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+class LinearModel():
+    """Class which replaces a SMT surrogate model, y = x1 + 2*x2"""
+
+    def predict_values(self, x):
+        return (x[:,0] + 2*x[:,1]).reshape(-1,1)
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def test_get_data_hash():
+    """Test function 'get_data_hash'"""
+
+    xd = np.array([[0.0,1.0],[2.0,3.0]])
+    yd = np.array([[2.0],[8.0]])
+
+    assert get_data_hash(xd,yd) == get_data_hash(xd.tolist(),yd.tolist())
+    assert get_data_hash(xd,yd) != get_data_hash(xd,yd+1e-12)
+    assert get_data_hash(xd,yd) != get_data_hash(xd.reshape(1,4),yd)
+
+
+def test_predictor():
+    """Test saving a surrogate and using it with a 'Predictor'"""
+
+    if not os.path.isdir(os.path.dirname(MODEL_PATH)):
+        os.makedirs(os.path.dirname(MODEL_PATH))
+    if os.path.isfile(MODEL_PATH):
+        os.remove(MODEL_PATH)
+
+    xd = np.array([[0.0,1.0],[2.0,3.0],[1.0,-1.0]])
+    yd = LinearModel().predict_values(xd)
+
+    predictor = Predictor(MODEL_PATH)
+    assert not predictor.is_trained_on(xd,yd)
+    with pytest.raises(OSError):
+        predictor.predict_values([0.0,0.0])
+
+    surrogate = Surrogate(LinearModel(),'LS',xd,yd,[0.1],y_names=['y'])
+    surrogate.save(MODEL_PATH)
+
+    assert np.array_equal(load_surrogate(MODEL_PATH).xlimits,[[0.0,2.0],[-1.0,3.0]])
+
+    assert predictor.is_trained_on(xd,yd)
+    assert predictor.is_trained_on(xd,yd,'LS')
+    assert not predictor.is_trained_on(xd,yd,'KRG')
+    assert not predictor.is_trained_on(xd,yd*2)
+
+    assert np.allclose(predictor.predict_values([[1.0,1.0],[0.5,2.0]]),[[3.0],[4.5]])
+    assert np.allclose(predictor.predict_values([1.0,1.0]),[[3.0]])
+
+    with pytest.raises(ValueError):
+        predictor.predict_values([[1.0,1.0,1.0]])
+
+    # Empty, truncated or corrupted files are not valid trained models
+    with open(MODEL_PATH,'rb') as f:
+        model_bytes = f.read()
+    for content in [b'', model_bytes[:len(model_bytes)//2], b'not a pickle file']:
+        with open(MODEL_PATH,'wb') as f:
+            f.write(content)
+        assert not Predictor(MODEL_PATH).is_trained_on(xd,yd)
+
+    os.remove(MODEL_PATH)
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Running Test Surrogate')
+    log.info('To run test use the following command:')
+    log.info('>> pytest -v')
@@ -0,0 +1,98 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'ceasiompy/SU2Run/func/extractloads.py'
+
+Python version: >=3.6
+
+
+| Author : agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import os
+import sys
+import shutil
+
+import numpy as np
+import pytest
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+from ceasiompy.SU2Run.func.extractloads import get_mesh_markers_ids, \
+                                               get_point_markers
+
+log = get_logger(__file__.split('.')[0])
+
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+WKDIR = os.path.join(MODULE_DIR,'ToolOutput')
+
+MESH_MARKERS = """NDIME= 3
+NMARK= 3
+MARKER_TAG= Wing
+MARKER_ELEMS= 2
+5 0 1 2
+5 1 2 3
+MARKER_TAG= Fuselage
+MARKER_ELEMS= 2
+9 3 4 5 6
+5 6 7 8
+MARKER_TAG= Farfield
+MARKER_ELEMS= 1
+5 9 10 11
+"""
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def test_get_mesh_markers_ids():
+    """Test function 'get_mesh_markers_ids'"""
+
+    shutil.rmtree(WKDIR,ignore_errors=True)
+    os.makedirs(WKDIR)
+
+    mesh_path = os.path.join(WKDIR,'mesh.su2')
+    with open(mesh_path,'w') as f:
+        f.write(MESH_MARKERS)
+
+    marker_dict = get_mesh_markers_ids(mesh_path)
+
+    assert list(marker_dict) == ['Wing','Fuselage']
+    assert np.array_equal(marker_dict['Wing'],[0,1,2,3])
+    assert np.array_equal(marker_dict['Fuselage'],[3,4,5,6,7,8])
+
+    shutil.rmtree(WKDIR)
+
+
+def test_get_point_markers():
+    """Test function 'get_point_markers'"""
+
+    marker_dict = {'Wing': np.array([0,1,2,3]),
+                   'Fuselage': np.array([3,4,5,20])}
+
+    point_marker = get_point_markers(marker_dict,7)
+
+    assert list(point_marker) == ['Wing']*4 + ['Fuselage']*2 + ['']
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Running Test Extract Loads')
+    log.info('To run test use the following command:')
+    log.info('>> pytest -v')
@@ -0,0 +1,152 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'ceasiompy/SU2Run/func/su2cache.py'
+
+Python version: >=3.6
+
+
+| Author : agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import os
+import sys
+import shutil
+
+import pytest
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+from ceasiompy.utils.su2functions import read_config
+from ceasiompy.SU2Run.func.su2cache import SU2CaseCache, is_converged
+
+log = get_logger(__file__.split('.')[0])
+
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+WKDIR = os.path.join(MODULE_DIR,'ToolOutput')
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def create_case(case_name, aoa, mesh_path, last_iter=49):
+    """ Create a case directory with a configuration and result files """
+
+    case_dir = os.path.join(WKDIR,case_name)
+    os.makedirs(case_dir)
+
+    with open(os.path.join(case_dir,'ConfigCFD.cfg'),'w') as f:
+        f.write('MESH_FILENAME= ' + mesh_path + '\n')
+        f.write('AOA= ' + str(aoa) + '\n')
+        f.write('INNER_ITER= 100\n')
+        f.write('CONV_FILENAME= history\n')
+        f.write('RESTART_FILENAME= restart_flow.dat\n')
+
+    with open(os.path.join(case_dir,'forces_breakdown.dat'),'w') as f:
+        f.write('Total CL: ' + str(aoa) + '\n' + 'x'*600000)
+
+    with open(os.path.join(case_dir,'history.csv'),'w') as f:
+        f.write('"Time_Iter","Outer_Iter","Inner_Iter",     "rms[Rho]"\n')
+        f.write('          0,          0,          0,     -1.2\n')
+        f.write('          0,          0, ' + str(last_iter).rjust(10) + ',     -8.1\n')
+
+    with open(os.path.join(case_dir,'restart_flow.dat'),'w') as f:
+        f.write('restart')
+
+    return case_dir
+
+
+def test_is_converged():
+    """Test the function 'is_converged'"""
+
+    shutil.rmtree(WKDIR,ignore_errors=True)
+    os.makedirs(WKDIR)
+
+    mesh_path = os.path.join(WKDIR,'mesh.su2')
+    for case_name, last_iter, converged in [('Case00',49,True),('Case01',99,False)]:
+        case_dir = create_case(case_name,0.0,mesh_path,last_iter)
+        cfg = read_config(os.path.join(case_dir,'ConfigCFD.cfg'))
+        assert is_converged(case_dir,cfg) == converged
+
+    # Diverged case
+    with open(os.path.join(case_dir,'history.csv'),'a') as f:
+        f.write('          0,          0,         50,     nan\n')
+    assert not is_converged(case_dir,cfg)
+
+    # No history file
+    os.remove(os.path.join(case_dir,'history.csv'))
+    assert not is_converged(case_dir,cfg)
+
+    shutil.rmtree(WKDIR)
+
+
+def test_su2_case_cache():
+    """Test the class 'SU2CaseCache'"""
+
+    shutil.rmtree(WKDIR,ignore_errors=True)
+    os.makedirs(WKDIR)
+
+    mesh_path = os.path.join(WKDIR,'mesh.su2')
+    with open(mesh_path,'w') as f:
+        f.write('NDIME= 3\n')
+
+    cache = SU2CaseCache(os.path.join(WKDIR,'Cache'),size_max=1.0)
+
+    case_dir_1 = create_case('Case00',0.0,mesh_path)
+    case_dir_2 = create_case('Case01',2.0,mesh_path)
+    key_1 = cache.get_key(os.path.join(case_dir_1,'ConfigCFD.cfg'))
+    key_2 = cache.get_key(os.path.join(case_dir_2,'ConfigCFD.cfg'))
+    assert key_1 != key_2
+
+    # Same configuration and mesh in another directory give the same key
+    case_dir_3 = create_case('Case02',0.0,mesh_path)
+    assert cache.get_key(os.path.join(case_dir_3,'ConfigCFD.cfg')) == key_1
+
+    assert not cache.fetch(key_1,case_dir_3)
+    cache.store(key_1,case_dir_1,os.path.join(case_dir_1,'ConfigCFD.cfg'))
+    for file in ['forces_breakdown.dat','history.csv','restart_flow.dat']:
+        os.remove(os.path.join(case_dir_3,file))
+    assert cache.fetch(key_1,case_dir_3)
+    for file in ['forces_breakdown.dat','history.csv','restart_flow.dat']:
+        assert os.path.isfile(os.path.join(case_dir_3,file))
+
+    # A case which has not converged is not cached
+    case_dir_4 = create_case('Case03',4.0,mesh_path,last_iter=99)
+    key_4 = cache.get_key(os.path.join(case_dir_4,'ConfigCFD.cfg'))
+    cache.store(key_4,case_dir_4,os.path.join(case_dir_4,'ConfigCFD.cfg'))
+    assert not cache.fetch(key_4,case_dir_4)
+
+    # Only one entry fits in the cache, the least recently used is removed
+    cache.store(key_2,case_dir_2,os.path.join(case_dir_2,'ConfigCFD.cfg'))
+    assert not cache.fetch(key_1,case_dir_3)
+    assert cache.fetch(key_2,case_dir_3)
+
+    # A modified mesh changes the key
+    with open(mesh_path,'a') as f:
+        f.write('NELEM= 0\n')
+    assert cache.get_key(os.path.join(case_dir_1,'ConfigCFD.cfg')) != key_1
+
+    shutil.rmtree(WKDIR)
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Running Test SU2 Cache')
+    log.info('To run test use the following command:')
+    log.info('>> pytest -v')
@@ -0,0 +1,82 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'ceasiompy/SU2Run/func/su2config.py'
+
+Python version: >=3.6
+
+
+| Author : agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import os
+import sys
+
+import pytest
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+from ceasiompy.SU2Run.func.su2config import get_case_dir_name, \
+                                            get_warm_start_parents, \
+                                            set_warm_start
+
+log = get_logger(__file__.split('.')[0])
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def test_get_case_dir_name():
+    """Test function 'get_case_dir_name'"""
+
+    assert get_case_dir_name(3,0.78,2.0,0.0) == 'Case03_alt3_mach0.78_aoa2.0_aos0.0'
+
+
+def test_get_warm_start_parents():
+    """Test function 'get_warm_start_parents'"""
+
+    alt_list = [0,0,0,0,0,0]
+    mach_list = [0.3,0.3,0.3,0.5,0.5,0.5]
+    aoa_list = [0,2,4,0,2,4]
+    aos_list = [0,0,0,0,0,0]
+
+    parent_list = get_warm_start_parents(alt_list,mach_list,aoa_list,aos_list)
+    assert parent_list == [None,0,1,0,3,4]
+
+    assert get_warm_start_parents([],[],[],[]) == []
+
+
+def test_set_warm_start():
+    """Test function 'set_warm_start'"""
+
+    cfg = {'RESTART_FILENAME': 'restart_flow.dat'}
+
+    set_warm_start(cfg,'/wkdir','Case00')
+    assert cfg['RESTART_SOL'] == 'YES'
+    assert cfg['SOLUTION_FILENAME'] == os.path.join('/wkdir','Case00','restart_flow.dat')
+
+    set_warm_start(cfg,'/wkdir',None)
+    assert cfg['RESTART_SOL'] == 'NO'
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Running Test SU2 Config')
+    log.info('To run test use the following command:')
+    log.info('>> pytest -v')
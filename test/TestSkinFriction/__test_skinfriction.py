@@ -72,6 +72,11 @@ def test_estimate_skin_friction_coef():
 
     assert cd0 == approx(0.005320707210958961)
 
+    # Test 1 bis, with arrays of mach and altitude (e.g. aeroMap columns)
+    cd0 = estimate_skin_friction_coef(wetted_area,wing_area,wing_span,[1,1],[1,1])
+
+    assert cd0 == approx([0.005320707210958961]*2)
+
     # Test 2, with "real values"
     tixi = open_tixi(CPACS_IN_PATH)
     tigl = open_tigl(tixi)
@@ -0,0 +1,172 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'ceasiompy/SkinFriction/skinfriction.py' with aeroMap
+arrays, results are compared to the previous case by case calculation
+
+Python version: >=3.6
+
+
+| Author : agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import os
+import sys
+import math
+import shutil
+
+import numpy as np
+import pytest
+from pytest import approx
+
+import ceasiompy.utils.cpacsfunctions as cpsf
+import ceasiompy.utils.apmfunctions as apmf
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+from ceasiompy.utils.standardatmosphere import get_atmosphere
+from ceasiompy.SkinFriction.skinfriction import get_largest_wing_dim, \
+                                          estimate_skin_friction_coef, \
+                                          add_skin_friction, SF_XPATH
+
+log = get_logger(__file__.split('.')[0])
+
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+CPACS_IN_PATH = MODULE_DIR + '/ToolInput/D150_AGILE_Hangar_v3.xml'
+CPACS_SMALL_PATH = MODULE_DIR + '/ToolOutput/SmallAeroMap.xml'
+CPACS_OUT_PATH = MODULE_DIR + '/ToolOutput/ToolOutput.xml'
+
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def estimate_skin_friction_coef_case(wetted_area,wing_area,wing_span,mach,alt):
+    """ Skin friction drag coefficient of one case, as it was calculated
+        before aeroMaps were handled as arrays """
+
+    Atm = get_atmosphere(alt)
+    kinetic_visc = Atm.visc/Atm.dens
+    speed = mach * Atm.sos
+    reynolds_number = (wetted_area/wing_span) * speed / kinetic_visc
+    cfe = 0.00258 + 0.00102 * math.exp(-6.28*1e-9*reynolds_number) \
+          + 0.00295 * math.exp(-2.01*1e-8*reynolds_number)
+
+    return cfe * wetted_area / wing_area
+
+
+def add_skin_friction_case(AeroCoef,wetted_area,wing_area,wing_span):
+    """ Coefficients with skin friction, calculated case by case as it was
+        done before in 'add_skin_friction' """
+
+    cl_list, cd_list, cs_list = [], [], []
+    for case in range(AeroCoef.get_count()):
+        cd0 = estimate_skin_friction_coef_case(wetted_area,wing_area,wing_span,
+                                               AeroCoef.mach[case],AeroCoef.alt[case])
+        aoa_rad = math.radians(AeroCoef.aoa[case])
+        aos_rad = math.radians(AeroCoef.aos[case])
+        cl_list.append(AeroCoef.cl[case] + cd0 * math.sin(aoa_rad))
+        cd_list.append(AeroCoef.cd[case] + cd0 * math.cos(aoa_rad) * math.cos(aos_rad))
+        cs_list.append(AeroCoef.cs[case] + cd0 * math.sin(aos_rad))
+
+    return cl_list, cd_list, cs_list
+
+
+def test_estimate_skin_friction_coef_array():
+    """Test function 'estimate_skin_friction_coef' with arrays """
+
+    wetted_area = 702
+    wing_area = 122.3
+    wing_span = 33.9
+    mach = np.array([0.2,0.5,0.78,0.78,0.9])
+    alt = np.array([0,5000,11000,12000,20000])
+
+    cd0 = estimate_skin_friction_coef(wetted_area,wing_area,wing_span,mach,alt)
+
+    assert cd0.shape == (5,)
+    for i in range(5):
+        cd0_scalar = estimate_skin_friction_coef(wetted_area,wing_area,wing_span,
+                                                 mach[i],alt[i])
+        assert np.isscalar(cd0_scalar)
+        assert cd0[i] == approx(cd0_scalar,rel=1e-12)
+        assert cd0[i] == approx(estimate_skin_friction_coef_case(wetted_area,wing_area,
+                                                                 wing_span,mach[i],alt[i]),
+                                rel=1e-9)
+
+    # Scalar altitude broadcast on an array of Mach numbers
+    cd0 = estimate_skin_friction_coef(wetted_area,wing_area,wing_span,mach,12000)
+    assert cd0 == approx([estimate_skin_friction_coef(wetted_area,wing_area,wing_span,m,12000)
+                          for m in mach])
+
+
+def test_add_skin_friction_small_aeromap():
+    """Test that 'add_skin_friction' gives the same '_SkinFriction' aeroMap
+       as the case by case calculation """
+
+    shutil.rmtree(os.path.join(MODULE_DIR,'ToolOutput'),ignore_errors=True)
+    os.makedirs(os.path.join(MODULE_DIR,'ToolOutput'))
+
+    # Small aeroMap, with a missing moment coefficient (cml)
+    Coef = apmf.AeroCoefficient()
+    Coef.alt = [0.0,0.0,10000.0,10000.0]
+    Coef.mach = [0.3,0.3,0.78,0.78]
+    Coef.aoa = [0.0,4.0,2.0,6.0]
+    Coef.aos = [0.0,0.0,2.0,-3.0]
+    Coef.cl = [0.1,0.5,0.3,0.7]
+    Coef.cd = [0.01,0.02,0.015,0.03]
+    Coef.cs = [0.0,0.0,0.01,-0.02]
+    Coef.cmd = [0.0,0.0,0.001,-0.002]
+    Coef.cms = [-0.01,-0.05,-0.03,-0.07]
+
+    tixi = cpsf.open_tixi(CPACS_IN_PATH)
+    apmf.create_empty_aeromap(tixi,'SmallAeroMap','Small aeroMap to test skin friction')
+    apmf.save_parameters(tixi,'SmallAeroMap',Coef)
+    apmf.save_coefficients(tixi,'SmallAeroMap',Coef)
+    cpsf.create_branch(tixi,SF_XPATH + '/aeroMapToCalculate')
+    cpsf.add_string_vector(tixi,SF_XPATH + '/aeroMapToCalculate',['SmallAeroMap'])
+    cpsf.close_tixi(tixi,CPACS_SMALL_PATH)
+
+    add_skin_friction(CPACS_SMALL_PATH,CPACS_OUT_PATH)
+
+    tixi = cpsf.open_tixi(CPACS_OUT_PATH)
+    tigl = cpsf.open_tigl(tixi)
+    wetted_area = cpsf.get_value(tixi,'/cpacs/toolspecific/CEASIOMpy/geometry/analysis/wettedArea')
+    wing_area, wing_span = get_largest_wing_dim(tixi,tigl)
+
+    AeroCoef = apmf.get_aeromap(tixi,'SmallAeroMap')
+    AeroCoef.complete_with_zeros()
+    cl_list, cd_list, cs_list = add_skin_friction_case(AeroCoef,wetted_area,wing_area,wing_span)
+
+    AeroCoefSF = apmf.get_aeromap(tixi,'SmallAeroMap_SkinFriction')
+    assert AeroCoefSF.aoa == approx(Coef.aoa)
+    assert AeroCoefSF.aos == approx(Coef.aos)
+    assert AeroCoefSF.cl == approx(cl_list)
+    assert AeroCoefSF.cd == approx(cd_list)
+    assert AeroCoefSF.cs == approx(cs_list)
+    assert AeroCoefSF.cml == approx([0.0]*4)
+    assert AeroCoefSF.cms == approx(Coef.cms)
+
+    shutil.rmtree(os.path.join(MODULE_DIR,'ToolOutput'))
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Test SkinFriction with aeroMap arrays')
+    log.info('To run test use the following command:')
+    log.info('>> pytest -v')
@@ -33,8 +33,9 @@ import ceasiompy.utils.apmfunctions as apmf
 
 from ceasiompy.StabilityDynamic.func_dynamic import get_unic, interpolation, get_index, \
                                             speed_derivative_at_trim, adimensionalise,\
-                                            speed_derivative_at_trim_lat, concise_derivative_longi, concise_derivative_lat,\
+                                            concise_derivative_longi, concise_derivative_lat,\
                                             longi_root_identification, direc_root_identification,\
+                                            longi_root_identification_batch, direc_root_identification_batch,\
                                             check_sign_longi, check_sign_lat,\
                                             short_period_damping_rating, short_period_frequency_rating, cap_rating, \
                                             phugoid_rating, roll_rating, spiral_rating, dutch_roll_rating, plot_splane,\
@@ -83,8 +84,8 @@ def test_get_index():
 
 
 def test_speed_derivative_at_trim():
-    """ Gives the speed derivative of coefficient Cd for trim conditions given by:
-    idx_trim_before , idx_trim_after and ratio '"""
+    """ Gives the speed derivatives of the coefficients at trim conditions
+    (alt, mach, trim_aoa, aos = 0) '"""
 
     alt_list      = [0,0,0,0,0,0,  0,0,0,0,0,0,  1,1,1,1,1,1,  1,1,1,1,1,1]
     mach_list = [0,0,1,1,2,2,  0,0,1,1,2,2,  0,0,1,1,2,2,  0,0,1,1,2,2]
@@ -92,19 +93,93 @@ def test_speed_derivative_at_trim():
     aos_list    = [0,0,0,0,0,0,  1,1,1,1,1,1,  0,0,0,0,0,0,  1,1,1,1,1,1]
     cd_list      = [1,2,2,3,3,4,  2,3,2,3,2,3,  1,2,1,2,1,2,  2,3,2,3,2,3]
 
-    mach =2
-    idx_alt = [0,1,2,3,4,5,7,8,9,10,11]
-    aos = 0
-    mach_unic = [0,1,2]
-    idx_trim_before=0
-    idx_trim_after=1
-    ratio = 0.5
-    parameter_list = cd_list
+    Coeffs = apmf.AeroCoefficient()
+    Coeffs.alt = alt_list
+    Coeffs.mach = mach_list
+    Coeffs.aoa = aoa_list
+    Coeffs.aos = aos_list
+    Coeffs.cd = cd_list
+
+    aeromap_interp = apmf.AeroMapInterpolator(Coeffs)
+    mach_unic = np.array([0,1,2])
+    aos_unic = np.array([0,1])
+
+    # Left derivative at the last mach, trim aoa = 1.5
+    cd_u = speed_derivative_at_trim(aeromap_interp, 0, 2, 1.5, mach_unic).cd
+    assert cd_u == approx(1)
+
+    # Right and middle derivatives for several trim points at once
+    cd_u = speed_derivative_at_trim(aeromap_interp, [0,0,1], [0,1,1], [1.5,1.0,2.0], mach_unic).cd
+    assert cd_u == approx([1.0,1.0,0.0])
+
+    # Derivative with respect to the angle of sideslip
+    cd_beta = speed_derivative_at_trim(aeromap_interp, 0, [0,1], 1.5, aos_unic, 'aos').cd
+    assert cd_beta == approx([1.0,0.0])
+
+    # Trim point outside of the aeroMap
+    assert np.isnan(speed_derivative_at_trim(aeromap_interp, 0, 1, 3.0, mach_unic).cd)
+
+
+def _state_matrix(real_roots, complex_roots, seed):
+    """ Random real matrix with the given roots (complex roots: a+bi, b>0) """
+
+    blocks = [[[r]] for r in real_roots] + [[[c.real, c.imag], [-c.imag, c.real]] for c in complex_roots]
+    n = sum(len(block) for block in blocks)
+    diag = np.zeros((n,n))
+    i = 0
+    for block in blocks:
+        diag[i:i+len(block),i:i+len(block)] = block
+        i += len(block)
+
+    q, _ = np.linalg.qr(np.random.default_rng(seed).normal(size=(n,n)))
+
+    return q @ diag @ q.T
+
+
+def test_longi_root_identification_batch():
+    """ Short period and phugoid roots of a stack of state matrices """
+
+    sp_list = [-1.2+2.5j, -0.8+1.9j, -2.0+3.0j]
+    ph_list = [-0.01+0.08j, 0.005+0.12j, -0.02+0.05j]
+    A_longi = [_state_matrix([],[sp,ph],n) for n, (sp,ph) in enumerate(zip(sp_list,ph_list))]
+    # Non oscillating phugoid: roots can not be identified
+    A_longi.append(_state_matrix([-0.05,-0.02],[-1.2+2.5j],3))
+
+    valid, roots, eg_value, eg_vector = longi_root_identification_batch(np.array(A_longi))
+
+    assert valid.tolist() == [True, True, True, False]
+    assert eg_value.shape == (4,4)
+    assert eg_vector.shape == (4,4,4)
+    assert roots[:3,0] == approx(np.conj(sp_list))
+    assert roots[:3,1] == approx(sp_list)
+    assert roots[:3,2] == approx(np.conj(ph_list))
+    assert roots[:3,3] == approx(ph_list)
+
+    # Same results as the function for one matrix
+    sp1, sp2, ph1, ph2 = longi_root_identification(A_longi[1])[:4]
+    assert [sp1, sp2, ph1, ph2] == approx(roots[1].tolist())
+    assert longi_root_identification(A_longi[3])[0] is None
+
+
+def test_direc_root_identification_batch():
+    """ Roll, spiral and dutch roll roots of a stack of state matrices """
+
+    A_direc = [_state_matrix([0.0,-1.5,-0.01],[-0.1+1.2j],0),
+               _state_matrix([-0.8,0.0,0.02],[-0.05+0.9j],1),
+               _state_matrix([0.0],[-0.1+1.2j,-0.2+0.4j],2)]
+
+    valid, roots, eg_value, eg_vector = direc_root_identification_batch(np.array(A_direc))
 
-    #cd_u = speed_derivative_at_trim(parameter_list,mach,mach_list,idx_alt,aoa_list,aos,aos_list,mach_unic_list,idx_trim_before, idx_trim_after, ratio)
-    cd_u = speed_derivative_at_trim(parameter_list , mach, mach_list, mach_unic, idx_alt, aoa_list, aos_list, idx_trim_before, idx_trim_after, ratio)
+    assert valid.tolist() == [True, True, False]
+    assert roots[:2,0].real == approx([-1.5,-0.8])
+    assert roots[:2,1].real == approx([-0.01,0.02])
+    assert roots[:2,2] == approx([-0.1+1.2j,-0.05+0.9j])
+    assert roots[:2,3] == approx([-0.1-1.2j,-0.05-0.9j])
 
-    assert cd_u == 1
+    roll, spiral, dr1, dr2 = direc_root_identification(A_direc[0])[:4]
+    assert (roll, spiral) == approx((-1.5,-0.01))
+    assert dr1 == approx(-0.1+1.2j)
+    assert direc_root_identification(A_direc[2])[0] is None
 
 
 #==============================================================================
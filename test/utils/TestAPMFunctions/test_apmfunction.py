@@ -25,6 +25,7 @@ import os
 import sys
 import shutil
 
+import numpy as np
 import pytest
 from pytest import raises
 
@@ -38,7 +39,9 @@ from ceasiompy.utils.cpacsfunctions import open_tixi, open_tigl, close_tixi,   \
                                      add_float_vector, get_float_vector,       \
                                      add_string_vector, get_string_vector
 
-from ceasiompy.utils.apmfunctions import AeroCoefficient, get_aeromap_uid_list,\
+from ceasiompy.utils.apmfunctions import AeroCoefficient, AeroMapIndex,     \
+                                         AeroMapInterpolator,                  \
+                                         get_aeromap_uid_list,                 \
                                          create_empty_aeromap, check_aeromap,  \
                                          save_parameters, save_coefficients,   \
                                          get_aeromap, merge_aeroMap,           \
@@ -56,7 +59,144 @@ CPACS_OUT_PATH = os.path.join(MODULE_DIR,'ToolOutput','ToolOutput.xml')
 #   CLASSES
 #==============================================================================
 
-# Test AeroCoefficient Class ???
+def test_aerocoefficient():
+    """Test the class 'AeroCoefficient'"""
+
+    Coef = AeroCoefficient()
+
+    # Empty columns
+    assert len(Coef.alt) == 0
+    assert len(Coef.dcldqstar) == 0
+
+    # Columns grown point by point
+    for i in range(50):
+        Coef.add_param_point(1000.0,0.5,float(49-i),0.0)
+        Coef.add_coefficients(0.1*i,0.01,0.0,0.0,0.0,-0.01*i)
+    Coef.damping_derivatives.add_damping_der_coef(1,2,3,4,5,6,'_dq')
+
+    assert Coef.get_count() == 50
+    assert Coef.alt.dtype == np.float64
+    assert Coef.cl[-1] == pytest.approx(4.9)
+    assert Coef.dcldqstar[0] == 1
+    assert Coef.damping_derivatives.dcmsdqstar[0] == 6
+
+    # Columns set at once
+    Coef.cs = [1.0]*50
+    assert Coef.cs.dtype == np.float64
+
+    # Sort all the columns by 'aoa'
+    Coef.sort_by_key('aoa')
+    assert np.all(np.diff(Coef.aoa) > 0)
+    assert Coef.cl[0] == pytest.approx(4.9)
+
+    # Empty coefficients are replaced by zeros
+    Coef2 = AeroCoefficient()
+    Coef2.alt = Coef.alt
+    Coef2.mach = Coef.mach
+    Coef2.aoa = Coef.aoa
+    Coef2.aos = Coef.aos
+    Coef2.complete_with_zeros()
+    assert np.all(Coef2.cml == 0)
+    assert len(Coef2.cml) == 50
+
+
+def test_aeromapindex():
+    """Test the class 'AeroMapIndex'"""
+
+    Coef = AeroCoefficient()
+    Coef.alt = [0,0,0,1000,1000,0]
+    Coef.mach = [0.5,0.5,0.6,0.5,0.5,0.5]
+    Coef.aoa = [2,0,0,0,2,4]
+    Coef.aos = [0,0,0,0,0,1]
+
+    index = AeroMapIndex(Coef)
+
+    assert np.array_equal(index.get_rows(alt=0,mach=0.5,aos=0),[0,1])
+    assert np.array_equal(index.get_rows(mach=0.5+1e-9),[0,1,3,4,5])
+    assert np.array_equal(index.get_rows(alt=0,aoa=4,aos=1),[5])
+    assert len(index.get_rows(alt=500)) == 0
+    assert np.array_equal(index.get_rows(),range(6))
+    assert np.array_equal(index.get_unique('aoa'),[0,2,4])
+
+    # Values on the (alt, mach, aos, aoa) grid, NaN where there is no row
+    axes, grid = index.get_grid(np.arange(6.0))
+    assert [list(axis) for axis in axes] == [[0,1000],[0.5,0.6],[0,1],[0,2,4]]
+    assert grid.shape == (2,2,2,3)
+    assert np.array_equal(grid[0,0,0],[1.0,0.0,np.nan],equal_nan=True)
+    assert grid[0,0,1,2] == 5.0
+    assert grid[1,0,0,1] == 4.0
+    assert np.isnan(grid[1,1]).all()
+
+
+def test_aeromapinterpolator():
+    """Test the class 'AeroMapInterpolator'"""
+
+    # Full grid, with only one aos
+    Coef = AeroCoefficient()
+    alt, mach, aoa = np.meshgrid([0,1000],[0.3,0.5,0.7],[-4,0,4,8],indexing='ij')
+    Coef.alt = alt.ravel()
+    Coef.mach = mach.ravel()
+    Coef.aoa = aoa.ravel()
+    Coef.aos = np.zeros(alt.size)
+    Coef.cl = 0.1*Coef.aoa + 0.3*Coef.mach + 1e-4*Coef.alt
+    Coef.cd = 0.01 + 0.1*Coef.mach
+    Coef.dcmsdqstar = -Coef.aoa
+
+    interp = AeroMapInterpolator(Coef)
+    assert interp.is_grid
+    assert interp.names == ['cl','cd','dcmsdqstar']
+
+    values = interp.get_values(500,0.4,[1.0,2.0,6.0],0)
+    assert values.shape == (3,)
+    assert values.cl == pytest.approx([0.27,0.37,0.77])
+    assert values.cd == pytest.approx(0.05)
+    assert values.dcmsdqstar == pytest.approx([-1.0,-2.0,-6.0])
+
+    # Grid of points, outside of the aeroMap or not at the only aos
+    values = interp.get_values(np.array([[0],[1000]]),[0.3,0.7],8,0)
+    assert values.cl == pytest.approx(np.array([[0.89,1.01],[0.99,1.11]]))
+    assert np.isnan(interp.get_values(0,0.9,0,0).cl)
+    assert np.isnan(interp.get_values(0,0.5,0,2).cl)
+
+    # Scattered points, the same linear function is interpolated exactly
+    Coef = AeroCoefficient()
+    rng = np.random.default_rng(0)
+    Coef.alt = rng.uniform(0,1000,100)
+    Coef.mach = rng.uniform(0.2,0.8,100)
+    Coef.aoa = rng.uniform(-5,10,100)
+    Coef.aos = np.zeros(100)
+    Coef.cl = 0.1*Coef.aoa + 0.3*Coef.mach + 1e-4*Coef.alt
+
+    interp = AeroMapInterpolator(Coef)
+    assert not interp.is_grid
+    assert interp.get_values([400,500],0.5,2,0).cl == pytest.approx([0.39,0.40])
+
+    # Degenerate aeroMaps (mach and aoa on a line, repeated aoa), the nearest
+    # point is used instead of the triangulation
+    Coef = AeroCoefficient()
+    Coef.alt = np.zeros(3)
+    Coef.mach = np.array([0.3,0.4,0.5])
+    Coef.aoa = np.array([0.0,2.0,4.0])
+    Coef.aos = np.zeros(3)
+    Coef.cl = np.array([0.1,0.3,0.5])
+
+    interp = AeroMapInterpolator(Coef)
+    assert interp.get_values(0,[0.31,0.49],[0.1,3.9],0).cl == pytest.approx([0.1,0.5])
+    assert np.isnan(interp.get_values(0,0.6,4.0,0).cl)
+
+    Coef = AeroCoefficient()
+    Coef.alt = np.zeros(3)
+    Coef.mach = np.full(3,0.3)
+    Coef.aoa = np.array([0.0,0.0,4.0])
+    Coef.aos = np.zeros(3)
+    Coef.cl = np.array([0.1,0.1,0.5])
+
+    interp = AeroMapInterpolator(Coef)
+    assert not interp.is_grid
+    assert interp.get_values(0,0.3,[0.5,3.5],0).cl == pytest.approx([0.1,0.5])
+
+    with pytest.raises(ValueError):
+        AeroMapInterpolator(AeroCoefficient())
 
 #==============================================================================
 #   FUNCTIONS
@@ -124,6 +124,74 @@ def test_close_tixi():
     assert lines_cpacs_in == lines_cpacs_out
 
 
+def test_keep_cpacs_in_memory():
+    """Test the functions to keep CPACS files in memory"""
+
+    memory_out_path = os.path.join(MODULE_DIR,'ToolOutput','memory_out.xml')
+    if os.path.exists(memory_out_path):
+        os.remove(memory_out_path)
+
+    # Saved in memory and not on disk
+    cpsf.keep_cpacs_in_memory(memory_out_path)
+    tixi = cpsf.open_tixi(CPACS_IN_PATH)
+    tixi.updateTextElement('/cpacs/header/name','InMemory')
+    cpsf.close_tixi(tixi,memory_out_path)
+
+    assert not os.path.exists(memory_out_path)
+    assert 'InMemory' in cpsf.get_cpacs_in_memory(memory_out_path)
+
+    # Read from memory
+    tixi = cpsf.open_tixi(memory_out_path)
+    assert tixi.getTextElement('/cpacs/header/name') == 'InMemory'
+
+    # Written on disk when released
+    cpsf.release_cpacs_in_memory(memory_out_path)
+    assert cpsf.get_cpacs_in_memory(memory_out_path) is None
+    tixi = cpsf.open_tixi(memory_out_path)
+    assert tixi.getTextElement('/cpacs/header/name') == 'InMemory'
+
+    os.remove(memory_out_path)
+
+
+def test_get_tixi_tigl():
+    """Test the function 'get_tixi_tigl' and the cache of shared handles"""
+
+    cache_out_path = os.path.join(MODULE_DIR,'ToolOutput','cache_out.xml')
+    if not os.path.exists(os.path.dirname(cache_out_path)):
+        os.makedirs(os.path.dirname(cache_out_path))
+    shutil.copy(CPACS_IN_PATH,cache_out_path)
+    cpsf.invalidate_handle_cache()
+
+    # Handles are reused while the file does not change
+    tixi, tigl = cpsf.get_tixi_tigl(cache_out_path)
+    assert tigl.getWingCount() == 1
+    assert cpsf.get_tixi_tigl(cache_out_path) == (tixi, tigl)
+
+    # Handles are replaced when the file is saved with 'close_tixi'
+    tixi_w = cpsf.open_tixi(cache_out_path)
+    tixi_w.updateTextElement('/cpacs/header/name','Cached')
+    cpsf.close_tixi(tixi_w,cache_out_path)
+    assert os.path.abspath(cache_out_path) not in cpsf.HANDLE_CACHE
+    tixi, _ = cpsf.get_tixi_tigl(cache_out_path,with_tigl=False)
+    assert tixi.getTextElement('/cpacs/header/name') == 'Cached'
+
+    # Least recently used handles are dropped, but can still be used
+    for i in range(cpsf.HANDLE_CACHE_SIZE):
+        copy_path = os.path.join(MODULE_DIR,'ToolOutput','cache_copy' + str(i) + '.xml')
+        shutil.copy(CPACS_IN_PATH,copy_path)
+        cpsf.get_tixi_tigl(copy_path,with_tigl=False)
+    assert len(cpsf.HANDLE_CACHE) == cpsf.HANDLE_CACHE_SIZE
+    assert os.path.abspath(cache_out_path) not in cpsf.HANDLE_CACHE
+    assert tixi.getTextElement('/cpacs/header/name') == 'Cached'
+
+    cpsf.invalidate_handle_cache()
+    assert not cpsf.HANDLE_CACHE
+
+    os.remove(cache_out_path)
+    for i in range(cpsf.HANDLE_CACHE_SIZE):
+        os.remove(os.path.join(MODULE_DIR,'ToolOutput','cache_copy' + str(i) + '.xml'))
+
+
 def test_create_branch():
     """Test the function 'create_branch'"""
 
@@ -0,0 +1,131 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed for CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'ceasiompy/utils/inertiafunctions.py'
+
+Python version: >=3.6
+
+| Author : agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+from ceasiompy.utils.inertiafunctions import get_fuselage_grid, get_wing_nodes, \
+                                             get_symmetric_points, lumped_masses_inertia
+
+log = get_logger(__file__.split('.')[0])
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+class FakeTigl():
+    """Class which replaces a TIGL handle, surfaces are simple planes"""
+
+    def __init__(self):
+        self.call_count = 0
+
+    def fuselageGetPoint(self, fus, seg, eta, zeta):
+        self.call_count += 1
+        return (eta, zeta, fus + seg)
+
+    def wingGetLowerPoint(self, wing, seg, eta, zeta):
+        self.call_count += 1
+        return (zeta, eta, -1.0)
+
+    def wingGetUpperPoint(self, wing, seg, eta, zeta):
+        self.call_count += 1
+        return (zeta, eta, 1.0)
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def test_get_fuselage_grid():
+    """Test function 'get_fuselage_grid'"""
+
+    tigl = FakeTigl()
+
+    grid = get_fuselage_grid(tigl,1,2,[0.0,0.5,1.0],[0.0,1.0])
+
+    assert grid.shape == (3,2,3)
+    assert np.array_equal(grid[1,1],[0.5,1.0,3.0])
+    assert tigl.call_count == 6
+
+    # Grid is cached on the handle
+    get_fuselage_grid(tigl,1,2,[0.0,0.5,1.0],[0.0,1.0])
+    assert tigl.call_count == 6
+
+
+def test_get_wing_nodes():
+    """Test function 'get_wing_nodes'"""
+
+    tigl = FakeTigl()
+
+    nodes = get_wing_nodes(tigl,1,1,[0.0,0.5],[0.25,0.25])
+
+    # For each section: 2 leading/trailing edge points + 2 lower/upper pairs
+    assert nodes.shape == (12,3)
+    assert np.allclose(nodes[:6],[[0.0,0.0,-1.0],[1.0,0.0,-1.0],
+                                  [0.25,0.0,-1.0],[0.25,0.0,1.0],
+                                  [0.5,0.0,-1.0],[0.5,0.0,1.0]])
+
+    assert len(get_wing_nodes(tigl,1,1,[],[0.25])) == 0
+
+
+def test_get_symmetric_points():
+    """Test function 'get_symmetric_points'"""
+
+    points = np.array([[1.0,2.0,3.0]])
+
+    assert np.array_equal(get_symmetric_points(points,1),[[1.0,2.0,-3.0]])
+    assert np.array_equal(get_symmetric_points(points,2),[[1.0,-2.0,3.0]])
+    assert np.array_equal(get_symmetric_points(points,3),[[-1.0,2.0,3.0]])
+
+    with pytest.raises(ValueError):
+        get_symmetric_points(points,4)
+
+
+def test_lumped_masses_inertia():
+    """Test function 'lumped_masses_inertia'"""
+
+    points = np.array([[1.0,0.0,0.0],[0.0,2.0,0.0],[1.0,1.0,1.0]])
+    masses = np.array([1.0,2.0,3.0])
+    cog = np.zeros(3)
+
+    inertia = lumped_masses_inertia(points,masses,cog)
+
+    # Ixx, Iyy, Izz, Ixy, Iyz, Ixz
+    assert np.allclose(inertia,[14.0,7.0,15.0,3.0,3.0,3.0])
+
+    # Single mass for all points and CoG offset
+    inertia = lumped_masses_inertia(points+1.0,2.0,np.ones(3))
+    assert np.allclose(inertia,lumped_masses_inertia(points,[2.0,2.0,2.0],cog))
+
+    assert np.array_equal(lumped_masses_inertia(np.empty((0,3)),1.0,cog),np.zeros(6))
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Running Test Inertia Functions')
+    log.info('To run test use the following command:')
+    log.info('>> pytest -v')
@@ -0,0 +1,101 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed for CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'ceasiompy/utils/loadfields.py'
+
+Python version: >=3.6
+
+| Author : agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import os
+import sys
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+from ceasiompy.utils.loadfields import save_load_fields, get_load_fields, \
+                                       get_load_fields_by_marker, export_load_fields_csv
+
+log = get_logger(__file__.split('.')[0])
+
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+WKDIR = os.path.join(MODULE_DIR,'ToolOutput')
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def test_load_fields():
+    """Test functions to save, get and export load fields"""
+
+    shutil.rmtree(WKDIR,ignore_errors=True)
+    os.makedirs(WKDIR)
+
+    load_file_path = os.path.join(WKDIR,'force.npz')
+    coord = np.arange(12,dtype=float).reshape(4,3)
+    force = -coord
+    marker = ['Wing','Fuselage','Wing','Wing_m']
+    metadata = {'source': 'SU2', 'mach': 0.3, 'aoa': 2.0, 'aos': 0.0}
+
+    save_load_fields(load_file_path,coord,force,marker,metadata)
+
+    coord_r, force_r, marker_r, metadata_r = get_load_fields(load_file_path)
+    assert np.array_equal(coord_r,coord)
+    assert np.array_equal(force_r,force)
+    assert list(marker_r) == marker
+    assert metadata_r == metadata
+
+    load_fields = get_load_fields_by_marker(load_file_path)
+    assert sorted(load_fields) == ['Fuselage','Wing','Wing_m']
+    assert load_fields['Wing'].shape == (2,6)
+    assert np.array_equal(load_fields['Wing'][1],[6,7,8,-6,-7,-8])
+
+    csv_file_path = os.path.join(WKDIR,'force.csv')
+    export_load_fields_csv(load_file_path,csv_file_path)
+    df = pd.read_csv(csv_file_path)
+    assert list(df.columns) == ['ids','x','y','z','fx','fy','fz','marker']
+    assert list(df['marker']) == marker
+    assert np.array_equal(df[['fx','fy','fz']].values,force)
+
+    # Columns of PyTornado 'aircraft_loads.csv'
+    export_load_fields_csv(load_file_path,csv_file_path,marker_col='wing_uid',with_ids=False)
+    df = pd.read_csv(csv_file_path)
+    assert list(df.columns) == ['x','y','z','fx','fy','fz','wing_uid']
+    assert list(df['wing_uid']) == marker
+
+    with pytest.raises(ValueError):
+        save_load_fields(load_file_path,coord,force,marker[:2])
+
+    with pytest.raises(OSError):
+        get_load_fields(os.path.join(WKDIR,'nothing.npz'))
+
+    shutil.rmtree(WKDIR)
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Running Test Load Fields')
+    log.info('To run test use the following command:')
+    log.info('>> pytest -v')
@@ -0,0 +1,120 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed for CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'ceasiompy/utils/su2mesh.py'
+
+Python version: >=3.6
+
+| Author : agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import os
+import sys
+import shutil
+
+import numpy as np
+import pytest
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+from ceasiompy.utils.su2mesh import SU2Mesh, get_elements_ids
+
+log = get_logger(__file__.split('.')[0])
+
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+WKDIR = os.path.join(MODULE_DIR,'ToolOutput')
+
+MESH = """% Small test mesh
+NDIME= 3
+NELEM= 2
+10 0 1 2 3 0
+10 1 2 3 4 1
+NPOIN= 5
+0.0 0.0 0.0 0
+1.0 0.0 0.0 1
+0.0 1.0 0.0 2
+0.0 0.0 1.0 3
+1.0 1.0 1.0 4
+NMARK= 2
+MARKER_TAG= Wing
+MARKER_ELEMS= 2
+5 0 1 2
+9 1 2 3 4
+MARKER_TAG= Farfield
+MARKER_ELEMS= 1
+5 1 3 4
+"""
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def test_su2mesh():
+    """Test the class 'SU2Mesh'"""
+
+    shutil.rmtree(WKDIR,ignore_errors=True)
+    os.makedirs(WKDIR)
+
+    mesh_path = os.path.join(WKDIR,'mesh.su2')
+    with open(mesh_path,'w') as f:
+        f.write(MESH)
+
+    mesh = SU2Mesh(mesh_path)
+
+    assert mesh.ndime == 3
+    assert mesh.nelem == 2
+    assert mesh.npoin == 5
+    assert mesh.marker_list == ['Wing','Farfield']
+    assert mesh.get_marker_list(farfield=False) == ['Wing']
+    assert mesh.get_marker_elem_count('Farfield') == 1
+    assert np.array_equal(mesh.get_marker_ids('Wing'),[0,1,2,3,4])
+    assert np.array_equal(mesh.get_marker_ids('Farfield'),[1,3,4])
+    assert np.array_equal(mesh.get_points()[4],[1.0,1.0,1.0])
+
+    with pytest.raises(ValueError):
+        mesh.get_marker_ids('Fuselage')
+
+    # Index is saved and reused
+    assert os.path.isfile(os.path.join(WKDIR,'mesh.meshindex.json'))
+    assert SU2Mesh(mesh_path).marker_list == ['Wing','Farfield']
+
+    # Index is rebuilt when the mesh changes
+    with open(mesh_path,'w') as f:
+        f.write(MESH.replace('NMARK= 2','NMARK= 3') + 'MARKER_TAG= Tail\nMARKER_ELEMS= 1\n3 0 4\n')
+    mesh = SU2Mesh(mesh_path)
+    assert mesh.marker_list == ['Wing','Farfield','Tail']
+    assert np.array_equal(mesh.get_marker_ids('Tail'),[0,4])
+
+    shutil.rmtree(WKDIR)
+
+
+def test_get_elements_ids():
+    """Test function 'get_elements_ids'"""
+
+    assert np.array_equal(get_elements_ids(b'5 3 1 2\n5 2 3 4\n',2),[1,2,3,4])
+    assert np.array_equal(get_elements_ids(b'5 3 1 2\n3 7 8\n',2),[1,2,3,7,8])
+    assert len(get_elements_ids(b'',0)) == 0
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Running Test SU2 Mesh')
+    log.info('To run test use the following command:')
+    log.info('>> pytest -v')
@@ -9,7 +9,7 @@ Python version: >=3.6
 
 | Author : Aidan Jungo
 | Creation: 2018-10-05
-| Last modifiction: 2019-08-07
+| Last modifiction: 2026-10-18
 """
 
 #==============================================================================
@@ -19,11 +19,13 @@ Python version: >=3.6
 import os
 import sys
 
+import numpy as np
 import pytest
 from pytest import approx
 
 from ceasiompy.utils.ceasiomlogger import get_logger
-from ceasiompy.utils.standardatmosphere import get_atmosphere, plot_atmosphere
+from ceasiompy.utils.standardatmosphere import get_atmosphere, get_atmosphere_array, \
+                                             plot_atmosphere
 
 log = get_logger(__file__.split('.')[0])
 
@@ -89,6 +91,47 @@ def test_get_atmosphere_84000m():
     assert atm.grav == approx(9.553079513419783)
 
 
+def test_get_atmosphere_array():
+    """Test 'get_atmosphere_array' against tabulated ISA (1976) values"""
+
+    # Geopotential altitude [m], temperature [K], pressure [Pa], density
+    # [kg/m^3] and speed of sound [m/s], at layer limits and inside layers
+    isa_table = np.array([[0.0,     288.15, 101325.0, 1.2250,     340.294],
+                          [5000.0,  255.65, 54019.9,  0.73612,    320.529],
+                          [11000.0, 216.65, 22632.1,  0.36392,    295.070],
+                          [20000.0, 216.65, 5474.89,  0.088035,   295.070],
+                          [32000.0, 228.65, 868.019,  0.013225,   303.131],
+                          [47000.0, 270.65, 110.906,  0.0014275,  329.799],
+                          [51000.0, 270.65, 66.9389,  8.6160e-4,  329.799],
+                          [71000.0, 214.65, 3.95642,  6.4211e-5,  293.704]])
+
+    # Altitudes in a 2D array, with repeated altitudes
+    alt = np.stack([isa_table[:,0],isa_table[::-1,0]])
+    atm = get_atmosphere_array(alt)
+    assert atm.shape == alt.shape
+
+    for row in [0,1]:
+        table = isa_table if row == 0 else isa_table[::-1]
+        assert atm.temp[row] == approx(table[:,1],rel=1e-6)
+        assert atm.pres[row] == approx(table[:,2],rel=1e-4)
+        assert atm.dens[row] == approx(table[:,3],rel=1e-4)
+        assert atm.sos[row] == approx(table[:,4],rel=1e-5)
+
+    # Values of the scalar function are the same
+    atm_10km = get_atmosphere(10000.0)
+    for name in ['temp','pres','dens','visc','sos','re_len_ma','grav']:
+        assert get_atmosphere_array([10000.0])[name][0] == approx(getattr(atm_10km,name),rel=1e-12)
+
+    # Scalar altitude
+    assert get_atmosphere_array(10000).temp == approx(223.15)
+
+    with pytest.raises(ValueError):
+        get_atmosphere_array([0.0, 85000.0])
+
+    with pytest.raises(ValueError):
+        get_atmosphere_array([1000.0, np.nan])
+
+
 #==============================================================================
 #    MAIN
 #==============================================================================
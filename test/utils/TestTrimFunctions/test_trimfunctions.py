@@ -0,0 +1,137 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'ceasiompy/utils/trimfunctions.py'
+
+Python version: >=3.6
+
+| Author : agent
+| Creation: 2026-10-18
+| Last modifiction: 2026-10-18
+
+"""
+
+#==============================================================================
+#   IMPORTS
+#==============================================================================
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from pytest import approx
+
+from ceasiompy.utils.ceasiomlogger import get_logger
+from ceasiompy.utils.apmfunctions import AeroCoefficient, AeroMapIndex
+from ceasiompy.utils.trimfunctions import TrimTable, find_crossings, check_crossing
+
+log = get_logger(__file__.split('.')[0])
+
+#==============================================================================
+#   CLASSES
+#==============================================================================
+
+
+#==============================================================================
+#   FUNCTIONS
+#==============================================================================
+
+def test_find_crossings():
+    """Test the function 'find_crossings'"""
+
+    x = [0.0, 1.0, 2.0, 3.0]
+    y = [[-2.0, -1.0, 1.0, 3.0],         # One change of sign
+         [1.0, 0.0, -1.0, -2.0],         # Exact 0 inside
+         [0.0, 1.0, 2.0, 3.0],           # Exact 0 at the first point
+         [1.0, 2.0, 3.0, 4.0],           # No crossing
+         [1.0, -1.0, 1.0, -1.0],         # Three crossings
+         [0.0, 0.0, 0.0, 0.0],           # Only 0
+         [np.nan, -1.0, np.nan, 1.0]]    # Missing points
+
+    table = find_crossings(y, x)
+
+    assert table.shape == (7,)
+    assert table['cross_nb'].tolist() == [1, 1, 1, 0, 3, 4, 1]
+    assert table['point_nb'].tolist() == [4, 4, 4, 4, 4, 4, 2]
+    assert table['value'][:3] == approx([1.5, 1.0, 0.0])
+    assert table['slope'][:3] == approx([2.0, -1.0, 1.0])
+    assert table['idx_before'][:3].tolist() == [1, 0, 0]
+    assert table['idx_after'][:3].tolist() == [2, 2, 1]
+    assert table['ratio'][:3] == approx([0.5, 0.5, 0.0])
+    assert np.isnan(table['value'][3])
+    assert table['idx_before'][3] == -1
+
+    # First crossing of several crossings
+    assert table['value'][4] == approx(0.5)
+
+    # Indices among the valid points
+    assert table['value'][6] == approx(2.0)
+    assert table['slope'][6] == approx(1.0)
+    assert (table['idx_before'][6], table['idx_after'][6]) == (0, 1)
+
+    assert [check_crossing(0, 0.5, trim) for trim in table] \
+           == [True, True, True, False, False, False, True]
+
+
+def test_trim_table():
+    """Test the class 'TrimTable'"""
+
+    Coef = AeroCoefficient()
+    alt, mach, aos, aoa = np.meshgrid([0.0, 1000.0], [0.5, 0.6], [0.0, 2.0],
+                                      [-2.0, 0.0, 2.0, 4.0], indexing='ij')
+    Coef.alt = alt.ravel()
+    Coef.mach = mach.ravel()
+    Coef.aos = aos.ravel()
+    Coef.aoa = aoa.ravel()
+
+    # Rows in a random order
+    order = np.random.default_rng(1).permutation(len(Coef.alt))
+    for param in ['alt','mach','aos','aoa']:
+        setattr(Coef, param, getattr(Coef, param)[order])
+
+    cl = 0.1 * (Coef.aoa + 1.0) + 0.1 * Coef.mach
+    cms = -0.02 * Coef.aoa + 0.01
+
+    index = AeroMapIndex(Coef)
+
+    cl_required = np.array([[0.2, 0.5], [0.3, -1.0]])
+    cl_trim = TrimTable(index, cl, 'aoa', cl_required[:,:,None,None])
+
+    assert cl_trim.params == ('alt','mach','aos')
+    assert cl_trim.table.shape == (2,2,2)
+
+    trim = cl_trim.get(alt=0, mach=0.5, aos=0)
+    assert trim['value'] == approx(0.5)
+    assert trim['slope'] == approx(0.1)
+    trim = cl_trim.get(alt=0, mach=0.6, aos=2)
+    assert trim['value'] == approx(3.4)
+    # cl is always higher than the required cl
+    assert cl_trim.get(alt=1000, mach=0.6, aos=0)['cross_nb'] == 0
+
+    cms_trim, cms_slope = cl_trim.interpolate(cms)
+    idx = cl_trim.get_index(alt=0, mach=0.5, aos=0)
+    assert cms_trim[idx] == approx(0.0)
+    assert cms_slope[idx] == approx(-0.02)
+    assert np.isnan(cms_trim[1,1,0])
+
+    # Trim in sideslip
+    cml_trim = TrimTable(index, Coef.aos - 1.0, 'aos')
+    assert cml_trim.params == ('alt','mach','aoa')
+    assert cml_trim.table['value'] == approx(np.ones((2,2,4)))
+
+    with pytest.raises(ValueError):
+        cl_trim.get(alt=500, mach=0.5, aos=0)
+
+
+#==============================================================================
+#    MAIN
+#==============================================================================
+
+if __name__ == '__main__':
+
+    log.info('Running Test Trim Functions')
+    log.info('To run test use the following command:')
+    log.info('>> pytest -v')
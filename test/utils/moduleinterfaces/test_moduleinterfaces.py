@@ -164,6 +164,21 @@ def test_get_tooloutput_file_path():
                                                 'ToolOutput.xml'))
 
 
+def test_get_module_run_dir(monkeypatch):
+    """
+    Test that the run directory and CPACS paths of a module are in the sandbox if any
+    """
+
+    assert m.get_module_run_dir('SU2Run') == os.path.join(m.LIB_DIR, 'SU2Run')
+
+    monkeypatch.setenv(m.SANDBOX_ENV, os.path.join(HERE, 'Sandbox'))
+
+    assert m.get_sandbox_dir() == os.path.join(HERE, 'Sandbox')
+    assert m.get_module_run_dir('SU2Run') == os.path.join(HERE, 'Sandbox', 'SU2Run')
+    assert m.get_toolinput_file_path('SU2Run') == os.path.join(HERE, 'Sandbox', 'SU2Run', 'ToolInput', 'ToolInput.xml')
+    assert m.get_tooloutput_file_path('SU2Run') == os.path.join(HERE, 'Sandbox', 'SU2Run', 'ToolOutput', 'ToolOutput.xml')
+
+
 def test_get_specs_for_module():
     """
     Test that 'get_specs_for_module()' works